@@ -18,10 +18,12 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.application.use_cases import ScrapeAllSourcesUseCase
+from src.infrastructure.adapters.http import get_shared_http_cache
 from src.infrastructure.persistence.django_repositories import (
     DjangoSourceRepository,
     DjangoScrapingJobRepository,
     DjangoNewsArticleRepository,
+    DjangoCrawlFrontierRepository,
 )
 
 # Configurar logging
@@ -56,12 +58,15 @@ async def main():
         source_repository = DjangoSourceRepository()
         scraping_job_repository = DjangoScrapingJobRepository()
         article_repository = DjangoNewsArticleRepository()
+        frontier_repository = DjangoCrawlFrontierRepository()
 
         # Crear instancia del caso de uso
         scrape_all_use_case = ScrapeAllSourcesUseCase(
             source_repository=source_repository,
             scraping_job_repository=scraping_job_repository,
             article_repository=article_repository,
+            frontier_repository=frontier_repository,
+            http_cache=get_shared_http_cache(),
         )
 
         # Ejecutar el coordinador
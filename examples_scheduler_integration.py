@@ -412,6 +412,48 @@ def example_aws_lambda():
     )
 
 
+# =============================================================================
+# EJEMPLO 8: Cola de jobs con varios workers
+# =============================================================================
+
+
+async def example_queue_workers(workers: int = 2):
+    """
+    Ejemplo de cola de jobs: se encolan las fuentes activas y varios workers
+    las drenan en paralelo sin scrapear dos veces la misma fuente.
+
+    En producción cada worker es un proceso propio (o un nodo), por ejemplo:
+
+    # Cron que solo encola
+    0 * * * * cd /path/to/project && python scripts/scraping_worker.py --enqueue --no-work
+
+    # Workers permanentes
+    python scripts/scraping_worker.py --poll 30
+    """
+    setup_django()
+
+    scrape_all = ScrapeAllSourcesUseCase(
+        source_repository=DjangoSourceRepository(),
+        scraping_job_repository=DjangoScrapingJobRepository(),
+        article_repository=DjangoNewsArticleRepository(),
+    )
+
+    queued_jobs = await scrape_all.enqueue_sources()
+    logger.info(f"Jobs encolados: {len(queued_jobs)}")
+
+    results = await asyncio.gather(
+        *(
+            scrape_all.run_worker(worker_id=f"ejemplo-{os.getpid()}-{i}")
+            for i in range(workers)
+        )
+    )
+    for result in results:
+        print(
+            f"{result['worker_id']}: {result['total_jobs_completed']} completados, "
+            f"{result['total_jobs_failed']} fallidos"
+        )
+
+
 # =============================================================================
 # MENÚ PRINCIPAL
 # =============================================================================
@@ -430,6 +472,7 @@ def main():
     print("5. Schedule - Scheduler Python simple")
     print("6. Ejecución Manual - Testing y debugging")
     print("7. AWS Lambda - Serverless")
+    print("8. Cola de jobs - Varios workers en paralelo")
     print("0. Salir")
 
     choice = input("\nOpción: ").strip()
@@ -442,6 +485,7 @@ def main():
         "5": example_schedule,
         "6": lambda: asyncio.run(example_manual_execution()),
         "7": example_aws_lambda,
+        "8": lambda: asyncio.run(example_queue_workers()),
     }
 
     if choice == "0":
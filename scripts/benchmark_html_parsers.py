@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark de backends de parseo HTML (lxml vs BeautifulSoup).
+
+Recorre un corpus de páginas guardadas y, por cada backend, mide la
+extracción de URLs de las secciones y la extracción por DOM (título,
+contenido, fecha) de los artículos con los selectores de cada scraper. El
+JSON-LD no interviene: se compara solo el costo del parser. También verifica
+que ambos backends extraen exactamente los mismos datos.
+
+Estructura del corpus:
+    <corpus>/<fuente>/sections/*.html
+    <corpus>/<fuente>/articles/*.html
+con <fuente> en: clarin, pagina12, lanacion. Por defecto se usa el corpus
+versionado de ``tests/fixtures/html_corpus``.
+
+Uso:
+    python scripts/benchmark_html_parsers.py [--corpus DIR] [--repeat 5]
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.adapters.parsing import get_html_parser  # noqa: E402
+from src.infrastructure.adapters.scrapers import (  # noqa: E402
+    ClarinScraper,
+    LaNacionScraper,
+    Pagina12Scraper,
+)
+
+SCRAPERS = {
+    "clarin": ClarinScraper,
+    "pagina12": Pagina12Scraper,
+    "lanacion": LaNacionScraper,
+}
+
+BACKENDS = ["lxml", "bs4"]
+
+DEFAULT_CORPUS = Path(__file__).parent.parent / "tests" / "fixtures" / "html_corpus"
+
+
+def load_corpus(corpus: Path):
+    pages = {}
+    for source in SCRAPERS:
+        sections = sorted((corpus / source / "sections").glob("*.html"))
+        articles = sorted((corpus / source / "articles").glob("*.html"))
+        if sections or articles:
+            pages[source] = (
+                [path.read_bytes() for path in sections],
+                [path.read_bytes() for path in articles],
+            )
+    return pages
+
+
+def extract_article(scraper, content: bytes):
+    soup = scraper.html_parser.parse(content)
+    return (
+        scraper._extract_title(soup),
+        scraper._extract_content(soup),
+        scraper._extract_publication_date(soup).isoformat(),
+    )
+
+
+def measure(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    pages = load_corpus(args.corpus)
+    if not pages:
+        sys.exit(f"No se encontraron páginas en {args.corpus}")
+
+    print(f"{'fuente':<10} {'backend':<8} {'secciones ms':>13} {'artículos/s':>12}")
+    for source, (sections, articles) in pages.items():
+        outputs = {}
+        for backend in BACKENDS:
+            scraper = SCRAPERS[source](html_parser=get_html_parser(backend))
+            outputs[backend] = (
+                [scraper._parse_article_urls(content) for content in sections],
+                [extract_article(scraper, content) for content in articles],
+            )
+
+            sections_s = measure(
+                lambda: [scraper._parse_article_urls(c) for c in sections], args.repeat
+            )
+            articles_s = measure(
+                lambda: [extract_article(scraper, c) for c in articles], args.repeat
+            )
+            rate = len(articles) / articles_s if articles_s else 0
+            print(f"{source:<10} {backend:<8} {sections_s * 1000:13.1f} {rate:12.1f}")
+
+        if outputs["lxml"] != outputs["bs4"]:
+            print(f"  ATENCIÓN: los backends difieren en {source}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Benchmark de throughput de parseo de los scrapers sobre el corpus HTML offline.
+
+Mide, para ClarinScraper, Pagina12Scraper, LaNacionScraper y el
+``parse_article`` de los spiders de Scrapy:
+
+- artículos parseados por segundo (ruta real de ``_parse_article``)
+- tiempo por etapa y por página: extracción de URLs de secciones, JSON-LD,
+  construcción del árbol, título, contenido y fecha
+- memoria pico (tracemalloc) y RSS máximo del proceso
+
+Cada objetivo corre en un proceso propio para que la memoria no se mezcle. El
+resultado es JSON; con ``--baseline`` se compara contra una ejecución anterior
+y el script termina con código 1 si algún objetivo pierde más de
+``--max-regression`` de throughput.
+
+Uso:
+    python scripts/benchmark_scrapers.py [--corpus DIR] [--parser lxml|bs4]
+        [--repeat 5] [--output resultados.json]
+        [--baseline anterior.json --max-regression 0.2]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+DEFAULT_CORPUS = Path(__file__).parent.parent / "tests" / "fixtures" / "html_corpus"
+
+# objetivo -> (fuente en el corpus, tipo, ruta de importación)
+TARGETS = {
+    "ClarinScraper": ("clarin", "scraper", "src.infrastructure.adapters.scrapers"),
+    "Pagina12Scraper": ("pagina12", "scraper", "src.infrastructure.adapters.scrapers"),
+    "LaNacionScraper": ("lanacion", "scraper", "src.infrastructure.adapters.scrapers"),
+    "ClarinSpider": (
+        "clarin",
+        "spider",
+        "src.infrastructure.external_services.scrapy_adapter.spiders",
+    ),
+    "Pagina12Spider": (
+        "pagina12",
+        "spider",
+        "src.infrastructure.external_services.scrapy_adapter.spiders",
+    ),
+    "LaNacionSpider": (
+        "lanacion",
+        "spider",
+        "src.infrastructure.external_services.scrapy_adapter.spiders",
+    ),
+    "InfobaeSpider": (
+        "infobae",
+        "spider",
+        "src.infrastructure.external_services.scrapy_adapter.spiders",
+    ),
+}
+
+
+def load_corpus(corpus: Path) -> dict:
+    """Lee el manifiesto y verifica que las páginas no cambiaron."""
+    manifest = json.loads((corpus / "manifest.json").read_text())
+    for page in manifest["pages"]:
+        content = (corpus / page["path"]).read_bytes()
+        if hashlib.sha256(content).hexdigest() != page["sha256"]:
+            sys.exit(f"El corpus no coincide con el manifiesto: {page['path']}")
+    return manifest
+
+
+def pages_for(corpus: Path, manifest: dict, source: str, kind: str) -> list:
+    return [
+        (page["url"], (corpus / page["path"]).read_bytes())
+        for page in manifest["pages"]
+        if page["path"].startswith(f"{source}/") and page["kind"] == kind
+    ]
+
+
+def timed(func, repeat: int) -> float:
+    """Mediana en segundos de ``repeat`` ejecuciones."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def per_page_ms(seconds: float, pages: int) -> float:
+    return round(seconds * 1000 / pages, 3) if pages else 0.0
+
+
+def bench_scraper(cls, sections, articles, parser_name, repeat) -> dict:
+    from src.infrastructure.adapters.parsing import get_html_parser
+    from src.infrastructure.adapters.scrapers.json_ld import extract_article_metadata
+
+    scraper = cls(html_parser=get_html_parser(parser_name))
+    parser = scraper.html_parser
+    docs = [parser.parse(content) for _, content in articles]
+
+    def parse_all():
+        for url, content in articles:
+            scraper._parse_article(url, content)
+
+    stages = {
+        "url_extraction": timed(
+            lambda: [scraper._parse_article_urls(c) for _, c in sections], repeat
+        ),
+        "json_ld": timed(
+            lambda: [extract_article_metadata(c) for _, c in articles], repeat
+        ),
+        "dom_parse": timed(lambda: [parser.parse(c) for _, c in articles], repeat),
+        "title": timed(lambda: [scraper._extract_title(d) for d in docs], repeat),
+        "content": timed(lambda: [scraper._extract_content(d) for d in docs], repeat),
+        "date": timed(
+            lambda: [scraper._extract_publication_date(d) for d in docs], repeat
+        ),
+    }
+    total = timed(parse_all, repeat)
+
+    return {
+        "parser": parser_name,
+        "articles_per_second": round(len(articles) / total, 1) if total else None,
+        "stages_ms_per_page": {
+            stage: per_page_ms(
+                seconds, len(sections) if stage == "url_extraction" else len(articles)
+            )
+            for stage, seconds in stages.items()
+        },
+    }
+
+
+def bench_spider(cls, articles, repeat) -> dict:
+    from scrapy.http import HtmlResponse
+
+    spider = cls()
+    spider.max_articles = float("inf")
+    responses = [
+        HtmlResponse(url=url, body=content, encoding="utf-8")
+        for url, content in articles
+    ]
+
+    def parse_all():
+        for response in responses:
+            list(spider.parse_article(response))
+
+    total = timed(parse_all, repeat)
+    return {
+        "parser": "parsel",
+        "articles_per_second": round(len(articles) / total, 1) if total else None,
+        "stages_ms_per_page": {"parse_article": per_page_ms(total, len(articles))},
+    }
+
+
+def run_target(name: str, corpus: str, parser_name: str, repeat: int) -> dict:
+    """Ejecuta un objetivo (en un proceso hijo) y devuelve su resultado."""
+    import importlib
+
+    logging.disable(logging.CRITICAL)
+    source, kind, module = TARGETS[name]
+    cls = getattr(importlib.import_module(module), name)
+    corpus_path = Path(corpus)
+    manifest = json.loads((corpus_path / "manifest.json").read_text())
+    sections = pages_for(corpus_path, manifest, source, "section")
+    articles = pages_for(corpus_path, manifest, source, "article")
+
+    tracemalloc.start()
+    if kind == "scraper":
+        result = bench_scraper(cls, sections, articles, parser_name, repeat)
+    else:
+        result = bench_spider(cls, articles, repeat)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "target": name,
+        "source": source,
+        "articles": len(articles),
+        "sections": len(sections) if kind == "scraper" else 0,
+        **result,
+        "peak_memory_kb": peak // 1024,
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def compare(results: list, baseline_path: Path, max_regression: float) -> list:
+    """Devuelve los objetivos cuyo throughput cayó más de ``max_regression``."""
+    baseline = json.loads(baseline_path.read_text())
+    previous = {
+        (result["target"], result["parser"]): result["articles_per_second"]
+        for result in baseline["results"]
+    }
+    regressions = []
+    for result in results:
+        before = previous.get((result["target"], result["parser"]))
+        after = result["articles_per_second"]
+        if before and after is not None and after < before * (1 - max_regression):
+            regressions.append(
+                f"{result['target']} ({result['parser']}): "
+                f"{before} -> {after} artículos/s"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--parser", default="lxml", choices=["lxml", "bs4"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--targets", nargs="*", choices=list(TARGETS))
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+
+    manifest = load_corpus(args.corpus)
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for name in args.targets or TARGETS:
+        with context.Pool(1) as pool:
+            results.append(
+                pool.apply(
+                    run_target, (name, str(args.corpus), args.parser, args.repeat)
+                )
+            )
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "corpus": {
+            "version": manifest["version"],
+            "origin": manifest.get("origin"),
+            "pages": len(manifest["pages"]),
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "repeat": args.repeat,
+        "results": results,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.max_regression)
+        for regression in regressions:
+            print(f"REGRESIÓN: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
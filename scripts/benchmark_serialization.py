@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark de serialización de respuestas de artículos.
+
+Compara, por cada 1.000 artículos, la ruta estándar de DRF
+(``NewsArticleSerializer(many=True)`` + ``JSONRenderer``) con la ruta rápida
+(serializer precompilado + ``FastJSONRenderer``) y verifica que ambas producen
+exactamente los mismos bytes.
+
+Uso:
+    python scripts/benchmark_serialization.py [--articles 1000] [--repeat 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def build_articles(total: int):
+    from src.application.dto.news_article_dto import NewsArticleDTO
+
+    base = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    contenido = "El índice de precios al consumidor subió en marzo. " * 40
+    return [
+        NewsArticleDTO(
+            id=uuid.uuid4(),
+            titulo=f"Título de la nota número {i}",
+            contenido=contenido,
+            fuente="Clarín",
+            fecha_publicacion=base - timedelta(minutes=i),
+            url=f"https://www.clarin.com/economia/nota-{i}.html",
+            categoria="Economía" if i % 3 else None,
+            procesado=bool(i % 2),
+            created_at=base,
+            updated_at=None,
+        )
+        for i in range(total)
+    ]
+
+
+def measure(render, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--articles", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.setdefault(
+        "DJANGO_SETTINGS_MODULE", "src.infrastructure.config.django_settings"
+    )
+    import django
+
+    django.setup()
+
+    from rest_framework.renderers import JSONRenderer
+
+    from src.presentation.django_app import renderers
+    from src.presentation.django_app.fast_serialization import compile_serializer
+    from src.presentation.django_app.renderers import FastJSONRenderer
+    from src.presentation.django_app.serializers import NewsArticleSerializer
+
+    articles = build_articles(args.articles)
+    compiled = compile_serializer(NewsArticleSerializer)
+    drf_renderer = JSONRenderer()
+    fast_renderer = FastJSONRenderer()
+
+    def drf_path():
+        return drf_renderer.render(NewsArticleSerializer(articles, many=True).data)
+
+    def fast_path():
+        return fast_renderer.render(compiled.encode_many(articles))
+
+    assert drf_path() == fast_path(), "La ruta rápida no es idéntica byte a byte"
+
+    scale = 1000 / args.articles
+    drf_ms = measure(drf_path, args.repeat) * 1000 * scale
+    fast_ms = measure(fast_path, args.repeat) * 1000 * scale
+
+    print(f"Artículos: {args.articles} - repeticiones: {args.repeat}")
+    print(f"Backend JSON rápido: {'orjson' if renderers.orjson else 'json (stdlib)'}")
+    print(f"DRF (Serializer + JSONRenderer): {drf_ms:8.2f} ms / 1.000 artículos")
+    print(f"Ruta rápida:                     {fast_ms:8.2f} ms / 1.000 artículos")
+    print(f"Aceleración: x{drf_ms / fast_ms:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Captura una nueva versión del corpus HTML offline desde los sitios reales.
+
+Por cada fuente descarga las páginas de sección de su spider, toma las
+primeras notas enlazadas (con el mismo ``parse`` del spider) y guarda todo con
+la estructura que usan los benchmarks y los tests:
+
+    <corpus>/<fuente>/sections/<slug>.html
+    <corpus>/<fuente>/articles/nota-<n>.html
+    <corpus>/manifest.json
+
+El manifiesto registra URL, tipo, sha256 y si la nota trae JSON-LD, e
+incrementa ``version`` respecto del corpus anterior. Los archivos se guardan
+tal cual los devuelve el servidor (sin reescribir la codificación).
+
+Uso:
+    python scripts/capture_html_corpus.py [--corpus DIR] [--articles 4]
+        [--sections 2]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import shutil
+import sys
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from scrapy.http import HtmlResponse
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.adapters.scrapers.base_scraper import (  # noqa: E402
+    USER_AGENT,
+)
+from src.infrastructure.adapters.scrapers.json_ld import (  # noqa: E402
+    extract_article_metadata,
+)
+from src.infrastructure.external_services.scrapy_adapter.spiders import (  # noqa: E402
+    ClarinSpider,
+    InfobaeSpider,
+    LaNacionSpider,
+    Pagina12Spider,
+)
+
+DEFAULT_CORPUS = Path(__file__).parent.parent / "tests" / "fixtures" / "html_corpus"
+
+SPIDERS = {
+    "clarin": ClarinSpider,
+    "pagina12": Pagina12Spider,
+    "lanacion": LaNacionSpider,
+    "infobae": InfobaeSpider,
+}
+
+
+def slug(url: str) -> str:
+    path = urlparse(url).path.strip("/")
+    return path.rsplit("/", 1)[-1] or "portada"
+
+
+def capture_source(session, spider_cls, sections: int, articles: int):
+    """Devuelve las páginas (url, tipo, contenido) de una fuente."""
+    spider = spider_cls()
+    pages, article_urls = [], []
+
+    for url in spider.start_urls[-sections:]:
+        response = session.get(url, timeout=15)
+        response.raise_for_status()
+        pages.append((url, "section", response.content))
+
+        html = HtmlResponse(url=url, body=response.content, encoding="utf-8")
+        for request in spider.parse(html):
+            if request.url not in article_urls:
+                article_urls.append(request.url)
+
+    for url in article_urls[:articles]:
+        response = session.get(url, timeout=15)
+        response.raise_for_status()
+        pages.append((url, "article", response.content))
+
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--sections", type=int, default=2)
+    parser.add_argument("--articles", type=int, default=4)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    manifest_path = args.corpus / "manifest.json"
+    version = 1
+    if manifest_path.exists():
+        version = json.loads(manifest_path.read_text())["version"] + 1
+
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+
+    captured = {}
+    for source, spider_cls in SPIDERS.items():
+        try:
+            captured[source] = capture_source(
+                session, spider_cls, args.sections, args.articles
+            )
+        except requests.RequestException as e:
+            sys.exit(f"Error capturando {source}: {e}")
+        print(f"{source}: {len(captured[source])} páginas")
+
+    entries = []
+    for source, pages in captured.items():
+        shutil.rmtree(args.corpus / source, ignore_errors=True)
+        article_number = 0
+        for url, kind, content in pages:
+            if kind == "section":
+                path = f"{source}/sections/{slug(url)}.html"
+            else:
+                article_number += 1
+                path = f"{source}/articles/nota-{article_number}.html"
+
+            target = args.corpus / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+
+            entry = {
+                "path": path,
+                "url": url,
+                "kind": kind,
+                "sha256": hashlib.sha256(content).hexdigest(),
+            }
+            if kind == "article":
+                entry["json_ld"] = extract_article_metadata(content).titulo is not None
+            entries.append(entry)
+
+    manifest = {
+        "version": version,
+        "origin": "capture",
+        "created_at": date.today().isoformat(),
+        "description": "Páginas capturadas de los sitios reales con "
+        "scripts/capture_html_corpus.py.",
+        "pages": entries,
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n")
+    print(f"Corpus versión {version} guardado en {args.corpus}")
+
+
+if __name__ == "__main__":
+    main()
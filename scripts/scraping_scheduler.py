@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Scheduler adaptativo de scraping (proceso de larga vida).
+
+Ejecuta cada fuente activa con su propio intervalo, que se ajusta a la tasa de
+artículos nuevos registrada en ScrapingJob. El cliente HTTP, la caché y el pool
+de parseo se crean una sola vez y se reutilizan en todas las ejecuciones.
+SIGINT / SIGTERM detienen el scheduler después de las ejecuciones en curso.
+
+Uso:
+    python scripts/scraping_scheduler.py
+    python scripts/scraping_scheduler.py --min-interval 120 --max-interval 7200
+    python scripts/scraping_scheduler.py --parse-processes 4
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scheduler adaptativo de scraping")
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=300,
+        help="Intervalo mínimo por fuente en segundos (por defecto 300)",
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=6 * 3600,
+        help="Intervalo máximo por fuente en segundos (por defecto 21600)",
+    )
+    parser.add_argument(
+        "--initial-interval",
+        type=float,
+        default=1800,
+        help="Intervalo de una fuente sin historial (por defecto 1800)",
+    )
+    parser.add_argument(
+        "--target-new",
+        type=int,
+        default=10,
+        help="Artículos nuevos buscados por ejecución (por defecto 10)",
+    )
+    parser.add_argument(
+        "--source-timeout",
+        type=float,
+        default=None,
+        help="Plazo máximo por fuente en segundos; al vencer se guarda lo extraído",
+    )
+    parser.add_argument(
+        "--breaker-failures",
+        type=int,
+        default=3,
+        help="Fallos seguidos que abren el circuito de una fuente (0 lo desactiva)",
+    )
+    parser.add_argument(
+        "--breaker-cooldown",
+        type=float,
+        default=300,
+        help="Segundos con el circuito abierto antes del sondeo (por defecto 300)",
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        help="Procesos de parseo compartidos por todas las ejecuciones",
+    )
+    return parser.parse_args()
+
+
+async def main():
+    import django
+
+    os.environ.setdefault(
+        "DJANGO_SETTINGS_MODULE", "src.infrastructure.config.django_settings"
+    )
+    django.setup()
+
+    from src.application.pipeline import create_parse_process_pool
+    from src.application.resilience import CircuitBreakerConfig
+    from src.application.scheduling import AdaptiveScheduler, SchedulerConfig
+    from src.application.use_cases import ScrapeAllSourcesUseCase
+    from src.infrastructure.adapters.http import get_shared_http_cache
+    from src.infrastructure.persistence.django_repositories import (
+        DjangoCrawlFrontierRepository,
+        DjangoNewsArticleRepository,
+        DjangoScrapingJobRepository,
+        DjangoSourceRepository,
+    )
+
+    args = parse_args()
+    circuit_breaker = (
+        CircuitBreakerConfig(
+            failure_threshold=args.breaker_failures, cooldown=args.breaker_cooldown
+        )
+        if args.breaker_failures
+        else None
+    )
+    config = SchedulerConfig(
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
+        initial_interval=args.initial_interval,
+        target_new_articles=args.target_new,
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_event.set)
+
+    source_repository = DjangoSourceRepository()
+    job_repository = DjangoScrapingJobRepository()
+
+    parse_pool = (
+        create_parse_process_pool(args.parse_processes)
+        if args.parse_processes
+        else contextlib.nullcontext()
+    )
+    with parse_pool as parse_executor:
+        coordinator = ScrapeAllSourcesUseCase(
+            source_repository=source_repository,
+            scraping_job_repository=job_repository,
+            article_repository=DjangoNewsArticleRepository(),
+            parse_executor=parse_executor,
+            frontier_repository=DjangoCrawlFrontierRepository(),
+            http_cache=get_shared_http_cache(),
+            source_timeout=args.source_timeout,
+            circuit_breaker=circuit_breaker,
+        )
+        scheduler = AdaptiveScheduler(
+            coordinator, source_repository, job_repository, config
+        )
+        await scheduler.run(stop_event)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Worker de la cola de scraping.
+
+Encola un job por fuente activa y/o procesa los jobs pendientes de la tabla
+ScrapingJob. Se pueden lanzar varios workers en paralelo (en la misma máquina
+o en varias) contra la misma base: cada job lo procesa un único worker.
+
+Uso:
+    # Encolar las fuentes activas (por ejemplo desde cron)
+    python scripts/scraping_worker.py --enqueue --no-work
+
+    # Drenar la cola y terminar
+    python scripts/scraping_worker.py
+
+    # Worker permanente que consulta la cola cada 30 segundos
+    python scripts/scraping_worker.py --poll 30
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Worker de la cola de scraping")
+    parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="Encolar un job por cada fuente activa antes de procesar",
+    )
+    parser.add_argument(
+        "--no-work",
+        action="store_true",
+        help="No procesar jobs (útil junto con --enqueue)",
+    )
+    parser.add_argument(
+        "--worker-id",
+        default=f"{socket.gethostname()}-{os.getpid()}",
+        help="Identificador del worker (por defecto host-PID)",
+    )
+    parser.add_argument(
+        "--lease",
+        type=float,
+        default=300,
+        help="Duración del lease de cada job en segundos (por defecto 300)",
+    )
+    parser.add_argument(
+        "--source-timeout",
+        type=float,
+        default=None,
+        help="Plazo máximo por fuente en segundos; al vencer se guarda lo extraído",
+    )
+    parser.add_argument(
+        "--breaker-failures",
+        type=int,
+        default=3,
+        help="Fallos seguidos que abren el circuito de una fuente (0 lo desactiva)",
+    )
+    parser.add_argument(
+        "--breaker-cooldown",
+        type=float,
+        default=300,
+        help="Segundos con el circuito abierto antes del sondeo (por defecto 300)",
+    )
+    parser.add_argument(
+        "--max-jobs", type=int, default=None, help="Máximo de jobs a procesar"
+    )
+    parser.add_argument(
+        "--poll",
+        type=float,
+        default=None,
+        help="Con la cola vacía, esperar estos segundos y volver a consultar",
+    )
+    return parser.parse_args()
+
+
+async def main():
+    import django
+
+    os.environ.setdefault(
+        "DJANGO_SETTINGS_MODULE", "src.infrastructure.config.django_settings"
+    )
+    django.setup()
+
+    from src.application.resilience import CircuitBreakerConfig
+    from src.application.use_cases import ScrapeAllSourcesUseCase
+    from src.infrastructure.adapters.http import get_shared_http_cache
+    from src.infrastructure.persistence.django_repositories import (
+        DjangoCrawlFrontierRepository,
+        DjangoNewsArticleRepository,
+        DjangoScrapingJobRepository,
+        DjangoSourceRepository,
+    )
+
+    args = parse_args()
+    circuit_breaker = (
+        CircuitBreakerConfig(
+            failure_threshold=args.breaker_failures, cooldown=args.breaker_cooldown
+        )
+        if args.breaker_failures
+        else None
+    )
+
+    coordinator = ScrapeAllSourcesUseCase(
+        source_repository=DjangoSourceRepository(),
+        scraping_job_repository=DjangoScrapingJobRepository(),
+        article_repository=DjangoNewsArticleRepository(),
+        frontier_repository=DjangoCrawlFrontierRepository(),
+        http_cache=get_shared_http_cache(),
+        source_timeout=args.source_timeout,
+        circuit_breaker=circuit_breaker,
+    )
+
+    if args.enqueue:
+        await coordinator.enqueue_sources()
+
+    if args.no_work:
+        return
+
+    result = await coordinator.run_worker(
+        worker_id=args.worker_id,
+        lease_seconds=args.lease,
+        max_jobs=args.max_jobs,
+        poll_interval=args.poll,
+    )
+    logger.info(
+        f"Artículos scrapeados: {result['total_articles_scraped']}, "
+        f"nuevos: {result['total_articles_persisted']}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
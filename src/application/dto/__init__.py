@@ -1,6 +1,8 @@
 from src.application.dto.news_article_dto import (
     CreateNewsArticleDTO,
     NewsArticleDTO,
+    NewsArticlePageDTO,
+    NewsArticleSummaryDTO,
     UpdateNewsArticleDTO,
 )
 from src.application.dto.scraping_job_dto import (
@@ -15,6 +17,8 @@ __all__ = [
     "CreateUserDTO",
     "UpdateUserDTO",
     "NewsArticleDTO",
+    "NewsArticlePageDTO",
+    "NewsArticleSummaryDTO",
     "CreateNewsArticleDTO",
     "UpdateNewsArticleDTO",
     "SourceDTO",
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Union
 from uuid import UUID
 
 
@@ -33,3 +33,20 @@ class NewsArticleDTO:
     procesado: bool
     created_at: datetime
     updated_at: Optional[datetime]
+
+
+@dataclass
+class NewsArticleSummaryDTO:
+    id: UUID
+    titulo: str
+    fuente: str
+    fecha_publicacion: datetime
+    url: str
+    categoria: Optional[str]
+    extracto: Optional[str]
+
+
+@dataclass
+class NewsArticlePageDTO:
+    items: List[Union[NewsArticleDTO, NewsArticleSummaryDTO]]
+    next_cursor: Optional[str] = None
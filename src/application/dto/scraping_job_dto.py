@@ -19,3 +19,4 @@ class ScrapingJobDTO:
     total_articulos: int
     created_at: datetime
     updated_at: Optional[datetime]
+    articulos_nuevos: int = 0
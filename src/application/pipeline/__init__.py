@@ -0,0 +1,16 @@
+from .ingestion_pipeline import (
+    IngestionPipeline,
+    PipelineConfig,
+    PipelineResult,
+    StageMetrics,
+)
+from .process_parsing import ArticleRecord, create_parse_process_pool
+
+__all__ = [
+    "ArticleRecord",
+    "IngestionPipeline",
+    "PipelineConfig",
+    "PipelineResult",
+    "StageMetrics",
+    "create_parse_process_pool",
+]
@@ -0,0 +1,448 @@
+"""
+Pipeline de ingesta productor/consumidor para una fuente.
+
+    URLs -> [fetch] -> [parse] -> [dedup] -> [writer] -> base de datos
+
+Cada etapa tiene su propio número de workers y se comunica con la siguiente a
+través de una ``asyncio.Queue`` acotada. Así las escrituras en la base de datos
+se solapan con las descargas, y si una etapa se atrasa (por ejemplo una base de
+datos lenta) las colas se llenan y las etapas anteriores se frenan en lugar de
+acumular artículos en memoria.
+
+El parseo (CPU) corre en un executor aparte para no bloquear el event loop:
+un pool de hilos por defecto o, con ``parse_processes``, un pool de procesos
+que usa todos los núcleos (ver ``process_parsing``).
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.domain.dto.article_dto import ArticleDTO
+from src.domain.ports.scraper_port import PipelineScraperPort
+
+from .process_parsing import (
+    create_parse_process_pool,
+    from_record,
+    parse_in_worker,
+)
+
+logger = logging.getLogger(__name__)
+
+# Marca de fin de cola: cada worker termina al recibir una
+_DONE = object()
+
+BatchWriter = Callable[[List[ArticleDTO]], Awaitable[int]]
+
+
+def _remaining(
+    loop: asyncio.AbstractEventLoop, deadline: Optional[float]
+) -> Optional[float]:
+    """Segundos hasta ``deadline`` (como mínimo 0), o None si no hay plazo."""
+    if deadline is None:
+        return None
+    return max(deadline - loop.time(), 0)
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """
+    Configuración del pipeline de ingesta.
+
+    Attributes:
+        fetch_concurrency: Descargas simultáneas
+        parse_workers: Workers de parseo (hilos del executor, o páginas en
+            vuelo hacia el pool de procesos)
+        parse_processes: Procesos de parseo. Con 0 se parsea en hilos
+        queue_size: Capacidad de cada cola entre etapas
+        batch_size: Artículos por escritura en la base de datos
+        flush_interval: Segundos máximos que un lote incompleto espera antes de
+            escribirse
+    """
+
+    fetch_concurrency: int = 8
+    parse_workers: int = 2
+    parse_processes: int = 0
+    queue_size: int = 32
+    batch_size: int = 10
+    flush_interval: float = 1.0
+
+    def __post_init__(self):
+        for name in ("fetch_concurrency", "parse_workers", "queue_size", "batch_size"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} debe ser mayor o igual a 1")
+        if self.flush_interval <= 0:
+            raise ValueError("flush_interval debe ser mayor a 0")
+        if self.parse_processes < 0:
+            raise ValueError("parse_processes debe ser mayor o igual a 0")
+
+
+@dataclass
+class StageMetrics:
+    """
+    Métricas de una etapa del pipeline.
+
+    Attributes:
+        name: Nombre de la etapa
+        workers: Workers de la etapa
+        processed: Elementos recibidos y procesados
+        emitted: Elementos entregados a la etapa siguiente
+        busy_seconds: Tiempo total procesando (sumado entre workers)
+        blocked_seconds: Tiempo esperando lugar en la cola siguiente
+        max_queue_depth: Máxima cantidad de elementos en la cola de entrada
+    """
+
+    name: str
+    workers: int
+    processed: int = 0
+    emitted: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    max_queue_depth: int = 0
+    _depth_total: int = field(default=0, repr=False)
+    _depth_samples: int = field(default=0, repr=False)
+    _started_at: Optional[float] = field(default=None, repr=False)
+    _finished_at: Optional[float] = field(default=None, repr=False)
+
+    def start(self) -> None:
+        self._started_at = time.perf_counter()
+
+    def finish(self) -> None:
+        self._finished_at = time.perf_counter()
+
+    def observe_queue(self, depth: int) -> None:
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self._depth_total += depth
+        self._depth_samples += 1
+
+    @property
+    def elapsed(self) -> float:
+        if self._started_at is None:
+            return 0.0
+        return (self._finished_at or time.perf_counter()) - self._started_at
+
+    @property
+    def throughput(self) -> float:
+        """Elementos procesados por segundo de reloj."""
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_queue_depth(self) -> float:
+        return self._depth_total / self._depth_samples if self._depth_samples else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "emitted": self.emitted,
+            "throughput": round(self.throughput, 2),
+            "busy_seconds": round(self.busy_seconds, 3),
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "max_queue_depth": self.max_queue_depth,
+            "mean_queue_depth": round(self.mean_queue_depth, 2),
+        }
+
+
+@dataclass
+class PipelineResult:
+    """
+    Resultado de una ejecución del pipeline.
+
+    Attributes:
+        articles_scraped: Artículos parseados
+        articles_persisted: Artículos nuevos guardados
+        metrics: Métricas por etapa
+        timed_out: Indica si se agotó el plazo y quedaron URLs sin descargar
+    """
+
+    articles_scraped: int
+    articles_persisted: int
+    metrics: Dict[str, StageMetrics]
+    timed_out: bool = False
+
+    def metrics_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stage.as_dict() for name, stage in self.metrics.items()}
+
+
+class IngestionPipeline:
+    """
+    Ejecuta el scraping de una fuente como pipeline de etapas concurrentes.
+
+    Etapas:
+        fetch: descarga cada URL (``fetch_concurrency`` workers)
+        parse: parsea el HTML en el executor (``parse_workers`` workers)
+        dedup: descarta artículos con una URL ya vista en la ejecución
+        writer: agrupa los artículos y los escribe en lotes de ``batch_size``
+            o cada ``flush_interval`` segundos
+
+    Example:
+        >>> pipeline = IngestionPipeline(scraper, write_batch, PipelineConfig())
+        >>> result = await pipeline.run()
+        >>> result.metrics_dict()["fetch"]["throughput"]
+    """
+
+    STAGES = ("fetch", "parse", "dedup", "writer")
+
+    def __init__(
+        self,
+        scraper: PipelineScraperPort,
+        write_batch: BatchWriter,
+        config: Optional[PipelineConfig] = None,
+        parse_executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            scraper: Scraper que expone descubrimiento, descarga y parseo
+            write_batch: Persiste un lote y devuelve cuántos artículos eran nuevos
+            config: Configuración del pipeline
+            parse_executor: Executor para el parseo. Si es un
+                ``ProcessPoolExecutor`` las páginas se parsean en otros
+                procesos, con una instancia de solo parseo de
+                ``type(scraper)`` (mismo backend HTML y URL base) en cada
+                uno. Si es None se crea durante la ejecución
+                un pool de ``parse_processes`` procesos o, si es 0, de
+                ``parse_workers`` hilos
+        """
+        self._scraper = scraper
+        self._write_batch = write_batch
+        self.config = config or PipelineConfig()
+        self._parse_executor = parse_executor
+        self._seen_urls: set[str] = set()
+        self._persisted = 0
+        self._timed_out = False
+        workers = {
+            "fetch": self.config.fetch_concurrency,
+            "parse": max(self.config.parse_workers, self.config.parse_processes),
+            "dedup": 1,
+            "writer": 1,
+        }
+        self.metrics = {name: StageMetrics(name, workers[name]) for name in self.STAGES}
+
+    async def run(self, deadline: Optional[float] = None) -> PipelineResult:
+        """
+        Descubre las URLs de la fuente y las procesa a través de todas las etapas.
+
+        Al vencer ``deadline`` se cancelan las descargas en curso y se descartan
+        las URLs pendientes, pero las páginas ya descargadas se parsean y
+        persisten igual: el resultado conserva todo lo extraído hasta entonces.
+
+        Args:
+            deadline: Plazo en tiempo del event loop (``loop.time()``); None
+                para no limitar la ejecución
+
+        Returns:
+            PipelineResult: Artículos scrapeados, persistidos y métricas por etapa
+
+        Raises:
+            Exception: Si una etapa falla; el resto de las etapas se cancela
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            urls = await asyncio.wait_for(
+                self._scraper.collect_article_urls(), _remaining(loop, deadline)
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Plazo agotado durante el descubrimiento de URLs")
+            urls = []
+            self._timed_out = True
+        queues = [asyncio.Queue(self.config.queue_size) for _ in self.STAGES]
+        url_queue, page_queue, article_queue, unique_queue = queues
+
+        executor = self._parse_executor
+        own_executor = executor is None
+        if own_executor and self.config.parse_processes:
+            executor = create_parse_process_pool(self.config.parse_processes)
+        elif own_executor:
+            executor = ThreadPoolExecutor(
+                max_workers=self.config.parse_workers, thread_name_prefix="parse"
+            )
+        if isinstance(executor, ProcessPoolExecutor):
+            # El worker replica el backend HTML y la URL base del scraper
+            worker_scraper = (
+                type(self._scraper),
+                self._scraper.html_parser.name,
+                self._scraper.base_url if self._scraper.redirected else None,
+            )
+
+        async def fetch(url):
+            timeout = _remaining(loop, deadline)
+            if timeout is not None and timeout <= 0:
+                self._timed_out = True
+                return None
+            try:
+                return await asyncio.wait_for(self._scraper.fetch_article(url), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Plazo agotado descargando {url}")
+                self._timed_out = True
+                return None
+
+        async def parse_page(page):
+            if not isinstance(executor, ProcessPoolExecutor):
+                return await loop.run_in_executor(
+                    executor, self._scraper.parse_article, page
+                )
+            scraper_class, parser_name, base_url = worker_scraper
+            record = await loop.run_in_executor(
+                executor,
+                parse_in_worker,
+                scraper_class,
+                page.url,
+                page.content,
+                page.encoding,
+                parser_name,
+                base_url,
+            )
+            return from_record(record) if record is not None else None
+
+        async def parse(page):
+            article = await parse_page(page)
+            await self._scraper.mark_parsed(page.url, article is not None)
+            return article
+
+        tasks = [
+            asyncio.ensure_future(self._produce(urls, url_queue)),
+            asyncio.ensure_future(
+                self._stage(
+                    "fetch",
+                    url_queue,
+                    page_queue,
+                    fetch,
+                    self.metrics["parse"].workers,
+                )
+            ),
+            asyncio.ensure_future(
+                self._stage("parse", page_queue, article_queue, parse, 1)
+            ),
+            asyncio.ensure_future(
+                self._stage("dedup", article_queue, unique_queue, self._dedup, 1)
+            ),
+            asyncio.ensure_future(self._writer(unique_queue)),
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            if own_executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        for stage in self.metrics.values():
+            logger.info(
+                f"Etapa {stage.name}: {stage.processed} elementos, "
+                f"{stage.throughput:.1f}/s, cola máx {stage.max_queue_depth}, "
+                f"bloqueada {stage.blocked_seconds:.2f}s"
+            )
+        return PipelineResult(
+            articles_scraped=self.metrics["parse"].emitted,
+            articles_persisted=self._persisted,
+            metrics=self.metrics,
+            timed_out=self._timed_out,
+        )
+
+    async def _produce(self, urls: List[str], outbox: asyncio.Queue) -> None:
+        for url in urls:
+            if self._timed_out:
+                break
+            await outbox.put(url)
+        for _ in range(self.config.fetch_concurrency):
+            await outbox.put(_DONE)
+
+    async def _stage(
+        self,
+        name: str,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue,
+        handle: Callable[[Any], Awaitable[Any]],
+        downstream_workers: int,
+    ) -> None:
+        """
+        Ejecuta los workers de una etapa hasta que se vacía su cola de entrada.
+
+        Los resultados None no se propagan. Cuando terminan todos los workers se
+        envía una marca de fin a cada worker de la etapa siguiente.
+        """
+        metrics = self.metrics[name]
+        metrics.start()
+
+        async def worker():
+            while True:
+                item = await inbox.get()
+                metrics.observe_queue(inbox.qsize())
+                if item is _DONE:
+                    return
+
+                started = time.perf_counter()
+                result = await handle(item)
+                metrics.busy_seconds += time.perf_counter() - started
+                metrics.processed += 1
+                if result is None:
+                    continue
+
+                metrics.emitted += 1
+                started = time.perf_counter()
+                await outbox.put(result)
+                metrics.blocked_seconds += time.perf_counter() - started
+
+        await asyncio.gather(*(worker() for _ in range(metrics.workers)))
+        metrics.finish()
+        for _ in range(downstream_workers):
+            await outbox.put(_DONE)
+
+    async def _dedup(self, article: ArticleDTO) -> Optional[ArticleDTO]:
+        # Solo por URL: notas distintas pueden compartir título (coberturas
+        # en vivo, "Últimas noticias", la misma nota en dos secciones)
+        if article.url in self._seen_urls:
+            logger.debug(f"Artículo repetido descartado: {article.url}")
+            return None
+        self._seen_urls.add(article.url)
+        return article
+
+    async def _writer(self, inbox: asyncio.Queue) -> None:
+        """
+        Agrupa los artículos en lotes y los persiste.
+
+        En las métricas del writer ``emitted`` cuenta los lotes escritos.
+        """
+        metrics = self.metrics["writer"]
+        metrics.start()
+        batch: List[ArticleDTO] = []
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else deadline - time.perf_counter()
+            try:
+                item = await asyncio.wait_for(inbox.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                item = None
+            else:
+                metrics.observe_queue(inbox.qsize())
+
+            if item is not None and item is not _DONE:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.perf_counter() + self.config.flush_interval
+
+            full = len(batch) >= self.config.batch_size
+            if batch and (full or item is None or item is _DONE):
+                await self._flush(batch)
+                batch = []
+                deadline = None
+            if item is _DONE:
+                break
+
+        metrics.finish()
+
+    async def _flush(self, batch: List[ArticleDTO]) -> None:
+        metrics = self.metrics["writer"]
+        started = time.perf_counter()
+        self._persisted += await self._write_batch(batch)
+        metrics.busy_seconds += time.perf_counter() - started
+        metrics.processed += len(batch)
+        metrics.emitted += 1
@@ -0,0 +1,111 @@
+"""
+Parseo de artículos en procesos separados.
+
+El parseo de HTML y la limpieza de texto son CPU y, con hilos, quedan
+limitados a un núcleo por el GIL. Con un ``ProcessPoolExecutor`` cada página
+viaja al worker como bytes (``FetchedPage``) y vuelve como una tupla plana
+(``ArticleRecord``), mucho más barata de serializar que un modelo pydantic.
+
+Cada tarea lleva la clase del scraper, el backend de HTML y la URL base del
+scraper del proceso principal, así el resultado es el mismo que parseando en
+hilos. Cada proceso crea una única instancia de solo parseo
+(``BaseNewsScraper.for_parsing``, sin sesión HTTP ni motor de descargas) por
+combinación y la reutiliza para todas las páginas de esa fuente.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from src.infrastructure.adapters.parsing import get_html_parser
+
+from src.domain.dto.article_dto import ArticleDTO
+from src.domain.dto.fetched_page import FetchedPage
+
+# (titulo, url, contenido, fecha_publicacion, fuente, categoria)
+ArticleRecord = Tuple[str, str, Optional[str], Optional[datetime], str, Optional[str]]
+
+# Instancias de parseo del proceso worker, por (clase, backend HTML, URL base)
+_parsers: Dict[Tuple[type, Optional[str], Optional[str]], object] = {}
+
+
+def to_record(article: ArticleDTO) -> ArticleRecord:
+    """Convierte un ArticleDTO en su tupla compacta."""
+    return (
+        article.titulo,
+        article.url,
+        article.contenido,
+        article.fecha_publicacion,
+        article.fuente,
+        article.categoria,
+    )
+
+
+def from_record(record: ArticleRecord) -> ArticleDTO:
+    """
+    Reconstruye el ArticleDTO de una tupla producida por ``to_record``.
+
+    Los datos ya se validaron en el worker, por lo que no se vuelven a validar.
+    """
+    titulo, url, contenido, fecha_publicacion, fuente, categoria = record
+    return ArticleDTO.model_construct(
+        titulo=titulo,
+        url=url,
+        contenido=contenido,
+        fecha_publicacion=fecha_publicacion,
+        fuente=fuente,
+        categoria=categoria,
+    )
+
+
+def parse_in_worker(
+    scraper_class: type,
+    url: str,
+    content: bytes,
+    encoding: Optional[str] = None,
+    html_parser: Optional[str] = None,
+    base_url: Optional[str] = None,
+) -> Optional[ArticleRecord]:
+    """
+    Parsea una página dentro de un proceso worker.
+
+    Args:
+        scraper_class: Clase del scraper (subclase de ``BaseNewsScraper``)
+        url: URL del artículo
+        content: HTML en bytes
+        encoding: Codificación informada por el servidor, si se conoce
+        html_parser: Nombre del backend de HTML del scraper ("lxml" o "bs4")
+        base_url: URL base del scraper, si se redirigió a otro servidor
+
+    Returns:
+        Optional[ArticleRecord]: Artículo como tupla o None si no pudo parsearse
+    """
+    key = (scraper_class, html_parser, base_url)
+    parser = _parsers.get(key)
+    if parser is None:
+        parser = _parsers[key] = scraper_class.for_parsing(
+            get_html_parser(html_parser), base_url
+        )
+    article = parser.parse_article(FetchedPage(url, content, encoding))
+    return to_record(article) if article is not None else None
+
+
+def create_parse_process_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Crea un pool de procesos para el parseo.
+
+    Los procesos se crean con ``spawn``: el proceso principal ya tiene hilos y
+    un event loop en marcha, que no deben copiarse con ``fork``.
+
+    Args:
+        workers: Cantidad de procesos. Por defecto, uno por núcleo
+
+    Returns:
+        ProcessPoolExecutor: Pool listo para ``IngestionPipeline``
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
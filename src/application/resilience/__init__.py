@@ -0,0 +1,13 @@
+from .circuit_breaker import (
+    CircuitBreakerConfig,
+    CircuitState,
+    CircuitStatus,
+    SourceCircuitBreaker,
+)
+
+__all__ = [
+    "CircuitBreakerConfig",
+    "CircuitState",
+    "CircuitStatus",
+    "SourceCircuitBreaker",
+]
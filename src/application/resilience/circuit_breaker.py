@@ -0,0 +1,204 @@
+"""
+Circuit breaker por fuente con estado persistido en ``scraping_jobs``.
+
+El estado no se guarda aparte: se deriva de los últimos jobs terminados de la
+fuente, por lo que sobrevive a reinicios y lo comparten todos los procesos
+(scheduler, workers, cron) que usan la misma base.
+
+- **Cerrado**: la fuente se scrapea normalmente.
+- **Abierto**: los últimos ``failure_threshold`` jobs fallaron, o fallaron al
+  menos ``failure_ratio`` de los últimos ``window_size`` (y también el último).
+  La fuente se omite sin crear jobs hasta que vence el enfriamiento, que se
+  duplica con cada fallo consecutivo de más (hasta ``max_cooldown``).
+- **Semiabierto**: venció el enfriamiento. Antes de scrapear se hace una única
+  petición barata a la portada; si falla se registra un job fallido (y el
+  enfriamiento vuelve a empezar, más largo), si responde se scrapea la fuente
+  y el resultado de ese job cierra o vuelve a abrir el circuito.
+
+Cuenta como fallo un job ``failed`` o un ``timed_out`` que no llegó a extraer
+ningún artículo.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import List, Optional
+
+from src.domain.entities.scraping_job import ScrapingJob
+from src.domain.repositories.scraping_job_repository import ScrapingJobRepository
+
+logger = logging.getLogger(__name__)
+
+# Estados de ScrapingJob que cierran una ejecución de la fuente
+FINISHED_STATUSES = ("completed", "timed_out", "failed")
+
+
+class CircuitState(Enum):
+    """Estado del circuito de una fuente."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """
+    Configuración del circuit breaker.
+
+    Attributes:
+        failure_threshold: Fallos consecutivos que abren el circuito
+        failure_ratio: Proporción de fallos en la ventana que abre el circuito
+        window_size: Jobs terminados que se consideran por fuente
+        min_jobs: Jobs terminados necesarios para evaluar ``failure_ratio``
+        cooldown: Enfriamiento tras abrirse el circuito (segundos)
+        max_cooldown: Enfriamiento máximo (segundos)
+    """
+
+    failure_threshold: int = 3
+    failure_ratio: float = 0.5
+    window_size: int = 10
+    min_jobs: int = 4
+    cooldown: float = 300
+    max_cooldown: float = 6 * 3600
+
+    def __post_init__(self):
+        if self.failure_threshold < 1:
+            raise ValueError("failure_threshold debe ser mayor o igual a 1")
+        if not 0 < self.failure_ratio <= 1:
+            raise ValueError("failure_ratio debe estar entre 0 (excluido) y 1")
+        if self.window_size < self.failure_threshold:
+            raise ValueError("window_size debe ser mayor o igual a failure_threshold")
+        if not 1 <= self.min_jobs <= self.window_size:
+            raise ValueError("min_jobs debe estar entre 1 y window_size")
+        if self.cooldown <= 0:
+            raise ValueError("cooldown debe ser mayor a 0")
+        if self.max_cooldown < self.cooldown:
+            raise ValueError("max_cooldown debe ser mayor o igual a cooldown")
+
+
+@dataclass(frozen=True)
+class CircuitStatus:
+    """
+    Estado del circuito de una fuente en un momento dado.
+
+    Attributes:
+        fuente: Nombre de la fuente
+        state: Estado del circuito
+        consecutive_failures: Fallos seguidos desde el último job exitoso
+        failure_ratio: Proporción de fallos entre los jobs de la ventana
+        retry_at: Fin del enfriamiento (None con el circuito cerrado)
+    """
+
+    fuente: str
+    state: CircuitState
+    consecutive_failures: int = 0
+    failure_ratio: float = 0.0
+    retry_at: Optional[datetime] = None
+
+
+def is_failure(job: ScrapingJob) -> bool:
+    """Indica si un job terminado cuenta como fallo para el circuito."""
+    return job.status == "failed" or (
+        job.status == "timed_out" and job.total_articulos == 0
+    )
+
+
+class SourceCircuitBreaker:
+    """
+    Evalúa el circuito de cada fuente con su historial de ``scraping_jobs``.
+
+    Cada consulta lee los últimos ``window_size`` jobs terminados de la
+    fuente; no guarda estado propio.
+    """
+
+    def __init__(
+        self,
+        scraping_job_repository: ScrapingJobRepository,
+        config: Optional[CircuitBreakerConfig] = None,
+    ):
+        self._scraping_job_repository = scraping_job_repository
+        self._config = config or CircuitBreakerConfig()
+
+    @property
+    def config(self) -> CircuitBreakerConfig:
+        return self._config
+
+    async def status(
+        self, fuente: str, now: Optional[datetime] = None
+    ) -> CircuitStatus:
+        """
+        Calcula el estado del circuito de una fuente.
+
+        Args:
+            fuente: Nombre de la fuente
+            now: Momento de referencia (por defecto, ahora)
+
+        Returns:
+            CircuitStatus: Estado del circuito
+        """
+        # Los jobs omitidos, pendientes o en curso no ocupan lugar en la ventana
+        page = await self._scraping_job_repository.get_page(
+            limit=self._config.window_size,
+            fuente=fuente,
+            statuses=FINISHED_STATUSES,
+        )
+        return self.evaluate(fuente, page.items, now)
+
+    def evaluate(
+        self,
+        fuente: str,
+        jobs: List[ScrapingJob],
+        now: Optional[datetime] = None,
+    ) -> CircuitStatus:
+        """
+        Calcula el estado del circuito a partir de jobs terminados.
+
+        Args:
+            fuente: Nombre de la fuente
+            jobs: Jobs terminados de la fuente, del más nuevo al más antiguo
+            now: Momento de referencia (por defecto, ahora)
+
+        Returns:
+            CircuitStatus: Estado del circuito
+        """
+        config = self._config
+        now = now or datetime.now(timezone.utc)
+        if not jobs:
+            return CircuitStatus(fuente=fuente, state=CircuitState.CLOSED)
+
+        consecutive_failures = 0
+        for job in jobs:
+            if not is_failure(job):
+                break
+            consecutive_failures += 1
+        failure_ratio = sum(is_failure(job) for job in jobs) / len(jobs)
+
+        tripped = consecutive_failures >= config.failure_threshold or (
+            consecutive_failures > 0
+            and len(jobs) >= config.min_jobs
+            and failure_ratio >= config.failure_ratio
+        )
+        if not tripped:
+            return CircuitStatus(
+                fuente=fuente,
+                state=CircuitState.CLOSED,
+                consecutive_failures=consecutive_failures,
+                failure_ratio=failure_ratio,
+            )
+
+        # Cada fallo seguido por encima del umbral duplica el enfriamiento
+        extra_failures = max(consecutive_failures - config.failure_threshold, 0)
+        cooldown = min(config.cooldown * 2**extra_failures, config.max_cooldown)
+        last_job = jobs[0]
+        retry_at = (last_job.fecha_fin or last_job.fecha_inicio) + timedelta(
+            seconds=cooldown
+        )
+        return CircuitStatus(
+            fuente=fuente,
+            state=CircuitState.OPEN if now < retry_at else CircuitState.HALF_OPEN,
+            consecutive_failures=consecutive_failures,
+            failure_ratio=failure_ratio,
+            retry_at=retry_at,
+        )
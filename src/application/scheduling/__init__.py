@@ -0,0 +1,7 @@
+from .adaptive_scheduler import AdaptiveScheduler, SchedulerConfig, SourceSchedule
+
+__all__ = [
+    "AdaptiveScheduler",
+    "SchedulerConfig",
+    "SourceSchedule",
+]
@@ -0,0 +1,305 @@
+"""
+Scheduler adaptativo: un intervalo de scraping propio para cada fuente.
+
+Después de cada ejecución el intervalo de la fuente se recalcula con la tasa
+de artículos nuevos observada (``articulos_nuevos`` de ScrapingJob entre una
+ejecución y la anterior):
+
+    intervalo = target_new_articles / tasa      (acotado a [min, max])
+
+Una fuente que publica mucho se consulta más seguido; si una ejecución solo
+trae duplicados, el intervalo se multiplica por ``backoff_factor``. Al
+arrancar, los intervalos se reconstruyen con el historial de ``scraping_jobs``,
+de modo que reiniciar el proceso no pierde lo aprendido.
+
+El scheduler es un proceso de larga vida: el cliente HTTP compartido, la caché
+HTTP y el executor de parseo del coordinador se reutilizan en cada ejecución.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from src.application.use_cases.scrape_all_sources import ScrapeAllSourcesUseCase
+from src.domain.repositories.scraping_job_repository import ScrapingJobRepository
+from src.domain.repositories.source_repository import SourceRepository
+
+logger = logging.getLogger(__name__)
+
+# Estados de job cuyas ejecuciones alimentan la tasa de artículos nuevos. Un job
+# cortado por su plazo también informa los artículos que guardó.
+REPLAYED_STATUSES = ("completed", "timed_out")
+
+
+@dataclass(frozen=True)
+class SchedulerConfig:
+    """
+    Configuración del scheduler adaptativo.
+
+    Attributes:
+        min_interval: Intervalo mínimo entre ejecuciones de una fuente (segundos)
+        max_interval: Intervalo máximo entre ejecuciones de una fuente (segundos)
+        initial_interval: Intervalo de una fuente sin historial (segundos)
+        target_new_articles: Artículos nuevos que se busca encontrar por
+            ejecución; define el intervalo a partir de la tasa observada
+        backoff_factor: Factor que multiplica el intervalo cuando una
+            ejecución no trae artículos nuevos
+        smoothing: Peso de la última tasa observada en el promedio móvil
+            exponencial (1 = solo la última ejecución)
+        history_size: Jobs completados o cortados por plazo que se leen por
+            fuente al arrancar
+        max_sleep: Espera máxima entre revisiones; acota cuánto tarda en
+            detectarse una fuente activada o desactivada
+    """
+
+    min_interval: float = 300
+    max_interval: float = 6 * 3600
+    initial_interval: float = 1800
+    target_new_articles: int = 10
+    backoff_factor: float = 2.0
+    smoothing: float = 0.5
+    history_size: int = 10
+    max_sleep: float = 60
+
+    def __post_init__(self):
+        if self.min_interval <= 0:
+            raise ValueError("min_interval debe ser mayor a 0")
+        if not self.min_interval <= self.initial_interval <= self.max_interval:
+            raise ValueError(
+                "initial_interval debe estar entre min_interval y max_interval"
+            )
+        if self.target_new_articles < 1:
+            raise ValueError("target_new_articles debe ser mayor o igual a 1")
+        if self.backoff_factor < 1:
+            raise ValueError("backoff_factor debe ser mayor o igual a 1")
+        if not 0 < self.smoothing <= 1:
+            raise ValueError("smoothing debe estar entre 0 (excluido) y 1")
+        if self.history_size < 1:
+            raise ValueError("history_size debe ser mayor o igual a 1")
+        if self.max_sleep <= 0:
+            raise ValueError("max_sleep debe ser mayor a 0")
+
+
+@dataclass
+class SourceSchedule:
+    """
+    Estado de planificación de una fuente.
+
+    Attributes:
+        fuente: Nombre de la fuente
+        interval: Intervalo actual entre ejecuciones (segundos)
+        next_run: Próxima ejecución
+        last_run: Inicio de la última ejecución completada
+        rate: Artículos nuevos por segundo (promedio móvil exponencial)
+    """
+
+    fuente: str
+    interval: float
+    next_run: datetime
+    last_run: Optional[datetime] = None
+    rate: Optional[float] = None
+
+    def record_run(
+        self, started_at: datetime, new_articles: int, config: SchedulerConfig
+    ) -> None:
+        """
+        Ajusta el intervalo con el resultado de una ejecución completada.
+
+        Args:
+            started_at: Inicio de la ejecución
+            new_articles: Artículos nuevos que encontró
+            config: Configuración del scheduler
+        """
+        if self.last_run is not None and started_at > self.last_run:
+            elapsed = (started_at - self.last_run).total_seconds()
+            observed = new_articles / elapsed
+            if self.rate is None:
+                self.rate = observed
+            else:
+                self.rate = (
+                    config.smoothing * observed + (1 - config.smoothing) * self.rate
+                )
+
+        if new_articles == 0:
+            interval = self.interval * config.backoff_factor
+        elif self.rate:
+            interval = config.target_new_articles / self.rate
+        else:
+            interval = self.interval
+
+        self.interval = min(max(interval, config.min_interval), config.max_interval)
+        self.last_run = started_at
+        self.next_run = started_at + timedelta(seconds=self.interval)
+
+    def record_failure(self, started_at: datetime) -> None:
+        """Reprograma la fuente tras una ejecución fallida, sin tocar el intervalo."""
+        self.next_run = started_at + timedelta(seconds=self.interval)
+
+
+class AdaptiveScheduler:
+    """
+    Proceso de larga vida que ejecuta cada fuente activa según su intervalo.
+
+    Cada fuente vencida se ejecuta como una tarea propia con
+    ``ScrapeAllSourcesUseCase.execute(sources=[fuente])``: una fuente lenta no
+    demora a las demás y una fuente nunca tiene dos ejecuciones en vuelo.
+    """
+
+    def __init__(
+        self,
+        coordinator: ScrapeAllSourcesUseCase,
+        source_repository: SourceRepository,
+        scraping_job_repository: ScrapingJobRepository,
+        config: Optional[SchedulerConfig] = None,
+    ):
+        self._coordinator = coordinator
+        self._source_repository = source_repository
+        self._scraping_job_repository = scraping_job_repository
+        self._config = config or SchedulerConfig()
+        self._schedules: Dict[str, SourceSchedule] = {}
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def schedules(self) -> Dict[str, SourceSchedule]:
+        """Planificación actual por nombre de fuente."""
+        return self._schedules
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """
+        Ejecuta el scheduler hasta que se active ``stop_event``.
+
+        Al detenerse espera a que terminen las ejecuciones en curso.
+
+        Args:
+            stop_event: Evento que detiene el scheduler; sin él corre para
+                siempre (hasta que se cancele la tarea)
+        """
+        stop_event = stop_event or asyncio.Event()
+        logger.info("Scheduler adaptativo iniciado")
+
+        try:
+            while not stop_event.is_set():
+                sleep_seconds = await self.tick()
+                stop_wait = asyncio.ensure_future(stop_event.wait())
+                try:
+                    await asyncio.wait(
+                        [stop_wait, *self._in_flight.values()],
+                        timeout=sleep_seconds,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                finally:
+                    stop_wait.cancel()
+        finally:
+            if self._in_flight:
+                logger.info(f"Esperando {len(self._in_flight)} ejecuciones en curso...")
+                await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+            logger.info("Scheduler adaptativo detenido")
+
+    async def tick(self) -> float:
+        """
+        Lanza las fuentes vencidas que no están en ejecución.
+
+        Returns:
+            float: Segundos hasta la próxima fuente vencida (como máximo
+                ``max_sleep``)
+        """
+        self._in_flight = {
+            fuente: task for fuente, task in self._in_flight.items() if not task.done()
+        }
+
+        active_sources = await self._source_repository.get_active_sources()
+        active_names = {source.nombre for source in active_sources}
+        for fuente in set(self._schedules) - active_names:
+            del self._schedules[fuente]
+
+        now = datetime.now(timezone.utc)
+        for source in active_sources:
+            schedule = self._schedules.get(source.nombre)
+            if schedule is None:
+                schedule = await self._load_schedule(source.nombre, now)
+                self._schedules[source.nombre] = schedule
+            if source.nombre in self._in_flight or schedule.next_run > now:
+                continue
+            self._in_flight[source.nombre] = asyncio.create_task(
+                self._run_source(source, schedule)
+            )
+
+        waiting = [
+            (schedule.next_run - now).total_seconds()
+            for fuente, schedule in self._schedules.items()
+            if fuente not in self._in_flight
+        ]
+        return max(min([self._config.max_sleep, *waiting]), 0)
+
+    async def _load_schedule(self, fuente: str, now: datetime) -> SourceSchedule:
+        """
+        Reconstruye la planificación de una fuente con su historial de jobs.
+
+        Los jobs completados o cortados por plazo (``REPLAYED_STATUSES``) se
+        reproducen del más antiguo al más nuevo, como si el scheduler los
+        hubiera ejecutado.
+
+        Args:
+            fuente: Nombre de la fuente
+            now: Momento actual (próxima ejecución si no hay historial)
+
+        Returns:
+            SourceSchedule: Planificación de la fuente
+        """
+        schedule = SourceSchedule(
+            fuente=fuente, interval=self._config.initial_interval, next_run=now
+        )
+        page = await self._scraping_job_repository.get_page(
+            limit=self._config.history_size,
+            fuente=fuente,
+            statuses=REPLAYED_STATUSES,
+        )
+        for job in reversed(page.items):
+            schedule.record_run(job.fecha_inicio, job.articulos_nuevos, self._config)
+
+        logger.info(
+            f"{fuente}: intervalo {schedule.interval:.0f}s según "
+            f"{len(page.items)} jobs, próxima ejecución {schedule.next_run:%H:%M:%S}"
+        )
+        return schedule
+
+    async def _run_source(self, source, schedule: SourceSchedule) -> List[Dict]:
+        """
+        Ejecuta una fuente y reprograma su próxima ejecución.
+
+        Args:
+            source: Entidad Source a ejecutar
+            schedule: Planificación de la fuente
+
+        Returns:
+            List[Dict]: Detalle de los jobs ejecutados
+        """
+        started_at = datetime.now(timezone.utc)
+        try:
+            result = await self._coordinator.execute(sources=[source])
+        except Exception as e:
+            logger.error(f"Error ejecutando {source.nombre}: {e}", exc_info=True)
+            schedule.record_failure(started_at)
+            return []
+
+        jobs_details = result["jobs_details"]
+        completed = [d for d in jobs_details if d["status"] in REPLAYED_STATUSES]
+        if completed:
+            new_articles = sum(d["articles_persisted"] for d in completed)
+            schedule.record_run(started_at, new_articles, self._config)
+        else:
+            schedule.record_failure(started_at)
+
+        logger.info(
+            f"{source.nombre}: próximo intervalo {schedule.interval:.0f}s "
+            f"(tasa {self._format_rate(schedule.rate)})"
+        )
+        return jobs_details
+
+    @staticmethod
+    def _format_rate(rate: Optional[float]) -> str:
+        if rate is None:
+            return "desconocida"
+        return f"{rate * 3600:.1f} artículos/hora"
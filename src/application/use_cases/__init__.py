@@ -10,6 +10,7 @@ from src.application.use_cases.scrape_and_persist_articles import (
     ScrapeAndPersistArticlesUseCase,
 )
 from src.application.use_cases.scrape_all_sources import ScrapeAllSourcesUseCase
+from src.application.use_cases.search_articles import SearchArticlesUseCase
 from src.application.use_cases.update_user import UpdateUserUseCase
 
 __all__ = [
@@ -20,6 +21,7 @@ __all__ = [
     "DeleteUserUseCase",
     "CreateArticleUseCase",
     "ListArticlesUseCase",
+    "SearchArticlesUseCase",
     "RegisterSourceUseCase",
     "ScrapeNewsUseCase",
     "ScrapeAndPersistArticlesUseCase",
@@ -12,8 +12,8 @@ class CreateArticleUseCase:
         self._article_repository = article_repository
 
     async def execute(self, dto: CreateNewsArticleDTO) -> NewsArticleDTO:
-        existing_article = await self._article_repository.get_by_url(dto.url)
-        if existing_article:
+        existing_urls = await self._article_repository.get_existing_urls([dto.url])
+        if dto.url in existing_urls:
             raise ValueError(f"Article with URL {dto.url} already exists")
 
         article = NewsArticle.create(
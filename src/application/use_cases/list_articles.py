@@ -1,8 +1,13 @@
-from typing import List
+from typing import List, Optional
 
-from src.application.dto.news_article_dto import NewsArticleDTO
-from src.domain.entities.news_article import NewsArticle
+from src.application.dto.news_article_dto import (
+    NewsArticleDTO,
+    NewsArticlePageDTO,
+    NewsArticleSummaryDTO,
+)
+from src.domain.entities.news_article import NewsArticle, NewsArticleSummary
 from src.domain.repositories.news_article_repository import NewsArticleRepository
+from src.domain.value_objects.pagination import PageCursor
 
 
 class ListArticlesUseCase:
@@ -14,6 +19,58 @@ class ListArticlesUseCase:
         articles = await self._article_repository.get_all(skip=skip, limit=limit)
         return [self._to_dto(article) for article in articles]
 
+    async def execute_summaries(
+        self, skip: int = 0, limit: int = 100
+    ) -> List[NewsArticleSummaryDTO]:
+        """
+        Lista artículos en modo resumido: extracto en lugar del contenido completo.
+        """
+        summaries = await self._article_repository.get_summaries(skip=skip, limit=limit)
+        return [self._to_summary_dto(summary) for summary in summaries]
+
+    async def execute_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fuente: Optional[str] = None,
+        categoria: Optional[str] = None,
+        summary: bool = False,
+    ) -> NewsArticlePageDTO:
+        """
+        Lista artículos con paginación por cursor (keyset).
+
+        Args:
+            limit: Tamaño máximo de la página
+            cursor: Token opaco devuelto por la página anterior (None para la primera)
+            fuente: Filtrar por fuente
+            categoria: Filtrar por categoría
+            summary: Devolver NewsArticleSummaryDTO sin leer el contenido completo
+
+        Returns:
+            NewsArticlePageDTO: Artículos de la página y token de la siguiente
+
+        Raises:
+            ValueError: Si el cursor no es válido
+        """
+        if summary:
+            get_page, to_dto = (
+                self._article_repository.get_summary_page,
+                self._to_summary_dto,
+            )
+        else:
+            get_page, to_dto = self._article_repository.get_page, self._to_dto
+
+        page = await get_page(
+            limit=limit,
+            cursor=PageCursor.decode(cursor) if cursor else None,
+            fuente=fuente,
+            categoria=categoria,
+        )
+        return NewsArticlePageDTO(
+            items=[to_dto(item) for item in page.items],
+            next_cursor=page.next_cursor.encode() if page.next_cursor else None,
+        )
+
     @staticmethod
     def _to_dto(article: NewsArticle) -> NewsArticleDTO:
         return NewsArticleDTO(
@@ -28,3 +85,15 @@ class ListArticlesUseCase:
             created_at=article.created_at,
             updated_at=article.updated_at,
         )
+
+    @staticmethod
+    def _to_summary_dto(summary: NewsArticleSummary) -> NewsArticleSummaryDTO:
+        return NewsArticleSummaryDTO(
+            id=summary.id,
+            titulo=summary.titulo,
+            fuente=summary.fuente,
+            fecha_publicacion=summary.fecha_publicacion,
+            url=summary.url,
+            categoria=summary.categoria,
+            extracto=summary.extracto,
+        )
@@ -1,11 +1,31 @@
+import asyncio
+import contextlib
+import inspect
 import logging
-from typing import Dict, List, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
+from src.application.pipeline import (
+    IngestionPipeline,
+    PipelineConfig,
+    create_parse_process_pool,
+)
+from src.application.resilience import (
+    CircuitBreakerConfig,
+    CircuitState,
+    CircuitStatus,
+    SourceCircuitBreaker,
+)
 from src.domain.entities.scraping_job import ScrapingJob
+from src.domain.enums import NewsSource
+from src.domain.repositories.crawl_frontier_repository import (
+    CrawlFrontierRepository,
+)
 from src.domain.repositories.news_article_repository import NewsArticleRepository
 from src.domain.repositories.scraping_job_repository import ScrapingJobRepository
 from src.domain.repositories.source_repository import SourceRepository
 from src.domain.ports.scraper_port import ScraperPort
+from src.infrastructure.adapters.http import HttpCache, get_shared_http_client
 from src.infrastructure.adapters.scrapers import (
     ClarinScraper,
     Pagina12Scraper,
@@ -26,34 +46,146 @@ class ScrapeAllSourcesUseCase:
     4. Persiste los artículos extraídos
     5. Genera estadísticas consolidadas del proceso
 
+    En modo concurrente (por defecto) cada fuente se procesa como una tarea
+    independiente y los scrapers bloqueantes se ejecutan en un pool de hilos
+    acotado, de modo que la duración total se aproxima a la de la fuente más
+    lenta en lugar de la suma de todas. Con ``concurrent=False`` las fuentes
+    se procesan una a una, como en la versión original.
+
+    Los scrapers que exponen sus etapas (PipelineScraperPort) se ejecutan como
+    un pipeline productor/consumidor (``IngestionPipeline``): descargas, parseo,
+    deduplicación y escritura en lotes corren en paralelo, conectadas por colas
+    acotadas. Los que solo ofrecen ``astream()`` (StreamingScraperPort) se
+    consumen en streaming: los artículos se persisten en micro-lotes de
+    ``persist_batch_size`` a medida que llegan, sin esperar al último artículo
+    de la fuente.
+
+    Con ``PipelineConfig(parse_processes=N)`` el parseo de todas las fuentes
+    se reparte en un único pool de N procesos creado para la ejecución, o en
+    el ``parse_executor`` recibido si el llamador mantiene uno entre
+    ejecuciones.
+
+    Todos los scrapers usan el cliente HTTP compartido del proceso
+    (``get_shared_http_client``), por lo que las conexiones keep-alive se
+    reutilizan entre fuentes y entre ejecuciones. La caché HTTP condicional es
+    opcional: la inyectan los puntos de entrada de larga vida (scheduler,
+    workers) con ``http_cache=get_shared_http_cache()``, de modo que crear el
+    coordinador (tests, API) no escribe en disco.
+
+    Con un ``frontier_repository`` los scrapers recuerdan las URLs descubiertas
+    entre ejecuciones y cortan el descubrimiento tras ``known_streak_limit``
+    URLs conocidas seguidas, en lugar de pedir siempre la misma cantidad de
+    artículos: un día con muchas noticias se cubre completo (hasta
+    ``MAX_ARTICLES_WITH_FRONTIER``) y uno tranquilo casi no descarga nada.
+
+    Para repartir el trabajo entre varios procesos o nodos, ``enqueue_sources``
+    encola un job pendiente por fuente en la tabla ScrapingJob y cada worker
+    los toma con ``run_worker``: un job nunca lo procesan dos workers a la vez
+    y los de un worker caído se reclaman al vencer su lease.
+
+    Con ``circuit_breaker`` cada fuente tiene un circuito que se abre tras
+    varios jobs fallidos seguidos o una proporción alta de fallos en
+    ``scraping_jobs``. Mientras está abierto la fuente se omite sin crear jobs
+    ni abrir conexiones; al vencer el enfriamiento una única petición a la
+    portada decide si se vuelve a scrapear (ver ``SourceCircuitBreaker``).
+
     El coordinador es extensible para integrarse con sistemas de programación
     como cron, APScheduler, Celery, etc.
     """
 
+    # Cupo fijo por fuente sin frontera
+    MAX_ARTICLES = 15
+    # Tope de seguridad por fuente con frontera: el corte real es la racha
+    MAX_ARTICLES_WITH_FRONTIER = 200
+
     def __init__(
         self,
         source_repository: SourceRepository,
         scraping_job_repository: ScrapingJobRepository,
         article_repository: NewsArticleRepository,
+        concurrent: bool = True,
+        max_concurrent_sources: int = 4,
+        persist_batch_size: int = 10,
+        pipeline_config: Optional[PipelineConfig] = None,
+        parse_executor: Optional[Executor] = None,
+        frontier_repository: Optional[CrawlFrontierRepository] = None,
+        known_streak_limit: int = 10,
+        source_timeout: Optional[float] = None,
+        run_timeout: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        http_cache: Optional[HttpCache] = None,
     ):
+        if max_concurrent_sources < 1:
+            raise ValueError("max_concurrent_sources debe ser mayor o igual a 1")
+        if persist_batch_size < 1:
+            raise ValueError("persist_batch_size debe ser mayor o igual a 1")
+        for name, timeout in (
+            ("source_timeout", source_timeout),
+            ("run_timeout", run_timeout),
+        ):
+            if timeout is not None and timeout <= 0:
+                raise ValueError(f"{name} debe ser mayor a 0")
+
         self._source_repository = source_repository
         self._scraping_job_repository = scraping_job_repository
         self._article_repository = article_repository
+        self._concurrent = concurrent
+        self._max_concurrent_sources = max_concurrent_sources
+        self._persist_batch_size = persist_batch_size
+        self._pipeline_config = pipeline_config or PipelineConfig(
+            batch_size=persist_batch_size
+        )
+        self._parse_executor = parse_executor
+        self._source_timeout = source_timeout
+        self._run_timeout = run_timeout
+        self._circuit_breaker = (
+            SourceCircuitBreaker(scraping_job_repository, circuit_breaker)
+            if circuit_breaker is not None
+            else None
+        )
+        scraper_options = {
+            "max_articles": self.MAX_ARTICLES,
+            "known_urls_checker": self._article_repository.get_existing_urls,
+            "http_cache": http_cache,
+            "http_client": get_shared_http_client(),
+        }
+        if frontier_repository is not None:
+            scraper_options.update(
+                max_articles=self.MAX_ARTICLES_WITH_FRONTIER,
+                frontier=frontier_repository,
+                known_streak_limit=known_streak_limit,
+            )
         self._scraper_factory = {
-            "Clarín": lambda: ClarinScraper(max_articles=15),
-            "Página12": lambda: Pagina12Scraper(max_articles=15),
-            "La Nación": lambda: LaNacionScraper(max_articles=15),
+            "Clarín": lambda: ClarinScraper(
+                discovery_strategy=NewsSource.CLARIN.discovery_strategy,
+                **scraper_options,
+            ),
+            "Página12": lambda: Pagina12Scraper(
+                discovery_strategy=NewsSource.PAGINA12.discovery_strategy,
+                **scraper_options,
+            ),
+            "La Nación": lambda: LaNacionScraper(
+                discovery_strategy=NewsSource.LA_NACION.discovery_strategy,
+                **scraper_options,
+            ),
         }
 
-    async def execute(self) -> Dict:
+    async def execute(self, sources: Optional[List] = None) -> Dict:
         """
         Ejecuta el scraping de todas las fuentes activas.
 
+        Args:
+            sources: Fuentes a procesar. Por defecto, todas las fuentes activas
+                del repositorio (el scheduler pasa solo las que tocan)
+
         Returns:
             Dict: Estadísticas consolidadas del proceso:
                 - total_sources: Total de fuentes procesadas
                 - total_jobs_completed: Jobs completados exitosamente
                 - total_jobs_failed: Jobs fallidos
+                - total_jobs_timed_out: Jobs cortados por plazo (con los
+                  artículos extraídos hasta entonces ya guardados)
+                - total_jobs_skipped: Fuentes omitidas con el circuito abierto
                 - total_articles_scraped: Total de artículos scrapeados
                 - total_articles_persisted: Total de artículos nuevos guardados
                 - jobs_details: Lista de detalles por cada job ejecutado
@@ -64,8 +196,11 @@ class ScrapeAllSourcesUseCase:
 
         try:
             # Fase 1: Obtener fuentes activas
-            logger.info("Fase 1: Consultando fuentes activas")
-            active_sources = await self._source_repository.get_active_sources()
+            if sources is None:
+                logger.info("Fase 1: Consultando fuentes activas")
+                active_sources = await self._source_repository.get_active_sources()
+            else:
+                active_sources = list(sources)
             total_sources = len(active_sources)
 
             logger.info(f"Fuentes activas encontradas: {total_sources}")
@@ -81,22 +216,27 @@ class ScrapeAllSourcesUseCase:
             logger.info("Fase 2: Ejecutando scraping por fuente")
             logger.info("=" * 80)
 
-            jobs_details = []
+            jobs_details = await self._process_sources(active_sources)
             total_jobs_completed = 0
             total_jobs_failed = 0
+            total_jobs_timed_out = 0
+            total_jobs_skipped = 0
             total_articles_scraped = 0
             total_articles_persisted = 0
 
-            for source in active_sources:
-                job_detail = await self._process_source(source)
-                jobs_details.append(job_detail)
-
-                if job_detail["status"] == "completed":
-                    total_jobs_completed += 1
-                    total_articles_scraped += job_detail["articles_scraped"]
-                    total_articles_persisted += job_detail["articles_persisted"]
-                else:
+            for job_detail in jobs_details:
+                if job_detail["status"] == "failed":
                     total_jobs_failed += 1
+                    continue
+                if job_detail["status"] == "skipped":
+                    total_jobs_skipped += 1
+                    continue
+                if job_detail["status"] == "timed_out":
+                    total_jobs_timed_out += 1
+                else:
+                    total_jobs_completed += 1
+                total_articles_scraped += job_detail["articles_scraped"]
+                total_articles_persisted += job_detail["articles_persisted"]
 
             # Fase 3: Resumen final
             logger.info("=" * 80)
@@ -105,6 +245,8 @@ class ScrapeAllSourcesUseCase:
             logger.info(f"Total de fuentes procesadas: {total_sources}")
             logger.info(f"Jobs completados: {total_jobs_completed}")
             logger.info(f"Jobs fallidos: {total_jobs_failed}")
+            logger.info(f"Jobs cortados por plazo: {total_jobs_timed_out}")
+            logger.info(f"Fuentes omitidas (circuito abierto): {total_jobs_skipped}")
             logger.info(f"Total artículos scrapeados: {total_articles_scraped}")
             logger.info(f"Total artículos nuevos guardados: {total_articles_persisted}")
             logger.info("=" * 80)
@@ -113,6 +255,8 @@ class ScrapeAllSourcesUseCase:
                 "total_sources": total_sources,
                 "total_jobs_completed": total_jobs_completed,
                 "total_jobs_failed": total_jobs_failed,
+                "total_jobs_timed_out": total_jobs_timed_out,
+                "total_jobs_skipped": total_jobs_skipped,
                 "total_articles_scraped": total_articles_scraped,
                 "total_articles_persisted": total_articles_persisted,
                 "jobs_details": jobs_details,
@@ -124,12 +268,216 @@ class ScrapeAllSourcesUseCase:
             )
             raise
 
-    async def _process_source(self, source) -> Dict:
+    async def enqueue_sources(self) -> List[ScrapingJob]:
+        """
+        Encola un job pendiente por cada fuente activa.
+
+        Las fuentes que ya tienen un job pendiente o tomado por un worker no se
+        vuelven a encolar, por lo que un cron que se dispara antes de que
+        termine la ronda anterior no duplica trabajo. Tampoco se encolan las
+        fuentes con el circuito abierto.
+
+        Returns:
+            List[ScrapingJob]: Jobs encolados
+        """
+        active_sources = await self._source_repository.get_active_sources()
+        queued_jobs = []
+        for source in active_sources:
+            if self._circuit_breaker is not None:
+                circuit = await self._circuit_status(source.nombre)
+                if circuit.state is CircuitState.OPEN:
+                    logger.info(self._circuit_message(circuit) + ", no se encola")
+                    continue
+            scraping_job = await self._scraping_job_repository.enqueue(
+                ScrapingJob.create(fuente=source.nombre)
+            )
+            if scraping_job is None:
+                logger.info(f"{source.nombre} ya tiene un job abierto, no se encola")
+                continue
+            queued_jobs.append(scraping_job)
+
+        logger.info(f"Jobs encolados: {len(queued_jobs)} de {len(active_sources)}")
+        return queued_jobs
+
+    async def run_worker(
+        self,
+        worker_id: str,
+        lease_seconds: float = 300,
+        max_jobs: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+    ) -> Dict:
+        """
+        Procesa jobs de la cola hasta vaciarla.
+
+        Varios workers (procesos o nodos) pueden drenar la misma cola en
+        paralelo: cada job lo toma un único worker (``claim_next``) con un
+        lease que se renueva mientras corre. Si el worker muere, el lease vence
+        y otro worker reclama el job.
+
+        Args:
+            worker_id: Identificador único del worker (por ejemplo host y PID)
+            lease_seconds: Duración del lease de cada job
+            max_jobs: Cantidad máxima de jobs a procesar; None para no limitar
+            poll_interval: Si se indica, con la cola vacía el worker espera
+                esos segundos y vuelve a consultar en lugar de terminar
+
+        Returns:
+            Dict: Estadísticas del worker:
+                - worker_id: Identificador del worker
+                - total_jobs_completed: Jobs completados exitosamente
+                - total_jobs_failed: Jobs fallidos
+                - total_jobs_timed_out: Jobs cortados por ``source_timeout``
+                - total_jobs_lost: Jobs cuyo lease se perdió
+                - total_jobs_skipped: Jobs omitidos con el circuito abierto
+                - total_articles_scraped: Total de artículos scrapeados
+                - total_articles_persisted: Total de artículos nuevos guardados
+                - jobs_details: Lista de detalles por cada job ejecutado
+        """
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds debe ser mayor a 0")
+
+        logger.info(f"Worker {worker_id} iniciado (lease de {lease_seconds}s)")
+        jobs_details = []
+
+        with self._open_parse_executor() as parse_executor, ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="scraper"
+        ) as executor:
+            while max_jobs is None or len(jobs_details) < max_jobs:
+                scraping_job = await self._scraping_job_repository.claim_next(
+                    worker_id, lease_seconds
+                )
+                if scraping_job is None:
+                    if poll_interval is None:
+                        break
+                    await asyncio.sleep(poll_interval)
+                    continue
+
+                logger.info(
+                    f"Worker {worker_id} tomó {scraping_job.fuente} "
+                    f"(job {scraping_job.id})"
+                )
+                jobs_details.append(
+                    await self._run_claimed_job(
+                        scraping_job,
+                        worker_id,
+                        lease_seconds,
+                        executor,
+                        parse_executor,
+                    )
+                )
+
+        completed = [
+            d for d in jobs_details if d["status"] in ("completed", "timed_out")
+        ]
+        result = {
+            "worker_id": worker_id,
+            "total_jobs_completed": sum(
+                d["status"] == "completed" for d in jobs_details
+            ),
+            "total_jobs_failed": sum(d["status"] == "failed" for d in jobs_details),
+            "total_jobs_timed_out": sum(
+                d["status"] == "timed_out" for d in jobs_details
+            ),
+            "total_jobs_lost": sum(d["status"] == "lost" for d in jobs_details),
+            "total_jobs_skipped": sum(d["status"] == "skipped" for d in jobs_details),
+            "total_articles_scraped": sum(d["articles_scraped"] for d in completed),
+            "total_articles_persisted": sum(d["articles_persisted"] for d in completed),
+            "jobs_details": jobs_details,
+        }
+        logger.info(
+            f"Worker {worker_id} finalizado: {result['total_jobs_completed']} "
+            f"completados, {result['total_jobs_failed']} fallidos, "
+            f"{result['total_jobs_lost']} perdidos"
+        )
+        return result
+
+    async def _process_sources(self, sources: List) -> List[Dict]:
+        """
+        Procesa las fuentes de forma secuencial o concurrente según la configuración.
+
+        En modo concurrente cada fuente corre como una tarea propia, con un
+        máximo de ``max_concurrent_sources`` fuentes en vuelo. Los detalles se
+        devuelven en el mismo orden que las fuentes recibidas.
+
+        Con ``run_timeout`` todas las fuentes comparten un plazo común: las que
+        siguen en curso al vencer se cortan y las que aún no empezaron quedan
+        registradas como ``timed_out`` sin artículos.
+
+        Args:
+            sources: Lista de entidades Source a procesar
+
+        Returns:
+            List[Dict]: Detalle de cada job ejecutado
+        """
+        run_deadline = None
+        if self._run_timeout is not None:
+            run_deadline = asyncio.get_running_loop().time() + self._run_timeout
+
+        with self._open_parse_executor() as parse_executor:
+            if not self._concurrent:
+                return [
+                    await self._process_source(
+                        source, parse_executor=parse_executor, run_deadline=run_deadline
+                    )
+                    for source in sources
+                ]
+
+            logger.info(
+                f"Modo concurrente: hasta {self._max_concurrent_sources} "
+                f"fuentes en paralelo"
+            )
+            semaphore = asyncio.Semaphore(self._max_concurrent_sources)
+
+            executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrent_sources,
+                thread_name_prefix="scraper",
+            )
+
+            async def run(source) -> Dict:
+                async with semaphore:
+                    return await self._process_source(
+                        source, executor, parse_executor, run_deadline
+                    )
+
+            try:
+                return list(await asyncio.gather(*(run(source) for source in sources)))
+            finally:
+                # Un scraper bloqueante cortado por plazo sigue corriendo en su
+                # hilo: no se lo espera para no estirar la ejecución
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _open_parse_executor(self) -> contextlib.AbstractContextManager:
+        """
+        Executor de parseo compartido por todas las fuentes de la ejecución.
+
+        Returns:
+            AbstractContextManager: Entrega el ``parse_executor`` recibido, un
+                pool de procesos que se cierra al terminar la ejecución si se
+                configuró ``parse_processes``, o None (cada pipeline usa hilos)
+        """
+        if self._parse_executor is not None:
+            return contextlib.nullcontext(self._parse_executor)
+        if self._pipeline_config.parse_processes:
+            logger.info(f"Parseo en {self._pipeline_config.parse_processes} procesos")
+            return create_parse_process_pool(self._pipeline_config.parse_processes)
+        return contextlib.nullcontext()
+
+    async def _process_source(
+        self,
+        source,
+        executor: Optional[ThreadPoolExecutor] = None,
+        parse_executor: Optional[Executor] = None,
+        run_deadline: Optional[float] = None,
+    ) -> Dict:
         """
         Procesa una fuente individual: scrapea, persiste y registra el job.
 
         Args:
             source: Entidad Source a procesar
+            executor: Pool de hilos donde ejecutar el scraper bloqueante. Si es
+                None se usa el executor por defecto del event loop.
+            parse_executor: Executor de parseo para el pipeline de ingesta
+            run_deadline: Plazo de toda la ejecución (``loop.time()``), si hay
 
         Returns:
             Dict: Detalle del job ejecutado con estadísticas
@@ -139,56 +487,466 @@ class ScrapeAllSourcesUseCase:
         logger.info(f"Procesando fuente: {source_name}")
         logger.info(f"{'='*80}")
 
+        blocked, scraper = await self._check_circuit(source_name)
+        if blocked is not None and blocked.state is CircuitState.OPEN:
+            # Circuito abierto: ni job ni conexiones
+            return self._build_skipped_detail(blocked)
+
         # Crear registro de ScrapingJob
         scraping_job = ScrapingJob.create(fuente=source_name)
         scraping_job = await self._scraping_job_repository.create(scraping_job)
         logger.info(f"ScrapingJob creado con ID: {scraping_job.id}")
 
+        # Iniciar el job
+        scraping_job.start()
+        await self._scraping_job_repository.update(scraping_job)
+        logger.info(f"ScrapingJob iniciado para {source_name}")
+
+        if blocked is not None:
+            job_detail = self._close_blocked_job(scraping_job, blocked)
+        else:
+            job_detail = await self._run_job(
+                scraping_job,
+                executor,
+                parse_executor,
+                self._source_deadline(run_deadline),
+                scraper,
+            )
+        await self._scraping_job_repository.update(scraping_job)
+        return job_detail
+
+    async def _circuit_status(self, source_name: str) -> CircuitStatus:
+        """
+        Estado del circuito de una fuente.
+
+        Si el historial no puede leerse se considera cerrado: un error del
+        circuit breaker no debe impedir el scraping.
+        """
+        try:
+            return await self._circuit_breaker.status(source_name)
+        except Exception as e:
+            logger.error(
+                f"{source_name}: no se pudo evaluar el circuit breaker, "
+                f"se considera cerrado: {e}",
+                exc_info=True,
+            )
+            return CircuitStatus(fuente=source_name, state=CircuitState.CLOSED)
+
+    async def _check_circuit(
+        self, source_name: str
+    ) -> Tuple[Optional[CircuitStatus], Optional[ScraperPort]]:
+        """
+        Consulta el circuit breaker de una fuente antes de scrapearla.
+
+        Con el circuito semiabierto hace el sondeo: una única petición a la
+        portada con el scraper de la fuente. Si responde, ese mismo scraper se
+        usa para la ejecución; un error al crearlo o al sondear cuenta como
+        sondeo fallido.
+
+        Args:
+            source_name: Nombre de la fuente
+
+        Returns:
+            Tuple[Optional[CircuitStatus], Optional[ScraperPort]]: Estado que
+                impide scrapear (None si la fuente debe scrapearse; si no,
+                ``OPEN``, o ``HALF_OPEN`` cuando el sondeo falló) y el scraper
+                del sondeo, si se creó uno
+        """
+        if self._circuit_breaker is None:
+            return None, None
+
+        circuit = await self._circuit_status(source_name)
+        if circuit.state is CircuitState.CLOSED:
+            return None, None
+        if circuit.state is CircuitState.OPEN:
+            logger.warning(self._circuit_message(circuit) + ", se omite")
+            return circuit, None
+
         try:
-            # Obtener el scraper correspondiente
             scraper = self._get_scraper_for_source(source_name)
+            probe = getattr(scraper, "probe", None)
+            site_up = not inspect.iscoroutinefunction(probe) or await probe()
+        except Exception as e:
+            logger.error(f"{source_name}: error en el sondeo: {e}", exc_info=True)
+            site_up = False
+        if not site_up:
+            logger.warning(f"{source_name}: sondeo fallido, el circuito sigue abierto")
+            return circuit, None
+
+        logger.info(f"{source_name}: circuito semiabierto, se vuelve a scrapear")
+        return None, scraper
+
+    def _close_blocked_job(
+        self, scraping_job: ScrapingJob, circuit: CircuitStatus
+    ) -> Dict:
+        """
+        Cierra sin scrapear un job cuya fuente bloquea el circuit breaker.
+
+        Con el circuito abierto el job queda ``skipped`` (no cuenta como fallo);
+        si falló el sondeo queda ``failed`` y el enfriamiento se alarga.
+
+        Args:
+            scraping_job: Job en curso o tomado de la cola
+            circuit: Estado devuelto por ``_check_circuit``
+
+        Returns:
+            Dict: Detalle del job
+        """
+        if circuit.state is CircuitState.OPEN:
+            scraping_job.skip()
+            return self._build_job_detail(
+                scraping_job, 0, 0, self._circuit_message(circuit)
+            )
+        scraping_job.fail()
+        return self._build_job_detail(
+            scraping_job, 0, 0, "Sondeo fallido con el circuito semiabierto"
+        )
+
+    @staticmethod
+    def _circuit_message(circuit: CircuitStatus) -> str:
+        return (
+            f"{circuit.fuente}: circuito abierto hasta "
+            f"{circuit.retry_at:%Y-%m-%d %H:%M:%S} "
+            f"({circuit.consecutive_failures} fallos seguidos, "
+            f"{circuit.failure_ratio:.0%} de fallos)"
+        )
+
+    def _source_deadline(self, run_deadline: Optional[float] = None) -> Optional[float]:
+        """
+        Plazo de una fuente que empieza ahora: el más cercano entre
+        ``source_timeout`` y el plazo de la ejecución.
+
+        Returns:
+            Optional[float]: Plazo en tiempo del event loop o None si no hay
+        """
+        deadlines = [run_deadline] if run_deadline is not None else []
+        if self._source_timeout is not None:
+            loop = asyncio.get_running_loop()
+            deadlines.append(loop.time() + self._source_timeout)
+        return min(deadlines, default=None)
+
+    async def _run_job(
+        self,
+        scraping_job: ScrapingJob,
+        executor: Optional[ThreadPoolExecutor] = None,
+        parse_executor: Optional[Executor] = None,
+        deadline: Optional[float] = None,
+        scraper: Optional[ScraperPort] = None,
+    ) -> Dict:
+        """
+        Ejecuta el scraper de un job en curso y deja el job completado, cortado
+        por plazo (``timed_out``) o fallido.
+
+        El estado final solo se modifica en la entidad: guardarlo queda a cargo
+        del llamador (``update`` en el coordinador, ``finish`` en los workers).
+
+        Args:
+            scraping_job: Job en estado ``running``
+            executor: Pool de hilos donde ejecutar el scraper bloqueante
+            parse_executor: Executor de parseo para el pipeline de ingesta
+            deadline: Plazo de la fuente (``loop.time()``); None sin límite
+            scraper: Scraper ya creado para la fuente (el del sondeo del
+                circuit breaker); si es None se crea uno
+
+        Returns:
+            Dict: Detalle del job ejecutado con estadísticas
+        """
+        source_name = scraping_job.fuente
+
+        try:
+            # Obtener el scraper correspondiente
+            if scraper is None:
+                scraper = self._get_scraper_for_source(source_name)
 
             if not scraper:
                 logger.warning(f"No hay scraper disponible para: {source_name}")
                 scraping_job.fail()
-                await self._scraping_job_repository.update(scraping_job)
                 return self._build_job_detail(
                     scraping_job, 0, 0, "No scraper available"
                 )
 
-            # Iniciar el job
-            scraping_job.start()
-            await self._scraping_job_repository.update(scraping_job)
-            logger.info(f"ScrapingJob iniciado para {source_name}")
-
-            # Ejecutar scraping
+            # Ejecutar scraping y persistir los artículos a medida que llegan
             logger.info(f"Ejecutando scraper para {source_name}...")
-            article_dtos = scraper.scrape()
-            articles_scraped = len(article_dtos)
+            (
+                articles_scraped,
+                articles_persisted,
+                metrics,
+                timed_out,
+            ) = await self._scrape_and_persist(
+                scraper, executor, parse_executor, deadline
+            )
             logger.info(f"Artículos scrapeados de {source_name}: {articles_scraped}")
-
-            # Persistir artículos
-            articles_persisted = await self._persist_articles(article_dtos)
             logger.info(
                 f"Artículos nuevos guardados de {source_name}: {articles_persisted}"
             )
 
+            unreachable = self._unreachable_error(scraper)
+            if articles_scraped == 0 and unreachable:
+                # Sin un solo artículo y sin respuestas: es un fallo del sitio,
+                # no una ejecución sin novedades
+                logger.error(f"{source_name}: {unreachable}")
+                scraping_job.fail()
+                return self._build_job_detail(scraping_job, 0, 0, unreachable)
+
             # Completar el job
-            scraping_job.complete(total_articulos=articles_scraped)
-            await self._scraping_job_repository.update(scraping_job)
-            logger.info(f"ScrapingJob completado para {source_name}")
+            if timed_out:
+                scraping_job.time_out(
+                    total_articulos=articles_scraped,
+                    articulos_nuevos=articles_persisted,
+                )
+                logger.warning(
+                    f"ScrapingJob de {source_name} cortado por plazo; se guardó "
+                    f"lo extraído hasta entonces"
+                )
+            else:
+                scraping_job.complete(
+                    total_articulos=articles_scraped,
+                    articulos_nuevos=articles_persisted,
+                )
+                logger.info(f"ScrapingJob completado para {source_name}")
 
             return self._build_job_detail(
-                scraping_job, articles_scraped, articles_persisted, None
+                scraping_job, articles_scraped, articles_persisted, None, metrics
             )
 
         except Exception as e:
             logger.error(f"Error procesando fuente {source_name}: {e}", exc_info=True)
             scraping_job.fail()
-            await self._scraping_job_repository.update(scraping_job)
 
             return self._build_job_detail(scraping_job, 0, 0, str(e))
 
+    async def _run_claimed_job(
+        self,
+        scraping_job: ScrapingJob,
+        worker_id: str,
+        lease_seconds: float,
+        executor: ThreadPoolExecutor,
+        parse_executor: Optional[Executor],
+    ) -> Dict:
+        """
+        Ejecuta un job tomado de la cola renovando su lease mientras corre.
+
+        Cada ``lease_seconds / 3`` se envía un heartbeat. Si el lease ya no es
+        del worker (venció y otro worker reclamó el job), el scraping se cancela
+        y el resultado no se guarda.
+
+        Args:
+            scraping_job: Job devuelto por ``claim_next``
+            worker_id: Identificador del worker
+            lease_seconds: Duración del lease
+            executor: Pool de hilos para scrapers bloqueantes
+            parse_executor: Executor de parseo para el pipeline de ingesta
+
+        Returns:
+            Dict: Detalle del job; con status ``lost`` si se perdió el lease
+        """
+        repository = self._scraping_job_repository
+        blocked, scraper = await self._check_circuit(scraping_job.fuente)
+        if blocked is not None:
+            job_detail = self._close_blocked_job(scraping_job, blocked)
+            if not await repository.finish(scraping_job, worker_id):
+                job_detail["status"] = "lost"
+            return job_detail
+
+        work = asyncio.ensure_future(
+            self._run_job(
+                scraping_job,
+                executor,
+                parse_executor,
+                self._source_deadline(),
+                scraper,
+            )
+        )
+
+        while True:
+            done, _ = await asyncio.wait({work}, timeout=lease_seconds / 3)
+            if done:
+                break
+            try:
+                renewed = await repository.renew_lease(
+                    scraping_job.id, worker_id, lease_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Heartbeat fallido para {scraping_job.id}: {e}")
+                continue
+            if not renewed:
+                logger.warning(
+                    f"Lease perdido para {scraping_job.fuente} "
+                    f"(job {scraping_job.id}), se cancela el scraping"
+                )
+                work.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await work
+                job_detail = self._build_job_detail(scraping_job, 0, 0, "Lease perdido")
+                job_detail["status"] = "lost"
+                return job_detail
+
+        job_detail = work.result()
+        if not await repository.finish(scraping_job, worker_id):
+            logger.warning(
+                f"Lease perdido para {scraping_job.fuente} (job "
+                f"{scraping_job.id}): el resultado no se guardó"
+            )
+            job_detail["status"] = "lost"
+        return job_detail
+
+    async def _scrape_and_persist(
+        self,
+        scraper: ScraperPort,
+        executor: Optional[ThreadPoolExecutor],
+        parse_executor: Optional[Executor] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[int, int, Optional[Dict], bool]:
+        """
+        Ejecuta el scraper y persiste sus artículos lote por lote.
+
+        El plazo corta la extracción (descargas en curso incluidas), nunca la
+        escritura: lo extraído antes de vencer se persiste igual.
+
+        Args:
+            scraper: Scraper a ejecutar
+            executor: Pool de hilos para scrapers bloqueantes
+            parse_executor: Executor de parseo para el pipeline de ingesta
+            deadline: Plazo en tiempo del event loop; None sin límite
+
+        Returns:
+            Tuple[int, int, Optional[Dict], bool]: Artículos scrapeados,
+                artículos nuevos guardados, métricas por etapa (solo con
+                pipeline) y si se agotó el plazo
+        """
+        if self._supports_pipeline(scraper):
+            result = await IngestionPipeline(
+                scraper,
+                self._persist_articles,
+                self._pipeline_config,
+                parse_executor=parse_executor,
+            ).run(deadline)
+            return (
+                result.articles_scraped,
+                result.articles_persisted,
+                result.metrics_dict(),
+                result.timed_out,
+            )
+
+        articles_scraped = 0
+        articles_persisted = 0
+        try:
+            async for batch in self._article_batches(scraper, executor, deadline):
+                articles_scraped += len(batch)
+                articles_persisted += await self._persist_articles(batch)
+        except asyncio.TimeoutError:
+            return articles_scraped, articles_persisted, None, True
+        return articles_scraped, articles_persisted, None, False
+
+    @staticmethod
+    def _unreachable_error(scraper: ScraperPort) -> Optional[str]:
+        """
+        Detecta un sitio que no respondió ninguna petición del scraper.
+
+        Args:
+            scraper: Scraper ya ejecutado (HealthCheckScraperPort)
+
+        Returns:
+            Optional[str]: Mensaje de error, o None si hubo alguna respuesta
+                o el scraper no informa sus peticiones
+        """
+        request_stats = getattr(scraper, "request_stats", None)
+        stats = request_stats() if callable(request_stats) else None
+        if not isinstance(stats, dict) or not stats.get("requests"):
+            return None
+        if stats.get("errors", 0) < stats["requests"]:
+            return None
+        return f"El sitio no respondió: fallaron las {stats['requests']} peticiones"
+
+    @staticmethod
+    def _supports_pipeline(scraper: ScraperPort) -> bool:
+        """Indica si el scraper implementa PipelineScraperPort."""
+        return (
+            inspect.iscoroutinefunction(getattr(scraper, "collect_article_urls", None))
+            and inspect.iscoroutinefunction(getattr(scraper, "fetch_article", None))
+            and callable(getattr(scraper, "parse_article", None))
+        )
+
+    async def _article_batches(
+        self,
+        scraper: ScraperPort,
+        executor: Optional[ThreadPoolExecutor],
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[List]:
+        """
+        Agrupa los artículos del scraper en lotes para persistir.
+
+        Con ``astream()`` se entregan micro-lotes de ``persist_batch_size``
+        mientras el scraper sigue descargando; con ``ascrape()`` / ``scrape()``
+        se entrega la lista completa como un único lote.
+
+        Args:
+            scraper: Scraper a ejecutar
+            executor: Pool de hilos para scrapers bloqueantes
+            deadline: Plazo en tiempo del event loop; None sin límite
+
+        Yields:
+            List: ArticleDTOs del lote
+
+        Raises:
+            asyncio.TimeoutError: Si vence el plazo; con ``astream()`` antes se
+                entrega el lote incompleto
+        """
+        loop = asyncio.get_running_loop()
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(deadline - loop.time(), 0)
+
+        astream = getattr(scraper, "astream", None)
+        if not inspect.isasyncgenfunction(astream):
+            article_dtos = await asyncio.wait_for(
+                self._run_scraper(scraper, executor), remaining()
+            )
+            if article_dtos:
+                yield article_dtos
+            return
+
+        batch = []
+        stream = astream()
+        while True:
+            try:
+                article_dto = await asyncio.wait_for(stream.__anext__(), remaining())
+            except StopAsyncIteration:
+                break
+            except asyncio.TimeoutError:
+                if batch:
+                    yield batch
+                raise
+            batch.append(article_dto)
+            if len(batch) >= self._persist_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _run_scraper(
+        self, scraper: ScraperPort, executor: Optional[ThreadPoolExecutor]
+    ) -> List:
+        """
+        Ejecuta un scraper sin bloquear el event loop.
+
+        Si el scraper ofrece ``ascrape()`` (AsyncScraperPort) se espera
+        directamente; en caso contrario ``scrape()`` se ejecuta en el executor.
+
+        Args:
+            scraper: Scraper a ejecutar
+            executor: Pool de hilos para scrapers bloqueantes
+
+        Returns:
+            List: ArticleDTOs extraídos
+        """
+        ascrape = getattr(scraper, "ascrape", None)
+        if inspect.iscoroutinefunction(ascrape):
+            return await ascrape()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, scraper.scrape)
+
     def _get_scraper_for_source(self, source_name: str) -> Optional[ScraperPort]:
         """
         Obtiene el scraper correspondiente para una fuente.
@@ -208,6 +966,11 @@ class ScrapeAllSourcesUseCase:
         """
         Persiste los artículos scrapeados evitando duplicados.
 
+        Todo el lote se inserta con una única llamada al repositorio, que
+        omite las URLs ya existentes. Si el lote falla se reintenta artículo
+        por artículo, de modo que un registro problemático no descarta al
+        resto.
+
         Args:
             article_dtos: Lista de ArticleDTO scrapeados
 
@@ -216,36 +979,46 @@ class ScrapeAllSourcesUseCase:
         """
         from src.domain.entities.news_article import NewsArticle
 
-        new_articles_count = 0
-
+        articles = []
         for dto in article_dtos:
             try:
-                # Verificar si ya existe
-                existing_article = await self._article_repository.get_by_url(dto.url)
-
-                if existing_article:
-                    logger.debug(f"Artículo duplicado (omitido): {dto.url}")
-                    continue
-
-                # Crear y persistir nuevo artículo
-                article = NewsArticle.create(
-                    titulo=dto.titulo,
-                    contenido=dto.contenido or "",
-                    fuente=dto.fuente,
-                    fecha_publicacion=dto.fecha_publicacion,
-                    url=dto.url,
-                    categoria=None,
+                articles.append(
+                    NewsArticle.create(
+                        titulo=dto.titulo,
+                        contenido=dto.contenido or "",
+                        fuente=dto.fuente,
+                        fecha_publicacion=dto.fecha_publicacion,
+                        url=dto.url,
+                        categoria=dto.categoria,
+                    )
                 )
+            except Exception as e:
+                logger.error(f"Artículo inválido (omitido) {dto.url}: {e}")
 
-                await self._article_repository.create(article)
-                new_articles_count += 1
-                logger.debug(f"Artículo guardado: {article.titulo[:60]}...")
+        if not articles:
+            return 0
 
-            except Exception as e:
-                logger.error(f"Error persistiendo artículo {dto.url}: {e}")
-                continue
+        try:
+            new_urls = await self._article_repository.bulk_create_if_absent(articles)
+        except Exception as e:
+            logger.error(
+                f"Error persistiendo lote de {len(articles)} artículos, "
+                f"reintentando uno por uno: {e}",
+                exc_info=True,
+            )
+            new_urls = set()
+            for article in articles:
+                try:
+                    new_urls |= await self._article_repository.bulk_create_if_absent(
+                        [article]
+                    )
+                except Exception as e:
+                    logger.error(f"Error persistiendo artículo {article.url}: {e}")
 
-        return new_articles_count
+        logger.debug(
+            f"Artículos duplicados (omitidos): {len(articles) - len(new_urls)}"
+        )
+        return len(new_urls)
 
     def _build_job_detail(
         self,
@@ -253,6 +1026,7 @@ class ScrapeAllSourcesUseCase:
         articles_scraped: int,
         articles_persisted: int,
         error: Optional[str],
+        metrics: Optional[Dict] = None,
     ) -> Dict:
         """
         Construye el detalle de un job ejecutado.
@@ -262,6 +1036,7 @@ class ScrapeAllSourcesUseCase:
             articles_scraped: Cantidad de artículos scrapeados
             articles_persisted: Cantidad de artículos nuevos guardados
             error: Mensaje de error si hubo fallo
+            metrics: Métricas por etapa del pipeline de ingesta, si se usó
 
         Returns:
             Dict: Detalle estructurado del job
@@ -278,6 +1053,33 @@ class ScrapeAllSourcesUseCase:
             "articles_persisted": articles_persisted,
             "duplicates": articles_scraped - articles_persisted,
             "error": error,
+            "metrics": metrics,
+        }
+
+    def _build_skipped_detail(self, circuit: CircuitStatus) -> Dict:
+        """
+        Construye el detalle de una fuente omitida con el circuito abierto.
+
+        No hay job: la fuente no se registra en ScrapingJob mientras el
+        circuito sigue abierto.
+
+        Args:
+            circuit: Estado del circuito de la fuente
+
+        Returns:
+            Dict: Detalle con status ``skipped``
+        """
+        return {
+            "job_id": None,
+            "source": circuit.fuente,
+            "status": "skipped",
+            "fecha_inicio": None,
+            "fecha_fin": None,
+            "articles_scraped": 0,
+            "articles_persisted": 0,
+            "duplicates": 0,
+            "error": self._circuit_message(circuit),
+            "metrics": None,
         }
 
     def _build_empty_response(self) -> Dict:
@@ -286,6 +1088,8 @@ class ScrapeAllSourcesUseCase:
             "total_sources": 0,
             "total_jobs_completed": 0,
             "total_jobs_failed": 0,
+            "total_jobs_timed_out": 0,
+            "total_jobs_skipped": 0,
             "total_articles_scraped": 0,
             "total_articles_persisted": 0,
             "jobs_details": [],
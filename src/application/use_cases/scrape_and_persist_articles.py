@@ -16,7 +16,8 @@ class ScrapeAndPersistArticlesUseCase:
     Este caso de uso orquesta el proceso completo:
     1. Ejecuta el scraper para obtener artículos
     2. Verifica duplicados por URL
-    3. Persiste los artículos nuevos en la base de datos
+    3. Persiste los artículos nuevos en la base de datos con una única
+       inserción en lote
     4. Retorna estadísticas del proceso
     """
 
@@ -53,46 +54,36 @@ class ScrapeAndPersistArticlesUseCase:
                     "articles": [],
                 }
 
-            # Fase 2: Filtrar duplicados y persistir
+            # Fase 2: Filtrar duplicados y persistir en un único lote
             logger.info("Fase 2: Verificando duplicados y persistiendo artículos")
-            new_articles = []
-            duplicate_count = 0
-
-            for dto in article_dtos:
-                try:
-                    # Verificar si ya existe un artículo con esta URL
-                    existing_article = await self._article_repository.get_by_url(
-                        dto.url
-                    )
-
-                    if existing_article:
-                        logger.info(f"Artículo duplicado (ya existe): {dto.url}")
-                        duplicate_count += 1
-                        continue
-
-                    # Crear nueva entidad NewsArticle
-                    article = NewsArticle.create(
-                        titulo=dto.titulo,
-                        contenido=dto.contenido or "",
-                        fuente=dto.fuente,
-                        fecha_publicacion=dto.fecha_publicacion,
-                        url=dto.url,
-                        categoria=None,  # La categoría podría extraerse del DTO si se implementa
-                    )
+            articles = [
+                NewsArticle.create(
+                    titulo=dto.titulo,
+                    contenido=dto.contenido or "",
+                    fuente=dto.fuente,
+                    fecha_publicacion=dto.fecha_publicacion,
+                    url=dto.url,
+                    categoria=dto.categoria,
+                )
+                for dto in article_dtos
+            ]
+            new_urls = set(
+                await self._article_repository.bulk_create_if_absent(articles)
+            )
 
-                    # Persistir en la base de datos
-                    saved_article = await self._article_repository.create(article)
-                    new_articles.append(saved_article)
+            new_articles = []
+            for article in articles:
+                # Una URL repetida dentro del lote cuenta como duplicado
+                if article.url in new_urls:
+                    new_urls.discard(article.url)
+                    new_articles.append(article)
                     logger.info(
-                        f"Artículo guardado exitosamente: {saved_article.titulo[:60]}..."
-                    )
-
-                except Exception as e:
-                    logger.error(
-                        f"Error procesando artículo {dto.url}: {e}", exc_info=True
+                        f"Artículo guardado exitosamente: {article.titulo[:60]}..."
                     )
-                    continue
+                else:
+                    logger.info(f"Artículo duplicado (ya existe): {article.url}")
 
+            duplicate_count = total_scraped - len(new_articles)
             total_new = len(new_articles)
 
             logger.info("=" * 80)
@@ -1,3 +1,4 @@
 from src.domain.dto.article_dto import ArticleDTO
+from src.domain.dto.fetched_page import FetchedPage
 
-__all__ = ["ArticleDTO"]
+__all__ = ["ArticleDTO", "FetchedPage"]
@@ -17,6 +17,7 @@ class ArticleDTO(BaseModel):
         contenido: Contenido completo del artículo (opcional si no se pudo extraer)
         fecha_publicacion: Fecha de publicación del artículo (opcional si no está disponible)
         fuente: Nombre de la fuente del artículo (ej: "Clarín", "Página 12")
+        categoria: Sección o categoría del artículo (opcional)
     """
 
     titulo: str = Field(..., description="Título del artículo")
@@ -30,6 +31,9 @@ class ArticleDTO(BaseModel):
     fuente: str = Field(
         ..., description="Nombre de la fuente (ej: 'Clarín', 'Página 12')"
     )
+    categoria: Optional[str] = Field(
+        None, description="Sección o categoría del artículo"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -40,6 +44,7 @@ class ArticleDTO(BaseModel):
                     "contenido": "Este es el contenido completo de la noticia...",
                     "fecha_publicacion": "2024-01-15T10:30:00",
                     "fuente": "Clarín",
+                    "categoria": "Política",
                 }
             ]
         }
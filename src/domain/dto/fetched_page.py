@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class FetchedPage:
+    """
+    Página de un artículo descargada y todavía sin parsear.
+
+    Attributes:
+        url: URL del artículo
+        content: HTML en bytes, tal como lo devolvió el servidor
+        encoding: Codificación declarada en la respuesta HTTP, si la hay
+    """
+
+    url: str
+    content: bytes
+    encoding: Optional[str] = None
@@ -1,6 +1,14 @@
-from src.domain.entities.news_article import NewsArticle
+from src.domain.entities.crawl_frontier_entry import CrawlFrontierEntry
+from src.domain.entities.news_article import NewsArticle, NewsArticleSummary
 from src.domain.entities.scraping_job import ScrapingJob
 from src.domain.entities.source import Source
 from src.domain.entities.user import User
 
-__all__ = ["User", "NewsArticle", "Source", "ScrapingJob"]
+__all__ = [
+    "User",
+    "NewsArticle",
+    "NewsArticleSummary",
+    "Source",
+    "ScrapingJob",
+    "CrawlFrontierEntry",
+]
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+
+@dataclass
+class CrawlFrontierEntry:
+    """
+    URL de artículo descubierta por el scraper de una fuente.
+
+    La frontera recuerda cada URL entre ejecuciones: cuándo se vio por primera
+    y última vez y si ya se descargó. Las URLs ya descargadas (o que fallaron
+    ``MAX_ATTEMPTS`` veces) son conocidas y no vuelven a pedirse.
+    """
+
+    PENDING = "pending"
+    FETCHED = "fetched"
+    FAILED = "failed"
+    MAX_ATTEMPTS = 3
+
+    fuente: str
+    url: str
+    first_seen: datetime
+    last_seen: datetime
+    status: str = PENDING
+    attempts: int = 0
+    fetched_at: Optional[datetime] = None
+
+    @classmethod
+    def create(cls, fuente: str, url: str) -> "CrawlFrontierEntry":
+        now = datetime.now(timezone.utc)
+        return cls(fuente=fuente, url=url, first_seen=now, last_seen=now)
+
+    @property
+    def is_known(self) -> bool:
+        """Indica si la URL ya no necesita descargarse."""
+        return self.status == self.FETCHED or (
+            self.status == self.FAILED and self.attempts >= self.MAX_ATTEMPTS
+        )
+
+    def seen(self) -> None:
+        self.last_seen = datetime.now(timezone.utc)
+
+    def mark_fetched(self) -> None:
+        self.status = self.FETCHED
+        self.attempts += 1
+        self.fetched_at = datetime.now(timezone.utc)
+
+    def mark_failed(self) -> None:
+        self.status = self.FAILED
+        self.attempts += 1
@@ -3,6 +3,9 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
 
+# Longitud máxima del extracto precalculado que se usa en los listados resumidos
+EXCERPT_LENGTH = 280
+
 
 @dataclass
 class NewsArticle:
@@ -53,3 +56,32 @@ class NewsArticle:
     def update_category(self, categoria: str) -> None:
         self.categoria = categoria
         self.updated_at = datetime.now(timezone.utc)
+
+    def excerpt(self, max_length: int = EXCERPT_LENGTH) -> str:
+        """
+        Devuelve el comienzo del contenido, cortado en un límite de palabra.
+
+        Args:
+            max_length: Longitud máxima del extracto sin contar los puntos suspensivos
+
+        Returns:
+            str: Extracto del contenido ("" si el artículo no tiene contenido)
+        """
+        text = " ".join(self.contenido.split())
+        if len(text) <= max_length:
+            return text
+        cut = text[:max_length].rsplit(" ", 1)[0] or text[:max_length]
+        return cut.rstrip(" ,.;:") + "…"
+
+
+@dataclass
+class NewsArticleSummary:
+    """Proyección de un artículo para listados: sin el contenido completo."""
+
+    id: UUID
+    titulo: str
+    fuente: str
+    fecha_publicacion: datetime
+    url: str
+    categoria: Optional[str]
+    extracto: Optional[str]
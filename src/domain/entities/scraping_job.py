@@ -14,6 +14,9 @@ class ScrapingJob:
     total_articulos: int
     created_at: datetime
     updated_at: Optional[datetime] = None
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    articulos_nuevos: int = 0
 
     @classmethod
     def create(cls, fuente: str) -> "ScrapingJob":
@@ -34,15 +37,32 @@ class ScrapingJob:
         self.fecha_inicio = datetime.now(timezone.utc)
         self.updated_at = datetime.now(timezone.utc)
 
-    def complete(self, total_articulos: int) -> None:
+    def complete(self, total_articulos: int, articulos_nuevos: int = 0) -> None:
         self.status = "completed"
         self.fecha_fin = datetime.now(timezone.utc)
         self.total_articulos = total_articulos
+        self.articulos_nuevos = articulos_nuevos
+        self.lease_expires_at = None
+        self.updated_at = datetime.now(timezone.utc)
+
+    def time_out(self, total_articulos: int, articulos_nuevos: int = 0) -> None:
+        self.status = "timed_out"
+        self.fecha_fin = datetime.now(timezone.utc)
+        self.total_articulos = total_articulos
+        self.articulos_nuevos = articulos_nuevos
+        self.lease_expires_at = None
         self.updated_at = datetime.now(timezone.utc)
 
     def fail(self) -> None:
         self.status = "failed"
         self.fecha_fin = datetime.now(timezone.utc)
+        self.lease_expires_at = None
+        self.updated_at = datetime.now(timezone.utc)
+
+    def skip(self) -> None:
+        self.status = "skipped"
+        self.fecha_fin = datetime.now(timezone.utc)
+        self.lease_expires_at = None
         self.updated_at = datetime.now(timezone.utc)
 
     def increment_articles(self) -> None:
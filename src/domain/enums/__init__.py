@@ -1,3 +1,4 @@
+from .discovery_strategy import DiscoveryStrategy
 from .source_enum import NewsSource
 
-__all__ = ["NewsSource"]
+__all__ = ["DiscoveryStrategy", "NewsSource"]
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class DiscoveryStrategy(Enum):
+    """
+    Estrategia con la que un scraper descubre las URLs de artículos.
+
+    - SECTIONS: recorre el HTML de las páginas de sección
+    - SITEMAP: lee el sitemap de noticias (``<urlset>`` / ``<sitemapindex>``)
+    - RSS: lee el feed RSS o Atom de la fuente
+    """
+
+    SECTIONS = "sections"
+    SITEMAP = "sitemap"
+    RSS = "rss"
@@ -1,5 +1,7 @@
 from enum import Enum, auto
 
+from .discovery_strategy import DiscoveryStrategy
+
 
 class NewsSource(Enum):
     """
@@ -10,6 +12,7 @@ class NewsSource(Enum):
     - Un nombre descriptivo
     - El dominio del sitio web
     - El país de origen
+    - Los feeds (sitemap de noticias / RSS) y la estrategia de descubrimiento
     """
 
     CLARIN = auto()
@@ -44,6 +47,63 @@ class NewsSource(Enum):
         """Devuelve el país de la fuente."""
         return "Argentina"
 
+    @property
+    def discovery_strategy(self) -> DiscoveryStrategy:
+        """
+        Devuelve la estrategia preferida para descubrir artículos de la fuente.
+
+        Las páginas de sección HTML son siempre el respaldo si el feed falla.
+        """
+        estrategias = {
+            NewsSource.CLARIN: DiscoveryStrategy.RSS,
+            NewsSource.LA_NACION: DiscoveryStrategy.SITEMAP,
+            NewsSource.PAGINA12: DiscoveryStrategy.RSS,
+            NewsSource.INFOBAE: DiscoveryStrategy.SITEMAP,
+        }
+        return estrategias[self]
+
+    def discovery_feeds(self, strategy: DiscoveryStrategy) -> list[str]:
+        """
+        Devuelve las URLs de los feeds de la fuente para una estrategia.
+
+        Args:
+            strategy: Estrategia de descubrimiento
+
+        Returns:
+            list[str]: URLs del sitemap de noticias o del feed RSS (vacía si la
+                fuente no publica feeds de ese tipo o la estrategia es SECTIONS)
+        """
+        feeds = {
+            NewsSource.CLARIN: {
+                DiscoveryStrategy.RSS: ["https://www.clarin.com/rss/lo-ultimo/"],
+                DiscoveryStrategy.SITEMAP: [
+                    "https://www.clarin.com/sitemap-google-news.xml"
+                ],
+            },
+            NewsSource.LA_NACION: {
+                DiscoveryStrategy.RSS: [
+                    "https://www.lanacion.com.ar/arc/outboundfeeds/rss/?outputType=xml"
+                ],
+                DiscoveryStrategy.SITEMAP: [
+                    "https://www.lanacion.com.ar/arc/outboundfeeds/sitemap-news/"
+                    "?outputType=xml"
+                ],
+            },
+            NewsSource.PAGINA12: {
+                DiscoveryStrategy.RSS: ["https://www.pagina12.com.ar/rss/portada"],
+            },
+            NewsSource.INFOBAE: {
+                DiscoveryStrategy.RSS: [
+                    "https://www.infobae.com/arc/outboundfeeds/rss/?outputType=xml"
+                ],
+                DiscoveryStrategy.SITEMAP: [
+                    "https://www.infobae.com/arc/outboundfeeds/sitemap-news/"
+                    "?outputType=xml"
+                ],
+            },
+        }
+        return feeds[self].get(strategy, [])
+
     @classmethod
     def from_nombre(cls, nombre: str) -> "NewsSource":
         """
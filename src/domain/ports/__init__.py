@@ -1,3 +1,17 @@
-from .scraper_port import IScraperPort, ScraperPort
+from .scraper_port import (
+    AsyncScraperPort,
+    HealthCheckScraperPort,
+    IScraperPort,
+    PipelineScraperPort,
+    ScraperPort,
+    StreamingScraperPort,
+)
 
-__all__ = ["IScraperPort", "ScraperPort"]
+__all__ = [
+    "AsyncScraperPort",
+    "HealthCheckScraperPort",
+    "IScraperPort",
+    "PipelineScraperPort",
+    "ScraperPort",
+    "StreamingScraperPort",
+]
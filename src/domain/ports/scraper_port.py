@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Protocol
+from typing import AsyncIterator, List, Optional, Protocol
 
 from src.domain.dto.article_dto import ArticleDTO
+from src.domain.dto.fetched_page import FetchedPage
 from src.domain.entities.news_article import NewsArticle
 
 
@@ -48,3 +49,123 @@ class ScraperPort(Protocol):
             Exception: Si ocurre un error durante el proceso de scraping
         """
         ...
+
+
+class AsyncScraperPort(Protocol):
+    """
+    Puerto para scrapers que ofrecen un punto de entrada asíncrono.
+
+    Permite que los coordinadores async ejecuten el scraping sin bloquear el
+    event loop ni recurrir a un pool de hilos. Los scrapers que lo implementan
+    suelen cumplir también ScraperPort, delegando ``scrape()`` en ``ascrape()``.
+    """
+
+    async def ascrape(self) -> list[ArticleDTO]:
+        """
+        Extrae artículos de una fuente de noticias de forma asíncrona.
+
+        Returns:
+            list[ArticleDTO]: Lista de artículos extraídos en formato estandarizado
+        """
+        ...
+
+
+class StreamingScraperPort(Protocol):
+    """
+    Puerto para scrapers que entregan los artículos a medida que los extraen.
+
+    A diferencia de ``scrape()`` / ``ascrape()``, que devuelven la lista
+    completa al final, ``astream()`` permite persistir o procesar cada artículo
+    apenas está disponible: el tiempo hasta el primer artículo y la memoria
+    usada no dependen de la cantidad total de artículos.
+    """
+
+    def astream(self) -> AsyncIterator[ArticleDTO]:
+        """
+        Extrae artículos de una fuente de noticias como iterador asíncrono.
+
+        Yields:
+            ArticleDTO: Cada artículo extraído, en orden de finalización
+        """
+        ...
+
+
+class PipelineScraperPort(Protocol):
+    """
+    Puerto para scrapers que exponen por separado las etapas del scraping.
+
+    Permite que un pipeline de ingesta ejecute el descubrimiento, la descarga
+    (I/O) y el parseo (CPU) de cada artículo en etapas independientes, con su
+    propia concurrencia.
+    """
+
+    async def collect_article_urls(self) -> list[str]:
+        """
+        Descubre las URLs de artículos nuevos de la fuente.
+
+        Returns:
+            list[str]: URLs a descargar, de la más relevante a la menos relevante
+        """
+        ...
+
+    async def fetch_article(self, url: str) -> Optional[FetchedPage]:
+        """
+        Descarga la página de un artículo.
+
+        Args:
+            url: URL del artículo
+
+        Returns:
+            Optional[FetchedPage]: Página descargada o None si la descarga falló
+        """
+        ...
+
+    def parse_article(self, page: FetchedPage) -> Optional[ArticleDTO]:
+        """
+        Parsea una página descargada (operación bloqueante, de CPU).
+
+        Args:
+            page: Página del artículo
+
+        Returns:
+            Optional[ArticleDTO]: Artículo extraído o None si no pudo parsearse
+        """
+        ...
+
+    async def mark_parsed(self, url: str, parsed: bool) -> None:
+        """
+        Registra el resultado del parseo de un artículo descargado.
+
+        Args:
+            url: URL del artículo
+            parsed: True si se extrajo el artículo
+        """
+        ...
+
+
+class HealthCheckScraperPort(Protocol):
+    """
+    Puerto para scrapers que informan si su sitio está respondiendo.
+
+    El coordinador lo usa con el circuit breaker por fuente: ``probe()`` es el
+    sondeo barato de un circuito semiabierto y ``request_stats()`` permite
+    distinguir una ejecución sin novedades de un sitio que no responde.
+    """
+
+    async def probe(self) -> bool:
+        """
+        Hace una única petición barata al sitio.
+
+        Returns:
+            bool: True si el sitio respondió sin error
+        """
+        ...
+
+    def request_stats(self) -> dict[str, int]:
+        """
+        Peticiones HTTP realizadas por el scraper.
+
+        Returns:
+            dict[str, int]: ``requests`` y ``errors`` (peticiones fallidas)
+        """
+        ...
@@ -1,3 +1,6 @@
+from src.domain.repositories.crawl_frontier_repository import (
+    CrawlFrontierRepository,
+)
 from src.domain.repositories.news_article_repository import NewsArticleRepository
 from src.domain.repositories.scraping_job_repository import ScrapingJobRepository
 from src.domain.repositories.source_repository import SourceRepository
@@ -8,4 +11,5 @@ __all__ = [
     "NewsArticleRepository",
     "SourceRepository",
     "ScrapingJobRepository",
+    "CrawlFrontierRepository",
 ]
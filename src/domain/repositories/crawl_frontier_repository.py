@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Set
+
+from src.domain.entities.crawl_frontier_entry import CrawlFrontierEntry
+
+
+class CrawlFrontierRepository(ABC):
+
+    @abstractmethod
+    async def register(self, fuente: str, urls: List[str]) -> Set[str]:
+        """
+        Registra las URLs descubiertas en una ejecución.
+
+        Las URLs nuevas quedan pendientes con ``first_seen`` = ahora; las ya
+        registradas actualizan ``last_seen``.
+
+        Returns:
+            Set[str]: URLs conocidas, que no hace falta volver a descargar
+        """
+        pass
+
+    @abstractmethod
+    async def mark_fetched(self, fuente: str, url: str) -> None:
+        pass
+
+    @abstractmethod
+    async def mark_failed(self, fuente: str, url: str) -> None:
+        pass
+
+    @abstractmethod
+    async def get_by_fuente(
+        self, fuente: str, status: Optional[str] = None, limit: int = 100
+    ) -> List[CrawlFrontierEntry]:
+        """Entradas de la fuente, de la vista por primera vez más reciente a la más antigua."""
+        pass
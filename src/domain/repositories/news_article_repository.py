@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 from uuid import UUID
 
-from src.domain.entities.news_article import NewsArticle
+from src.domain.entities.news_article import NewsArticle, NewsArticleSummary
+from src.domain.value_objects.pagination import CursorPage, PageCursor
 
 
 class NewsArticleRepository(ABC):
@@ -11,6 +12,16 @@ class NewsArticleRepository(ABC):
     async def create(self, article: NewsArticle) -> NewsArticle:
         pass
 
+    @abstractmethod
+    async def bulk_create_if_absent(self, articles: List[NewsArticle]) -> Set[str]:
+        """
+        Inserta en lote los artículos cuya URL todavía no existe.
+
+        Returns:
+            Set[str]: URLs de los artículos efectivamente insertados
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, article_id: UUID) -> Optional[NewsArticle]:
         pass
@@ -19,10 +30,75 @@ class NewsArticleRepository(ABC):
     async def get_by_url(self, url: str) -> Optional[NewsArticle]:
         pass
 
+    @abstractmethod
+    async def get_existing_urls(self, urls: Iterable[str]) -> Set[str]:
+        """
+        Devuelve el subconjunto de URLs que ya están almacenadas.
+
+        Las implementaciones deben resolver lotes grandes con pocas consultas.
+        """
+        pass
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[NewsArticle]:
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None,
+        fuente: Optional[str] = None,
+        categoria: Optional[str] = None,
+    ) -> CursorPage[NewsArticle]:
+        """
+        Página ordenada por (fecha_publicacion, id) descendente usando keyset.
+
+        Returns:
+            CursorPage[NewsArticle]: Artículos y cursor de la página siguiente
+                (None si no hay más resultados)
+        """
+        pass
+
+    @abstractmethod
+    async def get_summaries(
+        self, skip: int = 0, limit: int = 100
+    ) -> List[NewsArticleSummary]:
+        """
+        Igual que ``get_all`` pero sin leer el contenido de los artículos.
+        """
+        pass
+
+    @abstractmethod
+    async def get_summary_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None,
+        fuente: Optional[str] = None,
+        categoria: Optional[str] = None,
+    ) -> CursorPage[NewsArticleSummary]:
+        """
+        Igual que ``get_page`` pero sin leer el contenido de los artículos.
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 20
+    ) -> List[NewsArticle]:
+        """
+        Búsqueda de texto completo sobre titulo y contenido.
+
+        Args:
+            query: Términos a buscar (todos deben aparecer)
+            skip: Cantidad de resultados a omitir
+            limit: Cantidad máxima de resultados
+
+        Returns:
+            List[NewsArticle]: Artículos ordenados por relevancia y luego por fecha
+        """
+        pass
+
     @abstractmethod
     async def get_by_fuente(
         self, fuente: str, skip: int = 0, limit: int = 100
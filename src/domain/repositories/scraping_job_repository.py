@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from src.domain.entities.scraping_job import ScrapingJob
+from src.domain.value_objects.pagination import CursorPage, PageCursor
 
 
 class ScrapingJobRepository(ABC):
@@ -19,6 +20,31 @@ class ScrapingJobRepository(ABC):
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[ScrapingJob]:
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None,
+        fuente: Optional[str] = None,
+        status: Optional[str] = None,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> CursorPage[ScrapingJob]:
+        """
+        Página ordenada por (fecha_inicio, id) descendente usando keyset.
+
+        Args:
+            limit: Cantidad máxima de jobs
+            cursor: Cursor de la página anterior
+            fuente: Filtra por fuente
+            status: Filtra por un estado
+            statuses: Filtra por cualquiera de estos estados
+
+        Returns:
+            CursorPage[ScrapingJob]: Jobs y cursor de la página siguiente
+                (None si no hay más resultados)
+        """
+        pass
+
     @abstractmethod
     async def get_by_fuente(
         self, fuente: str, skip: int = 0, limit: int = 100
@@ -38,3 +64,61 @@ class ScrapingJobRepository(ABC):
     @abstractmethod
     async def delete(self, job_id: UUID) -> bool:
         pass
+
+    @abstractmethod
+    async def enqueue(self, job: ScrapingJob) -> Optional[ScrapingJob]:
+        """
+        Encola un job pendiente si la fuente no tiene otro abierto.
+
+        Un job está abierto si sigue pendiente o si un worker lo tiene tomado
+        con un lease (aunque haya vencido y todavía no se haya reclamado).
+
+        Returns:
+            Optional[ScrapingJob]: Job encolado o None si ya había uno abierto
+        """
+        pass
+
+    @abstractmethod
+    async def claim_next(
+        self, worker_id: str, lease_seconds: float
+    ) -> Optional[ScrapingJob]:
+        """
+        Toma de forma atómica el próximo job de la cola.
+
+        Son reclamables los jobs pendientes y los ``running`` cuyo lease venció
+        (su worker murió o dejó de enviar heartbeats), nunca los de una fuente
+        que otro worker tiene tomada con un lease vigente. Dos workers nunca
+        reciben el mismo job.
+
+        Args:
+            worker_id: Identificador del worker que toma el job
+            lease_seconds: Duración del lease
+
+        Returns:
+            Optional[ScrapingJob]: Job en estado ``running`` o None si la cola
+                está vacía
+        """
+        pass
+
+    @abstractmethod
+    async def renew_lease(
+        self, job_id: UUID, worker_id: str, lease_seconds: float
+    ) -> bool:
+        """
+        Heartbeat: extiende el lease de un job tomado por el worker.
+
+        Returns:
+            bool: False si el worker ya no tiene el job (otro lo reclamó)
+        """
+        pass
+
+    @abstractmethod
+    async def finish(self, job: ScrapingJob, worker_id: str) -> bool:
+        """
+        Guarda el estado final de un job tomado y libera su lease.
+
+        Returns:
+            bool: False si el worker ya no tenía el job; en ese caso no se
+                modifica nada
+        """
+        pass
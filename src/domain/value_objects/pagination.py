@@ -0,0 +1,44 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, List, Optional, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    Posición de búsqueda (keyset) en un listado ordenado por (fecha, id) descendente.
+
+    Se expone a los clientes como un token opaco: la página siguiente se obtiene
+    buscando los registros estrictamente anteriores a esta posición, por lo que
+    el costo no depende de cuántas páginas se hayan recorrido.
+    """
+
+    fecha: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [self.fecha.isoformat(), str(self.id)], separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            fecha, id_ = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return cls(fecha=datetime.fromisoformat(fecha), id=UUID(id_))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor: {token}") from e
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[PageCursor] = None
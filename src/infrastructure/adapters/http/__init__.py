@@ -0,0 +1,23 @@
+from .base_url import base_url_override, rebase_url
+from .fetch_engine import AsyncFetchEngine, run_sync
+from .http_cache import CacheEntry, HttpCache, get_shared_http_cache
+from .http_client import (
+    USER_AGENT,
+    PooledHttpClient,
+    close_shared_http_client,
+    get_shared_http_client,
+)
+
+__all__ = [
+    "AsyncFetchEngine",
+    "CacheEntry",
+    "HttpCache",
+    "PooledHttpClient",
+    "USER_AGENT",
+    "base_url_override",
+    "close_shared_http_client",
+    "get_shared_http_cache",
+    "get_shared_http_client",
+    "rebase_url",
+    "run_sync",
+]
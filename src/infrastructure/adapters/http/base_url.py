@@ -0,0 +1,48 @@
+"""
+Redirección del sitio de una fuente a otro servidor.
+
+Permite apuntar scrapers y spiders a un servidor local (por ejemplo el diario
+simulado de ``src.infrastructure.testing.fake_news_server``) sin tocar el
+código de cada sitio. La URL base de una fuente se reemplaza con la variable de
+entorno ``SCRAPER_BASE_URL_<FUENTE>``, donde ``<FUENTE>`` es el nombre del
+miembro de ``NewsSource`` (``CLARIN``, ``LA_NACION``, ``PAGINA12``,
+``INFOBAE``)::
+
+    SCRAPER_BASE_URL_CLARIN=http://127.0.0.1:8701
+"""
+
+import os
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+ENV_PREFIX = "SCRAPER_BASE_URL_"
+
+
+def base_url_override(source_name: str) -> Optional[str]:
+    """
+    URL base configurada para una fuente, si se redirigió.
+
+    Args:
+        source_name: Nombre del miembro de ``NewsSource``
+
+    Returns:
+        Optional[str]: URL base sin barra final, o None si no hay redirección
+    """
+    base_url = os.environ.get(f"{ENV_PREFIX}{source_name}", "").strip()
+    return base_url.rstrip("/") or None
+
+
+def rebase_url(url: str, base_url: str) -> str:
+    """
+    Reemplaza el esquema y el host de una URL por los de ``base_url``.
+
+    Args:
+        url: URL del sitio original
+        base_url: URL base del servidor de destino
+
+    Returns:
+        str: Misma ruta y query sobre el servidor de destino
+    """
+    base = urlsplit(base_url)
+    parts = urlsplit(url)
+    return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, ""))
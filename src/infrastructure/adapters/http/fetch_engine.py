@@ -0,0 +1,232 @@
+"""
+Motor de descargas asíncrono compartido por los scrapers basados en requests.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .http_cache import HttpCache
+from .http_client import PooledHttpClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncFetchEngine:
+    """
+    Motor de descargas concurrentes sobre una sesión HTTP con pool de conexiones.
+
+    Las peticiones de ``requests`` son bloqueantes, por lo que se ejecutan en un
+    pool de hilos propio mientras el event loop regula la concurrencia: un
+    máximo global de peticiones en vuelo y un máximo por host para no saturar
+    a ningún sitio. Las conexiones se reutilizan (keep-alive) gracias al pool
+    del ``HTTPAdapter`` montado en la sesión. Un ``PooledHttpClient``
+    compartido conserva sus propios pools, que no se reemplazan.
+
+    Con una ``HttpCache``, ``fetch_conditional`` revalida las descargas con
+    ``If-None-Match``/``If-Modified-Since`` y evita bajar de nuevo el cuerpo
+    cuando el servidor responde 304.
+
+    Attributes:
+        session: Sesión HTTP sobre la que se realizan las peticiones
+        timeout: Tiempo máximo de espera por petición (en segundos)
+        max_concurrency: Cantidad máxima de peticiones simultáneas
+        per_host_limit: Cantidad máxima de peticiones simultáneas por host
+        http_cache: Caché de peticiones condicionales (None para desactivarla)
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        timeout: int = 30,
+        max_concurrency: int = 8,
+        per_host_limit: int = 4,
+        http_cache: Optional[HttpCache] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency debe ser mayor o igual a 1")
+        if per_host_limit < 1:
+            raise ValueError("per_host_limit debe ser mayor o igual a 1")
+
+        self.session = session
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.http_cache = http_cache
+
+        if not isinstance(session, PooledHttpClient):
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_concurrency)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="fetch"
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global_semaphore: Optional[asyncio.Semaphore] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._requests = 0
+        self._errors = 0
+
+    async def fetch(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Descarga una URL respetando los límites de concurrencia.
+
+        Args:
+            url: URL a descargar
+            **kwargs: Argumentos adicionales para ``session.get``
+
+        Returns:
+            requests.Response: Respuesta HTTP exitosa
+
+        Raises:
+            requests.RequestException: Si la petición falla o el status es de error
+        """
+        self._bind_loop()
+        kwargs.setdefault("timeout", self.timeout)
+
+        self._requests += 1
+        try:
+            async with self._host_semaphore(url), self._global_semaphore:
+                response = await self.run_blocking(self.session.get, url, **kwargs)
+            response.raise_for_status()
+        except requests.RequestException:
+            self._errors += 1
+            raise
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Peticiones realizadas por el motor y cuántas fallaron.
+
+        Returns:
+            Dict[str, int]: ``requests`` y ``errors`` (errores de red o status
+                de error) desde la creación del motor
+        """
+        return {"requests": self._requests, "errors": self._errors}
+
+    async def fetch_conditional(self, url: str) -> Tuple[bytes, bool]:
+        """
+        Descarga una URL revalidándola contra la caché HTTP.
+
+        Si hay validadores guardados se envían como headers condicionales; ante
+        un 304 el cuerpo se lee de disco. Las respuestas 200 se guardan para la
+        próxima ejecución. Sin caché equivale a ``fetch``.
+
+        Args:
+            url: URL a descargar
+
+        Returns:
+            Tuple[bytes, bool]: Cuerpo de la respuesta e indicador de que no
+                cambió desde la descarga anterior (304)
+
+        Raises:
+            requests.RequestException: Si la petición falla o el status es de error
+        """
+        if self.http_cache is None:
+            response = await self.fetch(url)
+            return response.content, False
+
+        entry = self.http_cache.lookup(url)
+        if entry is not None:
+            response = await self.fetch(url, headers=entry.validators())
+            if response.status_code == 304:
+                content = await self.run_blocking(self.http_cache.read, entry)
+                if content is not None:
+                    return content, True
+                # La entrada desapareció del disco: descarga completa
+                response = await self.fetch(url)
+        else:
+            response = await self.fetch(url)
+
+        await self.run_blocking(self.http_cache.store, url, response)
+        return response.content, False
+
+    async def fetch_many(self, urls: Iterable[str]) -> List[Any]:
+        """
+        Descarga varias URLs de forma concurrente.
+
+        Args:
+            urls: URLs a descargar
+
+        Returns:
+            List: Una respuesta o una excepción por cada URL, en el mismo orden
+        """
+        return await asyncio.gather(
+            *(self.fetch(url) for url in urls), return_exceptions=True
+        )
+
+    async def run_blocking(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Ejecuta una función bloqueante en el pool de hilos del motor.
+
+        Se usa tanto para las peticiones HTTP como para el parseo del HTML, de
+        forma que el event loop nunca queda bloqueado.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
+
+    def close(self) -> None:
+        """Libera el pool de hilos del motor."""
+        self._executor.shutdown(wait=False)
+
+    def _bind_loop(self) -> None:
+        """Crea los semáforos para el event loop actual (uno por ``asyncio.run``)."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._host_semaphores = {}
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_limit)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Ejecuta una corrutina desde código síncrono.
+
+    Si ya hay un event loop corriendo en el hilo actual (por ejemplo, cuando un
+    caso de uso async invoca ``scrape()``), la corrutina se ejecuta en un hilo
+    auxiliar con su propio event loop para no bloquear ni anidar loops.
+
+    Args:
+        coro: Corrutina a ejecutar
+
+    Returns:
+        El resultado de la corrutina
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="run-sync") as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,299 @@
+"""
+Caché HTTP en disco para peticiones condicionales (ETag / Last-Modified).
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+ENTRY_SUFFIX = ".entry"
+
+
+@dataclass
+class CacheEntry:
+    """
+    Validadores almacenados para una URL.
+
+    Attributes:
+        url: URL descargada
+        etag: Valor del header ETag de la última respuesta 200
+        last_modified: Valor del header Last-Modified de la última respuesta 200
+        size: Tamaño en disco de la entrada (en bytes)
+    """
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    size: int = 0
+
+    def validators(self) -> Dict[str, str]:
+        """Headers condicionales a enviar para revalidar la entrada."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    Caché en disco de respuestas HTTP revalidables.
+
+    Cada URL se guarda en un único archivo ``<sha256(url)>.entry``: una primera
+    línea JSON con los validadores y, a continuación, el cuerpo de la
+    respuesta. Solo se guardan respuestas con ``ETag`` o ``Last-Modified``; el
+    resto no puede revalidarse y no tiene sentido ocupar disco con ellas.
+
+    El tamaño total está acotado por ``max_bytes``: al superarlo se eliminan
+    las entradas menos usadas recientemente. El orden de uso se persiste con
+    el mtime de cada archivo, de modo que sobrevive entre ejecuciones. Las
+    escrituras son atómicas (archivo temporal + ``os.replace``), por lo que
+    varios procesos pueden compartir el mismo directorio.
+
+    Contadores (ver ``stats()``):
+        - hits: revalidaciones respondidas con 304 y servidas desde disco
+        - misses: descargas completas (sin entrada o contenido modificado)
+        - stores: respuestas guardadas
+        - evictions: entradas eliminadas por exceder el tamaño máximo
+
+    Attributes:
+        directory: Directorio donde se guardan las entradas
+        max_bytes: Tamaño máximo total de las entradas (en bytes)
+    """
+
+    def __init__(self, directory, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 1:
+            raise ValueError("max_bytes debe ser mayor o igual a 1")
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """
+        Devuelve los validadores guardados para una URL, sin leer el disco.
+
+        Args:
+            url: URL a revalidar
+
+        Returns:
+            Optional[CacheEntry]: Entrada guardada o None si no existe
+        """
+        with self._lock:
+            return self._entries.get(self._key(url))
+
+    def read(self, entry: CacheEntry) -> Optional[bytes]:
+        """
+        Lee el cuerpo guardado de una entrada revalidada (respuesta 304).
+
+        Cuenta como hit y la marca como usada recientemente.
+
+        Args:
+            entry: Entrada obtenida con ``lookup``
+
+        Returns:
+            Optional[bytes]: Cuerpo guardado, o None si el archivo ya no existe
+                (por ejemplo, si otro proceso lo eliminó)
+        """
+        key = self._key(entry.url)
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                f.readline()
+                body = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._forget(key)
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        return body
+
+    def store(self, url: str, response: requests.Response) -> bool:
+        """
+        Registra una descarga completa y guarda la respuesta si es revalidable.
+
+        Cuenta como miss. Si la nueva respuesta no trae validadores, se
+        descarta la entrada anterior porque sus validadores ya no aplican.
+
+        Args:
+            url: URL solicitada
+            response: Respuesta 200 recibida
+
+        Returns:
+            bool: True si la respuesta se guardó en la caché
+        """
+        key = self._key(url)
+        etag = self._header(response, "ETag")
+        last_modified = self._header(response, "Last-Modified")
+
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                self._forget(key, delete=True)
+                return False
+
+        header = json.dumps(
+            {"url": url, "etag": etag, "last_modified": last_modified}
+        ).encode()
+        body = response.content
+        size = len(header) + 1 + len(body)
+        if size > self.max_bytes:
+            logger.debug(f"Respuesta demasiado grande para la caché HTTP: {url}")
+            return False
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(b"\n")
+                f.write(body)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"No se pudo guardar {url} en la caché HTTP: {e}")
+            return False
+
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = CacheEntry(url, etag, last_modified, size)
+            self._total_bytes += size
+            self.stores += 1
+            self._evict()
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores de uso y ocupación actual de la caché."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def clear(self) -> None:
+        """Elimina todas las entradas de la caché."""
+        with self._lock:
+            for key in list(self._entries):
+                self._forget(key, delete=True)
+
+    def _load_index(self) -> None:
+        """Reconstruye el índice en memoria a partir de las entradas en disco."""
+        paths = []
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                paths.append((path.stat(), path))
+            except OSError:
+                continue
+
+        for stat, path in sorted(paths, key=lambda item: item[0].st_mtime):
+            try:
+                with open(path, "rb") as f:
+                    meta = json.loads(f.readline())
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+                continue
+            self._entries[path.stem] = CacheEntry(
+                meta["url"], meta.get("etag"), meta.get("last_modified"), stat.st_size
+            )
+            self._total_bytes += stat.st_size
+
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Elimina las entradas menos usadas hasta respetar ``max_bytes``."""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._forget(key, delete=True)
+            self.evictions += 1
+
+    def _forget(self, key: str, delete: bool = False) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+        if delete:
+            self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return sha256(url.encode()).hexdigest()
+
+    @staticmethod
+    def _header(response: requests.Response, name: str) -> Optional[str]:
+        value = response.headers.get(name)
+        return value if isinstance(value, str) and value else None
+
+
+_shared_cache: Optional[HttpCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_http_cache() -> Optional[HttpCache]:
+    """
+    Devuelve la caché HTTP compartida por los scrapers del proceso.
+
+    Se configura con variables de entorno:
+        - SCRAPER_HTTP_CACHE_DIR: directorio de la caché
+          (por defecto ``~/.cache/news-scraper/http``; vacío la desactiva)
+        - SCRAPER_HTTP_CACHE_MAX_MB: tamaño máximo en MB (por defecto 64)
+
+    Returns:
+        Optional[HttpCache]: Caché compartida, o None si está desactivada o
+            el directorio no puede crearse
+    """
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is not None:
+            return _shared_cache
+
+        directory = os.environ.get(
+            "SCRAPER_HTTP_CACHE_DIR",
+            str(Path.home() / ".cache" / "news-scraper" / "http"),
+        )
+        if not directory:
+            return None
+
+        max_mb = int(os.environ.get("SCRAPER_HTTP_CACHE_MAX_MB", "64"))
+        try:
+            _shared_cache = HttpCache(directory, max_bytes=max_mb * 1024 * 1024)
+        except OSError as e:
+            logger.warning(f"Caché HTTP desactivada ({directory}): {e}")
+            return None
+
+        logger.info(f"Caché HTTP compartida en {directory} (máximo {max_mb} MB)")
+        return _shared_cache
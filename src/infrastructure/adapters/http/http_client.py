@@ -0,0 +1,178 @@
+"""
+Cliente HTTP con pool de conexiones compartido por todos los scrapers del proceso.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+class PooledHttpClient(requests.Session):
+    """
+    Sesión HTTP de larga vida con pools de conexiones por host.
+
+    Las conexiones TCP/TLS quedan abiertas (keep-alive) en un pool por host y
+    se reutilizan entre scrapers, fuentes y ejecuciones, de modo que un proceso
+    de larga vida (por ejemplo el scheduler) no repite handshakes. Un semáforo
+    global limita las peticiones simultáneas de todo el proceso, sin importar
+    cuántos scrapers o event loops compartan el cliente.
+
+    Attributes:
+        max_connections: Peticiones simultáneas como máximo en todo el proceso
+        connections_per_host: Conexiones abiertas como máximo por host
+        http2: Indica si las conexiones HTTPS negocian HTTP/2
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 64,
+        connections_per_host: int = 8,
+        max_hosts: int = 32,
+        http2: bool = False,
+    ):
+        """
+        Args:
+            max_connections: Techo global de peticiones simultáneas
+            connections_per_host: Tamaño del pool de cada host; al agotarse,
+                las peticiones a ese host esperan una conexión libre
+            max_hosts: Pools de host que se mantienen abiertos a la vez
+            http2: Usar HTTP/2 en HTTPS si el paquete ``h2`` está instalado
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections debe ser mayor o igual a 1")
+        if connections_per_host < 1:
+            raise ValueError("connections_per_host debe ser mayor o igual a 1")
+
+        super().__init__()
+        self.max_connections = max_connections
+        self.connections_per_host = connections_per_host
+        self.http2 = http2 and _enable_http2()
+        self.headers.update({"User-Agent": USER_AGENT})
+
+        adapter = HTTPAdapter(
+            pool_connections=max_hosts,
+            pool_maxsize=connections_per_host,
+            pool_block=True,
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any):
+        with self._slots:
+            with self._lock:
+                self._requests += 1
+                self._in_flight += 1
+                self._max_in_flight = max(self._max_in_flight, self._in_flight)
+            try:
+                return super().request(method, url, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Estadísticas de uso del cliente.
+
+        Returns:
+            Dict[str, int]: Peticiones realizadas, en vuelo, máximo en vuelo y
+                conexiones abiertas desde la creación del cliente (una cantidad
+                de conexiones muy inferior a la de peticiones indica reuso)
+        """
+        connections = 0
+        for adapter in set(self.adapters.values()):
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    connections += pool.num_connections
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "in_flight": self._in_flight,
+                "max_in_flight": self._max_in_flight,
+                "connections": connections,
+            }
+
+
+def _enable_http2() -> bool:
+    """
+    Activa el soporte experimental de HTTP/2 de urllib3.
+
+    El cambio alcanza a todo el proceso y urllib3 solo ofrece ``h2`` en ALPN:
+    conviene activarlo únicamente si todos los sitios scrapeados hablan HTTP/2.
+    """
+    try:
+        from urllib3.http2 import inject_into_urllib3
+
+        inject_into_urllib3()
+    except ImportError as e:
+        logger.warning(f"HTTP/2 no disponible, se usa HTTP/1.1: {e}")
+        return False
+    return True
+
+
+_shared_client: Optional[PooledHttpClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_http_client() -> PooledHttpClient:
+    """
+    Devuelve el cliente HTTP compartido por los scrapers del proceso.
+
+    Se configura con variables de entorno:
+        - SCRAPER_HTTP_MAX_CONNECTIONS: peticiones simultáneas en todo el
+          proceso (por defecto 64)
+        - SCRAPER_HTTP_CONNECTIONS_PER_HOST: conexiones por host (por defecto 8)
+        - SCRAPER_HTTP2: ``1`` para negociar HTTP/2 si ``h2`` está instalado
+
+    Returns:
+        PooledHttpClient: Cliente compartido
+    """
+    global _shared_client
+
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = PooledHttpClient(
+                max_connections=int(
+                    os.environ.get("SCRAPER_HTTP_MAX_CONNECTIONS", "64")
+                ),
+                connections_per_host=int(
+                    os.environ.get("SCRAPER_HTTP_CONNECTIONS_PER_HOST", "8")
+                ),
+                http2=os.environ.get("SCRAPER_HTTP2", "") == "1",
+            )
+            logger.info(
+                f"Cliente HTTP compartido: {_shared_client.max_connections} "
+                f"conexiones, {_shared_client.connections_per_host} por host"
+            )
+        return _shared_client
+
+
+def close_shared_http_client() -> None:
+    """Cierra las conexiones del cliente compartido; el próximo uso crea otro."""
+    global _shared_client
+
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
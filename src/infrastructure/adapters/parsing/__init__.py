@@ -0,0 +1,19 @@
+from .html_parser import (
+    BeautifulSoupHtmlParser,
+    HtmlParser,
+    LxmlHtmlParser,
+    detect_encoding,
+    get_html_parser,
+    http_encoding,
+)
+from .lxml_node import LxmlNode
+
+__all__ = [
+    "BeautifulSoupHtmlParser",
+    "HtmlParser",
+    "LxmlHtmlParser",
+    "LxmlNode",
+    "detect_encoding",
+    "get_html_parser",
+    "http_encoding",
+]
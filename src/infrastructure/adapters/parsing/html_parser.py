@@ -0,0 +1,247 @@
+"""
+Backends intercambiables para parsear HTML.
+
+Los scrapers y los pipelines no construyen el árbol directamente sino a través
+de un ``HtmlParser``. Ambos backends devuelven objetos con la misma API de
+consulta (la de BeautifulSoup que usan los selectores de cada sitio):
+
+- ``lxml`` (por defecto): ``lxml.html`` + XPath precompilado. El árbol se
+  construye en C y las búsquedas no recorren nodos en Python.
+- ``bs4``: BeautifulSoup con el parser lxml, como en la versión original.
+
+El backend se elige con ``SCRAPER_HTML_PARSER`` o pasando una instancia al
+scraper. En ambos casos la codificación declarada (HTTP o ``<meta charset>``)
+se pasa al parser para evitar la detección automática.
+"""
+
+import codecs
+import logging
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional, Union
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from .lxml_node import LxmlNode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARSER = "lxml"
+
+# Etiquetas cuyo texto no forma parte del contenido de una nota
+NON_CONTENT_TAGS = ("script", "style", "nav", "header", "footer", "aside")
+
+_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Errores de lxml ante documentos vacíos o sin elementos
+_PARSE_ERRORS = (etree.ParserError, etree.XMLSyntaxError)
+
+Markup = Union[bytes, str]
+
+
+class HtmlParser(ABC):
+    """Backend de parseo de HTML."""
+
+    name: str = ""
+
+    @abstractmethod
+    def parse(self, content: Markup, encoding: Optional[str] = None) -> Any:
+        """
+        Parsea un documento HTML completo.
+
+        Args:
+            content: HTML en bytes (o ya decodificado)
+            encoding: Codificación conocida (header HTTP); si es None se usa la
+                declarada en el documento
+
+        Returns:
+            Documento con la API de consulta de BeautifulSoup
+        """
+
+    @abstractmethod
+    def extract_text(
+        self, markup: str, exclude: Iterable[str] = NON_CONTENT_TAGS
+    ) -> str:
+        """
+        Devuelve el texto visible de un fragmento HTML.
+
+        Args:
+            markup: Fragmento HTML
+            exclude: Etiquetas que se eliminan junto con su contenido
+
+        Returns:
+            str: Textos del fragmento separados por un espacio
+        """
+
+
+class LxmlHtmlParser(HtmlParser):
+    """Backend lxml.html con selectores XPath precompilados."""
+
+    name = "lxml"
+
+    def __init__(self):
+        # Los parsers de lxml no deben compartirse entre hilos
+        self._local = threading.local()
+
+    def parse(self, content: Markup, encoding: Optional[str] = None) -> LxmlNode:
+        if isinstance(content, bytes):
+            parser = self._parser(detect_encoding(content, encoding))
+        else:
+            parser = self._parser(None)
+
+        try:
+            root = lxml.html.document_fromstring(content, parser=parser)
+        except _PARSE_ERRORS:
+            # Documento vacío o solo con comentarios
+            root = lxml.html.document_fromstring("<html></html>")
+        return LxmlNode(root)
+
+    def extract_text(
+        self, markup: str, exclude: Iterable[str] = NON_CONTENT_TAGS
+    ) -> str:
+        try:
+            root = lxml.html.fragment_fromstring(markup, create_parent="div")
+        except _PARSE_ERRORS:
+            return ""
+        node = LxmlNode(root)
+        for element in node.find_all(list(exclude)):
+            element.decompose()
+        return node.get_text(separator=" ", strip=True)
+
+    def _parser(self, encoding: Optional[str]) -> lxml.html.HTMLParser:
+        parsers: Dict[Optional[str], lxml.html.HTMLParser] = getattr(
+            self._local, "parsers", None
+        )
+        if parsers is None:
+            parsers = self._local.parsers = {}
+        parser = parsers.get(encoding)
+        if parser is None:
+            parser = parsers[encoding] = lxml.html.HTMLParser(encoding=encoding)
+        return parser
+
+
+class BeautifulSoupHtmlParser(HtmlParser):
+    """Backend BeautifulSoup (árbol Python sobre el parser lxml)."""
+
+    name = "bs4"
+
+    def parse(self, content: Markup, encoding: Optional[str] = None) -> BeautifulSoup:
+        if isinstance(content, bytes):
+            return BeautifulSoup(
+                content, "lxml", from_encoding=detect_encoding(content, encoding)
+            )
+        return BeautifulSoup(content, "lxml")
+
+    def extract_text(
+        self, markup: str, exclude: Iterable[str] = NON_CONTENT_TAGS
+    ) -> str:
+        soup = BeautifulSoup(markup, "lxml")
+        for element in soup(list(exclude)):
+            element.decompose()
+        return soup.get_text(separator=" ", strip=True)
+
+
+PARSERS = {
+    LxmlHtmlParser.name: LxmlHtmlParser,
+    BeautifulSoupHtmlParser.name: BeautifulSoupHtmlParser,
+}
+
+_instances: Dict[str, HtmlParser] = {}
+_instances_lock = threading.Lock()
+
+
+def get_html_parser(name: Optional[str] = None) -> HtmlParser:
+    """
+    Devuelve la instancia compartida de un backend de parseo.
+
+    Args:
+        name: "lxml" o "bs4". Si es None se usa ``SCRAPER_HTML_PARSER``
+            (por defecto "lxml")
+
+    Returns:
+        HtmlParser: Backend solicitado
+
+    Raises:
+        ValueError: Si el backend no existe
+    """
+    name = name or os.environ.get("SCRAPER_HTML_PARSER", DEFAULT_PARSER)
+    if name not in PARSERS:
+        raise ValueError(
+            f"Parser HTML desconocido: {name} (disponibles: {', '.join(PARSERS)})"
+        )
+
+    with _instances_lock:
+        parser = _instances.get(name)
+        if parser is None:
+            parser = _instances[name] = PARSERS[name]()
+        return parser
+
+
+def normalize_encoding(encoding: Optional[str]) -> Optional[str]:
+    """Nombre canónico de una codificación, o None si no es válida."""
+    if not encoding:
+        return None
+    try:
+        return codecs.lookup(encoding.strip()).name
+    except LookupError:
+        return None
+
+
+def http_encoding(response: Any) -> Optional[str]:
+    """
+    Codificación declarada explícitamente en el Content-Type de una respuesta.
+
+    A diferencia de ``response.encoding`` no asume ISO-8859-1 cuando el header
+    no incluye ``charset``.
+    """
+    content_type = getattr(response, "headers", {}).get("Content-Type")
+    if not isinstance(content_type, str):
+        return None
+    match = _CHARSET_RE.search(content_type)
+    return normalize_encoding(match.group(1)) if match else None
+
+
+def detect_encoding(content: bytes, declared: Optional[str] = None) -> str:
+    """
+    Determina la codificación de un documento sin heurísticas estadísticas.
+
+    Orden: codificación declarada (HTTP), BOM, ``<meta charset>`` en los
+    primeros 2 KB y, por último, UTF-8 si el contenido es válido o
+    Windows-1252 en caso contrario.
+
+    Args:
+        content: Documento en bytes
+        declared: Codificación informada por el servidor
+
+    Returns:
+        str: Nombre canónico de la codificación
+    """
+    encoding = normalize_encoding(declared)
+    if encoding:
+        return encoding
+
+    for bom, bom_encoding in _BOMS:
+        if content.startswith(bom):
+            return bom_encoding
+
+    match = _META_CHARSET_RE.search(content, 0, 2048)
+    if match:
+        encoding = normalize_encoding(match.group(1).decode("ascii", "ignore"))
+        if encoding:
+            return encoding
+
+    try:
+        content.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp1252"
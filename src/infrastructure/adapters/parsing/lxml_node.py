@@ -0,0 +1,160 @@
+"""
+Nodos HTML sobre lxml con el subconjunto de la API de BeautifulSoup que usan
+los scrapers (``find``, ``find_all``, ``get_text``, ``get``, ``[attr]``).
+
+Cada combinación de tag y atributos se traduce una sola vez a una expresión
+XPath precompilada (``etree.XPath``), que luego se evalúa en C sobre el árbol.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from lxml import etree
+
+# Mismos textos que BeautifulSoup.get_text(): sin scripts, estilos ni comentarios
+_TEXT_XPATH = etree.XPath(
+    ".//text()[not(parent::script or parent::style or parent::template)]"
+)
+
+Name = Union[None, str, Iterable[str]]
+AttrValue = Union[bool, str, Iterable[str]]
+
+
+class LxmlNode:
+    """
+    Elemento de un documento parseado con lxml.html.
+
+    Attributes:
+        name: Nombre del tag
+        attrs: Atributos del elemento
+    """
+
+    __slots__ = ("_element",)
+
+    def __init__(self, element: etree._Element):
+        self._element = element
+
+    @property
+    def name(self) -> str:
+        return self._element.tag
+
+    @property
+    def attrs(self) -> Dict[str, str]:
+        return dict(self._element.attrib)
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    def find(
+        self, name: Name = None, attrs: Optional[Dict[str, AttrValue]] = None, **kwargs
+    ) -> Optional["LxmlNode"]:
+        """Primer descendiente que coincide, igual que ``Tag.find``."""
+        matches = _compile(_selector_key(name, attrs, kwargs), first=True)(
+            self._element
+        )
+        return LxmlNode(matches[0]) if matches else None
+
+    def find_all(
+        self, name: Name = None, attrs: Optional[Dict[str, AttrValue]] = None, **kwargs
+    ) -> List["LxmlNode"]:
+        """Descendientes que coinciden, en orden de documento (``Tag.find_all``)."""
+        matches = _compile(_selector_key(name, attrs, kwargs), first=False)(
+            self._element
+        )
+        return [LxmlNode(element) for element in matches]
+
+    __call__ = find_all
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        texts = _TEXT_XPATH(self._element)
+        if strip:
+            texts = [text.strip() for text in texts]
+            texts = [text for text in texts if text]
+        return separator.join(texts)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._element.get(key, default)
+
+    def __getitem__(self, key: str) -> str:
+        value = self._element.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def decompose(self) -> None:
+        """Elimina el elemento (y su contenido) del árbol."""
+        self._element.drop_tree()
+
+    def __repr__(self) -> str:
+        return f"<LxmlNode {self.name}>"
+
+
+SelectorKey = Tuple[Tuple[str, ...], Tuple[Tuple[str, Any], ...]]
+
+
+def _selector_key(
+    name: Name, attrs: Optional[Dict[str, AttrValue]], kwargs: Dict[str, AttrValue]
+) -> SelectorKey:
+    """Normaliza los argumentos de ``find``/``find_all`` a una clave hasheable."""
+    if name is None:
+        names: Tuple[str, ...] = ()
+    elif isinstance(name, str):
+        names = (name,)
+    else:
+        names = tuple(name)
+
+    merged = dict(attrs or {})
+    for key, value in kwargs.items():
+        merged["class" if key == "class_" else key] = value
+
+    items = []
+    for key, value in sorted(merged.items()):
+        if not isinstance(value, (bool, str)):
+            value = tuple(value)
+        items.append((key, value))
+    return names, tuple(items)
+
+
+@lru_cache(maxsize=None)
+def _compile(key: SelectorKey, first: bool) -> etree.XPath:
+    names, attrs = key
+    if not names:
+        step = "*"
+    elif len(names) == 1:
+        step = names[0]
+    else:
+        step = "*[" + " or ".join(f"self::{name}" for name in names) + "]"
+
+    for attr, value in attrs:
+        step += f"[{_condition(attr, value)}]"
+
+    expression = f".//{step}"
+    if first:
+        expression = f"({expression})[1]"
+    return etree.XPath(expression)
+
+
+def _condition(attr: str, value: Any) -> str:
+    if value is True:
+        return f"@{attr}"
+    if value is False:
+        return f"not(@{attr})"
+    values = (value,) if isinstance(value, str) else value
+    if attr == "class":
+        # Igual que BeautifulSoup: coincide con cualquiera de las clases
+        classes = "concat(' ', normalize-space(@class), ' ')"
+        tests = [f"contains({classes}, {_literal(f' {v} ')})" for v in values]
+    else:
+        tests = [f"@{attr}={_literal(v)}" for v in values]
+    return " or ".join(tests) if tests else "false()"
+
+
+def _literal(value: str) -> str:
+    """Literal XPath 1.0 para un texto arbitrario."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ', "\'", '.join(f"'{part}'" for part in parts) + ")"
@@ -1,5 +1,6 @@
+from .base_scraper import BaseNewsScraper
 from .clarin_scraper import ClarinScraper
 from .pagina12_scraper import Pagina12Scraper
 from .lanacion_scraper import LaNacionScraper
 
-__all__ = ["ClarinScraper", "Pagina12Scraper", "LaNacionScraper"]
+__all__ = ["BaseNewsScraper", "ClarinScraper", "Pagina12Scraper", "LaNacionScraper"]
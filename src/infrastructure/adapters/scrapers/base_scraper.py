@@ -0,0 +1,794 @@
+import asyncio
+import itertools
+import logging
+from datetime import timedelta
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+from src.domain.dto.article_dto import ArticleDTO
+from src.domain.dto.fetched_page import FetchedPage
+from src.domain.enums import DiscoveryStrategy, NewsSource
+from src.domain.repositories.crawl_frontier_repository import (
+    CrawlFrontierRepository,
+)
+from src.infrastructure.adapters.http import (
+    USER_AGENT,
+    AsyncFetchEngine,
+    HttpCache,
+    PooledHttpClient,
+    base_url_override,
+    rebase_url,
+    run_sync,
+)
+from src.infrastructure.adapters.parsing import (
+    HtmlParser,
+    get_html_parser,
+    http_encoding,
+)
+
+from .feed_discovery import FeedEntry, parse_feed, rank_entries
+from .json_ld import extract_article_metadata
+
+logger = logging.getLogger(__name__)
+
+# Recibe URLs candidatas y devuelve las que ya están almacenadas
+KnownUrlsChecker = Callable[[list[str]], Awaitable[set[str]]]
+
+# Máximo de sitemaps hijos (los más recientes) a leer de un <sitemapindex>
+MAX_CHILD_SITEMAPS = 2
+
+
+class BaseNewsScraper:
+    """
+    Base común para los scrapers de diarios basados en requests.
+
+    Resuelve el flujo compartido por todas las fuentes (descubrimiento de URLs
+    en las secciones y extracción del contenido de cada artículo) y delega en
+    las subclases el conocimiento específico de cada sitio: secciones, filtros
+    de URLs y selectores de título, contenido y fecha.
+
+    Todas las descargas pasan por un AsyncFetchEngine, de modo que las secciones
+    y los artículos se descargan de forma concurrente con límites por host.
+    ``ascrape()`` es el punto de entrada asíncrono y ``scrape()`` conserva el
+    contrato síncrono de ScraperPort.
+
+    Si se indica un ``known_urls_checker``, las URLs descubiertas se contrastan
+    en un único lote contra el almacén de artículos antes de descargarlas: las
+    ya conocidas nunca se descargan y el cupo de ``max_articles`` se destina
+    solo a URLs nuevas.
+
+    Con una ``frontier`` (CrawlFrontierRepository) el scraper recuerda entre
+    ejecuciones cada URL descubierta, cuándo la vio por primera vez y si ya la
+    procesó; las procesadas también cuentan como conocidas. Una URL se marca
+    procesada solo cuando su página se descarga y se parsea; si falla
+    cualquiera de los dos pasos se registra el fallo y se reintenta en las
+    siguientes ejecuciones. Con
+    ``known_streak_limit`` el descubrimiento se detiene al encontrar esa
+    cantidad de URLs conocidas seguidas: como los candidatos van de más nuevo a
+    más antiguo, una racha de conocidas indica que lo que sigue ya se procesó.
+    Así ``max_articles`` (que puede ser None) queda solo como tope de
+    seguridad y la cantidad de artículos descargados sigue al ritmo de
+    publicación de la fuente.
+
+    Con una ``http_cache`` las páginas de sección se piden de forma condicional
+    (ETag / Last-Modified). Una sección que responde 304 no se vuelve a
+    descargar: sus URLs se extraen del HTML guardado en caché y el filtro de
+    URLs conocidas descarta las ya procesadas, de modo que los enlaces que
+    quedaron fuera por ``max_articles`` o cuya descarga falló se reintentan
+    (ver ``skip_unchanged_sections``).
+
+    Con ``discovery_strategy`` SITEMAP o RSS las URLs se descubren desde los
+    feeds de la fuente (``NewsSource.discovery_feeds``), ordenadas de más nueva
+    a más antigua según lastmod / pubDate y descartando las anteriores a
+    ``feed_max_age``. Si ningún feed puede leerse se recorren las secciones
+    HTML como respaldo.
+
+    El HTML se parsea con un ``HtmlParser`` intercambiable (lxml por defecto,
+    BeautifulSoup como alternativa); los selectores de cada sitio usan la API
+    de consulta común a ambos backends (``find``, ``find_all``, ``get_text``).
+
+    El sitio puede redirigirse a otro servidor (p. ej. el diario simulado para
+    pruebas de carga) con el argumento ``base_url`` o la variable
+    ``SCRAPER_BASE_URL_<FUENTE>``; secciones, feeds y filtros de URL pasan a
+    usar ese host.
+
+    Con un ``http_client`` (``PooledHttpClient``) el scraper usa ese cliente
+    compartido en lugar de abrir su propia sesión: las conexiones sobreviven al
+    scraper y se reutilizan en las siguientes ejecuciones.
+
+    Attributes:
+        base_url: URL base del sitio
+        site_domain: Dominio que deben contener las URLs de artículos
+        fuente: Nombre de la fuente asignado a los artículos extraídos
+        sections: Rutas de las secciones a recorrer
+        skip_patterns: Fragmentos de URL que se descartan al descubrir artículos
+        max_articles: Número máximo de artículos a extraer por sesión (None
+            para no limitar)
+        frontier: Frontera persistente de URLs de la fuente
+        known_streak_limit: URLs conocidas seguidas que detienen el
+            descubrimiento (None para recorrer todos los candidatos)
+        timeout: Tiempo máximo de espera para las peticiones HTTP (en segundos)
+        skip_unchanged_sections: Omitir la extracción de URLs de las secciones
+            y feeds que responden 304. Ahorra el parseo, pero los enlaces que
+            la ejecución anterior no llegó a procesar (cortados por
+            ``max_articles`` o con la descarga fallida) no se reintentan
+            hasta que cambie la página. Por defecto False: se reparsea el HTML
+            guardado en caché.
+        source: Fuente del enum NewsSource (define los feeds disponibles)
+        discovery_strategy: Estrategia de descubrimiento de URLs
+        feed_max_age: Antigüedad máxima de las entradas de los feeds
+        html_parser: Backend de parseo de HTML
+    """
+
+    base_url: str = ""
+    site_domain: str = ""
+    fuente: str = ""
+    sections: list[str] = []
+    skip_patterns: list[str] = ["javascript:", "#"]
+    skip_unchanged_sections: bool = False
+    source: Optional[NewsSource] = None
+    feed_max_age: Optional[timedelta] = timedelta(days=2)
+
+    def __init__(
+        self,
+        max_articles: Optional[int] = 15,
+        timeout: int = 30,
+        max_concurrency: int = 8,
+        per_host_limit: int = 4,
+        known_urls_checker: Optional[KnownUrlsChecker] = None,
+        http_cache: Optional[HttpCache] = None,
+        discovery_strategy: DiscoveryStrategy = DiscoveryStrategy.SECTIONS,
+        html_parser: Optional[HtmlParser] = None,
+        base_url: Optional[str] = None,
+        http_client: Optional[PooledHttpClient] = None,
+        frontier: Optional[CrawlFrontierRepository] = None,
+        known_streak_limit: Optional[int] = None,
+    ):
+        if known_streak_limit is not None and known_streak_limit < 1:
+            raise ValueError("known_streak_limit debe ser mayor o igual a 1")
+
+        self.max_articles = max_articles
+        self.frontier = frontier
+        self.known_streak_limit = known_streak_limit
+        self._configure_parsing(html_parser, base_url)
+        self.discovery_strategy = discovery_strategy
+        self.timeout = timeout
+        self.known_urls_checker = known_urls_checker
+        self._owns_session = http_client is None
+        if http_client is not None:
+            self.session = http_client
+        else:
+            self.session = requests.Session()
+            self.session.headers.update({"User-Agent": USER_AGENT})
+        self.fetch_engine = AsyncFetchEngine(
+            self.session,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            per_host_limit=per_host_limit,
+            http_cache=http_cache,
+        )
+        logger.info(
+            f"{self.__class__.__name__} inicializado - max_articles: {max_articles}"
+        )
+
+    @classmethod
+    def for_parsing(
+        cls,
+        html_parser: Optional[HtmlParser] = None,
+        base_url: Optional[str] = None,
+    ) -> "BaseNewsScraper":
+        """
+        Crea una instancia que solo parsea artículos (``parse_article``).
+
+        No abre sesión HTTP ni motor de descargas: la usan los procesos de
+        parseo, que reciben las páginas ya descargadas.
+
+        Args:
+            html_parser: Backend de parseo de HTML
+            base_url: URL base del sitio, si se redirigió a otro servidor
+
+        Returns:
+            BaseNewsScraper: Instancia de la clase lista para parsear
+        """
+        scraper = cls.__new__(cls)
+        scraper._configure_parsing(html_parser, base_url)
+        return scraper
+
+    def _configure_parsing(
+        self, html_parser: Optional[HtmlParser], base_url: Optional[str]
+    ) -> None:
+        """Configura el backend de HTML y la URL base del sitio."""
+        if base_url is None and self.source is not None:
+            base_url = base_url_override(self.source.name)
+        self.redirected = bool(base_url)
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+            self.site_domain = urlsplit(self.base_url).netloc
+        self.html_parser = html_parser or get_html_parser()
+
+    def scrape(self) -> list[ArticleDTO]:
+        """
+        Extrae artículos de las secciones configuradas de la fuente.
+
+        Returns:
+            list[ArticleDTO]: Lista de artículos extraídos en formato estandarizado
+
+        Raises:
+            Exception: Si ocurre un error crítico durante el proceso de scraping
+        """
+        return run_sync(self.ascrape())
+
+    async def ascrape(self) -> list[ArticleDTO]:
+        """
+        Versión asíncrona de ``scrape()``.
+
+        Returns:
+            list[ArticleDTO]: Lista de artículos extraídos en formato estandarizado
+        """
+        logger.info(f"Iniciando scraping de {self.fuente}")
+
+        # Fase 1: Recolectar URLs de artículos de las secciones
+        article_urls_list = await self.collect_article_urls()
+
+        # Fase 2: Extraer contenido de cada artículo
+        results = await asyncio.gather(
+            *(self._aextract_article_content(url) for url in article_urls_list)
+        )
+        articles = [article for article in results if article]
+
+        self._log_completed(len(articles))
+        return articles
+
+    async def astream(self) -> AsyncIterator[ArticleDTO]:
+        """
+        Versión en streaming de ``ascrape()``: entrega cada artículo apenas se
+        extrae, en orden de finalización.
+
+        Se descargan a la vez como máximo ``max_concurrency`` artículos, de modo
+        que el primer artículo llega tras la primera descarga y la memoria no
+        crece con ``max_articles``. Si el consumidor deja de iterar se cancelan
+        las descargas pendientes.
+
+        Yields:
+            ArticleDTO: Artículos extraídos
+        """
+        logger.info(f"Iniciando scraping en streaming de {self.fuente}")
+        article_urls = iter(await self.collect_article_urls())
+        window = self.fetch_engine.max_concurrency
+        pending: set[asyncio.Task] = set()
+        extracted = 0
+
+        try:
+            while True:
+                for url in itertools.islice(article_urls, window - len(pending)):
+                    pending.add(
+                        asyncio.ensure_future(self._aextract_article_content(url))
+                    )
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    article = task.result()
+                    if article:
+                        extracted += 1
+                        yield article
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self._log_completed(extracted)
+
+    async def collect_article_urls(self) -> list[str]:
+        """
+        Descubre las URLs de artículos que todavía no están almacenadas.
+
+        Returns:
+            list[str]: Hasta ``max_articles`` URLs, de la más relevante a la
+                menos relevante
+        """
+        article_urls = await self._discover_article_urls()
+        article_urls = await self._filter_known_urls(article_urls)
+        article_urls = article_urls[: self.max_articles]
+        logger.info(f"Extrayendo contenido de {len(article_urls)} artículos")
+        return article_urls
+
+    async def probe(self) -> bool:
+        """
+        Comprueba con una única petición a la portada que el sitio responde.
+
+        Returns:
+            bool: True si la portada respondió sin error
+        """
+        try:
+            await self.fetch_engine.fetch(self.base_url)
+        except Exception as e:
+            logger.warning(f"Sondeo de {self.fuente} fallido: {e}")
+            return False
+        return True
+
+    def request_stats(self) -> dict[str, int]:
+        """
+        Peticiones HTTP del scraper y cuántas fallaron.
+
+        Returns:
+            dict[str, int]: ``requests`` y ``errors`` desde su creación
+        """
+        return self.fetch_engine.stats()
+
+    def _log_completed(self, total: int) -> None:
+        logger.info(f"Scraping completado. Total de artículos extraídos: {total}")
+        if self.fetch_engine.http_cache is not None:
+            logger.info(f"Caché HTTP: {self.fetch_engine.http_cache.stats()}")
+
+    async def _discover_article_urls(self) -> list[str]:
+        """
+        Descubre las URLs de artículos según la estrategia configurada.
+
+        Returns:
+            list[str]: URLs únicas, de la más relevante a la menos relevante
+        """
+        if self.discovery_strategy is not DiscoveryStrategy.SECTIONS:
+            urls = await self._discover_from_feeds()
+            if urls is not None:
+                return urls
+            logger.warning(
+                f"Descubrimiento por {self.discovery_strategy.value} no disponible "
+                f"para {self.fuente}, se recorren las secciones HTML"
+            )
+
+        return await self._discover_from_sections()
+
+    async def _discover_from_feeds(self) -> Optional[list[str]]:
+        """
+        Descarga los feeds de la fuente en paralelo y combina sus URLs.
+
+        Returns:
+            Optional[list[str]]: URLs ordenadas de la más nueva a la más antigua,
+                o None si la fuente no tiene feeds o ninguno pudo leerse
+        """
+        feeds = (
+            self.source.discovery_feeds(self.discovery_strategy) if self.source else []
+        )
+        if not feeds:
+            return None
+        if self.redirected:
+            feeds = [rebase_url(feed_url, self.base_url) for feed_url in feeds]
+
+        results = await asyncio.gather(
+            *(self._aextract_feed_entries(feed_url) for feed_url in feeds)
+        )
+        if all(entries is None for entries in results):
+            return None
+
+        entries = [
+            FeedEntry(url, entry.published)
+            for feed_entries in results
+            for entry in feed_entries or []
+            if (url := self._normalize_article_url(entry.url))
+        ]
+        ranked = rank_entries(entries, max_age=self.feed_max_age)
+        logger.info(
+            f"URLs extraídas de {len(feeds)} feed(s) {self.discovery_strategy.value}: "
+            f"{len(ranked)}"
+        )
+        return [entry.url for entry in ranked]
+
+    async def _aextract_feed_entries(
+        self, feed_url: str, follow_index: bool = True
+    ) -> Optional[list[FeedEntry]]:
+        """
+        Descarga y parsea un sitemap o feed RSS/Atom.
+
+        De un ``<sitemapindex>`` se leen los ``MAX_CHILD_SITEMAPS`` sitemaps
+        hijos más recientes.
+
+        Args:
+            feed_url: URL del feed
+            follow_index: Seguir los sitemaps hijos de un índice
+
+        Returns:
+            Optional[list[FeedEntry]]: Entradas del feed (vacía si no cambió
+                desde la ejecución anterior) o None si no pudo leerse
+        """
+        try:
+            logger.info(f"Extrayendo URLs de feed: {feed_url}")
+            content, not_modified = await self.fetch_engine.fetch_conditional(feed_url)
+            if not_modified and self.skip_unchanged_sections:
+                logger.info(f"Feed sin cambios (304), se omite: {feed_url}")
+                return []
+            parsed = await self.fetch_engine.run_blocking(parse_feed, content)
+        except requests.RequestException as e:
+            logger.error(f"Error de red al acceder al feed {feed_url}: {e}")
+            return None
+        except ValueError as e:
+            logger.error(f"Feed inválido en {feed_url}: {e}")
+            return None
+
+        if not parsed.sitemaps or not follow_index:
+            return parsed.entries
+
+        children = rank_entries(parsed.sitemaps)[:MAX_CHILD_SITEMAPS]
+        results = await asyncio.gather(
+            *(
+                self._aextract_feed_entries(child.url, follow_index=False)
+                for child in children
+            )
+        )
+        return parsed.entries + [
+            entry for entries in results for entry in entries or []
+        ]
+
+    async def _discover_from_sections(self) -> list[str]:
+        """
+        Descarga todas las secciones en paralelo y combina sus URLs.
+
+        Las secciones listan primero sus notas más nuevas, por lo que se
+        intercalan: primero la más reciente de cada sección, luego la segunda
+        de cada una, y así sucesivamente.
+
+        Returns:
+            list[str]: URLs únicas, de la más nueva a la más antigua
+        """
+        section_urls = [urljoin(self.base_url, section) for section in self.sections]
+        results = await asyncio.gather(
+            *(self._aextract_article_urls_from_section(url) for url in section_urls)
+        )
+
+        for section, urls in zip(self.sections, results):
+            logger.info(f"URLs extraídas de {section}: {len(urls)}")
+
+        article_urls: dict[str, None] = {}
+        for urls in itertools.zip_longest(*results):
+            article_urls.update(dict.fromkeys(url for url in urls if url))
+
+        return list(article_urls)
+
+    async def _filter_known_urls(self, article_urls: list[str]) -> list[str]:
+        """
+        Descarta las URLs que ya existen en el almacén de artículos o que la
+        frontera ya descargó.
+
+        Cada consulta se hace en un único lote. Si falla, se continúa sin
+        filtrar para no perder el scraping completo por un error de
+        persistencia. Con ``known_streak_limit`` se dejan de considerar los
+        candidatos a partir de la primera racha de URLs conocidas.
+
+        Args:
+            article_urls: URLs descubiertas, de la más nueva a la más antigua
+
+        Returns:
+            list[str]: URLs no conocidas, conservando el orden original
+        """
+        if not article_urls or (not self.known_urls_checker and not self.frontier):
+            return article_urls
+
+        known_urls = await self._lookup_known_urls(article_urls)
+        new_urls = []
+        streak = 0
+        for url in article_urls:
+            if url not in known_urls:
+                new_urls.append(url)
+                streak = 0
+                continue
+            streak += 1
+            if self.known_streak_limit and streak >= self.known_streak_limit:
+                logger.info(
+                    f"{streak} URLs conocidas seguidas en {self.fuente}: "
+                    f"se detiene el descubrimiento"
+                )
+                break
+
+        logger.info(
+            f"URLs ya conocidas (omitidas): "
+            f"{len(known_urls & set(article_urls))} - URLs nuevas: {len(new_urls)}"
+        )
+        return new_urls
+
+    async def _lookup_known_urls(self, article_urls: list[str]) -> set[str]:
+        """
+        Consulta el almacén de artículos y registra las URLs en la frontera.
+
+        Returns:
+            set[str]: URLs que no hace falta descargar
+        """
+        known_urls: set[str] = set()
+        if self.known_urls_checker:
+            try:
+                known_urls |= await self.known_urls_checker(article_urls)
+            except Exception as e:
+                logger.error(f"Error consultando URLs conocidas: {e}", exc_info=True)
+
+        if self.frontier is not None:
+            try:
+                known_urls |= await self.frontier.register(self.fuente, article_urls)
+            except Exception as e:
+                logger.error(
+                    f"Error registrando URLs en la frontera: {e}", exc_info=True
+                )
+        return known_urls
+
+    async def _mark_in_frontier(self, url: str, fetched: bool) -> None:
+        """Registra en la frontera el resultado del procesamiento de un artículo."""
+        if self.frontier is None:
+            return
+        try:
+            if fetched:
+                await self.frontier.mark_fetched(self.fuente, url)
+            else:
+                await self.frontier.mark_failed(self.fuente, url)
+        except Exception as e:
+            logger.error(f"Error actualizando la frontera para {url}: {e}")
+
+    def _extract_article_urls_from_section(self, section_url: str) -> list[str]:
+        """
+        Extrae URLs de artículos de una sección específica.
+
+        Args:
+            section_url: URL de la sección a scrapear
+
+        Returns:
+            list[str]: URLs de artículos encontradas, sin repetidos
+        """
+        return run_sync(self._aextract_article_urls_from_section(section_url))
+
+    async def _aextract_article_urls_from_section(self, section_url: str) -> list[str]:
+        try:
+            logger.info(f"Extrayendo URLs de sección: {section_url}")
+            content, not_modified = await self.fetch_engine.fetch_conditional(
+                section_url
+            )
+            if not_modified and self.skip_unchanged_sections:
+                logger.info(f"Sección sin cambios (304), se omite: {section_url}")
+                return []
+            return await self.fetch_engine.run_blocking(
+                self._parse_article_urls, content
+            )
+
+        except requests.RequestException as e:
+            logger.error(f"Error de red al acceder a {section_url}: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error inesperado en {section_url}: {e}", exc_info=True)
+            return []
+
+    def _parse_article_urls(
+        self, content: bytes, encoding: Optional[str] = None
+    ) -> list[str]:
+        """
+        Parsea el HTML de una sección y devuelve las URLs de artículos.
+
+        Args:
+            content: HTML de la sección
+            encoding: Codificación informada por el servidor, si se conoce
+
+        Returns:
+            list[str]: URLs de artículos encontradas, sin repetidos
+        """
+        soup = self.html_parser.parse(content, encoding)
+        article_urls: dict[str, None] = {}
+
+        for container in self._find_link_containers(soup):
+            for link in container.find_all("a", href=True):
+                url = self._normalize_article_url(link["href"])
+                if url:
+                    article_urls[url] = None
+
+        return list(article_urls)
+
+    def _find_link_containers(self, soup: BeautifulSoup) -> Iterable:
+        """Devuelve los elementos de la sección que contienen enlaces a artículos."""
+        return soup.find_all("article")
+
+    def _normalize_article_url(self, href: str) -> Optional[str]:
+        """
+        Filtra y convierte un enlace en una URL absoluta de artículo.
+
+        Args:
+            href: Valor del atributo href
+
+        Returns:
+            Optional[str]: URL absoluta o None si el enlace debe descartarse
+        """
+        # Filtrar URLs no deseadas
+        if any(skip in href for skip in self.skip_patterns):
+            return None
+
+        # Convertir a URL absoluta
+        if href.startswith("/"):
+            href = urljoin(self.base_url, href)
+        elif not href.startswith("http"):
+            return None
+
+        if not self._is_article_url(href):
+            return None
+
+        return href
+
+    def _is_article_url(self, url: str) -> bool:
+        """Indica si una URL absoluta corresponde a un artículo de la fuente."""
+        raise NotImplementedError
+
+    def _extract_article_content(self, url: str) -> Optional[ArticleDTO]:
+        """
+        Extrae el contenido completo de un artículo individual.
+
+        Args:
+            url: URL del artículo a extraer
+
+        Returns:
+            Optional[ArticleDTO]: ArticleDTO con el contenido extraído o None si falla
+        """
+        return run_sync(self._aextract_article_content(url))
+
+    async def _aextract_article_content(self, url: str) -> Optional[ArticleDTO]:
+        page = await self.fetch_article(url)
+        if page is None:
+            return None
+
+        article = await self.fetch_engine.run_blocking(self.parse_article, page)
+        await self.mark_parsed(url, article is not None)
+        if article:
+            logger.info(f"Artículo extraído exitosamente: {article.titulo[:60]}...")
+        return article
+
+    async def fetch_article(self, url: str) -> Optional[FetchedPage]:
+        """
+        Descarga la página de un artículo sin parsearla.
+
+        Un error de descarga se registra en la frontera; una descarga exitosa
+        se registra recién con el resultado del parseo (``mark_parsed``).
+
+        Args:
+            url: URL del artículo
+
+        Returns:
+            Optional[FetchedPage]: Página descargada o None si hubo un error
+        """
+        try:
+            response = await self.fetch_engine.fetch(url)
+        except requests.RequestException as e:
+            logger.error(f"Error de red al acceder al artículo {url}: {e}")
+            await self._mark_in_frontier(url, fetched=False)
+            return None
+        except Exception as e:
+            logger.error(
+                f"Error inesperado descargando artículo {url}: {e}", exc_info=True
+            )
+            await self._mark_in_frontier(url, fetched=False)
+            return None
+        return FetchedPage(url, response.content, http_encoding(response))
+
+    async def mark_parsed(self, url: str, parsed: bool) -> None:
+        """
+        Registra en la frontera el resultado del parseo de un artículo.
+
+        Args:
+            url: URL del artículo
+            parsed: True si se extrajo el artículo; False registra un fallo
+        """
+        await self._mark_in_frontier(url, fetched=parsed)
+
+    def parse_article(self, page: FetchedPage) -> Optional[ArticleDTO]:
+        """
+        Parsea una página descargada con ``fetch_article``.
+
+        Args:
+            page: Página del artículo
+
+        Returns:
+            Optional[ArticleDTO]: Artículo extraído o None si no pudo parsearse
+        """
+        try:
+            return self._parse_article(page.url, page.content, page.encoding)
+        except Exception as e:
+            logger.error(
+                f"Error inesperado extrayendo artículo {page.url}: {e}", exc_info=True
+            )
+            return None
+
+    def _parse_article(
+        self, url: str, content: bytes, encoding: Optional[str] = None
+    ) -> Optional[ArticleDTO]:
+        """
+        Parsea el HTML de un artículo y construye su ArticleDTO.
+
+        Primero se leen título, cuerpo, fecha y sección del JSON-LD de la
+        página; el DOM solo se construye si falta alguno de los tres primeros,
+        y los selectores se aplican únicamente a los campos faltantes.
+
+        Args:
+            url: URL del artículo
+            content: HTML del artículo
+            encoding: Codificación informada por el servidor, si se conoce
+
+        Returns:
+            Optional[ArticleDTO]: Artículo extraído o None si no tiene título
+        """
+        metadata = extract_article_metadata(content)
+        soup: Optional[BeautifulSoup] = None
+        if not (metadata.titulo and metadata.contenido and metadata.fecha_publicacion):
+            soup = self.html_parser.parse(content, encoding)
+
+        # Extraer título
+        titulo = metadata.titulo or self._extract_title(soup)
+        if not titulo:
+            logger.warning(f"No se pudo extraer el título de {url}")
+            return None
+
+        # Extraer contenido
+        contenido = metadata.contenido or self._extract_content(soup)
+        if not contenido:
+            logger.warning(f"No se pudo extraer el contenido de {url}")
+            contenido = ""
+
+        # Extraer fecha de publicación
+        fecha_publicacion = (
+            metadata.fecha_publicacion or self._extract_publication_date(soup)
+        )
+
+        # Categoría: solo desde el DOM si ya fue necesario construirlo
+        categoria = metadata.categoria
+        if not categoria and soup is not None:
+            categoria = self._extract_category(soup)
+
+        return ArticleDTO(
+            titulo=titulo,
+            url=url,
+            contenido=contenido,
+            fecha_publicacion=fecha_publicacion,
+            fuente=self.fuente,
+            categoria=categoria,
+        )
+
+    def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
+        raise NotImplementedError
+
+    def _extract_content(self, soup: BeautifulSoup) -> str:
+        raise NotImplementedError
+
+    def _extract_publication_date(self, soup: BeautifulSoup):
+        raise NotImplementedError
+
+    def _extract_category(self, soup: BeautifulSoup) -> Optional[str]:
+        """Extrae la sección del artículo de los metadatos Open Graph."""
+        element = soup.find("meta", attrs={"property": "article:section"})
+        if element and element.get("content"):
+            return self._clean_text(element["content"])
+        return None
+
+    def _clean_text(self, text: str) -> str:
+        """
+        Limpia y normaliza el texto extraído.
+
+        Args:
+            text: Texto a limpiar
+
+        Returns:
+            str: Texto limpio y normalizado
+        """
+        if not text:
+            return ""
+
+        # Eliminar espacios múltiples
+        text = " ".join(text.split())
+
+        # Eliminar saltos de línea y caracteres especiales
+        text = text.replace("\n", " ").replace("\r", " ").replace("\t", " ")
+
+        # Eliminar espacios múltiples resultantes
+        text = " ".join(text.split())
+
+        return text.strip()
+
+    def __del__(self):
+        """Cerrar la sesión y el motor de descargas al destruir el objeto."""
+        if hasattr(self, "fetch_engine"):
+            self.fetch_engine.close()
+        if hasattr(self, "session") and self._owns_session:
+            self.session.close()
@@ -1,17 +1,17 @@
 import logging
 from datetime import datetime, timezone
 from typing import Optional
-from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
-from src.domain.dto.article_dto import ArticleDTO
+from src.domain.enums import NewsSource
+
+from .base_scraper import BaseNewsScraper
 
 logger = logging.getLogger(__name__)
 
 
-class ClarinScraper:
+class ClarinScraper(BaseNewsScraper):
     """
     Scraper específico para extraer artículos del sitio web de Clarín.
 
@@ -24,172 +24,20 @@ class ClarinScraper:
         timeout: Tiempo máximo de espera para las peticiones HTTP (en segundos)
     """
 
-    def __init__(self, max_articles: int = 15, timeout: int = 30):
-        self.base_url = "https://www.clarin.com"
-        self.max_articles = max_articles
-        self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-        )
-        logger.info(f"ClarinScraper inicializado - max_articles: {max_articles}")
-
-    def scrape(self) -> list[ArticleDTO]:
-        """
-        Extrae artículos de las secciones configuradas de Clarín.
-
-        Returns:
-            list[ArticleDTO]: Lista de artículos extraídos en formato estandarizado
-
-        Raises:
-            Exception: Si ocurre un error crítico durante el proceso de scraping
-        """
-        logger.info("Iniciando scraping de Clarín")
-        articles = []
-
-        sections = [
-            "/ultimas-noticias/",
-            "/politica/",
-            "/economia/",
-        ]
-
-        article_urls = set()
-
-        # Fase 1: Recolectar URLs de artículos de las secciones
-        for section in sections:
-            if len(article_urls) >= self.max_articles:
-                break
-
-            try:
-                section_url = urljoin(self.base_url, section)
-                logger.info(f"Extrayendo URLs de sección: {section_url}")
-                urls = self._extract_article_urls_from_section(section_url)
-                article_urls.update(urls)
-                logger.info(f"URLs extraídas de {section}: {len(urls)}")
-            except Exception as e:
-                logger.error(
-                    f"Error extrayendo URLs de sección {section}: {e}", exc_info=True
-                )
-
-        # Fase 2: Extraer contenido de cada artículo
-        article_urls_list = list(article_urls)[: self.max_articles]
-        logger.info(f"Extrayendo contenido de {len(article_urls_list)} artículos")
-
-        for url in article_urls_list:
-            try:
-                article = self._extract_article_content(url)
-                if article:
-                    articles.append(article)
-                    logger.info(
-                        f"Artículo extraído exitosamente: {article.titulo[:60]}..."
-                    )
-            except Exception as e:
-                logger.error(f"Error extrayendo artículo {url}: {e}", exc_info=True)
-
-        logger.info(
-            f"Scraping completado. Total de artículos extraídos: {len(articles)}"
-        )
-        return articles
-
-    def _extract_article_urls_from_section(self, section_url: str) -> set[str]:
-        """
-        Extrae URLs de artículos de una sección específica de Clarín.
-
-        Args:
-            section_url: URL de la sección a scrapear
-
-        Returns:
-            set[str]: Conjunto de URLs de artículos encontradas
-        """
-        try:
-            response = self.session.get(section_url, timeout=self.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "lxml")
-            article_urls = set()
-
-            # Buscar enlaces en artículos
-            articles = soup.find_all("article")
-            for article in articles:
-                links = article.find_all("a", href=True)
-                for link in links:
-                    href = link["href"]
-
-                    # Filtrar URLs no deseadas
-                    if any(
-                        skip in href
-                        for skip in ["/tema/", "/tags/", "/autor/", "javascript:", "#"]
-                    ):
-                        continue
-
-                    # Convertir a URL absoluta
-                    if href.startswith("/"):
-                        href = urljoin(self.base_url, href)
-                    elif not href.startswith("http"):
-                        continue
-
-                    # Verificar que sea de Clarín
-                    if "clarin.com" in href:
-                        article_urls.add(href)
-
-            return article_urls
-
-        except requests.RequestException as e:
-            logger.error(f"Error de red al acceder a {section_url}: {e}")
-            return set()
-        except Exception as e:
-            logger.error(f"Error inesperado en {section_url}: {e}", exc_info=True)
-            return set()
-
-    def _extract_article_content(self, url: str) -> Optional[ArticleDTO]:
-        """
-        Extrae el contenido completo de un artículo individual.
-
-        Args:
-            url: URL del artículo a extraer
-
-        Returns:
-            Optional[ArticleDTO]: ArticleDTO con el contenido extraído o None si falla
-        """
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "lxml")
-
-            # Extraer título
-            titulo = self._extract_title(soup)
-            if not titulo:
-                logger.warning(f"No se pudo extraer el título de {url}")
-                return None
-
-            # Extraer contenido
-            contenido = self._extract_content(soup)
-            if not contenido:
-                logger.warning(f"No se pudo extraer el contenido de {url}")
-                contenido = ""
-
-            # Extraer fecha de publicación
-            fecha_publicacion = self._extract_publication_date(soup)
-
-            return ArticleDTO(
-                titulo=titulo,
-                url=url,
-                contenido=contenido,
-                fecha_publicacion=fecha_publicacion,
-                fuente="Clarín",
-            )
-
-        except requests.RequestException as e:
-            logger.error(f"Error de red al acceder al artículo {url}: {e}")
-            return None
-        except Exception as e:
-            logger.error(
-                f"Error inesperado extrayendo artículo {url}: {e}", exc_info=True
-            )
-            return None
+    base_url = "https://www.clarin.com"
+    site_domain = "clarin.com"
+    fuente = "Clarín"
+    source = NewsSource.CLARIN
+    sections = [
+        "/ultimas-noticias/",
+        "/politica/",
+        "/economia/",
+    ]
+    skip_patterns = ["/tema/", "/tags/", "/autor/", "javascript:", "#"]
+
+    def _is_article_url(self, url: str) -> bool:
+        # Verificar que sea de Clarín
+        return self.site_domain in url
 
     def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
         """Extrae el título del artículo."""
@@ -281,8 +129,3 @@ class ClarinScraper:
 
         # Si no se encuentra fecha, usar la fecha actual
         return datetime.now(timezone.utc)
-
-    def __del__(self):
-        """Cerrar la sesión al destruir el objeto."""
-        if hasattr(self, "session"):
-            self.session.close()
@@ -0,0 +1,184 @@
+"""
+Descubrimiento de artículos a partir de sitemaps de noticias y feeds RSS/Atom.
+
+Los documentos se recorren en modo streaming (``iterparse``): cada ``<url>``,
+``<item>`` o ``<entry>`` se procesa al cerrarse y se libera inmediatamente, sin
+construir el árbol completo.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from typing import Iterable, Optional
+from xml.etree.ElementTree import ParseError, iterparse
+
+logger = logging.getLogger(__name__)
+
+# Elementos raíz admitidos
+_ROOT_TAGS = {"urlset", "sitemapindex", "rss", "RDF", "feed"}
+
+# Elementos que representan una entrada, según el tipo de documento
+_ENTRY_TAGS = {"url", "sitemap", "item", "entry"}
+
+# Elementos con la fecha de publicación / modificación de la entrada
+_DATE_TAGS = {
+    "lastmod",
+    "publication_date",
+    "pubDate",
+    "date",
+    "published",
+    "updated",
+}
+
+
+@dataclass
+class FeedEntry:
+    """
+    Entrada de un sitemap o feed.
+
+    Attributes:
+        url: URL del artículo (o del sitemap hijo en un ``<sitemapindex>``)
+        published: Fecha de lastmod / pubDate, si el documento la informa
+    """
+
+    url: str
+    published: Optional[datetime] = None
+
+
+@dataclass
+class ParsedFeed:
+    """
+    Resultado de parsear un sitemap o feed.
+
+    Attributes:
+        entries: Artículos encontrados
+        sitemaps: Sitemaps hijos, si el documento es un ``<sitemapindex>``
+    """
+
+    entries: list[FeedEntry] = field(default_factory=list)
+    sitemaps: list[FeedEntry] = field(default_factory=list)
+
+
+def parse_feed(content: bytes) -> ParsedFeed:
+    """
+    Parsea un sitemap (``urlset`` / ``sitemapindex``), RSS 2.0 o Atom.
+
+    Args:
+        content: Documento XML
+
+    Returns:
+        ParsedFeed: Entradas encontradas, en el orden del documento
+
+    Raises:
+        ValueError: Si el contenido no es XML válido o no es un sitemap ni un feed
+    """
+    parsed = ParsedFeed()
+    root: Optional[str] = None
+    url: Optional[str] = None
+    published: Optional[datetime] = None
+
+    try:
+        for event, element in iterparse(BytesIO(content), events=("start", "end")):
+            tag = _local_name(element.tag)
+
+            if root is None:
+                root = tag
+                if root not in _ROOT_TAGS:
+                    raise ValueError(
+                        f"El documento no es un sitemap ni un feed: <{tag}>"
+                    )
+
+            if event == "start":
+                if tag in _ENTRY_TAGS:
+                    url, published = None, None
+                continue
+
+            if tag in ("loc", "link") and url is None:
+                # Sitemap: <loc>; RSS: <link>texto</link>; Atom: <link href="..."/>
+                # (el primero de la entrada: los <image:loc> vienen después)
+                if element.get("rel", "alternate") == "alternate":
+                    url = (element.text or element.get("href") or "").strip() or None
+            elif tag in _DATE_TAGS:
+                # news:publication_date es más precisa que lastmod
+                date = _parse_date(element.text)
+                if date and (published is None or tag == "publication_date"):
+                    published = date
+            elif tag in _ENTRY_TAGS:
+                if url:
+                    target = parsed.sitemaps if tag == "sitemap" else parsed.entries
+                    target.append(FeedEntry(url, published))
+                url, published = None, None
+                element.clear()
+    except ParseError as e:
+        raise ValueError(f"Feed XML inválido: {e}") from e
+
+    return parsed
+
+
+def rank_entries(
+    entries: Iterable[FeedEntry], max_age: Optional[timedelta] = None
+) -> list[FeedEntry]:
+    """
+    Ordena las entradas de más nueva a más antigua y descarta las viejas.
+
+    Las entradas sin fecha se conservan al final, en su orden original. Si una
+    URL aparece varias veces se conserva la aparición con la fecha más nueva.
+
+    Args:
+        entries: Entradas de uno o varios feeds
+        max_age: Antigüedad máxima de las entradas con fecha (None: sin límite)
+
+    Returns:
+        list[FeedEntry]: Entradas únicas ordenadas
+    """
+    oldest = datetime.now(timezone.utc) - max_age if max_age else None
+    unique: dict[str, FeedEntry] = {}
+    for entry in entries:
+        if oldest and entry.published and entry.published < oldest:
+            continue
+        current = unique.get(entry.url)
+        if current is None or (
+            entry.published
+            and (current.published is None or entry.published > current.published)
+        ):
+            unique[entry.url] = entry
+
+    epoch = datetime.min.replace(tzinfo=timezone.utc)
+    return sorted(
+        unique.values(),
+        key=lambda entry: entry.published or epoch,
+        reverse=True,
+    )
+
+
+def _local_name(tag: str) -> str:
+    """Quita el namespace (``{uri}nombre``) de un tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parsea fechas W3C (sitemaps, Atom) y RFC 822 (RSS).
+
+    Returns:
+        Optional[datetime]: Fecha con zona horaria (UTC si no la informa) o
+            None si no puede interpretarse
+    """
+    if not value:
+        return None
+    value = value.strip()
+
+    try:
+        date = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            logger.debug(f"Fecha de feed no reconocida: {value}")
+            return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date
@@ -0,0 +1,135 @@
+"""
+Extracción de metadatos de artículos desde bloques JSON-LD (schema.org).
+
+Los diarios publican en cada nota un ``<script type="application/ld+json">``
+con el objeto NewsArticle: título, fecha, sección y, en general, el cuerpo
+completo. Los bloques se localizan con una expresión regular sobre el HTML
+crudo, sin construir el DOM, por lo que cuando el JSON-LD está completo el
+artículo se extrae sin pasar por BeautifulSoup.
+"""
+
+import html
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_JSON_LD_RE = re.compile(
+    rb"<script[^>]+type\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+ARTICLE_TYPES = {
+    "Article",
+    "NewsArticle",
+    "ReportageNewsArticle",
+    "AnalysisNewsArticle",
+    "OpinionNewsArticle",
+    "BackgroundNewsArticle",
+    "ReviewNewsArticle",
+    "BlogPosting",
+}
+
+
+@dataclass
+class ArticleMetadata:
+    """
+    Campos de un artículo leídos del JSON-LD (None si no están presentes).
+
+    Attributes:
+        titulo: headline
+        contenido: articleBody, sin etiquetas HTML
+        fecha_publicacion: datePublished
+        categoria: articleSection (la primera si es una lista)
+    """
+
+    titulo: Optional[str] = None
+    contenido: Optional[str] = None
+    fecha_publicacion: Optional[datetime] = None
+    categoria: Optional[str] = None
+
+
+def extract_article_metadata(content: bytes) -> ArticleMetadata:
+    """
+    Lee el primer objeto de tipo artículo de los bloques JSON-LD del HTML.
+
+    Los bloques con JSON inválido se ignoran.
+
+    Args:
+        content: HTML del artículo
+
+    Returns:
+        ArticleMetadata: Campos encontrados (todos None si no hay JSON-LD)
+    """
+    for match in _JSON_LD_RE.finditer(content):
+        try:
+            data = json.loads(_decode(match.group(1)), strict=False)
+        except ValueError:
+            continue
+
+        article = next(_article_objects(data), None)
+        if article is not None:
+            return ArticleMetadata(
+                titulo=_clean(article.get("headline")),
+                contenido=_clean(article.get("articleBody"), strip_tags=True),
+                fecha_publicacion=_parse_date(article.get("datePublished")),
+                categoria=_clean(_first(article.get("articleSection"))),
+            )
+
+    return ArticleMetadata()
+
+
+def _article_objects(data: Any) -> Iterator[dict]:
+    """Recorre listas y ``@graph`` buscando objetos con un tipo de artículo."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _article_objects(item)
+    elif isinstance(data, dict):
+        types = data.get("@type")
+        types = types if isinstance(types, list) else [types]
+        if any(isinstance(t, str) and t in ARTICLE_TYPES for t in types):
+            yield data
+        if "@graph" in data:
+            yield from _article_objects(data["@graph"])
+
+
+def _decode(raw: bytes) -> str:
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw.decode("cp1252", errors="replace")
+
+
+def _first(value: Any) -> Any:
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _clean(value: Any, strip_tags: bool = False) -> Optional[str]:
+    """Normaliza un texto del JSON-LD: entidades HTML, etiquetas y espacios."""
+    if not isinstance(value, str):
+        return None
+    if strip_tags:
+        value = _TAG_RE.sub(" ", value)
+    value = " ".join(html.unescape(value).split())
+    return value or None
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        date = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        logger.debug(f"datePublished no reconocida en JSON-LD: {value}")
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date
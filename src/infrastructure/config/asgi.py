@@ -9,5 +9,7 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault(
     "DJANGO_SETTINGS_MODULE", "src.infrastructure.config.django_settings"
 )
+# Bajo ASGI la API se sirve con las vistas asíncronas nativas
+os.environ.setdefault("API_ASYNC_VIEWS", "True")
 
 application = get_asgi_application()
@@ -62,6 +62,10 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "src.infrastructure.config.wsgi.application"
+ASGI_APPLICATION = "src.infrastructure.config.asgi.application"
+
+# Servir la API con las vistas asíncronas nativas (activado por asgi.py)
+API_ASYNC_VIEWS = env.bool("API_ASYNC_VIEWS", default=False)
 
 DATABASES = {"default": env.db("DATABASE_URL", default="sqlite:///db.sqlite3")}
 
@@ -94,8 +98,11 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
+    # FastJSONRenderer produce los mismos bytes que JSONRenderer (usa orjson si
+    # está instalado). Volver a "rest_framework.renderers.JSONRenderer" y a
+    # FAST_SERIALIZATION=False restablece la ruta estándar de DRF.
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "src.presentation.django_app.renderers.FastJSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
@@ -103,6 +110,8 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
     "PAGE_SIZE": 100,
     "DATETIME_FORMAT": "%Y-%m-%dT%H:%M:%S.%fZ",
+    # Serializers precompilados en las respuestas (ver fast_serialization.py)
+    "FAST_SERIALIZATION": env.bool("API_FAST_SERIALIZATION", default=True),
 }
 
 CORS_ALLOW_ALL_ORIGINS = DEBUG
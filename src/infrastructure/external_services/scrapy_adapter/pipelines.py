@@ -1,7 +1,8 @@
 import logging
-from bs4 import BeautifulSoup
 import re
 
+from src.infrastructure.adapters.parsing import get_html_parser
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,12 +23,7 @@ class TextCleaningPipeline:
         if not html_content:
             return ""
 
-        soup = BeautifulSoup(html_content, "lxml")
-
-        for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
-            script.decompose()
-
-        text = soup.get_text(separator=" ", strip=True)
+        text = get_html_parser().extract_text(html_content)
 
         text = self._clean_text(text)
 
@@ -2,18 +2,40 @@ import scrapy
 import logging
 from datetime import datetime, timezone
 from typing import Optional
+from urllib.parse import urlsplit
+from src.domain.enums import NewsSource
+from src.infrastructure.adapters.http import base_url_override, rebase_url
 from src.infrastructure.external_services.scrapy_adapter.items import NewsArticleItem
 
 logger = logging.getLogger(__name__)
 
 
 class BaseNewsSpider(scrapy.Spider):
+    """
+    Base de los spiders de diarios.
+
+    El sitio puede redirigirse a otro servidor con ``-a base_url=...`` o la
+    variable ``SCRAPER_BASE_URL_<FUENTE>``: se reescriben ``start_urls`` y
+    ``allowed_domains``, y ``site_url`` (prefijo que deben tener los enlaces a
+    artículos) pasa a ser el del servidor de destino.
+    """
+
     max_articles = 15
+    source: Optional[NewsSource] = None
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, base_url: Optional[str] = None, **kwargs):
         super().__init__(*args, **kwargs)
         self.articles_count = 0
 
+        if base_url is None and self.source is not None:
+            base_url = base_url_override(self.source.name)
+        if base_url:
+            self.start_urls = [rebase_url(url, base_url) for url in self.start_urls]
+            self.allowed_domains = [urlsplit(base_url).hostname]
+
+        site = urlsplit(self.start_urls[0])
+        self.site_url = f"{site.scheme}://{site.netloc}/"
+
     def create_article_item(
         self,
         titulo: str,
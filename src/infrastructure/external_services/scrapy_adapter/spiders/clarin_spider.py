@@ -1,6 +1,7 @@
 import scrapy
 import logging
 from datetime import datetime, timezone
+from src.domain.enums import NewsSource
 from .base_spider import BaseNewsSpider
 
 logger = logging.getLogger(__name__)
@@ -9,6 +10,7 @@ logger = logging.getLogger(__name__)
 class ClarinSpider(BaseNewsSpider):
     name = "clarin"
     allowed_domains = ["clarin.com"]
+    source = NewsSource.CLARIN
     start_urls = [
         "https://www.clarin.com/ultimas-noticias/",
         "https://www.clarin.com/politica/",
@@ -1,6 +1,7 @@
 import scrapy
 import logging
 from datetime import datetime, timezone
+from src.domain.enums import NewsSource
 from .base_spider import BaseNewsSpider
 
 logger = logging.getLogger(__name__)
@@ -9,6 +10,7 @@ logger = logging.getLogger(__name__)
 class InfobaeSpider(BaseNewsSpider):
     name = "infobae"
     allowed_domains = ["infobae.com"]
+    source = NewsSource.INFOBAE
     start_urls = [
         "https://www.infobae.com/",
         "https://www.infobae.com/politica/",
@@ -34,7 +36,7 @@ class InfobaeSpider(BaseNewsSpider):
                 if "/tag/" in link or "/autor/" in link:
                     continue
 
-                if not link.startswith("https://www.infobae.com/"):
+                if not link.startswith(self.site_url):
                     continue
 
                 yield scrapy.Request(
@@ -1,6 +1,7 @@
 import scrapy
 import logging
 from datetime import datetime, timezone
+from src.domain.enums import NewsSource
 from .base_spider import BaseNewsSpider
 
 logger = logging.getLogger(__name__)
@@ -9,6 +10,7 @@ logger = logging.getLogger(__name__)
 class LaNacionSpider(BaseNewsSpider):
     name = "lanacion"
     allowed_domains = ["lanacion.com.ar"]
+    source = NewsSource.LA_NACION
     start_urls = [
         "https://www.lanacion.com.ar/",
         "https://www.lanacion.com.ar/politica/",
@@ -34,7 +36,7 @@ class LaNacionSpider(BaseNewsSpider):
                 if "/tema/" in link or "/autor/" in link or "/seccion/" in link:
                     continue
 
-                if not link.startswith("https://www.lanacion.com.ar/"):
+                if not link.startswith(self.site_url):
                     continue
 
                 yield scrapy.Request(
@@ -1,6 +1,7 @@
 import scrapy
 import logging
 from datetime import datetime, timezone
+from src.domain.enums import NewsSource
 from .base_spider import BaseNewsSpider
 
 logger = logging.getLogger(__name__)
@@ -9,6 +10,7 @@ logger = logging.getLogger(__name__)
 class Pagina12Spider(BaseNewsSpider):
     name = "pagina12"
     allowed_domains = ["pagina12.com.ar"]
+    source = NewsSource.PAGINA12
     start_urls = [
         "https://www.pagina12.com.ar/",
         "https://www.pagina12.com.ar/secciones/el-pais",
@@ -34,7 +36,7 @@ class Pagina12Spider(BaseNewsSpider):
                 if "/autores/" in link or "/tags/" in link or "/secciones/" in link:
                     continue
 
-                if not link.startswith("https://www.pagina12.com.ar/"):
+                if not link.startswith(self.site_url):
                     continue
 
                 yield scrapy.Request(
@@ -1,5 +1,11 @@
 from django.contrib import admin
-from .models import UserModel, SourceModel, NewsArticleModel, ScrapingJobModel
+from .models import (
+    CrawlFrontierModel,
+    NewsArticleModel,
+    ScrapingJobModel,
+    SourceModel,
+    UserModel,
+)
 
 
 @admin.register(UserModel)
@@ -43,8 +49,25 @@ class NewsArticleAdmin(admin.ModelAdmin):
 
 @admin.register(ScrapingJobModel)
 class ScrapingJobAdmin(admin.ModelAdmin):
-    list_display = ["fuente", "status", "total_articulos", "fecha_inicio", "fecha_fin"]
+    list_display = [
+        "fuente",
+        "status",
+        "total_articulos",
+        "articulos_nuevos",
+        "fecha_inicio",
+        "fecha_fin",
+        "lease_owner",
+    ]
     list_filter = ["status", "fuente", "fecha_inicio"]
     search_fields = ["fuente"]
     readonly_fields = ["id", "created_at"]
     date_hierarchy = "fecha_inicio"
+
+
+@admin.register(CrawlFrontierModel)
+class CrawlFrontierAdmin(admin.ModelAdmin):
+    list_display = ["url", "fuente", "status", "attempts", "first_seen", "fetched_at"]
+    list_filter = ["status", "fuente"]
+    search_fields = ["url"]
+    readonly_fields = ["id"]
+    date_hierarchy = "first_seen"
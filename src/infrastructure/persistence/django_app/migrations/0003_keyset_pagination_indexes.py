@@ -0,0 +1,44 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("persistence", "0002_change_source_to_enum"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="newsarticlemodel",
+            index=models.Index(
+                fields=["fecha_publicacion", "id"], name="news_pub_keyset_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="newsarticlemodel",
+            index=models.Index(
+                fields=["fuente", "fecha_publicacion", "id"],
+                name="news_fuente_pub_keyset_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="newsarticlemodel",
+            index=models.Index(
+                fields=["categoria", "fecha_publicacion", "id"],
+                name="news_cat_pub_keyset_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="scrapingjobmodel",
+            index=models.Index(
+                fields=["fecha_inicio", "id"], name="jobs_inicio_keyset_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="scrapingjobmodel",
+            index=models.Index(
+                fields=["fuente", "fecha_inicio", "id"],
+                name="jobs_fuente_inicio_keyset_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,94 @@
+"""
+Índice de búsqueda de texto completo sobre titulo y contenido.
+
+- PostgreSQL: columna tsvector generada (configuración "spanish", titulo con
+  peso A y contenido con peso B) e índice GIN.
+- SQLite: tabla virtual FTS5 de contenido externo sincronizada por triggers.
+  Se enlaza por rowid; tras un VACUUM conviene reconstruirla con
+  ``INSERT INTO news_articles_fts(news_articles_fts) VALUES ('rebuild')``.
+
+En otros motores no se crea nada y la búsqueda usa el filtro sin índice.
+"""
+
+from django.db import migrations
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE news_articles ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('spanish', coalesce(titulo, '')), 'A')
+        || setweight(to_tsvector('spanish', coalesce(contenido, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX news_articles_search_idx ON news_articles USING GIN (search_vector)",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS news_articles_search_idx",
+    "ALTER TABLE news_articles DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE news_articles_fts USING fts5(
+        titulo,
+        contenido,
+        content='news_articles',
+        content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER news_articles_fts_ai AFTER INSERT ON news_articles BEGIN
+        INSERT INTO news_articles_fts(rowid, titulo, contenido)
+        VALUES (new.rowid, new.titulo, new.contenido);
+    END
+    """,
+    """
+    CREATE TRIGGER news_articles_fts_ad AFTER DELETE ON news_articles BEGIN
+        INSERT INTO news_articles_fts(news_articles_fts, rowid, titulo, contenido)
+        VALUES ('delete', old.rowid, old.titulo, old.contenido);
+    END
+    """,
+    """
+    CREATE TRIGGER news_articles_fts_au AFTER UPDATE OF titulo, contenido
+    ON news_articles BEGIN
+        INSERT INTO news_articles_fts(news_articles_fts, rowid, titulo, contenido)
+        VALUES ('delete', old.rowid, old.titulo, old.contenido);
+        INSERT INTO news_articles_fts(rowid, titulo, contenido)
+        VALUES (new.rowid, new.titulo, new.contenido);
+    END
+    """,
+    "INSERT INTO news_articles_fts(news_articles_fts) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS news_articles_fts_au",
+    "DROP TRIGGER IF EXISTS news_articles_fts_ad",
+    "DROP TRIGGER IF EXISTS news_articles_fts_ai",
+    "DROP TABLE IF EXISTS news_articles_fts",
+]
+
+
+def _run(schema_editor, statements_by_vendor):
+    for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def forwards(apps, schema_editor):
+    _run(schema_editor, {"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD})
+
+
+def backwards(apps, schema_editor):
+    _run(schema_editor, {"postgresql": POSTGRES_BACKWARD, "sqlite": SQLITE_BACKWARD})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("persistence", "0003_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
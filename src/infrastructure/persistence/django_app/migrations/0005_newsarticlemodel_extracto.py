@@ -0,0 +1,45 @@
+from django.db import migrations, models
+
+EXCERPT_LENGTH = 280
+BATCH_SIZE = 500
+
+
+def _excerpt(contenido):
+    text = " ".join((contenido or "").split())
+    if len(text) <= EXCERPT_LENGTH:
+        return text
+    cut = text[:EXCERPT_LENGTH].rsplit(" ", 1)[0] or text[:EXCERPT_LENGTH]
+    return cut.rstrip(" ,.;:") + "…"
+
+
+def backfill_extracto(apps, schema_editor):
+    NewsArticleModel = apps.get_model("persistence", "NewsArticleModel")
+    pending = NewsArticleModel.objects.filter(extracto__isnull=True).only(
+        "id", "contenido"
+    )
+
+    batch = []
+    for article in pending.iterator(chunk_size=BATCH_SIZE):
+        article.extracto = _excerpt(article.contenido)
+        batch.append(article)
+        if len(batch) >= BATCH_SIZE:
+            NewsArticleModel.objects.bulk_update(batch, ["extracto"])
+            batch = []
+    if batch:
+        NewsArticleModel.objects.bulk_update(batch, ["extracto"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("persistence", "0004_news_articles_full_text_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsarticlemodel",
+            name="extracto",
+            field=models.CharField(blank=True, max_length=300, null=True),
+        ),
+        migrations.RunPython(backfill_extracto, migrations.RunPython.noop),
+    ]
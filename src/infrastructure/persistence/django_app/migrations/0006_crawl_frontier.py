@@ -0,0 +1,62 @@
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("persistence", "0005_newsarticlemodel_extracto"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CrawlFrontierModel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("fuente", models.CharField(max_length=255)),
+                ("url", models.URLField(max_length=1000)),
+                ("first_seen", models.DateTimeField()),
+                ("last_seen", models.DateTimeField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("fetched", "Fetched"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.IntegerField(default=0)),
+                ("fetched_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Crawl Frontier Entry",
+                "verbose_name_plural": "Crawl Frontier",
+                "db_table": "crawl_frontier",
+                "ordering": ["-first_seen"],
+                "indexes": [
+                    models.Index(
+                        fields=["fuente", "status", "first_seen"],
+                        name="frontier_fuente_status_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("fuente", "url"), name="frontier_fuente_url_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("persistence", "0006_crawl_frontier"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapingjobmodel",
+            name="lease_owner",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name="scrapingjobmodel",
+            name="lease_expires_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="scrapingjobmodel",
+            index=models.Index(
+                fields=["status", "lease_expires_at"], name="jobs_status_lease_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("persistence", "0007_scraping_job_lease"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapingjobmodel",
+            name="articulos_nuevos",
+            field=models.IntegerField(default=0),
+        ),
+    ]
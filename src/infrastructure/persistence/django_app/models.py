@@ -63,6 +63,8 @@ class NewsArticleModel(models.Model):
     url = models.URLField(max_length=1000, unique=True)
     categoria = models.CharField(max_length=255, null=True, blank=True, db_index=True)
     procesado = models.BooleanField(default=False, db_index=True)
+    # Comienzo del contenido, precalculado para los listados resumidos
+    extracto = models.CharField(max_length=300, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(null=True, blank=True)
 
@@ -75,6 +77,17 @@ class NewsArticleModel(models.Model):
             models.Index(fields=["fuente", "fecha_publicacion"]),
             models.Index(fields=["categoria"]),
             models.Index(fields=["procesado"]),
+            models.Index(
+                fields=["fecha_publicacion", "id"], name="news_pub_keyset_idx"
+            ),
+            models.Index(
+                fields=["fuente", "fecha_publicacion", "id"],
+                name="news_fuente_pub_keyset_idx",
+            ),
+            models.Index(
+                fields=["categoria", "fecha_publicacion", "id"],
+                name="news_cat_pub_keyset_idx",
+            ),
         ]
 
     def __str__(self):
@@ -86,7 +99,9 @@ class ScrapingJobModel(models.Model):
         ("pending", "Pending"),
         ("running", "Running"),
         ("completed", "Completed"),
+        ("timed_out", "Timed out"),
         ("failed", "Failed"),
+        ("skipped", "Skipped"),
     ]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -97,8 +112,11 @@ class ScrapingJobModel(models.Model):
         max_length=20, choices=STATUS_CHOICES, default="pending", db_index=True
     )
     total_articulos = models.IntegerField(default=0)
+    articulos_nuevos = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(null=True, blank=True)
+    lease_owner = models.CharField(max_length=255, null=True, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "scraping_jobs"
@@ -108,7 +126,52 @@ class ScrapingJobModel(models.Model):
         indexes = [
             models.Index(fields=["fuente", "status"]),
             models.Index(fields=["status", "fecha_inicio"]),
+            models.Index(fields=["fecha_inicio", "id"], name="jobs_inicio_keyset_idx"),
+            models.Index(
+                fields=["fuente", "fecha_inicio", "id"],
+                name="jobs_fuente_inicio_keyset_idx",
+            ),
+            models.Index(
+                fields=["status", "lease_expires_at"], name="jobs_status_lease_idx"
+            ),
         ]
 
     def __str__(self):
         return f"Job {self.fuente} - {self.status}"
+
+
+class CrawlFrontierModel(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("fetched", "Fetched"),
+        ("failed", "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    fuente = models.CharField(max_length=255)
+    url = models.URLField(max_length=1000)
+    first_seen = models.DateTimeField()
+    last_seen = models.DateTimeField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    attempts = models.IntegerField(default=0)
+    fetched_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "crawl_frontier"
+        verbose_name = "Crawl Frontier Entry"
+        verbose_name_plural = "Crawl Frontier"
+        ordering = ["-first_seen"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["fuente", "url"], name="frontier_fuente_url_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["fuente", "status", "first_seen"],
+                name="frontier_fuente_status_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.fuente} - {self.url} ({self.status})"
@@ -3,19 +3,33 @@ Implementaciones Django de los repositorios.
 Adaptadores que conectan las entidades del dominio con Django ORM.
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Sequence, Set
 from uuid import UUID
-from datetime import datetime
-
-from src.domain.entities import NewsArticle, Source, ScrapingJob, User
+from datetime import datetime, timedelta, timezone
+
+from asgiref.sync import sync_to_async
+from django.db import connection, transaction
+from django.db.models import F, Q, QuerySet
+
+from src.domain.entities import (
+    CrawlFrontierEntry,
+    NewsArticle,
+    NewsArticleSummary,
+    Source,
+    ScrapingJob,
+    User,
+)
 from src.domain.enums import NewsSource
+from src.domain.value_objects.pagination import CursorPage, PageCursor
 from src.domain.repositories import (
+    CrawlFrontierRepository,
     NewsArticleRepository,
     SourceRepository,
     ScrapingJobRepository,
     UserRepository,
 )
 from src.infrastructure.persistence.django_app.models import (
+    CrawlFrontierModel,
     NewsArticleModel,
     SourceModel,
     ScrapingJobModel,
@@ -23,6 +37,40 @@ from src.infrastructure.persistence.django_app.models import (
 )
 
 
+def _keyset_slice(
+    queryset: QuerySet, date_field: str, cursor: Optional[PageCursor], limit: int
+) -> QuerySet:
+    """
+    Ordena por (fecha, id) descendente y busca a partir del cursor.
+
+    En lugar de OFFSET se filtra por los registros estrictamente anteriores al
+    último de la página previa, de modo que la base de datos resuelve cualquier
+    página con un recorrido por índice de ``limit + 1`` filas. La fila extra
+    solo indica si existe una página siguiente.
+    """
+    queryset = queryset.order_by(f"-{date_field}", "-id")
+    if cursor is not None:
+        queryset = queryset.filter(
+            Q(**{f"{date_field}__lt": cursor.fecha})
+            | Q(**{date_field: cursor.fecha, "id__lt": cursor.id})
+        )
+    return queryset[: limit + 1]
+
+
+def _build_page(models: list, date_field: str, limit: int, to_entity) -> CursorPage:
+    # Una página vacía no tiene desde dónde continuar
+    if limit < 1:
+        return CursorPage(items=[], next_cursor=None)
+    next_cursor = None
+    if len(models) > limit:
+        models = models[:limit]
+        last = models[-1]
+        next_cursor = PageCursor(fecha=getattr(last, date_field), id=last.id)
+    return CursorPage(
+        items=[to_entity(model) for model in models], next_cursor=next_cursor
+    )
+
+
 class DjangoUserRepository(UserRepository):
     """Adaptador Django para UserRepository"""
 
@@ -176,6 +224,41 @@ class DjangoSourceRepository(SourceRepository):
 class DjangoNewsArticleRepository(NewsArticleRepository):
     """Adaptador Django para NewsArticleRepository"""
 
+    # Cantidad de URLs por consulta IN, por debajo del límite de parámetros de SQLite
+    URL_LOOKUP_CHUNK_SIZE = 500
+    # Filas por INSERT ... RETURNING en PostgreSQL
+    INSERT_BATCH_SIZE = 1000
+
+    # Columnas leídas en los listados resumidos (nunca el contenido completo)
+    SUMMARY_FIELDS = (
+        "id",
+        "titulo",
+        "fuente",
+        "fecha_publicacion",
+        "url",
+        "categoria",
+        "extracto",
+    )
+
+    # Consultas de búsqueda sobre los índices creados en la migración 0004.
+    # "{columns}" se reemplaza por las columnas del modelo para no leer la
+    # columna tsvector en PostgreSQL.
+    _POSTGRES_SEARCH_SQL = """
+        SELECT {columns}
+        FROM news_articles a, websearch_to_tsquery('spanish', %s) q
+        WHERE a.search_vector @@ q
+        ORDER BY ts_rank(a.search_vector, q) DESC, a.fecha_publicacion DESC
+        LIMIT %s OFFSET %s
+    """
+    _SQLITE_SEARCH_SQL = """
+        SELECT {columns}
+        FROM news_articles_fts f
+        JOIN news_articles a ON a.rowid = f.rowid
+        WHERE news_articles_fts MATCH %s
+        ORDER BY bm25(news_articles_fts, 10.0, 1.0), a.fecha_publicacion DESC
+        LIMIT %s OFFSET %s
+    """
+
     @staticmethod
     def _to_entity(model: NewsArticleModel) -> NewsArticle:
         return NewsArticle(
@@ -202,15 +285,104 @@ class DjangoNewsArticleRepository(NewsArticleRepository):
             url=entity.url,
             categoria=entity.categoria,
             procesado=entity.procesado,
+            extracto=entity.excerpt(),
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
 
+    @staticmethod
+    def _to_summary(model: NewsArticleModel) -> NewsArticleSummary:
+        return NewsArticleSummary(
+            id=model.id,
+            titulo=model.titulo,
+            fuente=model.fuente,
+            fecha_publicacion=model.fecha_publicacion,
+            url=model.url,
+            categoria=model.categoria,
+            extracto=model.extracto,
+        )
+
     async def create(self, article: NewsArticle) -> NewsArticle:
         model = self._to_model(article)
         await model.asave()
         return self._to_entity(model)
 
+    async def bulk_create_if_absent(self, articles: List[NewsArticle]) -> Set[str]:
+        if not articles:
+            return set()
+        return await sync_to_async(self._bulk_create_if_absent)(articles)
+
+    def _bulk_create_if_absent(self, articles: List[NewsArticle]) -> Set[str]:
+        """
+        Un SELECT de las URLs existentes y un único INSERT de las nuevas.
+
+        Si otro proceso inserta la misma URL entre ambas sentencias, la
+        restricción unique de ``url`` descarta la fila y esa URL no se informa
+        como nueva: se devuelven solo las filas que insertó esta llamada.
+        """
+        articles_by_url = {}
+        for article in articles:
+            articles_by_url.setdefault(article.url, article)
+
+        with transaction.atomic():
+            existing_urls = self._find_existing_urls(articles_by_url)
+            new_models = [
+                self._to_model(article)
+                for url, article in articles_by_url.items()
+                if url not in existing_urls
+            ]
+            if not new_models:
+                return set()
+            if connection.vendor == "postgresql":
+                return self._insert_returning_urls(new_models)
+
+            NewsArticleModel.objects.bulk_create(new_models, ignore_conflicts=True)
+            # Los ids (UUID) se generan aquí: una fila con nuestro id la
+            # insertó esta llamada; la de un proceso concurrente tiene otro id
+            new_ids = [model.id for model in new_models]
+            inserted = set()
+            for start in range(0, len(new_ids), self.URL_LOOKUP_CHUNK_SIZE):
+                chunk = new_ids[start : start + self.URL_LOOKUP_CHUNK_SIZE]
+                inserted.update(
+                    NewsArticleModel.objects.filter(id__in=chunk).values_list(
+                        "url", flat=True
+                    )
+                )
+            return inserted
+
+    def _insert_returning_urls(self, new_models: List[NewsArticleModel]) -> Set[str]:
+        """
+        ``INSERT ... ON CONFLICT (url) DO NOTHING RETURNING url`` (PostgreSQL).
+
+        Returns:
+            Set[str]: URLs de las filas efectivamente insertadas
+        """
+        meta = NewsArticleModel._meta
+        fields = meta.concrete_fields
+        quote = connection.ops.quote_name
+        columns = ", ".join(quote(field.column) for field in fields)
+        url_column = quote(meta.get_field("url").column)
+        row = "(" + ", ".join(["%s"] * len(fields)) + ")"
+
+        inserted = set()
+        with connection.cursor() as cursor:
+            for start in range(0, len(new_models), self.INSERT_BATCH_SIZE):
+                batch = new_models[start : start + self.INSERT_BATCH_SIZE]
+                params = [
+                    field.get_db_prep_save(field.pre_save(model, True), connection)
+                    for model in batch
+                    for field in fields
+                ]
+                cursor.execute(
+                    f"INSERT INTO {quote(meta.db_table)} ({columns}) "
+                    f"VALUES {', '.join([row] * len(batch))} "
+                    f"ON CONFLICT ({url_column}) DO NOTHING "
+                    f"RETURNING {url_column}",
+                    params,
+                )
+                inserted.update(url for (url,) in cursor.fetchall())
+        return inserted
+
     async def get_by_id(self, article_id: UUID) -> Optional[NewsArticle]:
         try:
             model = await NewsArticleModel.objects.aget(id=article_id)
@@ -225,12 +397,120 @@ class DjangoNewsArticleRepository(NewsArticleRepository):
         except NewsArticleModel.DoesNotExist:
             return None
 
+    async def get_existing_urls(self, urls: Iterable[str]) -> Set[str]:
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return set()
+        return await sync_to_async(self._find_existing_urls)(unique_urls)
+
+    def _find_existing_urls(self, urls: Iterable[str]) -> Set[str]:
+        """Consulta las URLs existentes en bloques indexados por la columna ``url``."""
+        urls = list(urls)
+        existing_urls = set()
+        for start in range(0, len(urls), self.URL_LOOKUP_CHUNK_SIZE):
+            chunk = urls[start : start + self.URL_LOOKUP_CHUNK_SIZE]
+            existing_urls.update(
+                NewsArticleModel.objects.filter(url__in=chunk).values_list(
+                    "url", flat=True
+                )
+            )
+        return existing_urls
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[NewsArticle]:
         models = [
             model async for model in NewsArticleModel.objects.all()[skip : skip + limit]
         ]
         return [self._to_entity(model) for model in models]
 
+    async def get_summaries(
+        self, skip: int = 0, limit: int = 100
+    ) -> List[NewsArticleSummary]:
+        queryset = NewsArticleModel.objects.only(*self.SUMMARY_FIELDS)
+        return [
+            self._to_summary(model) async for model in queryset[skip : skip + limit]
+        ]
+
+    async def get_summary_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None,
+        fuente: Optional[str] = None,
+        categoria: Optional[str] = None,
+    ) -> CursorPage[NewsArticleSummary]:
+        queryset = NewsArticleModel.objects.only(*self.SUMMARY_FIELDS)
+        if fuente is not None:
+            queryset = queryset.filter(fuente=fuente)
+        if categoria is not None:
+            queryset = queryset.filter(categoria=categoria)
+
+        models = [
+            model
+            async for model in _keyset_slice(
+                queryset, "fecha_publicacion", cursor, limit
+            )
+        ]
+        return _build_page(models, "fecha_publicacion", limit, self._to_summary)
+
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 20
+    ) -> List[NewsArticle]:
+        terms = query.split()
+        if not terms:
+            return []
+        return await sync_to_async(self._search)(query, terms, skip, limit)
+
+    def _search(
+        self, query: str, terms: List[str], skip: int, limit: int
+    ) -> List[NewsArticle]:
+        columns = ", ".join(
+            f"a.{field.column}" for field in NewsArticleModel._meta.concrete_fields
+        )
+
+        if connection.vendor == "postgresql":
+            sql = self._POSTGRES_SEARCH_SQL.format(columns=columns)
+            params = [query, limit, skip]
+        elif connection.vendor == "sqlite":
+            # Cada término entre comillas: FTS5 los combina con AND y no
+            # interpreta operadores escritos por el usuario
+            match = " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+            sql = self._SQLITE_SEARCH_SQL.format(columns=columns)
+            params = [match, limit, skip]
+        else:
+            # Motor sin índice de texto completo: filtro secuencial por término
+            queryset = NewsArticleModel.objects.all()
+            for term in terms:
+                queryset = queryset.filter(
+                    Q(titulo__icontains=term) | Q(contenido__icontains=term)
+                )
+            models = queryset.order_by("-fecha_publicacion")[skip : skip + limit]
+            return [self._to_entity(model) for model in models]
+
+        return [
+            self._to_entity(model)
+            for model in NewsArticleModel.objects.raw(sql, params)
+        ]
+
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None,
+        fuente: Optional[str] = None,
+        categoria: Optional[str] = None,
+    ) -> CursorPage[NewsArticle]:
+        queryset = NewsArticleModel.objects.all()
+        if fuente is not None:
+            queryset = queryset.filter(fuente=fuente)
+        if categoria is not None:
+            queryset = queryset.filter(categoria=categoria)
+
+        models = [
+            model
+            async for model in _keyset_slice(
+                queryset, "fecha_publicacion", cursor, limit
+            )
+        ]
+        return _build_page(models, "fecha_publicacion", limit, self._to_entity)
+
     async def get_by_fuente(
         self, fuente: str, skip: int = 0, limit: int = 100
     ) -> List[NewsArticle]:
@@ -262,6 +542,7 @@ class DjangoNewsArticleRepository(NewsArticleRepository):
         model.url = article.url
         model.categoria = article.categoria
         model.procesado = article.procesado
+        model.extracto = article.excerpt()
         model.updated_at = article.updated_at
         await model.asave()
         return self._to_entity(model)
@@ -278,6 +559,9 @@ class DjangoNewsArticleRepository(NewsArticleRepository):
 class DjangoScrapingJobRepository(ScrapingJobRepository):
     """Adaptador Django para ScrapingJobRepository"""
 
+    # Candidatos que se intentan tomar por llamada en bases sin SKIP LOCKED
+    CLAIM_CANDIDATES = 10
+
     @staticmethod
     def _to_entity(model: ScrapingJobModel) -> ScrapingJob:
         return ScrapingJob(
@@ -289,6 +573,9 @@ class DjangoScrapingJobRepository(ScrapingJobRepository):
             total_articulos=model.total_articulos,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            lease_owner=model.lease_owner,
+            lease_expires_at=model.lease_expires_at,
+            articulos_nuevos=model.articulos_nuevos,
         )
 
     @staticmethod
@@ -302,6 +589,9 @@ class DjangoScrapingJobRepository(ScrapingJobRepository):
             total_articulos=entity.total_articulos,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
+            lease_owner=entity.lease_owner,
+            lease_expires_at=entity.lease_expires_at,
+            articulos_nuevos=entity.articulos_nuevos,
         )
 
     async def create(self, job: ScrapingJob) -> ScrapingJob:
@@ -322,6 +612,28 @@ class DjangoScrapingJobRepository(ScrapingJobRepository):
         ]
         return [self._to_entity(model) for model in models]
 
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None,
+        fuente: Optional[str] = None,
+        status: Optional[str] = None,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> CursorPage[ScrapingJob]:
+        queryset = ScrapingJobModel.objects.all()
+        if fuente is not None:
+            queryset = queryset.filter(fuente=fuente)
+        if status is not None:
+            queryset = queryset.filter(status=status)
+        if statuses is not None:
+            queryset = queryset.filter(status__in=statuses)
+
+        models = [
+            model
+            async for model in _keyset_slice(queryset, "fecha_inicio", cursor, limit)
+        ]
+        return _build_page(models, "fecha_inicio", limit, self._to_entity)
+
     async def get_by_fuente(
         self, fuente: str, skip: int = 0, limit: int = 100
     ) -> List[ScrapingJob]:
@@ -351,7 +663,10 @@ class DjangoScrapingJobRepository(ScrapingJobRepository):
         model.fecha_fin = job.fecha_fin
         model.status = job.status
         model.total_articulos = job.total_articulos
+        model.articulos_nuevos = job.articulos_nuevos
         model.updated_at = job.updated_at
+        model.lease_owner = job.lease_owner
+        model.lease_expires_at = job.lease_expires_at
         await model.asave()
         return self._to_entity(model)
 
@@ -362,3 +677,208 @@ class DjangoScrapingJobRepository(ScrapingJobRepository):
             return True
         except ScrapingJobModel.DoesNotExist:
             return False
+
+    async def enqueue(self, job: ScrapingJob) -> Optional[ScrapingJob]:
+        return await sync_to_async(self._enqueue)(job)
+
+    def _enqueue(self, job: ScrapingJob) -> Optional[ScrapingJob]:
+        """
+        La consulta y el INSERT deben ser atómicos frente a otros ``enqueue``
+        de la misma fuente. En PostgreSQL (READ COMMITTED) ``atomic()`` no
+        alcanza: se toma un advisory lock de transacción por fuente, y quien
+        llega segundo espera al primero y ve su job al consultar. En SQLite
+        una sola transacción escribe a la vez y la que leyó antes del INSERT
+        de la otra no puede escribir: falla en lugar de duplicar el job.
+        """
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT pg_advisory_xact_lock(hashtext(%s))",
+                        [f"scraping_jobs:{job.fuente}"],
+                    )
+            open_jobs = ScrapingJobModel.objects.filter(fuente=job.fuente).filter(
+                Q(status="pending")
+                | Q(status="running", lease_expires_at__isnull=False)
+            )
+            if open_jobs.exists():
+                return None
+            model = self._to_model(job)
+            model.save()
+            return self._to_entity(model)
+
+    async def claim_next(
+        self, worker_id: str, lease_seconds: float
+    ) -> Optional[ScrapingJob]:
+        model = await sync_to_async(self._claim_next)(worker_id, lease_seconds)
+        return self._to_entity(model) if model is not None else None
+
+    def _claim_next(
+        self, worker_id: str, lease_seconds: float
+    ) -> Optional[ScrapingJobModel]:
+        """
+        En PostgreSQL el candidato se bloquea con ``SELECT ... FOR UPDATE SKIP
+        LOCKED``: los workers concurrentes saltan las filas ya bloqueadas en
+        lugar de esperarlas. SQLite no tiene bloqueos de fila, pero serializa
+        las escrituras: cada candidato se toma con un UPDATE condicionado al
+        estado leído (compare-and-set) y, si otro worker se adelantó, se prueba
+        con el siguiente.
+        """
+        now = datetime.now(timezone.utc)
+        live_sources = ScrapingJobModel.objects.filter(
+            status="running", lease_expires_at__gte=now
+        ).values("fuente")
+        claimable = (
+            ScrapingJobModel.objects.filter(
+                Q(status="pending") | Q(status="running", lease_expires_at__lt=now)
+            )
+            .exclude(fuente__in=live_sources)
+            .order_by("created_at")
+        )
+        changes = {
+            "status": "running",
+            "lease_owner": worker_id,
+            "lease_expires_at": now + timedelta(seconds=lease_seconds),
+            "fecha_inicio": now,
+            "fecha_fin": None,
+            "updated_at": now,
+        }
+
+        if connection.features.has_select_for_update_skip_locked:
+            with transaction.atomic():
+                model = claimable.select_for_update(skip_locked=True).first()
+                if model is None:
+                    return None
+                for field, value in changes.items():
+                    setattr(model, field, value)
+                model.save(update_fields=list(changes))
+                return model
+
+        for candidate in claimable[: self.CLAIM_CANDIDATES]:
+            claimed = (
+                ScrapingJobModel.objects.filter(
+                    id=candidate.id,
+                    status=candidate.status,
+                    lease_expires_at=candidate.lease_expires_at,
+                )
+                .exclude(fuente__in=live_sources)
+                .update(**changes)
+            )
+            if claimed:
+                return ScrapingJobModel.objects.get(id=candidate.id)
+        return None
+
+    async def renew_lease(
+        self, job_id: UUID, worker_id: str, lease_seconds: float
+    ) -> bool:
+        now = datetime.now(timezone.utc)
+        renewed = await ScrapingJobModel.objects.filter(
+            id=job_id, status="running", lease_owner=worker_id
+        ).aupdate(lease_expires_at=now + timedelta(seconds=lease_seconds))
+        return renewed > 0
+
+    async def finish(self, job: ScrapingJob, worker_id: str) -> bool:
+        finished = await ScrapingJobModel.objects.filter(
+            id=job.id, status="running", lease_owner=worker_id
+        ).aupdate(
+            status=job.status,
+            fecha_fin=job.fecha_fin,
+            total_articulos=job.total_articulos,
+            articulos_nuevos=job.articulos_nuevos,
+            updated_at=job.updated_at,
+            lease_expires_at=None,
+        )
+        return finished > 0
+
+
+class DjangoCrawlFrontierRepository(CrawlFrontierRepository):
+    """Adaptador Django para CrawlFrontierRepository"""
+
+    URL_LOOKUP_CHUNK_SIZE = 500
+
+    @staticmethod
+    def _to_entity(model: CrawlFrontierModel) -> CrawlFrontierEntry:
+        return CrawlFrontierEntry(
+            fuente=model.fuente,
+            url=model.url,
+            first_seen=model.first_seen,
+            last_seen=model.last_seen,
+            status=model.status,
+            attempts=model.attempts,
+            fetched_at=model.fetched_at,
+        )
+
+    async def register(self, fuente: str, urls: List[str]) -> Set[str]:
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return set()
+        return await sync_to_async(self._register)(fuente, unique_urls)
+
+    def _register(self, fuente: str, urls: List[str]) -> Set[str]:
+        """
+        Un SELECT por bloque de URLs, un UPDATE de ``last_seen`` y un único
+        INSERT de las nuevas.
+        """
+        now = datetime.now(timezone.utc)
+        known_urls = set()
+        existing_urls = set()
+
+        with transaction.atomic():
+            for start in range(0, len(urls), self.URL_LOOKUP_CHUNK_SIZE):
+                chunk = urls[start : start + self.URL_LOOKUP_CHUNK_SIZE]
+                queryset = CrawlFrontierModel.objects.filter(
+                    fuente=fuente, url__in=chunk
+                )
+                for model in queryset:
+                    existing_urls.add(model.url)
+                    if self._to_entity(model).is_known:
+                        known_urls.add(model.url)
+                queryset.update(last_seen=now)
+
+            CrawlFrontierModel.objects.bulk_create(
+                [
+                    CrawlFrontierModel(
+                        fuente=fuente, url=url, first_seen=now, last_seen=now
+                    )
+                    for url in urls
+                    if url not in existing_urls
+                ],
+                ignore_conflicts=True,
+            )
+
+        return known_urls
+
+    async def mark_fetched(self, fuente: str, url: str) -> None:
+        await self._mark(
+            fuente,
+            url,
+            status=CrawlFrontierEntry.FETCHED,
+            fetched_at=datetime.now(timezone.utc),
+        )
+
+    async def mark_failed(self, fuente: str, url: str) -> None:
+        await self._mark(fuente, url, status=CrawlFrontierEntry.FAILED)
+
+    async def _mark(self, fuente: str, url: str, **fields) -> None:
+        updated = await CrawlFrontierModel.objects.filter(
+            fuente=fuente, url=url
+        ).aupdate(attempts=F("attempts") + 1, **fields)
+        if not updated:
+            now = datetime.now(timezone.utc)
+            await CrawlFrontierModel.objects.acreate(
+                fuente=fuente,
+                url=url,
+                first_seen=now,
+                last_seen=now,
+                attempts=1,
+                **fields,
+            )
+
+    async def get_by_fuente(
+        self, fuente: str, status: Optional[str] = None, limit: int = 100
+    ) -> List[CrawlFrontierEntry]:
+        queryset = CrawlFrontierModel.objects.filter(fuente=fuente)
+        if status is not None:
+            queryset = queryset.filter(status=status)
+        models = [model async for model in queryset.order_by("-first_seen")[:limit]]
+        return [self._to_entity(model) for model in models]
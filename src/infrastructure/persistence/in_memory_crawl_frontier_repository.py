@@ -0,0 +1,46 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.domain.entities.crawl_frontier_entry import CrawlFrontierEntry
+from src.domain.repositories.crawl_frontier_repository import (
+    CrawlFrontierRepository,
+)
+
+
+class InMemoryCrawlFrontierRepository(CrawlFrontierRepository):
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], CrawlFrontierEntry] = {}
+
+    async def register(self, fuente: str, urls: List[str]) -> Set[str]:
+        known_urls = set()
+        for url in urls:
+            entry = self._entries.get((fuente, url))
+            if entry is None:
+                self._entries[(fuente, url)] = CrawlFrontierEntry.create(fuente, url)
+                continue
+            entry.seen()
+            if entry.is_known:
+                known_urls.add(url)
+        return known_urls
+
+    async def mark_fetched(self, fuente: str, url: str) -> None:
+        self._get_or_create(fuente, url).mark_fetched()
+
+    async def mark_failed(self, fuente: str, url: str) -> None:
+        self._get_or_create(fuente, url).mark_failed()
+
+    def _get_or_create(self, fuente: str, url: str) -> CrawlFrontierEntry:
+        return self._entries.setdefault(
+            (fuente, url), CrawlFrontierEntry.create(fuente, url)
+        )
+
+    async def get_by_fuente(
+        self, fuente: str, status: Optional[str] = None, limit: int = 100
+    ) -> List[CrawlFrontierEntry]:
+        entries = [
+            entry
+            for entry in self._entries.values()
+            if entry.fuente == fuente and (status is None or entry.status == status)
+        ]
+        entries.sort(key=lambda entry: entry.first_seen, reverse=True)
+        return entries[:limit]
@@ -0,0 +1,155 @@
+from typing import Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from src.domain.entities.news_article import NewsArticle, NewsArticleSummary
+from src.domain.repositories.news_article_repository import NewsArticleRepository
+from src.domain.value_objects.pagination import CursorPage, PageCursor
+
+
+class InMemoryNewsArticleRepository(NewsArticleRepository):
+
+    def __init__(self):
+        self._articles: Dict[UUID, NewsArticle] = {}
+        self._ids_by_url: Dict[str, UUID] = {}
+
+    async def create(self, article: NewsArticle) -> NewsArticle:
+        if article.url in self._ids_by_url:
+            raise ValueError(f"Article with URL {article.url} already exists")
+        self._articles[article.id] = article
+        self._ids_by_url[article.url] = article.id
+        return article
+
+    async def bulk_create_if_absent(self, articles: List[NewsArticle]) -> Set[str]:
+        new_urls = set()
+        for article in articles:
+            if article.url not in self._ids_by_url:
+                await self.create(article)
+                new_urls.add(article.url)
+        return new_urls
+
+    async def get_by_id(self, article_id: UUID) -> Optional[NewsArticle]:
+        return self._articles.get(article_id)
+
+    async def get_by_url(self, url: str) -> Optional[NewsArticle]:
+        article_id = self._ids_by_url.get(url)
+        return self._articles.get(article_id) if article_id else None
+
+    async def get_existing_urls(self, urls: Iterable[str]) -> Set[str]:
+        return {url for url in urls if url in self._ids_by_url}
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[NewsArticle]:
+        return self._sorted(self._articles.values())[skip : skip + limit]
+
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None,
+        fuente: Optional[str] = None,
+        categoria: Optional[str] = None,
+    ) -> CursorPage[NewsArticle]:
+        articles = sorted(
+            (
+                a
+                for a in self._articles.values()
+                if (fuente is None or a.fuente == fuente)
+                and (categoria is None or a.categoria == categoria)
+            ),
+            key=self._keyset_key,
+            reverse=True,
+        )
+        if cursor is not None:
+            position = (cursor.fecha, cursor.id.hex)
+            articles = [a for a in articles if self._keyset_key(a) < position]
+
+        next_cursor = None
+        if len(articles) > limit:
+            last = articles[limit - 1]
+            next_cursor = PageCursor(fecha=last.fecha_publicacion, id=last.id)
+        return CursorPage(items=articles[:limit], next_cursor=next_cursor)
+
+    async def get_summaries(
+        self, skip: int = 0, limit: int = 100
+    ) -> List[NewsArticleSummary]:
+        articles = await self.get_all(skip=skip, limit=limit)
+        return [self._to_summary(article) for article in articles]
+
+    async def get_summary_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None,
+        fuente: Optional[str] = None,
+        categoria: Optional[str] = None,
+    ) -> CursorPage[NewsArticleSummary]:
+        page = await self.get_page(
+            limit=limit, cursor=cursor, fuente=fuente, categoria=categoria
+        )
+        return CursorPage(
+            items=[self._to_summary(article) for article in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 20
+    ) -> List[NewsArticle]:
+        terms = [term.lower() for term in query.split()]
+        if not terms:
+            return []
+
+        matches = []
+        for article in self._articles.values():
+            titulo = article.titulo.lower()
+            text = f"{titulo} {article.contenido.lower()}"
+            if all(term in text for term in terms):
+                title_hits = sum(term in titulo for term in terms)
+                matches.append((title_hits, article.fecha_publicacion, article))
+
+        matches.sort(key=lambda match: match[:2], reverse=True)
+        return [article for _, _, article in matches][skip : skip + limit]
+
+    async def get_by_fuente(
+        self, fuente: str, skip: int = 0, limit: int = 100
+    ) -> List[NewsArticle]:
+        articles = [a for a in self._articles.values() if a.fuente == fuente]
+        return self._sorted(articles)[skip : skip + limit]
+
+    async def get_by_categoria(
+        self, categoria: str, skip: int = 0, limit: int = 100
+    ) -> List[NewsArticle]:
+        articles = [a for a in self._articles.values() if a.categoria == categoria]
+        return self._sorted(articles)[skip : skip + limit]
+
+    async def update(self, article: NewsArticle) -> NewsArticle:
+        if article.id not in self._articles:
+            raise ValueError(f"Article with id {article.id} not found")
+        previous = self._articles[article.id]
+        self._ids_by_url.pop(previous.url, None)
+        self._articles[article.id] = article
+        self._ids_by_url[article.url] = article.id
+        return article
+
+    async def delete(self, article_id: UUID) -> bool:
+        article = self._articles.pop(article_id, None)
+        if article is None:
+            return False
+        self._ids_by_url.pop(article.url, None)
+        return True
+
+    @staticmethod
+    def _to_summary(article: NewsArticle) -> NewsArticleSummary:
+        return NewsArticleSummary(
+            id=article.id,
+            titulo=article.titulo,
+            fuente=article.fuente,
+            fecha_publicacion=article.fecha_publicacion,
+            url=article.url,
+            categoria=article.categoria,
+            extracto=article.excerpt(),
+        )
+
+    @staticmethod
+    def _keyset_key(article: NewsArticle):
+        return (article.fecha_publicacion, article.id.hex)
+
+    @staticmethod
+    def _sorted(articles: Iterable[NewsArticle]) -> List[NewsArticle]:
+        return sorted(articles, key=lambda a: a.fecha_publicacion, reverse=True)
@@ -0,0 +1,3 @@
+from .fake_news_server import FakeNewsServer, FakeSite, FakeSiteConfig
+
+__all__ = ["FakeNewsServer", "FakeSite", "FakeSiteConfig"]
@@ -0,0 +1,604 @@
+"""
+Servidor HTTP local que simula los sitios de Clarín, Página 12, La Nación e
+Infobae para pruebas de carga de los scrapers y spiders.
+
+Cada fuente se sirve en su propio puerto, con páginas de sección, notas y
+feeds (RSS / sitemap de noticias) generados de forma determinista con el
+marcado y las rutas de cada diario, de modo que los selectores y filtros de URL
+existentes funcionan sin cambios. El volumen de notas, la latencia, la tasa de
+errores y el tamaño de página son configurables (``FakeSiteConfig``).
+
+Para apuntar los scrapers y spiders al servidor se usan las variables
+``SCRAPER_BASE_URL_<FUENTE>`` que devuelve ``FakeNewsServer.environment()``
+(ver ``src.infrastructure.adapters.http.base_url``).
+
+Uso:
+    python -m src.infrastructure.testing.fake_news_server --port 8701 \\
+        --articles 5000 --latency 50 --error-rate 0.01
+"""
+
+import argparse
+import html
+import json
+import logging
+import random
+import re
+import threading
+import time
+import unicodedata
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.domain.enums import NewsSource
+
+logger = logging.getLogger(__name__)
+
+WORDS = (
+    "el gobierno anunció nuevas medidas económicas para contener la inflación "
+    "mientras los mercados reaccionaron con cautela ante la incertidumbre "
+    "política el ministro de economía aseguró que el programa fiscal se "
+    "mantendrá durante el resto del año y que las reservas del banco central "
+    "crecerán en los próximos meses según fuentes oficiales consultadas por "
+    "este medio la oposición cuestionó el alcance del anuncio y pidió mayor "
+    "información en el congreso sobre el impacto en salarios jubilaciones y "
+    "tarifas de servicios públicos en todo el país"
+).split()
+
+SCRIPTS = (
+    "<script>window.dataLayer=window.dataLayer||[];function gtag(){dataLayer.push"
+    '(arguments)}gtag("js",new Date());</script><script async '
+    'src="https://www.googletagmanager.com/gtag/js"></script><style>body{margin:0;'
+    "font-family:Georgia,serif}.hidden{display:none}</style>"
+)
+
+
+@dataclass(frozen=True)
+class FakeSiteConfig:
+    """
+    Parámetros de los sitios simulados.
+
+    Attributes:
+        articles: Notas publicadas al iniciar el servidor
+        articles_per_section: Enlaces a notas por página de sección o feed
+        new_articles_per_minute: Notas nuevas que se publican por minuto
+        latency: Latencia media de cada respuesta (en segundos)
+        jitter: Variación relativa de la latencia (0.5 = ±50%)
+        error_rate: Fracción de respuestas que devuelven 503
+        page_size: Tamaño aproximado de cada nota en bytes
+        seed: Semilla para generar el contenido
+    """
+
+    articles: int = 1000
+    articles_per_section: int = 30
+    new_articles_per_minute: float = 0.0
+    latency: float = 0.0
+    jitter: float = 0.5
+    error_rate: float = 0.0
+    page_size: int = 60_000
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class SiteShape:
+    """Rutas y marcado propios de un diario."""
+
+    categories: Tuple[str, ...]
+    section_prefix: str
+    article_path: Callable[[int, str, str, datetime], str]
+    article_id: "re.Pattern[str]"
+    section_item: Callable[[str, str, str], str]
+    article_body: Callable[[str, str, str, str, str], str]
+
+
+def _clarin_item(path: str, title: str, summary: str) -> str:
+    return (
+        f'<article class="box-notas"><a href="{path}"><h2 class="title">{title}</h2>'
+        f'<p class="summary">{summary}</p></a></article>'
+    )
+
+
+def _pagina12_item(path: str, title: str, summary: str) -> str:
+    return (
+        '<div class="article-item"><div class="article-item__content">'
+        f'<h2 class="title"><a href="{path}">{title}</a></h2>'
+        f'<div class="article-item__subtitle">{summary}</div></div></div>'
+    )
+
+
+def _lanacion_item(path: str, title: str, summary: str) -> str:
+    return (
+        f'<div class="mod-article"><h2 class="com-title"><a class="com-link" '
+        f'href="{path}">{title}</a></h2><p class="com-subhead">{summary}</p></div>'
+    )
+
+
+def _infobae_item(path: str, title: str, summary: str) -> str:
+    return (
+        f'<div class="story-card"><h2 class="story-card-hl"><a href="{path}">'
+        f"{title}</a></h2><p>{summary}</p></div>"
+    )
+
+
+def _clarin_body(crumbs: str, title: str, summary: str, date: str, text: str) -> str:
+    return (
+        f'<div class="breadcrumb">{crumbs}</div><article><h1 class="title">{title}'
+        f'</h1><h2 class="bajada">{summary}</h2><time datetime="{date}"></time>'
+        f'<div class="body-nota">{text}</div></article>'
+    )
+
+
+def _pagina12_body(crumbs: str, title: str, summary: str, date: str, text: str) -> str:
+    return (
+        f'<div class="breadcrumb">{crumbs}</div><article class="article-full">'
+        f'<h1 class="article-title">{title}</h1><time datetime="{date}"></time>'
+        f'<div class="article-main-content article-text">{text}</div></article>'
+    )
+
+
+def _lanacion_body(crumbs: str, title: str, summary: str, date: str, text: str) -> str:
+    return (
+        f'<div class="com-breadcrumb">{crumbs}</div><article class="article">'
+        f'<h1 class="com-title">{title}</h1><time datetime="{date}"></time>'
+        f'<div class="nota">{text}</div></article>'
+    )
+
+
+def _infobae_body(crumbs: str, title: str, summary: str, date: str, text: str) -> str:
+    return (
+        f'<nav class="breadcrumb">{crumbs}</nav><article><h1 class="article-title">'
+        f'{title}</h1><span class="date">{date[:10]}</span>'
+        f'<div class="article-content">{text}</div></article>'
+    )
+
+
+SITES: Dict[NewsSource, SiteShape] = {
+    NewsSource.CLARIN: SiteShape(
+        categories=("politica", "economia", "sociedad", "mundo"),
+        section_prefix="/",
+        article_path=lambda id_, cat, slug, _: f"/{cat}/{slug}_0_{id_}.html",
+        article_id=re.compile(r"_0_(\d+)\.html$"),
+        section_item=_clarin_item,
+        article_body=_clarin_body,
+    ),
+    NewsSource.PAGINA12: SiteShape(
+        categories=("el-pais", "economia", "sociedad", "el-mundo"),
+        section_prefix="/secciones/",
+        article_path=lambda id_, cat, slug, _: f"/notas/{id_}-{slug}",
+        article_id=re.compile(r"^/notas/(\d+)-"),
+        section_item=_pagina12_item,
+        article_body=_pagina12_body,
+    ),
+    NewsSource.LA_NACION: SiteShape(
+        categories=("politica", "economia", "sociedad", "el-mundo"),
+        section_prefix="/",
+        article_path=lambda id_, cat, slug, _: f"/{cat}/{slug}-nid{id_}/",
+        article_id=re.compile(r"-nid(\d+)/?$"),
+        section_item=_lanacion_item,
+        article_body=_lanacion_body,
+    ),
+    NewsSource.INFOBAE: SiteShape(
+        categories=("politica", "economia", "sociedad", "america"),
+        section_prefix="/",
+        article_path=lambda id_, cat, slug, day: (
+            f"/{cat}/{day:%Y/%m/%d}/{slug}-{id_}/"
+        ),
+        article_id=re.compile(r"/\d{4}/\d{2}/\d{2}/[a-z-]+-(\d+)/$"),
+        section_item=_infobae_item,
+        article_body=_infobae_body,
+    ),
+}
+
+
+class FakeSite:
+    """
+    Contenido de un diario simulado.
+
+    Las notas se identifican con un entero creciente: la más nueva es la de id
+    más alto y cada id genera siempre la misma página. Con
+    ``new_articles_per_minute`` aparecen notas nuevas a medida que pasa el
+    tiempo y las secciones y feeds cambian de versión (ETag).
+    """
+
+    def __init__(self, source: NewsSource, config: FakeSiteConfig, started_at=None):
+        self.source = source
+        self.shape = SITES[source]
+        self.config = config
+        self.started_at = time.time() if started_at is None else started_at
+        # Separación entre publicaciones (5 minutos si no se publican notas nuevas)
+        rate = config.new_articles_per_minute
+        self.spacing = 60 / rate if rate > 0 else 300.0
+        self.render_article = lru_cache(maxsize=2048)(self._render_article)
+
+    def newest_id(self, now: Optional[float] = None) -> int:
+        elapsed = (time.time() if now is None else now) - self.started_at
+        published = int(elapsed / 60 * self.config.new_articles_per_minute)
+        return self.config.articles + max(published, 0)
+
+    def published_at(self, article_id: int) -> datetime:
+        offset = (article_id - self.config.articles) * self.spacing
+        return datetime.fromtimestamp(self.started_at + offset, tz=timezone.utc)
+
+    def category(self, article_id: int) -> str:
+        return self.shape.categories[article_id % len(self.shape.categories)]
+
+    def article_url_path(self, article_id: int) -> str:
+        rng = self._rng(article_id)
+        slug = _slug(_sentence(rng, 6))
+        return self.shape.article_path(
+            article_id, self.category(article_id), slug, self.published_at(article_id)
+        )
+
+    def article_ids(self, category: Optional[str] = None) -> list[int]:
+        """Ids más recientes de una categoría (o de todas si es None)."""
+        ids = []
+        article_id = self.newest_id()
+        while article_id > 0 and len(ids) < self.config.articles_per_section:
+            if category is None or self.category(article_id) == category:
+                ids.append(article_id)
+            article_id -= 1
+        return ids
+
+    def route(self, path: str) -> Tuple[str, Optional[int], Optional[str]]:
+        """
+        Clasifica una ruta.
+
+        Returns:
+            Tuple: (tipo, id de nota, categoría) con tipo "article", "missing",
+                "robots", "rss", "sitemap" o "section"
+        """
+        if path == "/robots.txt":
+            return "robots", None, None
+        match = self.shape.article_id.search(path)
+        if match:
+            article_id = int(match.group(1))
+            exists = 0 < article_id <= self.newest_id()
+            if exists and self.article_url_path(article_id) == path:
+                return "article", article_id, None
+            return "missing", None, None
+        if "sitemap" in path:
+            return "sitemap", None, None
+        if "rss" in path:
+            return "rss", None, None
+
+        segment = path[len(self.shape.section_prefix) :].strip("/").split("/")[0]
+        category = segment if segment in self.shape.categories else None
+        return "section", None, category
+
+    def render_section(self, category: Optional[str]) -> str:
+        rng = self._rng(zlib.crc32((category or "").encode()))
+        items = []
+        for article_id in self.article_ids(category):
+            title_rng = self._rng(article_id)
+            title = html.escape(_title(title_rng))
+            items.append(
+                self.shape.section_item(
+                    self.article_url_path(article_id), title, _sentence(title_rng)
+                )
+            )
+        tags = " ".join(
+            f'<a href="/tema/{_slug(word)}.html">#{word}</a>'
+            for word in rng.sample(WORDS, 20)
+        )
+        return (
+            f'<!DOCTYPE html><html lang="es"><head><meta charset="utf-8">'
+            f"<title>{self.source.nombre}</title>{SCRIPTS}</head><body>"
+            f'<header>{self._nav()}</header><main><section class="tags">{tags}'
+            f'</section><section class="news-list">{"".join(items)}</section>'
+            f"</main>{_footer()}</body></html>"
+        )
+
+    def _render_article(self, article_id: int) -> str:
+        rng = self._rng(article_id)
+        title = _title(rng)
+        summary = _sentence(rng)
+        date = self.published_at(article_id).isoformat()
+        category = self.category(article_id).replace("-", " ").title()
+
+        paragraphs = []
+        size = 3000
+        while size < self.config.page_size or not paragraphs:
+            paragraph = " ".join(_sentence(rng) for _ in range(rng.randint(2, 4)))
+            paragraphs.append(paragraph)
+            size += len(paragraph) + 7
+
+        head = (
+            f'<meta charset="utf-8"><title>{html.escape(title)}</title>'
+            f'<meta property="og:title" content="{html.escape(title)}">'
+            f'<meta property="article:published_time" content="{date}">'
+            f'<meta property="article:section" content="{category}">{SCRIPTS}'
+        )
+        if article_id % 2 == 0:
+            head += _json_ld(title, date, category, paragraphs)
+
+        crumbs = f'<a href="/">Inicio</a><a href="/{self.category(article_id)}/">'
+        crumbs += f"{category}</a>"
+        text = "".join(f"<p>{html.escape(p)}</p>" for p in paragraphs)
+        body = self.shape.article_body(
+            crumbs, html.escape(title), html.escape(summary), date, text
+        )
+        return (
+            f'<!DOCTYPE html><html lang="es"><head>{head}</head><body>'
+            f"<header>{self._nav()}</header>{body}{_footer()}</body></html>"
+        )
+
+    def render_feed(self, kind: str, base_url: str) -> str:
+        entries = []
+        for article_id in self.article_ids():
+            url = html.escape(base_url + self.article_url_path(article_id))
+            published = self.published_at(article_id)
+            if kind == "rss":
+                entries.append(
+                    f"<item><title>{html.escape(_title(self._rng(article_id)))}"
+                    f"</title><link>{url}</link><pubDate>"
+                    f"{format_datetime(published)}</pubDate></item>"
+                )
+            else:
+                entries.append(
+                    f"<url><loc>{url}</loc><lastmod>{published.isoformat()}"
+                    "</lastmod></url>"
+                )
+        if kind == "rss":
+            return (
+                '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+                f"<title>{self.source.nombre}</title>{''.join(entries)}</channel></rss>"
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><urlset xmlns='
+            f'"http://www.sitemaps.org/schemas/sitemap/0.9">{"".join(entries)}'
+            "</urlset>"
+        )
+
+    def _nav(self) -> str:
+        links = "".join(
+            f'<li><a href="{self.shape.section_prefix}{category}">{category}</a></li>'
+            for category in self.shape.categories
+        )
+        return f'<nav class="main-menu"><ul>{links}</ul></nav>'
+
+    def _rng(self, key: int) -> random.Random:
+        return random.Random(f"{self.config.seed}-{self.source.name}-{key}")
+
+
+def _sentence(rng: random.Random, words: Optional[int] = None) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words or rng.randint(12, 28)))
+    return text[0].upper() + text[1:] + "."
+
+
+def _title(rng: random.Random) -> str:
+    return _sentence(rng, rng.randint(8, 14))[:-1]
+
+
+def _slug(text: str) -> str:
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore")
+    return "-".join(re.findall(r"[a-z]+", ascii_text.decode().lower()))
+
+
+def _json_ld(title: str, date: str, section: str, paragraphs: Iterable[str]) -> str:
+    data = {
+        "@context": "https://schema.org",
+        "@type": "NewsArticle",
+        "headline": title,
+        "datePublished": date,
+        "articleSection": section,
+        "articleBody": "\n\n".join(paragraphs),
+    }
+    return (
+        '<script type="application/ld+json">'
+        f"{json.dumps(data, ensure_ascii=False)}</script>"
+    )
+
+
+def _footer() -> str:
+    links = "".join(f'<a href="/legales/{i}">Legal {i}</a>' for i in range(10))
+    return f"<footer><p>Todos los derechos reservados.</p>{links}</footer>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_SiteServer"
+
+    def do_GET(self):
+        site, owner = self.server.site, self.server.owner
+        owner.wait_latency()
+
+        if owner.should_fail():
+            return self._send(503, b"Servicio no disponible", "text/plain")
+
+        path = urlsplit(self.path).path
+        kind, article_id, category = site.route(path)
+        if kind == "missing":
+            return self._send(404, b"No encontrado", "text/plain")
+        if kind == "robots":
+            return self._send(200, b"User-agent: *\nAllow: /\n", "text/plain")
+
+        if kind == "article":
+            etag = f'"{site.source.name.lower()}-{article_id}"'
+        else:
+            etag = f'"{site.source.name.lower()}-{kind}-{site.newest_id()}"'
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, b"", None, etag)
+
+        if kind == "article":
+            body = site.render_article(article_id)
+        elif kind == "section":
+            body = site.render_section(category)
+        else:
+            body = site.render_feed(kind, self.server.base_url)
+        content_type = "text/html" if kind in ("article", "section") else "text/xml"
+        self._send(200, body.encode("utf-8"), content_type, etag)
+
+    def _send(self, status: int, body: bytes, content_type, etag=None):
+        # Antes de responder, para que el cliente vea estadísticas actualizadas
+        self.server.owner.record(status, len(body))
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.server.site.source.name} {format % args}")
+
+
+class _SiteServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, site: FakeSite, owner: "FakeNewsServer"):
+        super().__init__(address, _Handler)
+        self.site = site
+        self.owner = owner
+        host, port = self.server_address[:2]
+        self.base_url = f"http://{host}:{port}"
+
+
+class FakeNewsServer:
+    """
+    Levanta un sitio simulado por fuente, cada uno en su propio puerto.
+
+    Se usa como context manager::
+
+        with FakeNewsServer(FakeSiteConfig(latency=0.05)) as server:
+            os.environ.update(server.environment())
+            ClarinScraper().scrape()
+
+    Attributes:
+        config: Parámetros de los sitios
+        base_urls: URL base de cada fuente (disponible después de ``start``)
+    """
+
+    def __init__(
+        self,
+        config: Optional[FakeSiteConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        sources: Optional[Iterable[NewsSource]] = None,
+    ):
+        """
+        Args:
+            config: Parámetros de los sitios (por defecto ``FakeSiteConfig()``)
+            host: Interfaz donde escuchar
+            port: Puerto de la primera fuente; las siguientes usan los puertos
+                consecutivos. Con 0 se asignan puertos libres
+            sources: Fuentes a simular (por defecto todas las de ``SITES``)
+        """
+        self.config = config or FakeSiteConfig()
+        self.host = host
+        self.port = port
+        self.sources = list(sources or SITES)
+        self.base_urls: Dict[NewsSource, str] = {}
+        self._servers: list[_SiteServer] = []
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "errors": 0, "not_modified": 0, "bytes": 0}
+
+    def start(self) -> "FakeNewsServer":
+        started_at = time.time()
+        for index, source in enumerate(self.sources):
+            port = self.port + index if self.port else 0
+            site = FakeSite(source, self.config, started_at)
+            server = _SiteServer((self.host, port), site, self)
+            threading.Thread(
+                target=server.serve_forever, name=f"fake-{source.name}", daemon=True
+            ).start()
+            self._servers.append(server)
+            self.base_urls[source] = server.base_url
+            logger.info(f"Sitio simulado de {source.nombre} en {server.base_url}")
+        return self
+
+    def stop(self) -> None:
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers.clear()
+
+    def environment(self) -> Dict[str, str]:
+        """Variables ``SCRAPER_BASE_URL_<FUENTE>`` que redirigen cada fuente."""
+        return {
+            f"SCRAPER_BASE_URL_{source.name}": base_url
+            for source, base_url in self.base_urls.items()
+        }
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def wait_latency(self) -> None:
+        if self.config.latency <= 0:
+            return
+        with self._lock:
+            variation = self._random.uniform(-self.config.jitter, self.config.jitter)
+        time.sleep(max(self.config.latency * (1 + variation), 0))
+
+    def should_fail(self) -> bool:
+        if self.config.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.config.error_rate
+
+    def record(self, status: int, size: int) -> None:
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["bytes"] += size
+            if status >= 500:
+                self._stats["errors"] += 1
+            elif status == 304:
+                self._stats["not_modified"] += 1
+
+    def __enter__(self) -> "FakeNewsServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diarios simulados para carga")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8701)
+    parser.add_argument("--articles", type=int, default=1000)
+    parser.add_argument("--articles-per-section", type=int, default=30)
+    parser.add_argument("--new-per-minute", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0, help="ms")
+    parser.add_argument("--jitter", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=60, help="KB")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    config = FakeSiteConfig(
+        articles=args.articles,
+        articles_per_section=args.articles_per_section,
+        new_articles_per_minute=args.new_per_minute,
+        latency=args.latency / 1000,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        page_size=args.page_size * 1024,
+        seed=args.seed,
+    )
+    server = FakeNewsServer(config, host=args.host, port=args.port).start()
+    for name, value in server.environment().items():
+        print(f"export {name}={value}")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"Estadísticas: {server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
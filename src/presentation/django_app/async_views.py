@@ -0,0 +1,279 @@
+"""
+Vistas asíncronas nativas de la API.
+
+Mismos endpoints, contratos y payloads que ``views.py``, pero los handlers son
+corrutinas: bajo ASGI Django los ejecuta directamente en el event loop y los
+casos de uso se esperan con ``await`` en lugar de pasar por ``async_to_sync``.
+Así un worker puede atender muchas peticiones que esperan a la base de datos
+al mismo tiempo.
+
+``urls.py`` las selecciona cuando ``API_ASYNC_VIEWS`` está activo (por defecto
+al arrancar con ``src.infrastructure.config.asgi``).
+"""
+
+import json
+
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import MethodNotAllowed
+from rest_framework.settings import api_settings
+
+from src.application.dto import (
+    CreateNewsArticleDTO,
+    CreateSourceDTO,
+    CreateUserDTO,
+)
+from src.application.use_cases import (
+    CreateArticleUseCase,
+    CreateUserUseCase,
+    ListArticlesUseCase,
+    ListUsersUseCase,
+    RegisterSourceUseCase,
+    SearchArticlesUseCase,
+)
+from src.domain.enums import NewsSource
+from src.infrastructure.persistence.django_repositories import (
+    DjangoNewsArticleRepository,
+    DjangoSourceRepository,
+    DjangoUserRepository,
+)
+from .fast_serialization import serialize
+from .serializers import (
+    NewsArticleCreateSerializer,
+    NewsArticleSerializer,
+    NewsArticleSummarySerializer,
+    SourceCreateSerializer,
+    SourceSerializer,
+    UserCreateSerializer,
+    UserSerializer,
+)
+from .views import _pagination_params, _source_data
+
+
+class AsyncAPIView(View):
+    """
+    Base para vistas asíncronas con respuestas JSON equivalentes a las de DRF.
+
+    Las respuestas se renderizan con el mismo renderer configurado para la API
+    síncrona (``DEFAULT_RENDERER_CLASSES``), por lo que el cuerpo es idéntico.
+
+    Como en ``APIView``, las excepciones pasan por el ``EXCEPTION_HANDLER`` de
+    DRF: las de DRF y de Django (404, 403, método no permitido) se responden
+    con su cuerpo JSON, y las inesperadas se vuelven a lanzar para que Django
+    genere el 500.
+    """
+
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Igual que APIView: la API no usa autenticación por sesión
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            method = request.method.lower()
+            handler = getattr(self, method, None)
+            if method not in self.http_method_names or handler is None:
+                raise MethodNotAllowed(request.method)
+            return await handler(request, *args, **kwargs)
+        except Exception as exc:
+            return self.handle_exception(exc, request, args, kwargs)
+
+    def handle_exception(self, exc, request, args, kwargs) -> HttpResponse:
+        """Responde la excepción con el exception handler de DRF."""
+        context = {"view": self, "args": args, "kwargs": kwargs, "request": request}
+        response = api_settings.EXCEPTION_HANDLER(exc, context)
+        if response is None:
+            raise exc
+        rendered = self.render(response.data, response.status_code)
+        for header, value in response.items():
+            if header.lower() != "content-type":
+                rendered[header] = value
+        if isinstance(exc, MethodNotAllowed):
+            rendered["Allow"] = ", ".join(self._allowed_methods())
+        return rendered
+
+    def render(self, data, status_code: int = status.HTTP_200_OK) -> HttpResponse:
+        return HttpResponse(
+            self.renderer.render(data),
+            status=status_code,
+            content_type="application/json",
+        )
+
+    def parse_json(self, request):
+        """
+        Decodifica el cuerpo JSON de la petición.
+
+        Raises:
+            ValueError: Si el cuerpo no es JSON válido
+        """
+        if not request.body:
+            return {}
+        try:
+            return json.loads(request.body)
+        except ValueError as e:
+            raise ValueError(f"JSON parse error - {e}") from e
+
+    def validate(self, serializer_class, request):
+        """
+        Parsea y valida el cuerpo con un serializer de DRF.
+
+        Returns:
+            tuple: (validated_data, None) o (None, respuesta 400 con los errores)
+        """
+        try:
+            data = self.parse_json(request)
+        except ValueError as e:
+            return None, self.render({"detail": str(e)}, status.HTTP_400_BAD_REQUEST)
+
+        serializer = serializer_class(data=data)
+        if not serializer.is_valid():
+            return None, self.render(serializer.errors, status.HTTP_400_BAD_REQUEST)
+        return serializer.validated_data, None
+
+
+class NewsArticleListCreateView(AsyncAPIView):
+    """Vista asíncrona para listar y crear artículos de noticias"""
+
+    async def get(self, request):
+        try:
+            skip, limit = _pagination_params(request.GET, default_limit=100)
+        except ValueError as e:
+            return self.render({"error": str(e)}, status.HTTP_400_BAD_REQUEST)
+        use_case = ListArticlesUseCase(DjangoNewsArticleRepository())
+
+        # view=summary: listado sin contenido completo (solo extracto precalculado)
+        view = request.GET.get("view", "full")
+        if view not in ("full", "summary"):
+            return self.render(
+                {"error": f"Invalid view: {view}"}, status.HTTP_400_BAD_REQUEST
+            )
+        summary = view == "summary"
+
+        # Paginación por cursor: se activa al enviar el parámetro (vacío = primera página)
+        if "cursor" in request.GET:
+            try:
+                page = await use_case.execute_page(
+                    limit=limit,
+                    cursor=request.GET.get("cursor") or None,
+                    fuente=request.GET.get("fuente"),
+                    categoria=request.GET.get("categoria"),
+                    summary=summary,
+                )
+            except ValueError as e:
+                return self.render({"error": str(e)}, status.HTTP_400_BAD_REQUEST)
+
+            if summary:
+                data = serialize(NewsArticleSummarySerializer, page.items, many=True)
+            else:
+                data = serialize(NewsArticleSerializer, page.items, many=True)
+            return self.render({"results": data, "next_cursor": page.next_cursor})
+
+        if summary:
+            summaries = await use_case.execute_summaries(skip=skip, limit=limit)
+            return self.render(
+                serialize(NewsArticleSummarySerializer, summaries, many=True)
+            )
+
+        articles = await use_case.execute(skip=skip, limit=limit)
+        data = serialize(NewsArticleSerializer, articles, many=True)
+        return self.render(data)
+
+    async def post(self, request):
+        data, error_response = self.validate(NewsArticleCreateSerializer, request)
+        if error_response:
+            return error_response
+
+        use_case = CreateArticleUseCase(DjangoNewsArticleRepository())
+
+        try:
+            article = await use_case.execute(CreateNewsArticleDTO(**data))
+        except ValueError as e:
+            return self.render({"error": str(e)}, status.HTTP_400_BAD_REQUEST)
+
+        return self.render(
+            serialize(NewsArticleSerializer, article),
+            status.HTTP_201_CREATED,
+        )
+
+
+class NewsArticleSearchView(AsyncAPIView):
+    """Vista asíncrona de búsqueda de texto completo sobre artículos"""
+
+    async def get(self, request):
+        query = request.GET.get("q", "")
+        use_case = SearchArticlesUseCase(DjangoNewsArticleRepository())
+
+        try:
+            skip, limit = _pagination_params(request.GET, default_limit=20)
+            articles = await use_case.execute(query, skip=skip, limit=limit)
+        except ValueError as e:
+            return self.render({"error": str(e)}, status.HTTP_400_BAD_REQUEST)
+
+        data = serialize(NewsArticleSerializer, articles, many=True)
+        return self.render(data)
+
+
+class SourceListCreateView(AsyncAPIView):
+    """Vista asíncrona para registrar fuentes"""
+
+    async def post(self, request):
+        data, error_response = self.validate(SourceCreateSerializer, request)
+        if error_response:
+            return error_response
+
+        dto = CreateSourceDTO(source_type=NewsSource[data["source_type"]])
+        use_case = RegisterSourceUseCase(DjangoSourceRepository())
+
+        try:
+            source = await use_case.execute(dto)
+        except ValueError as e:
+            return self.render({"error": str(e)}, status.HTTP_400_BAD_REQUEST)
+
+        return self.render(
+            serialize(SourceSerializer, _source_data(source)), status.HTTP_201_CREATED
+        )
+
+
+class UserListCreateView(AsyncAPIView):
+    """Vista asíncrona para listar y crear usuarios"""
+
+    async def get(self, request):
+        skip = int(request.GET.get("skip", 0))
+        limit = int(request.GET.get("limit", 100))
+
+        use_case = ListUsersUseCase(DjangoUserRepository())
+        users = await use_case.execute(skip=skip, limit=limit)
+
+        return self.render(serialize(UserSerializer, users, many=True))
+
+    async def post(self, request):
+        data, error_response = self.validate(UserCreateSerializer, request)
+        if error_response:
+            return error_response
+
+        use_case = CreateUserUseCase(DjangoUserRepository())
+
+        try:
+            user = await use_case.execute(CreateUserDTO(**data))
+        except ValueError as e:
+            return self.render({"error": str(e)}, status.HTTP_400_BAD_REQUEST)
+
+        return self.render(serialize(UserSerializer, user), status.HTTP_201_CREATED)
+
+
+class HealthCheckView(AsyncAPIView):
+    """Vista asíncrona para health check"""
+
+    async def get(self, request):
+        return self.render(
+            {
+                "status": "healthy",
+                "service": "News Scraping API",
+                "architecture": "Hexagonal (Clean Architecture)",
+            }
+        )
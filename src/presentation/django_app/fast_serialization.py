@@ -0,0 +1,175 @@
+"""
+Ruta rápida de serialización para las respuestas de la API.
+
+``Serializer(many=True).data`` recorre, por cada objeto y cada campo, toda la
+maquinaria genérica de DRF (resolución de ``source``, ``SkipField``,
+``OrderedDict``/``ReturnDict``). Para los serializers planos de esta API eso
+domina el tiempo de respuesta en páginas grandes.
+
+``compile_serializer`` analiza una sola vez los campos declarados y genera un
+codificador por campo: ``str`` directo para textos y UUIDs, conversión directa
+de zona horaria + ``strftime`` para fechas y ``to_representation`` del propio
+campo para el resto. El resultado es el mismo diccionario que produce DRF, de
+modo que el JSON renderizado es idéntico byte a byte.
+
+Se activa con ``REST_FRAMEWORK["FAST_SERIALIZATION"]``.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+
+from django.conf import settings
+from rest_framework import fields as drf_fields
+from rest_framework.settings import api_settings
+
+Encoder = Callable[[Any], Any]
+
+# DATETIME_FORMAT de la API
+ISO_MICROSECONDS_Z_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def fast_serialization_enabled() -> bool:
+    return bool(getattr(settings, "REST_FRAMEWORK", {}).get("FAST_SERIALIZATION"))
+
+
+class CompiledSerializer:
+    """
+    Codificador precompilado equivalente a ``serializer_class(instance).data``.
+
+    Acepta tanto diccionarios como objetos con atributos (DTOs), igual que DRF.
+    """
+
+    def __init__(self, field_encoders: List[Tuple[str, Encoder]]):
+        self._names = [name for name, _ in field_encoders]
+        self._encoders = [encoder for _, encoder in field_encoders]
+        self._item_getter = self._build_getter(itemgetter)
+        self._attr_getter = self._build_getter(attrgetter)
+
+    def _build_getter(self, getter_factory) -> Callable[[Any], tuple]:
+        if not self._names:
+            return lambda instance: ()
+        if len(self._names) == 1:
+            single = getter_factory(self._names[0])
+            return lambda instance: (single(instance),)
+        return getter_factory(*self._names)
+
+    def encode(self, instance) -> dict:
+        return self.encode_many([instance])[0]
+
+    def encode_many(self, instances: Iterable) -> List[dict]:
+        names = self._names
+        encoders = self._encoders
+        results = []
+        for instance in instances:
+            getter = (
+                self._item_getter
+                if isinstance(instance, Mapping)
+                else self._attr_getter
+            )
+            values = getter(instance)
+            results.append(
+                {
+                    name: None if value is None else encode(value)
+                    for name, encode, value in zip(names, encoders, values)
+                }
+            )
+        return results
+
+
+def _datetime_encoder(field: drf_fields.DateTimeField) -> Encoder:
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    field_timezone = (
+        field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    )
+    fallback = field.to_representation
+
+    if (
+        output_format is None
+        or output_format.lower() == drf_fields.ISO_8601
+        or field_timezone is None
+    ):
+        return fallback
+
+    if output_format == ISO_MICROSECONDS_Z_FORMAT:
+        # Mismo texto que strftime con este formato cuando el offset es cero
+        # (zona horaria UTC), sin el costo de interpretar el formato
+        def encode(value):
+            if isinstance(value, datetime) and value.tzinfo is not None:
+                local = value.astimezone(field_timezone)
+                iso = local.isoformat(timespec="microseconds")
+                if iso.endswith("+00:00") and local.year >= 1000:
+                    return iso[:-6] + "Z"
+                return local.strftime(output_format)
+            return fallback(value)
+
+        return encode
+
+    def encode(value):
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            return value.astimezone(field_timezone).strftime(output_format)
+        return fallback(value)
+
+    return encode
+
+
+def _field_encoder(field: drf_fields.Field) -> Encoder:
+    representation = type(field).to_representation
+    if representation is drf_fields.CharField.to_representation:
+        return str
+    if (
+        representation is drf_fields.UUIDField.to_representation
+        and field.uuid_format == "hex_verbose"
+    ):
+        return str
+    if representation is drf_fields.DateTimeField.to_representation:
+        return _datetime_encoder(field)
+    return field.to_representation
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(serializer_class) -> Optional[CompiledSerializer]:
+    """
+    Precompila un serializer plano.
+
+    Returns:
+        Optional[CompiledSerializer]: Codificador, o None si el serializer usa
+            campos anidados o con ``source`` propio (se usa DRF en ese caso)
+    """
+    field_encoders = []
+    for field in serializer_class()._readable_fields:
+        if field.source != field.field_name or isinstance(
+            field, drf_fields.SerializerMethodField
+        ):
+            return None
+        # Serializers anidados y campos de colección
+        if hasattr(field, "fields") or hasattr(field, "child"):
+            return None
+        field_encoders.append((field.field_name, _field_encoder(field)))
+    return CompiledSerializer(field_encoders)
+
+
+def serialize(serializer_class, instance, many: bool = False):
+    """
+    Serializa para una respuesta, usando la ruta precompilada si está activa.
+
+    Args:
+        serializer_class: Serializer de DRF que define los campos de salida
+        instance: Objeto (o lista de objetos si ``many``) a serializar
+        many: Serializar una colección
+
+    Returns:
+        dict o list: Datos listos para renderizar
+    """
+    if fast_serialization_enabled():
+        compiled = compile_serializer(serializer_class)
+        if compiled is not None:
+            try:
+                if many:
+                    return compiled.encode_many(instance)
+                return compiled.encode(instance)
+            except (AttributeError, KeyError):
+                # Objetos incompletos: DRF decide qué campos omitir
+                pass
+    return serializer_class(instance, many=many).data
@@ -73,6 +73,16 @@ class NewsArticleSerializer(serializers.Serializer):
     updated_at = serializers.DateTimeField(read_only=True, allow_null=True)
 
 
+class NewsArticleSummarySerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    titulo = serializers.CharField()
+    fuente = serializers.CharField()
+    fecha_publicacion = serializers.DateTimeField()
+    url = serializers.URLField()
+    categoria = serializers.CharField(allow_null=True)
+    extracto = serializers.CharField(allow_null=True)
+
+
 class ScrapingJobCreateSerializer(serializers.Serializer):
     fuente = serializers.CharField(max_length=255)
 
@@ -1,20 +1,29 @@
 """
 URL Configuration for News Scraping API.
+
+Con ``API_ASYNC_VIEWS`` activo se usan las vistas asíncronas nativas de
+``async_views`` (mismas rutas y respuestas que las de ``views``).
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
-from .views import (
-    NewsArticleListCreateView,
-    SourceListCreateView,
-    UserListCreateView,
-    HealthCheckView,
-)
+
+from . import async_views, views
+
+api_views = async_views if settings.API_ASYNC_VIEWS else views
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-    path("health/", HealthCheckView.as_view(), name="health-check"),
-    path("api/articles/", NewsArticleListCreateView.as_view(), name="articles"),
-    path("api/sources/", SourceListCreateView.as_view(), name="sources"),
-    path("api/users/", UserListCreateView.as_view(), name="users"),
+    path("health/", api_views.HealthCheckView.as_view(), name="health-check"),
+    path(
+        "api/articles/", api_views.NewsArticleListCreateView.as_view(), name="articles"
+    ),
+    path(
+        "api/articles/search/",
+        api_views.NewsArticleSearchView.as_view(),
+        name="articles-search",
+    ),
+    path("api/sources/", api_views.SourceListCreateView.as_view(), name="sources"),
+    path("api/users/", api_views.UserListCreateView.as_view(), name="users"),
 ]
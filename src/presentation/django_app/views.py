@@ -17,6 +17,7 @@ from src.application.use_cases import (
     CreateArticleUseCase,
     ListArticlesUseCase,
     RegisterSourceUseCase,
+    SearchArticlesUseCase,
     CreateUserUseCase,
     ListUsersUseCase,
 )
@@ -26,9 +27,11 @@ from src.infrastructure.persistence.django_repositories import (
     DjangoSourceRepository,
     DjangoUserRepository,
 )
+from .fast_serialization import serialize
 from .serializers import (
     NewsArticleCreateSerializer,
     NewsArticleSerializer,
+    NewsArticleSummarySerializer,
     SourceCreateSerializer,
     SourceSerializer,
     UserCreateSerializer,
@@ -36,36 +39,91 @@ from .serializers import (
 )
 
 
+def _source_data(source) -> dict:
+    return {
+        "id": source.id,
+        "source_type": source.source_type.name,
+        "nombre": source.nombre,
+        "dominio": source.dominio,
+        "pais": source.pais,
+        "activo": source.activo,
+        "created_at": source.created_at,
+        "updated_at": source.updated_at,
+    }
+
+
+def _pagination_params(query_params, default_limit: int) -> tuple:
+    """
+    Lee ``skip`` y ``limit`` de la query string.
+
+    Returns:
+        tuple: (skip, limit)
+
+    Raises:
+        ValueError: Si no son enteros, ``skip`` es negativo o ``limit`` es menor a 1
+    """
+    try:
+        skip = int(query_params.get("skip", 0))
+        limit = int(query_params.get("limit", default_limit))
+    except ValueError:
+        raise ValueError("skip and limit must be integers")
+    if skip < 0:
+        raise ValueError("skip must be greater than or equal to 0")
+    if limit < 1:
+        raise ValueError("limit must be greater than or equal to 1")
+    return skip, limit
+
+
 class NewsArticleListCreateView(APIView):
     """Vista para listar y crear artículos de noticias"""
 
     def get(self, request):
-        skip = int(request.GET.get("skip", 0))
-        limit = int(request.GET.get("limit", 100))
-
+        try:
+            skip, limit = _pagination_params(request.GET, default_limit=100)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         use_case = ListArticlesUseCase(DjangoNewsArticleRepository())
+
+        # view=summary: listado sin contenido completo (solo extracto precalculado)
+        view = request.GET.get("view", "full")
+        if view not in ("full", "summary"):
+            return Response(
+                {"error": f"Invalid view: {view}"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        summary = view == "summary"
+
+        # Paginación por cursor: se activa al enviar el parámetro (vacío = primera página)
+        if "cursor" in request.GET:
+            try:
+                page = async_to_sync(use_case.execute_page)(
+                    limit=limit,
+                    cursor=request.GET.get("cursor") or None,
+                    fuente=request.GET.get("fuente"),
+                    categoria=request.GET.get("categoria"),
+                    summary=summary,
+                )
+            except ValueError as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+            if summary:
+                data = serialize(NewsArticleSummarySerializer, page.items, many=True)
+            else:
+                data = serialize(NewsArticleSerializer, page.items, many=True)
+            return Response({"results": data, "next_cursor": page.next_cursor})
+
+        if summary:
+            summaries = async_to_sync(use_case.execute_summaries)(
+                skip=skip, limit=limit
+            )
+            return Response(
+                serialize(NewsArticleSummarySerializer, summaries, many=True)
+            )
+
         articles = async_to_sync(use_case.execute)(skip=skip, limit=limit)
 
-        serializer = NewsArticleSerializer(
-            [
-                {
-                    "id": article.id,
-                    "titulo": article.titulo,
-                    "contenido": article.contenido,
-                    "fuente": article.fuente,
-                    "fecha_publicacion": article.fecha_publicacion,
-                    "url": article.url,
-                    "categoria": article.categoria,
-                    "procesado": article.procesado,
-                    "created_at": article.created_at,
-                    "updated_at": article.updated_at,
-                }
-                for article in articles
-            ],
-            many=True,
-        )
+        data = serialize(NewsArticleSerializer, articles, many=True)
 
-        return Response(serializer.data)
+        return Response(data)
 
     def post(self, request):
         serializer = NewsArticleCreateSerializer(data=request.data)
@@ -76,25 +134,31 @@ class NewsArticleListCreateView(APIView):
 
         try:
             article = async_to_sync(use_case.execute)(dto)
-            response_serializer = NewsArticleSerializer(
-                {
-                    "id": article.id,
-                    "titulo": article.titulo,
-                    "contenido": article.contenido,
-                    "fuente": article.fuente,
-                    "fecha_publicacion": article.fecha_publicacion,
-                    "url": article.url,
-                    "categoria": article.categoria,
-                    "procesado": article.procesado,
-                    "created_at": article.created_at,
-                    "updated_at": article.updated_at,
-                }
+            return Response(
+                serialize(NewsArticleSerializer, article),
+                status=status.HTTP_201_CREATED,
             )
-            return Response(response_serializer.data, status=status.HTTP_201_CREATED)
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
+class NewsArticleSearchView(APIView):
+    """Vista de búsqueda de texto completo sobre artículos"""
+
+    def get(self, request):
+        query = request.GET.get("q", "")
+        use_case = SearchArticlesUseCase(DjangoNewsArticleRepository())
+
+        try:
+            skip, limit = _pagination_params(request.GET, default_limit=20)
+            articles = async_to_sync(use_case.execute)(query, skip=skip, limit=limit)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = serialize(NewsArticleSerializer, articles, many=True)
+        return Response(data)
+
+
 class SourceListCreateView(APIView):
     """Vista para listar y registrar fuentes"""
 
@@ -110,19 +174,10 @@ class SourceListCreateView(APIView):
 
         try:
             source = async_to_sync(use_case.execute)(dto)
-            response_serializer = SourceSerializer(
-                {
-                    "id": source.id,
-                    "source_type": source.source_type.name,
-                    "nombre": source.nombre,
-                    "dominio": source.dominio,
-                    "pais": source.pais,
-                    "activo": source.activo,
-                    "created_at": source.created_at,
-                    "updated_at": source.updated_at,
-                }
+            return Response(
+                serialize(SourceSerializer, _source_data(source)),
+                status=status.HTTP_201_CREATED,
             )
-            return Response(response_serializer.data, status=status.HTTP_201_CREATED)
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -137,22 +192,9 @@ class UserListCreateView(APIView):
         use_case = ListUsersUseCase(DjangoUserRepository())
         users = async_to_sync(use_case.execute)(skip=skip, limit=limit)
 
-        serializer = UserSerializer(
-            [
-                {
-                    "id": user.id,
-                    "email": user.email,
-                    "name": user.name,
-                    "is_active": user.is_active,
-                    "created_at": user.created_at,
-                    "updated_at": user.updated_at,
-                }
-                for user in users
-            ],
-            many=True,
-        )
+        data = serialize(UserSerializer, users, many=True)
 
-        return Response(serializer.data)
+        return Response(data)
 
     def post(self, request):
         serializer = UserCreateSerializer(data=request.data)
@@ -163,17 +205,10 @@ class UserListCreateView(APIView):
 
         try:
             user = async_to_sync(use_case.execute)(dto)
-            response_serializer = UserSerializer(
-                {
-                    "id": user.id,
-                    "email": user.email,
-                    "name": user.name,
-                    "is_active": user.is_active,
-                    "created_at": user.created_at,
-                    "updated_at": user.updated_at,
-                }
+            return Response(
+                serialize(UserSerializer, user),
+                status=status.HTTP_201_CREATED,
             )
-            return Response(response_serializer.data, status=status.HTTP_201_CREATED)
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -0,0 +1,113 @@
+"""
+Tests de integración de los endpoints de artículos.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from rest_framework.test import APIClient
+
+from src.infrastructure.persistence.django_app.models import NewsArticleModel
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+@pytest.fixture
+def articles(db):
+    base = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    return [
+        NewsArticleModel.objects.create(
+            titulo=titulo,
+            contenido="Contenido de prueba",
+            fuente="Clarín",
+            fecha_publicacion=base - timedelta(hours=i),
+            url=f"https://a.com/{i}",
+            extracto="Contenido de prueba",
+        )
+        for i, titulo in enumerate(
+            ["Suba del dólar", "Elecciones en Córdoba", "El dólar se estabiliza"]
+        )
+    ]
+
+
+@pytest.mark.django_db
+class TestArticlesApi:
+    def test_list_with_cursor_walks_all_pages(self, client, articles):
+        response = client.get("/api/articles/", {"cursor": "", "limit": 2})
+        assert response.status_code == 200
+        first = response.json()
+
+        response = client.get(
+            "/api/articles/", {"cursor": first["next_cursor"], "limit": 2}
+        )
+        second = response.json()
+
+        urls = [a["url"] for a in first["results"] + second["results"]]
+        assert urls == ["https://a.com/0", "https://a.com/1", "https://a.com/2"]
+        assert second["next_cursor"] is None
+
+    def test_list_with_invalid_cursor(self, client, articles):
+        response = client.get("/api/articles/", {"cursor": "invalido"})
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("limit", ["0", "-1", "abc"])
+    def test_list_with_cursor_rejects_invalid_limit(self, client, articles, limit):
+        response = client.get("/api/articles/", {"cursor": "", "limit": limit})
+
+        assert response.status_code == 400
+        assert "limit" in response.json()["error"]
+
+    @pytest.mark.parametrize("params", [{"skip": "-1"}, {"skip": "x"}, {"limit": "0"}])
+    def test_list_rejects_invalid_pagination(self, client, articles, params):
+        response = client.get("/api/articles/", params)
+
+        assert response.status_code == 400
+
+    def test_search(self, client, articles):
+        response = client.get("/api/articles/search/", {"q": "dolar"})
+
+        assert response.status_code == 200
+        assert [a["url"] for a in response.json()] == [
+            "https://a.com/0",
+            "https://a.com/2",
+        ]
+
+    def test_search_without_query(self, client, articles):
+        response = client.get("/api/articles/search/")
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "params", [{"skip": "-1"}, {"limit": "0"}, {"limit": "-1"}, {"limit": "abc"}]
+    )
+    def test_search_rejects_invalid_pagination(self, client, articles, params):
+        response = client.get("/api/articles/search/", {"q": "dolar", **params})
+
+        assert response.status_code == 400
+
+    def test_list_summary_mode_omits_contenido(self, client, articles):
+        response = client.get("/api/articles/", {"view": "summary", "limit": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [a["url"] for a in data] == ["https://a.com/0", "https://a.com/1"]
+        assert "contenido" not in data[0]
+        assert data[0]["extracto"] == "Contenido de prueba"
+
+    def test_list_summary_mode_with_cursor(self, client, articles):
+        response = client.get(
+            "/api/articles/", {"view": "summary", "cursor": "", "limit": 2}
+        )
+
+        data = response.json()
+        assert "contenido" not in data["results"][0]
+        assert data["next_cursor"] is not None
+
+    def test_list_with_invalid_view(self, client, articles):
+        response = client.get("/api/articles/", {"view": "otro"})
+
+        assert response.status_code == 400
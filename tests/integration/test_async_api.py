@@ -0,0 +1,142 @@
+"""
+Tests de integración de las vistas asíncronas nativas de la API.
+"""
+
+import json
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from django.test import AsyncRequestFactory, RequestFactory
+
+from src.presentation.django_app import async_views, views
+from src.infrastructure.persistence.django_app.models import UserModel
+
+
+class FailingView(async_views.AsyncAPIView):
+    async def get(self, request):
+        if request.GET.get("error") == "404":
+            raise Http404
+        raise RuntimeError("fallo inesperado")
+
+
+def post_json(path: str, data) -> object:
+    return AsyncRequestFactory().post(
+        path, data=json.dumps(data), content_type="application/json"
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestAsyncApi:
+    async def test_views_are_coroutines(self):
+        for view_class in (
+            async_views.NewsArticleListCreateView,
+            async_views.NewsArticleSearchView,
+            async_views.SourceListCreateView,
+            async_views.UserListCreateView,
+        ):
+            assert view_class.view_is_async
+
+    async def test_create_and_list_articles(self):
+        view = async_views.NewsArticleListCreateView.as_view()
+        payload = {
+            "titulo": "Suba del dólar",
+            "contenido": "El dólar subió",
+            "fuente": "Clarín",
+            "fecha_publicacion": "2024-05-01T12:00:00Z",
+            "url": "https://a.com/1",
+        }
+
+        created = await view(post_json("/api/articles/", payload))
+        duplicated = await view(post_json("/api/articles/", payload))
+        listed = await view(AsyncRequestFactory().get("/api/articles/"))
+
+        assert created.status_code == 201
+        assert duplicated.status_code == 400
+        assert [a["url"] for a in json.loads(listed.content)] == ["https://a.com/1"]
+
+    async def test_list_rejects_invalid_limit(self):
+        view = async_views.NewsArticleListCreateView.as_view()
+
+        for limit in ("0", "-1", "abc"):
+            response = await view(
+                AsyncRequestFactory().get(
+                    "/api/articles/", {"cursor": "", "limit": limit}
+                )
+            )
+
+            assert response.status_code == 400
+            assert "limit" in json.loads(response.content)["error"]
+
+    async def test_search_rejects_invalid_pagination(self):
+        view = async_views.NewsArticleSearchView.as_view()
+
+        for params in ({"skip": "-1"}, {"limit": "-1"}, {"limit": "abc"}):
+            response = await view(
+                AsyncRequestFactory().get("/api/articles/search/", {"q": "a", **params})
+            )
+
+            assert response.status_code == 400
+
+    async def test_invalid_body_returns_validation_errors(self):
+        view = async_views.UserListCreateView.as_view()
+
+        response = await view(post_json("/api/users/", {"email": "x@y.com"}))
+
+        assert response.status_code == 400
+        assert "name" in json.loads(response.content)
+
+    async def test_register_source(self):
+        view = async_views.SourceListCreateView.as_view()
+
+        response = await view(post_json("/api/sources/", {"source_type": "CLARIN"}))
+
+        assert response.status_code == 201
+        assert json.loads(response.content)["nombre"] == "Clarín"
+
+    async def test_list_users_matches_sync_view_bytes(self):
+        await UserModel.objects.acreate(email="ana@example.com", name="Ana")
+
+        async_response = await async_views.UserListCreateView.as_view()(
+            AsyncRequestFactory().get("/api/users/")
+        )
+
+        def sync_list():
+            response = views.UserListCreateView.as_view()(
+                RequestFactory().get("/api/users/")
+            )
+            return response.render()
+
+        sync_response = await sync_to_async(sync_list)()
+
+        assert async_response.status_code == sync_response.status_code == 200
+        assert async_response.content == sync_response.content
+
+    async def test_unsupported_method_matches_sync_view(self):
+        async_response = await async_views.HealthCheckView.as_view()(
+            AsyncRequestFactory().put("/api/health/")
+        )
+
+        def sync_put():
+            response = views.HealthCheckView.as_view()(
+                RequestFactory().put("/api/health/")
+            )
+            return response.render()
+
+        sync_response = await sync_to_async(sync_put)()
+
+        assert async_response.status_code == sync_response.status_code == 405
+        assert async_response.content == sync_response.content
+        assert async_response["Allow"] == sync_response["Allow"]
+
+    async def test_exceptions_go_through_drf_exception_handler(self):
+        view = FailingView.as_view()
+
+        not_found = await view(AsyncRequestFactory().get("/", {"error": "404"}))
+
+        assert not_found.status_code == 404
+        assert "detail" in json.loads(not_found.content)
+        # Como en APIView, las excepciones inesperadas llegan a Django (500)
+        with pytest.raises(RuntimeError, match="fallo inesperado"):
+            await view(AsyncRequestFactory().get("/"))
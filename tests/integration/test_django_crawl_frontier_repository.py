@@ -0,0 +1,62 @@
+"""
+Tests de integración para DjangoCrawlFrontierRepository.
+"""
+
+import pytest
+import os
+import django
+
+# Configurar Django
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", "src.infrastructure.config.django_settings"
+)
+django.setup()
+
+from src.domain.entities.crawl_frontier_entry import CrawlFrontierEntry
+from src.infrastructure.persistence.django_repositories import (
+    DjangoCrawlFrontierRepository,
+)
+
+URLS = [f"https://www.clarin.com/nota-{i}.html" for i in range(4)]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestDjangoCrawlFrontierRepository:
+    """Tests de integración de la frontera de URLs con la base de datos"""
+
+    async def test_register_returns_fetched_urls_as_known(self):
+        repository = DjangoCrawlFrontierRepository()
+
+        assert await repository.register("Clarín", URLS) == set()
+        await repository.mark_fetched("Clarín", URLS[0])
+        await repository.mark_failed("Clarín", URLS[1])
+
+        assert await repository.register("Clarín", URLS + URLS[:1]) == {URLS[0]}
+        # La misma URL en otra fuente es una entrada distinta
+        assert await repository.register("Infobae", URLS[:1]) == set()
+
+    async def test_failed_urls_are_retried_up_to_max_attempts(self):
+        repository = DjangoCrawlFrontierRepository()
+        await repository.register("Clarín", URLS[:1])
+
+        for _ in range(CrawlFrontierEntry.MAX_ATTEMPTS):
+            assert await repository.register("Clarín", URLS[:1]) == set()
+            await repository.mark_failed("Clarín", URLS[0])
+
+        assert await repository.register("Clarín", URLS[:1]) == {URLS[0]}
+
+    async def test_get_by_fuente_tracks_status(self):
+        repository = DjangoCrawlFrontierRepository()
+        await repository.register("Clarín", URLS[:2])
+        await repository.mark_fetched("Clarín", URLS[1])
+        # Descarga sin registro previo: se crea la entrada
+        await repository.mark_fetched("Clarín", URLS[3])
+
+        entries = await repository.get_by_fuente("Clarín")
+        fetched = await repository.get_by_fuente("Clarín", status="fetched")
+
+        assert len(entries) == 3
+        assert {entry.url for entry in fetched} == {URLS[1], URLS[3]}
+        assert all(entry.fetched_at and entry.attempts == 1 for entry in fetched)
+        assert entries[0].first_seen >= entries[-1].first_seen
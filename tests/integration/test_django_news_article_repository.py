@@ -0,0 +1,256 @@
+"""
+Tests de integración para DjangoNewsArticleRepository.
+"""
+
+import pytest
+import os
+import django
+
+# Configurar Django
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", "src.infrastructure.config.django_settings"
+)
+django.setup()
+
+from datetime import datetime, timedelta, timezone
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.domain.entities.news_article import NewsArticle
+from src.infrastructure.persistence.django_repositories import (
+    DjangoNewsArticleRepository,
+)
+from src.infrastructure.persistence.django_app.models import NewsArticleModel
+
+
+def make_article(url: str, minutes_ago: int = 0, **kwargs) -> NewsArticle:
+    return NewsArticle.create(
+        titulo=kwargs.get("titulo", f"Titulo {url}"),
+        contenido=kwargs.get("contenido", "Contenido de prueba"),
+        fuente=kwargs.get("fuente", "Clarín"),
+        fecha_publicacion=datetime.now(timezone.utc) - timedelta(minutes=minutes_ago),
+        url=url,
+        categoria=kwargs.get("categoria"),
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestDjangoNewsArticleRepository:
+    """Tests de integración del repositorio de artículos con la base de datos"""
+
+    async def test_bulk_create_if_absent_inserts_only_new_urls(self):
+        repository = DjangoNewsArticleRepository()
+        await repository.create(make_article("https://a.com/1"))
+
+        new_urls = await repository.bulk_create_if_absent(
+            [
+                make_article("https://a.com/1"),
+                make_article("https://a.com/2"),
+                make_article("https://a.com/3"),
+            ]
+        )
+
+        assert new_urls == {"https://a.com/2", "https://a.com/3"}
+        assert await sync_to_async(NewsArticleModel.objects.count)() == 3
+
+    async def test_bulk_create_if_absent_ignores_urls_inserted_concurrently(
+        self, monkeypatch
+    ):
+        repository = DjangoNewsArticleRepository()
+        await repository.create(make_article("https://a.com/1"))
+        # Otro proceso insertó la URL entre el SELECT y el INSERT
+        monkeypatch.setattr(repository, "_find_existing_urls", lambda urls: set())
+
+        new_urls = await repository.bulk_create_if_absent(
+            [make_article("https://a.com/1"), make_article("https://a.com/2")]
+        )
+
+        assert new_urls == {"https://a.com/2"}
+        assert await sync_to_async(NewsArticleModel.objects.count)() == 2
+
+    async def test_bulk_create_if_absent_deduplicates_within_batch(self):
+        repository = DjangoNewsArticleRepository()
+
+        new_urls = await repository.bulk_create_if_absent(
+            [make_article("https://a.com/1"), make_article("https://a.com/1")]
+        )
+
+        assert new_urls == {"https://a.com/1"}
+        assert await sync_to_async(NewsArticleModel.objects.count)() == 1
+
+    async def test_bulk_create_if_absent_with_empty_list(self):
+        repository = DjangoNewsArticleRepository()
+
+        assert await repository.bulk_create_if_absent([]) == set()
+
+    async def test_get_existing_urls(self):
+        repository = DjangoNewsArticleRepository()
+        await repository.bulk_create_if_absent(
+            [make_article("https://a.com/1"), make_article("https://a.com/2")]
+        )
+
+        existing = await repository.get_existing_urls(
+            ["https://a.com/1", "https://a.com/2", "https://a.com/3"]
+        )
+
+        assert existing == {"https://a.com/1", "https://a.com/2"}
+
+    async def test_get_existing_urls_chunks_large_batches(self):
+        repository = DjangoNewsArticleRepository()
+        repository.URL_LOOKUP_CHUNK_SIZE = 10
+        await repository.bulk_create_if_absent(
+            [make_article(f"https://a.com/{i}") for i in range(0, 50, 2)]
+        )
+        candidates = [f"https://a.com/{i}" for i in range(50)]
+
+        def lookup_counting_queries():
+            with CaptureQueriesContext(connection) as queries:
+                existing = repository._find_existing_urls(candidates)
+            return existing, len(queries)
+
+        existing, query_count = await sync_to_async(lookup_counting_queries)()
+
+        assert existing == {f"https://a.com/{i}" for i in range(0, 50, 2)}
+        assert query_count == 5
+        assert await repository.get_existing_urls(iter(candidates)) == existing
+
+    async def test_get_page_walks_all_articles_in_keyset_order(self):
+        repository = DjangoNewsArticleRepository()
+        # Varios artículos comparten fecha para ejercitar el desempate por id
+        fecha = datetime(2024, 5, 1, tzinfo=timezone.utc)
+        articles = [make_article(f"https://a.com/{i}") for i in range(9)]
+        for i, article in enumerate(articles):
+            article.fecha_publicacion = fecha - timedelta(hours=i // 3)
+        await repository.bulk_create_if_absent(articles)
+
+        seen = []
+        cursor = None
+        while True:
+            page = await repository.get_page(limit=4, cursor=cursor)
+            seen.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        expected = sorted(
+            articles, key=lambda a: (a.fecha_publicacion, a.id.hex), reverse=True
+        )
+        assert [a.id for a in seen] == [a.id for a in expected]
+
+    async def test_get_page_filters_by_fuente(self):
+        repository = DjangoNewsArticleRepository()
+        await repository.bulk_create_if_absent(
+            [
+                make_article("https://a.com/1", fuente="Clarín"),
+                make_article("https://a.com/2", minutes_ago=1, fuente="Infobae"),
+                make_article("https://a.com/3", minutes_ago=2, fuente="Clarín"),
+            ]
+        )
+
+        page = await repository.get_page(limit=1, fuente="Clarín")
+        next_page = await repository.get_page(
+            limit=1, cursor=page.next_cursor, fuente="Clarín"
+        )
+
+        assert [a.url for a in page.items] == ["https://a.com/1"]
+        assert [a.url for a in next_page.items] == ["https://a.com/3"]
+        assert next_page.next_cursor is None
+
+    async def test_get_page_with_zero_limit_is_empty(self):
+        repository = DjangoNewsArticleRepository()
+        await repository.bulk_create_if_absent([make_article("https://a.com/1")])
+
+        page = await repository.get_page(limit=0)
+
+        assert page.items == [] and page.next_cursor is None
+
+    async def test_search_ranks_title_matches_first(self):
+        repository = DjangoNewsArticleRepository()
+        await repository.bulk_create_if_absent(
+            [
+                make_article(
+                    "https://a.com/1",
+                    titulo="Partido del domingo",
+                    contenido="La inflación de marzo fue comentada en la previa",
+                ),
+                make_article(
+                    "https://a.com/2",
+                    minutes_ago=5,
+                    titulo="La inflación de marzo",
+                    contenido="El índice de precios subió",
+                ),
+                make_article("https://a.com/3", titulo="Clima", contenido="Lluvias"),
+            ]
+        )
+
+        results = await repository.search("inflacion marzo")
+
+        assert [a.url for a in results] == ["https://a.com/2", "https://a.com/1"]
+
+    async def test_search_paginates_results(self):
+        repository = DjangoNewsArticleRepository()
+        await repository.bulk_create_if_absent(
+            [
+                make_article(f"https://a.com/{i}", minutes_ago=i, titulo="Elecciones")
+                for i in range(5)
+            ]
+        )
+
+        first = await repository.search("elecciones", skip=0, limit=3)
+        second = await repository.search("elecciones", skip=3, limit=3)
+
+        assert [a.url for a in first + second] == [
+            f"https://a.com/{i}" for i in range(5)
+        ]
+
+    async def test_search_index_follows_updates_and_deletes(self):
+        repository = DjangoNewsArticleRepository()
+        article = await repository.create(
+            make_article("https://a.com/1", titulo="Economía regional")
+        )
+
+        article.titulo = "Turismo regional"
+        await repository.update(article)
+        assert await repository.search("economia") == []
+        assert [a.id for a in await repository.search("turismo")] == [article.id]
+
+        await repository.delete(article.id)
+        assert await repository.search("turismo") == []
+
+    async def test_search_treats_operators_as_plain_terms(self):
+        repository = DjangoNewsArticleRepository()
+        await repository.create(make_article("https://a.com/1", titulo="Dólar hoy"))
+
+        assert await repository.search('dolar "OR') == []
+        assert await repository.search("   ") == []
+
+    async def test_summaries_do_not_read_contenido(self):
+        repository = DjangoNewsArticleRepository()
+        await repository.bulk_create_if_absent(
+            [
+                make_article("https://a.com/1", contenido="palabra " * 200),
+                make_article("https://a.com/2", minutes_ago=1),
+            ]
+        )
+
+        def list_summaries():
+            with CaptureQueriesContext(connection) as queries:
+                summaries = async_to_sync(repository.get_summaries)()
+                page = async_to_sync(repository.get_summary_page)(limit=1)
+            return summaries, page, [q["sql"] for q in queries]
+
+        summaries, page, queries = await sync_to_async(
+            list_summaries, thread_sensitive=False
+        )()
+
+        assert [s.url for s in summaries] == ["https://a.com/1", "https://a.com/2"]
+        assert summaries[0].extracto.endswith("…")
+        assert len(summaries[0].extracto) <= 300
+        assert summaries[1].extracto == "Contenido de prueba"
+        assert [s.url for s in page.items] == ["https://a.com/1"]
+        assert page.next_cursor is not None
+        assert queries
+        assert all('"contenido"' not in sql for sql in queries)
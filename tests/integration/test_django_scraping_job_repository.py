@@ -0,0 +1,224 @@
+"""
+Tests de integración para DjangoScrapingJobRepository.
+"""
+
+import asyncio
+
+import pytest
+import os
+import django
+
+# Configurar Django
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", "src.infrastructure.config.django_settings"
+)
+django.setup()
+
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from django.db import connection
+
+from src.application.resilience import (
+    CircuitBreakerConfig,
+    CircuitState,
+    SourceCircuitBreaker,
+)
+from src.domain.entities.scraping_job import ScrapingJob
+from src.infrastructure.persistence.django_repositories import (
+    DjangoScrapingJobRepository,
+)
+
+
+def make_job(fuente: str, hours_ago: int) -> ScrapingJob:
+    job = ScrapingJob.create(fuente=fuente)
+    job.fecha_inicio = datetime(2024, 5, 1, tzinfo=timezone.utc) - timedelta(
+        hours=hours_ago
+    )
+    return job
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestDjangoScrapingJobRepository:
+    """Tests de integración del repositorio de jobs con la base de datos"""
+
+    async def test_get_page_walks_all_jobs_in_keyset_order(self):
+        repository = DjangoScrapingJobRepository()
+        jobs = [make_job("Clarín", hours_ago=i // 2) for i in range(5)]
+        for job in jobs:
+            await repository.create(job)
+
+        seen = []
+        cursor = None
+        while True:
+            page = await repository.get_page(limit=2, cursor=cursor)
+            seen.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        expected = sorted(jobs, key=lambda j: (j.fecha_inicio, j.id.hex), reverse=True)
+        assert [j.id for j in seen] == [j.id for j in expected]
+
+    async def test_get_page_filters_by_fuente_and_status(self):
+        repository = DjangoScrapingJobRepository()
+        completed = make_job("Clarín", hours_ago=0)
+        completed.complete(total_articulos=3)
+        for job in [completed, make_job("Clarín", 1), make_job("Infobae", 2)]:
+            await repository.create(job)
+
+        page = await repository.get_page(fuente="Clarín", status="completed")
+
+        assert [j.id for j in page.items] == [completed.id]
+        assert page.next_cursor is None
+
+    async def test_get_page_filters_by_several_statuses(self):
+        repository = DjangoScrapingJobRepository()
+        completed = make_job("Clarín", hours_ago=2)
+        completed.complete(total_articulos=3)
+        timed_out = make_job("Clarín", hours_ago=1)
+        timed_out.time_out(total_articulos=1)
+        skipped = make_job("Clarín", hours_ago=0)
+        skipped.skip()
+        for job in [completed, timed_out, skipped, make_job("Clarín", 3)]:
+            await repository.create(job)
+
+        page = await repository.get_page(
+            fuente="Clarín", statuses=("completed", "timed_out")
+        )
+
+        assert [j.id for j in page.items] == [timed_out.id, completed.id]
+
+    async def test_circuit_breaker_ignores_skipped_jobs_filling_the_window(self):
+        repository = DjangoScrapingJobRepository()
+        config = CircuitBreakerConfig(window_size=3, min_jobs=3, cooldown=3600)
+        for hours_ago in (12, 11, 10):
+            failed = make_job("Clarín", hours_ago)
+            failed.fail()
+            await repository.create(failed)
+        # Con el circuito abierto cada pasada registra un job omitido
+        for hours_ago in range(9, 0, -1):
+            skipped = make_job("Clarín", hours_ago)
+            skipped.skip()
+            await repository.create(skipped)
+        await repository.create(make_job("Clarín", 0))
+
+        status = await SourceCircuitBreaker(repository, config).status("Clarín")
+
+        assert status.state is CircuitState.OPEN
+        assert status.consecutive_failures == 3
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestScrapingJobQueue:
+    """Tests de la cola de jobs (enqueue / claim_next / lease)"""
+
+    async def test_enqueue_skips_sources_with_open_job(self):
+        repository = DjangoScrapingJobRepository()
+
+        first = await repository.enqueue(ScrapingJob.create(fuente="Clarín"))
+        duplicate = await repository.enqueue(ScrapingJob.create(fuente="Clarín"))
+        other = await repository.enqueue(ScrapingJob.create(fuente="La Nación"))
+
+        assert first is not None and other is not None
+        assert duplicate is None
+
+        claimed = await repository.claim_next("worker-1", lease_seconds=60)
+        assert claimed.id == first.id
+        assert await repository.enqueue(ScrapingJob.create(fuente="Clarín")) is None
+
+        claimed.complete(total_articulos=1)
+        assert await repository.finish(claimed, "worker-1")
+        assert await repository.enqueue(ScrapingJob.create(fuente="Clarín"))
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="SQLite serializa las escrituras de toda la base",
+    )
+    async def test_concurrent_enqueues_create_a_single_job(self):
+        repository = DjangoScrapingJobRepository()
+        barrier = Barrier(4)
+
+        def enqueue():
+            barrier.wait()
+            try:
+                return repository._enqueue(ScrapingJob.create(fuente="Clarín"))
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(4) as pool:
+            results = await asyncio.gather(
+                *(asyncio.wrap_future(pool.submit(enqueue)) for _ in range(4))
+            )
+
+        assert sum(job is not None for job in results) == 1
+
+    async def test_claim_next_takes_oldest_and_sets_lease(self):
+        repository = DjangoScrapingJobRepository()
+        first = await repository.enqueue(ScrapingJob.create(fuente="Clarín"))
+        await repository.enqueue(ScrapingJob.create(fuente="La Nación"))
+
+        claimed = await repository.claim_next("worker-1", lease_seconds=60)
+
+        assert claimed.id == first.id
+        assert claimed.status == "running"
+        assert claimed.lease_owner == "worker-1"
+        assert claimed.lease_expires_at > datetime.now(timezone.utc)
+
+        second = await repository.claim_next("worker-2", lease_seconds=60)
+        assert second.fuente == "La Nación"
+        assert await repository.claim_next("worker-3", lease_seconds=60) is None
+
+    async def test_concurrent_workers_never_share_a_job(self):
+        repository = DjangoScrapingJobRepository()
+        for i in range(6):
+            await repository.enqueue(ScrapingJob.create(fuente=f"Fuente {i}"))
+
+        claims = await asyncio.gather(
+            *(repository.claim_next(f"worker-{i}", lease_seconds=60) for i in range(10))
+        )
+
+        claimed_ids = [job.id for job in claims if job is not None]
+        assert len(claimed_ids) == 6
+        assert len(set(claimed_ids)) == 6
+
+    async def test_source_with_live_lease_is_not_claimed_twice(self):
+        repository = DjangoScrapingJobRepository()
+        # Dos jobs pendientes de la misma fuente (por ejemplo creados a mano)
+        await repository.create(ScrapingJob.create(fuente="Clarín"))
+        await repository.create(ScrapingJob.create(fuente="Clarín"))
+
+        assert await repository.claim_next("worker-1", lease_seconds=60)
+        assert await repository.claim_next("worker-2", lease_seconds=60) is None
+
+    async def test_expired_lease_is_reclaimed(self):
+        repository = DjangoScrapingJobRepository()
+        job = await repository.enqueue(ScrapingJob.create(fuente="Clarín"))
+        await repository.claim_next("worker-1", lease_seconds=0.01)
+        await asyncio.sleep(0.05)
+
+        reclaimed = await repository.claim_next("worker-2", lease_seconds=60)
+
+        assert reclaimed.id == job.id
+        assert reclaimed.lease_owner == "worker-2"
+        assert not await repository.renew_lease(job.id, "worker-1", 60)
+        reclaimed.fail()
+        assert not await repository.finish(reclaimed, "worker-1")
+        assert await repository.finish(reclaimed, "worker-2")
+
+        stored = await repository.get_by_id(job.id)
+        assert stored.status == "failed"
+        assert stored.lease_expires_at is None
+
+    async def test_renew_lease_extends_expiry(self):
+        repository = DjangoScrapingJobRepository()
+        await repository.enqueue(ScrapingJob.create(fuente="Clarín"))
+        claimed = await repository.claim_next("worker-1", lease_seconds=1)
+
+        assert await repository.renew_lease(claimed.id, "worker-1", 120)
+
+        stored = await repository.get_by_id(claimed.id)
+        assert stored.lease_expires_at > claimed.lease_expires_at
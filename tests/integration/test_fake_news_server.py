@@ -0,0 +1,163 @@
+"""
+Tests de integración de scrapers y spiders contra el diario simulado local.
+"""
+
+import pytest
+import requests
+from scrapy.http import HtmlResponse
+
+from src.domain.enums import NewsSource
+from src.infrastructure.adapters.http import (
+    PooledHttpClient,
+    base_url_override,
+    rebase_url,
+)
+from src.infrastructure.adapters.scrapers import (
+    ClarinScraper,
+    LaNacionScraper,
+    Pagina12Scraper,
+)
+from src.infrastructure.external_services.scrapy_adapter.spiders import (
+    ClarinSpider,
+    InfobaeSpider,
+    LaNacionSpider,
+    Pagina12Spider,
+)
+from src.infrastructure.testing import FakeNewsServer, FakeSite, FakeSiteConfig
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeNewsServer(FakeSiteConfig(articles=200, page_size=8000)) as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def no_http_cache(monkeypatch):
+    monkeypatch.setenv("SCRAPER_HTTP_CACHE_DIR", "")
+
+
+class TestBaseUrlOverride:
+    """Tests para la redirección de fuentes"""
+
+    def test_override_from_environment(self, monkeypatch):
+        monkeypatch.setenv("SCRAPER_BASE_URL_CLARIN", "http://127.0.0.1:8701/")
+
+        assert base_url_override("CLARIN") == "http://127.0.0.1:8701"
+        assert base_url_override("INFOBAE") is None
+
+    def test_rebase_url_keeps_path_and_query(self):
+        url = "https://www.lanacion.com.ar/arc/outboundfeeds/rss/?outputType=xml"
+
+        assert rebase_url(url, "http://127.0.0.1:8702") == (
+            "http://127.0.0.1:8702/arc/outboundfeeds/rss/?outputType=xml"
+        )
+
+
+@pytest.mark.parametrize(
+    "scraper_class", [ClarinScraper, Pagina12Scraper, LaNacionScraper]
+)
+class TestScrapersAgainstFakeServer:
+    """Los scrapers redirigidos extraen notas del servidor local"""
+
+    def test_sections(self, server, monkeypatch, scraper_class):
+        monkeypatch.setenv(
+            f"SCRAPER_BASE_URL_{scraper_class.source.name}",
+            server.base_urls[scraper_class.source],
+        )
+
+        articles = scraper_class(max_articles=5).scrape()
+
+        assert len(articles) == 5
+        for article in articles:
+            assert article.url.startswith(server.base_urls[scraper_class.source])
+            assert article.titulo and article.contenido
+
+    def test_feeds(self, server, scraper_class):
+        scraper = scraper_class(
+            max_articles=5,
+            base_url=server.base_urls[scraper_class.source],
+            discovery_strategy=scraper_class.source.discovery_strategy,
+        )
+
+        articles = scraper.scrape()
+
+        # El feed lista primero las notas más nuevas
+        assert [article.url for article in articles] == [
+            server.base_urls[scraper_class.source]
+            + FakeSite(scraper_class.source, server.config).article_url_path(id_)
+            for id_ in range(200, 195, -1)
+        ]
+
+
+@pytest.mark.parametrize(
+    "spider_class", [ClarinSpider, Pagina12Spider, LaNacionSpider, InfobaeSpider]
+)
+def test_spiders_against_fake_server(server, spider_class):
+    base_url = server.base_urls[spider_class.source]
+    spider = spider_class(base_url=base_url)
+
+    assert all(url.startswith(base_url) for url in spider.start_urls)
+    assert spider.allowed_domains == ["127.0.0.1"]
+
+    url = spider.start_urls[-1]
+    section = HtmlResponse(url=url, body=requests.get(url).content, encoding="utf-8")
+    article_requests = list(spider.parse(section))
+    assert article_requests
+
+    article_url = article_requests[0].url
+    response = HtmlResponse(
+        url=article_url, body=requests.get(article_url).content, encoding="utf-8"
+    )
+    items = list(spider.parse_article(response))
+    assert len(items) == 1
+    assert items[0]["titulo"]
+
+
+def test_shared_client_reuses_connections_across_runs(server):
+    client = PooledHttpClient(connections_per_host=4)
+    base_url = server.base_urls[NewsSource.CLARIN]
+
+    for _ in range(3):
+        scraper = ClarinScraper(max_articles=10, base_url=base_url, http_client=client)
+        assert len(scraper.scrape()) == 10
+        del scraper
+
+    stats = client.stats()
+    assert stats["requests"] > 30
+    assert stats["connections"] <= 4
+
+
+def test_conditional_get_and_errors():
+    config = FakeSiteConfig(articles=50, error_rate=1.0)
+    with FakeNewsServer(config, sources=[NewsSource.CLARIN]) as server:
+        url = server.base_urls[NewsSource.CLARIN] + "/politica/"
+
+        assert requests.get(url).status_code == 503
+        assert (
+            ClarinScraper(base_url=server.base_urls[NewsSource.CLARIN]).scrape() == []
+        )
+        assert server.stats()["errors"] == server.stats()["requests"]
+
+    with FakeNewsServer(FakeSiteConfig(articles=50)) as server:
+        url = server.base_urls[NewsSource.CLARIN] + "/politica/"
+        etag = requests.get(url).headers["ETag"]
+
+        response = requests.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert server.stats()["not_modified"] == 1
+
+
+def test_new_articles_are_published_over_time():
+    site = FakeSite(
+        NewsSource.INFOBAE,
+        FakeSiteConfig(articles=100, new_articles_per_minute=10),
+        started_at=0,
+    )
+
+    assert site.newest_id(now=0) == 100
+    assert site.newest_id(now=120) == 120
+    assert site.published_at(120) > site.published_at(100)
+    assert site.route(site.article_url_path(99)) == ("article", 99, None)
+    assert site.route("/politica/") == ("section", None, "politica")
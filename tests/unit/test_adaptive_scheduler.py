@@ -0,0 +1,168 @@
+"""
+Tests unitarios para el scheduler adaptativo.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.scheduling import (
+    AdaptiveScheduler,
+    SchedulerConfig,
+    SourceSchedule,
+)
+from src.domain.entities.scraping_job import ScrapingJob
+from src.domain.entities.source import Source
+from src.domain.enums import NewsSource
+from src.domain.value_objects.pagination import CursorPage
+
+CONFIG = SchedulerConfig(
+    min_interval=60,
+    max_interval=3600,
+    initial_interval=600,
+    target_new_articles=10,
+    smoothing=1.0,
+)
+START = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_completed_job(fuente: str, started_at: datetime, new_articles: int):
+    job = ScrapingJob.create(fuente=fuente)
+    job.fecha_inicio = started_at
+    job.complete(total_articulos=new_articles + 5, articulos_nuevos=new_articles)
+    return job
+
+
+class FakeCoordinator:
+    """Coordinador que devuelve una cantidad fija de artículos nuevos por fuente."""
+
+    def __init__(self, new_articles):
+        self.new_articles = new_articles
+        self.runs = []
+
+    async def execute(self, sources=None):
+        source = sources[0]
+        self.runs.append(source.nombre)
+        await asyncio.sleep(0.01)
+        return {
+            "jobs_details": [
+                {
+                    "source": source.nombre,
+                    "status": "completed",
+                    "articles_persisted": self.new_articles[source.nombre],
+                }
+            ]
+        }
+
+
+class TestSourceSchedule:
+    """Tests para el ajuste del intervalo de una fuente"""
+
+    def test_busy_source_is_polled_faster(self):
+        schedule = SourceSchedule("Clarín", interval=600, next_run=START)
+        schedule.record_run(START, 5, CONFIG)
+
+        # 20 artículos nuevos en 10 minutos: 10 artículos cada 5 minutos
+        schedule.record_run(START + timedelta(minutes=10), 20, CONFIG)
+
+        assert schedule.interval == pytest.approx(300)
+        assert schedule.next_run == START + timedelta(minutes=15)
+
+    def test_only_duplicates_backs_off_until_max_interval(self):
+        schedule = SourceSchedule("Clarín", interval=600, next_run=START)
+        started_at = START
+        intervals = []
+        for _ in range(5):
+            schedule.record_run(started_at, 0, CONFIG)
+            intervals.append(schedule.interval)
+            started_at = schedule.next_run
+
+        assert intervals == [1200, 2400, 3600, 3600, 3600]
+
+    def test_interval_never_goes_below_min_interval(self):
+        schedule = SourceSchedule("Clarín", interval=600, next_run=START)
+        schedule.record_run(START, 1, CONFIG)
+        schedule.record_run(START + timedelta(minutes=1), 500, CONFIG)
+
+        assert schedule.interval == CONFIG.min_interval
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            SchedulerConfig(min_interval=0)
+        with pytest.raises(ValueError):
+            SchedulerConfig(min_interval=600, initial_interval=60)
+        with pytest.raises(ValueError):
+            SchedulerConfig(smoothing=0)
+
+
+class TestAdaptiveScheduler:
+    """Tests para AdaptiveScheduler"""
+
+    @pytest.mark.asyncio
+    async def test_schedule_is_rebuilt_from_job_history(self):
+        source_repository = AsyncMock()
+        source_repository.get_active_sources.return_value = [
+            Source.create(source_type=NewsSource.CLARIN)
+        ]
+        job_repository = AsyncMock()
+        now = datetime.now(timezone.utc)
+        # La última ejecución se cortó por plazo, pero guardó 20 artículos
+        timed_out = ScrapingJob.create(fuente="Clarín")
+        timed_out.fecha_inicio = now - timedelta(minutes=3)
+        timed_out.time_out(total_articulos=25, articulos_nuevos=20)
+        history = [
+            timed_out,
+            make_completed_job("Clarín", now - timedelta(minutes=13), 3),
+        ]
+        job_repository.get_page.return_value = CursorPage(items=history)
+        coordinator = FakeCoordinator({"Clarín": 0})
+
+        scheduler = AdaptiveScheduler(
+            coordinator, source_repository, job_repository, CONFIG
+        )
+        sleep_seconds = await scheduler.tick()
+
+        schedule = scheduler.schedules["Clarín"]
+        assert schedule.interval == pytest.approx(300)
+        assert schedule.last_run == history[0].fecha_inicio
+        assert coordinator.runs == []
+        assert sleep_seconds == pytest.approx(CONFIG.max_sleep)
+        job_repository.get_page.assert_awaited_once_with(
+            limit=CONFIG.history_size,
+            fuente="Clarín",
+            statuses=("completed", "timed_out"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_polls_busy_sources_more_often(self):
+        sources = [
+            Source.create(source_type=NewsSource.CLARIN),
+            Source.create(source_type=NewsSource.LA_NACION),
+        ]
+        source_repository = AsyncMock()
+        source_repository.get_active_sources.return_value = sources
+        job_repository = AsyncMock()
+        job_repository.get_page.return_value = CursorPage(items=[])
+        coordinator = FakeCoordinator({"Clarín": 10, "La Nación": 0})
+        config = SchedulerConfig(
+            min_interval=0.05,
+            max_interval=10,
+            initial_interval=0.05,
+            target_new_articles=10,
+            max_sleep=0.05,
+        )
+
+        scheduler = AdaptiveScheduler(
+            coordinator, source_repository, job_repository, config
+        )
+        stop_event = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.6, stop_event.set)
+        await scheduler.run(stop_event)
+
+        busy_runs = coordinator.runs.count("Clarín")
+        idle_runs = coordinator.runs.count("La Nación")
+        assert busy_runs >= 5
+        assert idle_runs <= 4
+        assert scheduler.schedules["La Nación"].interval > 0.05
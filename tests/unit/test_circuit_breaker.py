@@ -0,0 +1,118 @@
+"""
+Tests unitarios para el circuit breaker por fuente.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.resilience import (
+    CircuitBreakerConfig,
+    CircuitState,
+    SourceCircuitBreaker,
+)
+from src.domain.entities.scraping_job import ScrapingJob
+from src.domain.value_objects.pagination import CursorPage
+
+CONFIG = CircuitBreakerConfig(
+    failure_threshold=3,
+    failure_ratio=0.5,
+    window_size=10,
+    min_jobs=4,
+    cooldown=60,
+    max_cooldown=600,
+)
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_jobs(*statuses: str):
+    """Jobs terminados del más nuevo al más antiguo, uno por minuto."""
+    jobs = []
+    for minutes_ago, status in enumerate(statuses):
+        job = ScrapingJob.create(fuente="Clarín")
+        job.fecha_inicio = NOW - timedelta(minutes=minutes_ago)
+        job.fecha_fin = job.fecha_inicio
+        job.status = status
+        jobs.append(job)
+    return jobs
+
+
+@pytest.fixture
+def breaker():
+    return SourceCircuitBreaker(AsyncMock(), CONFIG)
+
+
+class TestSourceCircuitBreaker:
+    """Tests para SourceCircuitBreaker"""
+
+    def test_without_history_is_closed(self, breaker):
+        assert breaker.evaluate("Clarín", [], NOW).state is CircuitState.CLOSED
+
+    def test_consecutive_failures_open_the_circuit(self, breaker):
+        jobs = make_jobs("failed", "failed", "failed", "completed")
+
+        status = breaker.evaluate("Clarín", jobs, NOW)
+
+        assert status.state is CircuitState.OPEN
+        assert status.consecutive_failures == 3
+        assert status.retry_at == NOW + timedelta(seconds=60)
+
+    def test_high_failure_ratio_opens_the_circuit(self, breaker):
+        jobs = make_jobs("failed", "completed", "failed", "failed", "completed")
+
+        status = breaker.evaluate("Clarín", jobs, NOW)
+
+        assert status.state is CircuitState.OPEN
+        assert status.failure_ratio == pytest.approx(0.6)
+
+    def test_success_after_failures_closes_the_circuit(self, breaker):
+        jobs = make_jobs("completed", "failed", "failed", "failed", "failed")
+
+        assert breaker.evaluate("Clarín", jobs, NOW).state is CircuitState.CLOSED
+
+    def test_empty_timed_out_job_counts_as_failure(self, breaker):
+        jobs = make_jobs("timed_out", "timed_out", "failed")
+        assert breaker.evaluate("Clarín", jobs, NOW).state is CircuitState.OPEN
+
+        jobs[0].total_articulos = 4
+        assert breaker.evaluate("Clarín", jobs, NOW).state is CircuitState.CLOSED
+
+    def test_cooldown_doubles_with_each_extra_failure(self, breaker):
+        jobs = make_jobs(*["failed"] * 6)
+
+        status = breaker.evaluate("Clarín", jobs, NOW)
+
+        assert status.retry_at == NOW + timedelta(seconds=480)
+        status = breaker.evaluate("Clarín", make_jobs(*["failed"] * 10), NOW)
+        assert status.retry_at == NOW + timedelta(seconds=600)
+
+    def test_half_open_after_cooldown(self, breaker):
+        jobs = make_jobs("failed", "failed", "failed")
+
+        status = breaker.evaluate("Clarín", jobs, NOW + timedelta(seconds=61))
+
+        assert status.state is CircuitState.HALF_OPEN
+
+    @pytest.mark.asyncio
+    async def test_status_reads_finished_jobs_from_repository(self):
+        repository = AsyncMock()
+        repository.get_page.return_value = CursorPage(
+            items=make_jobs("failed", "failed", "failed")
+        )
+        breaker = SourceCircuitBreaker(repository, CONFIG)
+
+        status = await breaker.status("Clarín", NOW)
+
+        assert status.state is CircuitState.OPEN
+        repository.get_page.assert_awaited_once_with(
+            limit=10, fuente="Clarín", statuses=("completed", "timed_out", "failed")
+        )
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            CircuitBreakerConfig(failure_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreakerConfig(failure_ratio=1.5)
+        with pytest.raises(ValueError):
+            CircuitBreakerConfig(cooldown=600, max_cooldown=60)
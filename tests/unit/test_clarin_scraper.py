@@ -3,10 +3,15 @@ Tests unitarios para el scraper de Clarín.
 """
 
 import pytest
+import requests
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone
 
+from src.infrastructure.adapters.http import run_sync
 from src.infrastructure.adapters.scrapers.clarin_scraper import ClarinScraper
+from src.infrastructure.persistence.in_memory_crawl_frontier_repository import (
+    InMemoryCrawlFrontierRepository,
+)
 from src.domain.dto.article_dto import ArticleDTO
 
 
@@ -29,7 +34,7 @@ class TestClarinScraper:
         assert scraper.max_articles == 15
         assert scraper.timeout == 30
 
-    @patch("src.infrastructure.adapters.scrapers.clarin_scraper.requests.Session")
+    @patch("src.infrastructure.adapters.scrapers.base_scraper.requests.Session")
     def test_scrape_returns_list(self, mock_session_class):
         """Test que scrape() retorna una lista"""
         # Mock de la sesión que retorna respuestas vacías
@@ -146,7 +151,7 @@ class TestClarinScraper:
     def test_scraper_handles_network_errors_gracefully(self):
         """Test que el scraper maneja errores de red apropiadamente"""
         with patch(
-            "src.infrastructure.adapters.scrapers.clarin_scraper.requests.Session"
+            "src.infrastructure.adapters.scrapers.base_scraper.requests.Session"
         ) as mock_session_class:
             mock_session = Mock()
             mock_session_class.return_value = mock_session
@@ -190,3 +195,264 @@ class TestClarinScraper:
             assert not any("/tema/" in url for url in urls)
             assert not any("/tags/" in url for url in urls)
             assert not any("/autor/" in url for url in urls)
+
+    def test_scrape_fetches_sections_and_articles_through_engine(self):
+        """Test que secciones y artículos se descargan a través del motor"""
+        section_html = b"""
+        <html><body>
+            <article><a href="/politica/nota-1.html">Nota 1</a></article>
+            <article><a href="/politica/nota-2.html">Nota 2</a></article>
+        </body></html>
+        """
+        article_html = b"""
+        <html><body>
+            <h1 class="title">Titulo de la nota</h1>
+            <div class="body-nota"><p>Primer parrafo.</p></div>
+        </body></html>
+        """
+
+        def fake_get(url, timeout=None, **kwargs):
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.content = article_html if "nota-" in url else section_html
+            return response
+
+        scraper = ClarinScraper(max_articles=5)
+        with patch.object(scraper.session, "get", side_effect=fake_get) as mock_get:
+            articles = scraper.scrape()
+
+        # 3 secciones + 2 artículos únicos
+        assert mock_get.call_count == 5
+        assert sorted(article.url for article in articles) == [
+            "https://www.clarin.com/politica/nota-1.html",
+            "https://www.clarin.com/politica/nota-2.html",
+        ]
+        assert all(article.fuente == "Clarín" for article in articles)
+        assert all(article.titulo == "Titulo de la nota" for article in articles)
+
+    @pytest.mark.asyncio
+    async def test_ascrape_is_async_entry_point(self):
+        """Test que ascrape() puede esperarse desde un event loop"""
+        scraper = ClarinScraper(max_articles=1)
+        mock_response = Mock()
+        mock_response.content = b"<html><body></body></html>"
+        mock_response.raise_for_status = Mock()
+
+        with patch.object(scraper.session, "get", return_value=mock_response):
+            articles = await scraper.ascrape()
+
+        assert articles == []
+
+    @pytest.mark.asyncio
+    async def test_astream_yields_articles_as_they_are_extracted(self):
+        """Test que astream() entrega los artículos sin esperar al último"""
+        section_html = b"".join(
+            f'<article><a href="/politica/nota-{i}.html">N</a></article>'.encode()
+            for i in range(6)
+        )
+        article_html = b"""
+        <html><body>
+            <h1 class="title">Titulo de la nota</h1>
+            <div class="body-nota"><p>Primer parrafo.</p></div>
+        </body></html>
+        """
+
+        def fake_get(url, timeout=None, **kwargs):
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.content = article_html if "nota-" in url else section_html
+            return response
+
+        scraper = ClarinScraper(max_articles=6, max_concurrency=2)
+        with patch.object(scraper.session, "get", side_effect=fake_get) as mock_get:
+            stream = scraper.astream()
+            first = await stream.__anext__()
+            # Solo se descargaron las secciones y la primera ventana de artículos
+            assert mock_get.call_count <= 3 + 2
+
+            rest = [article async for article in stream]
+
+        assert first.titulo == "Titulo de la nota"
+        assert len(rest) == 5
+        assert mock_get.call_count == 3 + 6
+
+    def test_scrape_skips_known_urls_before_fetching(self):
+        """Test que las URLs ya almacenadas nunca se descargan"""
+        section_html = b"""
+        <html><body>
+            <article><a href="/politica/nota-1.html">Nota 1</a></article>
+            <article><a href="/politica/nota-2.html">Nota 2</a></article>
+            <article><a href="/politica/nota-3.html">Nota 3</a></article>
+        </body></html>
+        """
+        article_html = (
+            b"<html><body><h1>Titulo</h1><article><p>Texto</p></article></body></html>"
+        )
+        known_url = "https://www.clarin.com/politica/nota-1.html"
+        checked_batches = []
+
+        async def known_urls_checker(urls):
+            checked_batches.append(list(urls))
+            return {known_url}
+
+        def fake_get(url, timeout=None, **kwargs):
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.content = article_html if "nota-" in url else section_html
+            return response
+
+        scraper = ClarinScraper(max_articles=2, known_urls_checker=known_urls_checker)
+        with patch.object(scraper.session, "get", side_effect=fake_get) as mock_get:
+            articles = scraper.scrape()
+
+        fetched_urls = [c.args[0] for c in mock_get.call_args_list]
+        # Una sola consulta por lote con todas las URLs descubiertas
+        assert len(checked_batches) == 1
+        assert len(checked_batches[0]) == 3
+        assert known_url not in fetched_urls
+        # El cupo de max_articles se usa para las URLs nuevas
+        assert sorted(article.url for article in articles) == [
+            "https://www.clarin.com/politica/nota-2.html",
+            "https://www.clarin.com/politica/nota-3.html",
+        ]
+
+    def test_scrape_continues_when_known_urls_checker_fails(self):
+        """Test que un error en la consulta de URLs conocidas no detiene el scraping"""
+        section_html = b'<html><body><article><a href="/politica/nota-1.html">N</a></article></body></html>'
+        article_html = b"<html><body><h1>Titulo</h1></body></html>"
+
+        async def failing_checker(urls):
+            raise RuntimeError("DB caida")
+
+        def fake_get(url, timeout=None, **kwargs):
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.content = article_html if "nota-" in url else section_html
+            return response
+
+        scraper = ClarinScraper(max_articles=5, known_urls_checker=failing_checker)
+        with patch.object(scraper.session, "get", side_effect=fake_get):
+            articles = scraper.scrape()
+
+        assert len(articles) == 1
+
+
+class TestCrawlFrontier:
+    """Tests del descubrimiento con frontera persistente"""
+
+    @staticmethod
+    def fake_get(sections):
+        article_html = (
+            b"<html><body><h1>Titulo</h1><article><p>Texto</p></article></body></html>"
+        )
+
+        def get(url, timeout=None, **kwargs):
+            response = Mock()
+            response.raise_for_status = Mock()
+            path = url.replace("https://www.clarin.com", "")
+            if path in sections:
+                links = "".join(
+                    f'<article><a href="{link}">N</a></article>'
+                    for link in sections[path]
+                )
+                response.content = f"<html><body>{links}</body></html>".encode()
+            else:
+                response.content = article_html
+            return response
+
+        return get
+
+    def test_sections_are_interleaved_newest_first(self):
+        sections = {
+            "/ultimas-noticias/": ["/a-1.html", "/a-2.html", "/a-3.html"],
+            "/politica/": ["/b-1.html", "/a-1.html"],
+            "/economia/": ["/c-1.html"],
+        }
+        scraper = ClarinScraper(max_articles=None)
+
+        with patch.object(scraper.session, "get", side_effect=self.fake_get(sections)):
+            urls = run_sync(scraper.collect_article_urls())
+
+        assert [url.rsplit("/", 1)[1] for url in urls] == [
+            "a-1.html",
+            "b-1.html",
+            "c-1.html",
+            "a-2.html",
+            "a-3.html",
+        ]
+
+    def test_stops_after_streak_of_known_urls(self):
+        links = [f"/politica/nota-{i}.html" for i in range(1, 11)]
+        sections = {"/ultimas-noticias/": links}
+        frontier = InMemoryCrawlFrontierRepository()
+        for link in links[2:]:
+            run_sync(frontier.mark_fetched("Clarín", "https://www.clarin.com" + link))
+
+        scraper = ClarinScraper(
+            max_articles=None, frontier=frontier, known_streak_limit=3
+        )
+        with patch.object(
+            scraper.session, "get", side_effect=self.fake_get(sections)
+        ) as mock_get:
+            articles = scraper.scrape()
+
+        assert sorted(article.url for article in articles) == [
+            "https://www.clarin.com/politica/nota-1.html",
+            "https://www.clarin.com/politica/nota-2.html",
+        ]
+        assert mock_get.call_count == len(ClarinScraper.sections) + 2
+
+        # Segunda ejecución sin notas nuevas: no se descarga ningún artículo
+        scraper = ClarinScraper(
+            max_articles=None, frontier=frontier, known_streak_limit=3
+        )
+        with patch.object(
+            scraper.session, "get", side_effect=self.fake_get(sections)
+        ) as mock_get:
+            assert scraper.scrape() == []
+        assert mock_get.call_count == len(ClarinScraper.sections)
+
+        fetched = run_sync(frontier.get_by_fuente("Clarín", status="fetched"))
+        assert len(fetched) == 10
+
+    def test_failed_downloads_are_recorded(self):
+        sections = {"/ultimas-noticias/": ["/politica/nota-1.html"]}
+        frontier = InMemoryCrawlFrontierRepository()
+        get = self.fake_get(sections)
+
+        def failing_get(url, **kwargs):
+            if "nota-" in url:
+                raise requests.ConnectionError("caído")
+            return get(url, **kwargs)
+
+        scraper = ClarinScraper(frontier=frontier)
+        with patch.object(scraper.session, "get", side_effect=failing_get):
+            assert scraper.scrape() == []
+
+        (entry,) = run_sync(frontier.get_by_fuente("Clarín"))
+        assert entry.status == "failed"
+        assert entry.attempts == 1
+        assert not entry.is_known
+
+    def test_unparseable_pages_are_recorded_as_failed(self):
+        sections = {"/ultimas-noticias/": ["/politica/nota-1.html"]}
+        frontier = InMemoryCrawlFrontierRepository()
+        get = self.fake_get(sections)
+
+        def get_without_title(url, **kwargs):
+            response = get(url, **kwargs)
+            if "nota-" in url:
+                response.content = b"<html><body><p>Sin titulo</p></body></html>"
+            return response
+
+        scraper = ClarinScraper(frontier=frontier)
+        with patch.object(scraper.session, "get", side_effect=get_without_title):
+            assert scraper.scrape() == []
+
+        (entry,) = run_sync(frontier.get_by_fuente("Clarín"))
+        assert entry.status == "failed"
+        assert not entry.is_known
+
+    def test_invalid_streak_limit(self):
+        with pytest.raises(ValueError):
+            ClarinScraper(known_streak_limit=0)
@@ -0,0 +1,49 @@
+import pytest
+from datetime import datetime, timezone
+
+from src.application.dto.news_article_dto import CreateNewsArticleDTO
+from src.application.use_cases.create_article import CreateArticleUseCase
+from src.infrastructure.persistence.in_memory_news_article_repository import (
+    InMemoryNewsArticleRepository,
+)
+
+
+def make_dto(url: str = "https://www.clarin.com/nota.html") -> CreateNewsArticleDTO:
+    return CreateNewsArticleDTO(
+        titulo="Titulo",
+        contenido="Contenido",
+        fuente="Clarín",
+        fecha_publicacion=datetime.now(timezone.utc),
+        url=url,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_article_success():
+    repository = InMemoryNewsArticleRepository()
+    use_case = CreateArticleUseCase(repository)
+
+    result = await use_case.execute(make_dto())
+
+    assert result.url == "https://www.clarin.com/nota.html"
+    assert await repository.get_existing_urls([result.url]) == {result.url}
+
+
+@pytest.mark.asyncio
+async def test_create_article_duplicate_url():
+    repository = InMemoryNewsArticleRepository()
+    use_case = CreateArticleUseCase(repository)
+    await use_case.execute(make_dto())
+
+    with pytest.raises(ValueError, match="already exists"):
+        await use_case.execute(make_dto())
+
+
+@pytest.mark.asyncio
+async def test_in_memory_get_existing_urls_accepts_any_iterable():
+    repository = InMemoryNewsArticleRepository()
+    await CreateArticleUseCase(repository).execute(make_dto("https://a.com/1"))
+
+    candidates = (f"https://a.com/{i}" for i in range(1000))
+
+    assert await repository.get_existing_urls(candidates) == {"https://a.com/1"}
@@ -0,0 +1,128 @@
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from src.application.dto.news_article_dto import NewsArticleDTO, NewsArticleSummaryDTO
+from src.presentation.django_app import renderers
+from src.presentation.django_app.fast_serialization import compile_serializer, serialize
+from src.presentation.django_app.renderers import FastJSONRenderer
+from src.presentation.django_app.serializers import (
+    NewsArticleSerializer,
+    NewsArticleSummarySerializer,
+    ScrapingJobSerializer,
+    UserSerializer,
+)
+
+
+def make_article(i: int) -> NewsArticleDTO:
+    return NewsArticleDTO(
+        id=uuid.uuid4(),
+        titulo=f"Título {i}   «ñ»",
+        contenido='Contenido\ncon "comillas" y \\barras\\ \x01',
+        fuente="Clarín",
+        fecha_publicacion=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        url=f"https://a.com/{i}",
+        categoria=None if i % 2 else "Política",
+        procesado=bool(i % 2),
+        created_at=datetime(2024, 5, 1, tzinfo=timezone(timedelta(hours=-3))),
+        updated_at=None,
+    )
+
+
+def test_compiled_serializer_matches_drf_for_objects_and_dicts():
+    articles = [make_article(i) for i in range(5)]
+    compiled = compile_serializer(NewsArticleSerializer)
+
+    expected = NewsArticleSerializer(articles, many=True).data
+
+    assert compiled.encode_many(articles) == expected
+    assert compiled.encode_many([vars(a) for a in articles]) == expected
+    assert compiled.encode(articles[0]) == NewsArticleSerializer(articles[0]).data
+
+
+def test_compiled_serializer_matches_drf_for_other_responses():
+    summary = NewsArticleSummaryDTO(
+        id=uuid.uuid4(),
+        titulo="T",
+        fuente="Clarín",
+        fecha_publicacion=datetime.now(timezone.utc),
+        url="https://a.com/1",
+        categoria=None,
+        extracto=None,
+    )
+    user = {
+        "id": uuid.uuid4(),
+        "email": "ana@example.com",
+        "name": "Ana",
+        "is_active": 1,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": None,
+    }
+    job = {
+        "id": uuid.uuid4(),
+        "fuente": "Clarín",
+        "fecha_inicio": datetime.now(timezone.utc),
+        "fecha_fin": None,
+        "status": "completed",
+        "total_articulos": 3,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": None,
+    }
+
+    for serializer_class, instance in (
+        (NewsArticleSummarySerializer, summary),
+        (UserSerializer, user),
+        (ScrapingJobSerializer, job),
+    ):
+        expected = serializer_class(instance).data
+        assert compile_serializer(serializer_class).encode(instance) == expected
+
+
+def test_serialize_falls_back_to_drf_for_incomplete_objects():
+    # DRF omite los campos de solo lectura ausentes
+    data = vars(make_article(1)).copy()
+    del data["created_at"], data["updated_at"]
+
+    result = serialize(NewsArticleSerializer, data)
+
+    assert result == NewsArticleSerializer(data).data
+    assert "created_at" not in result
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fast_renderer_is_byte_identical(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(renderers, "orjson", None)
+    payloads = [
+        NewsArticleSerializer([make_article(i) for i in range(3)], many=True).data,
+        {"results": [], "next_cursor": None},
+        {
+            "fecha": datetime(2024, 5, 1, 12, 0, 0, 987654, tzinfo=timezone.utc),
+            "dia": date(2024, 5, 1),
+            "id": uuid.uuid4(),
+            "monto": Decimal("10.50"),
+            "lazy": gettext_lazy("Texto"),
+            "items": (1, 2, {3}),
+            "big": 2**70,
+            1: "clave entera",
+            "separadores": "  ",
+        },
+    ]
+
+    for data in payloads:
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_fast_renderer_keeps_indentation_support():
+    data = {"a": [1, 2]}
+    media_type = "application/json; indent=2"
+
+    rendered = FastJSONRenderer().render(data, accepted_media_type=media_type)
+
+    assert rendered == JSONRenderer().render(data, accepted_media_type=media_type)
+    assert json.loads(rendered) == data
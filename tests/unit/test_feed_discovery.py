@@ -0,0 +1,211 @@
+"""
+Tests unitarios para el descubrimiento de URLs por sitemap / RSS.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.domain.enums import DiscoveryStrategy, NewsSource
+from src.infrastructure.adapters.scrapers.clarin_scraper import ClarinScraper
+from src.infrastructure.adapters.scrapers.feed_discovery import (
+    FeedEntry,
+    parse_feed,
+    rank_entries,
+)
+
+NEWS_SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+  <url>
+    <loc>https://www.clarin.com/politica/nota-1.html</loc>
+    <lastmod>2024-05-01T09:00:00Z</lastmod>
+    <news:news>
+      <news:publication_date>2024-05-01T08:00:00-03:00</news:publication_date>
+    </news:news>
+    <image:image><image:loc>https://images.clarin.com/1.jpg</image:loc></image:image>
+  </url>
+  <url>
+    <loc>https://www.clarin.com/politica/nota-2.html</loc>
+    <lastmod>2024-05-02</lastmod>
+  </url>
+</urlset>
+"""
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+  <title>Clarin</title>
+  <link>https://www.clarin.com</link>
+  <item>
+    <title>Vieja</title>
+    <link>https://www.clarin.com/politica/vieja.html</link>
+    <pubDate>Wed, 01 May 2024 10:00:00 -0300</pubDate>
+  </item>
+  <item>
+    <title>Nueva</title>
+    <link>https://www.clarin.com/politica/nueva.html</link>
+    <pubDate>Thu, 02 May 2024 10:00:00 -0300</pubDate>
+  </item>
+  <item>
+    <title>Tag</title>
+    <link>https://www.clarin.com/tema/economia.html</link>
+  </item>
+</channel></rss>
+"""
+
+
+class TestParseFeed:
+    """Tests para parse_feed"""
+
+    def test_parses_news_sitemap(self):
+        parsed = parse_feed(NEWS_SITEMAP)
+
+        assert [entry.url for entry in parsed.entries] == [
+            "https://www.clarin.com/politica/nota-1.html",
+            "https://www.clarin.com/politica/nota-2.html",
+        ]
+        # news:publication_date tiene prioridad sobre lastmod
+        assert parsed.entries[0].published == datetime(
+            2024, 5, 1, 11, 0, tzinfo=timezone.utc
+        )
+        assert parsed.entries[1].published == datetime(2024, 5, 2, tzinfo=timezone.utc)
+        assert parsed.sitemaps == []
+
+    def test_parses_rss_items_without_channel_link(self):
+        parsed = parse_feed(RSS_FEED)
+
+        assert [entry.url for entry in parsed.entries] == [
+            "https://www.clarin.com/politica/vieja.html",
+            "https://www.clarin.com/politica/nueva.html",
+            "https://www.clarin.com/tema/economia.html",
+        ]
+        assert parsed.entries[1].published == datetime(
+            2024, 5, 2, 13, 0, tzinfo=timezone.utc
+        )
+        assert parsed.entries[2].published is None
+
+    def test_parses_atom_feed(self):
+        atom = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+          <link href="https://a.com/"/>
+          <entry>
+            <link rel="self" href="https://a.com/feed/1"/>
+            <link href="https://a.com/nota-1"/>
+            <updated>2024-05-01T10:00:00Z</updated>
+          </entry>
+        </feed>"""
+
+        parsed = parse_feed(atom)
+
+        assert parsed.entries == [
+            FeedEntry(
+                "https://a.com/nota-1", datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+            )
+        ]
+
+    def test_parses_sitemap_index(self):
+        index = b"""<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+          <sitemap><loc>https://a.com/sitemap-1.xml</loc></sitemap>
+          <sitemap><loc>https://a.com/sitemap-2.xml</loc></sitemap>
+        </sitemapindex>"""
+
+        parsed = parse_feed(index)
+
+        assert parsed.entries == []
+        assert [entry.url for entry in parsed.sitemaps] == [
+            "https://a.com/sitemap-1.xml",
+            "https://a.com/sitemap-2.xml",
+        ]
+
+    def test_invalid_xml_raises_value_error(self):
+        with pytest.raises(ValueError):
+            parse_feed(b"<html><body><p>no es un feed</body></html>")
+
+
+class TestRankEntries:
+    """Tests para rank_entries"""
+
+    def test_orders_newest_first_and_keeps_undated_last(self):
+        now = datetime.now(timezone.utc)
+        entries = [
+            FeedEntry("https://a.com/sin-fecha"),
+            FeedEntry("https://a.com/vieja", now - timedelta(hours=5)),
+            FeedEntry("https://a.com/nueva", now - timedelta(hours=1)),
+        ]
+
+        ranked = rank_entries(entries)
+
+        assert [entry.url for entry in ranked] == [
+            "https://a.com/nueva",
+            "https://a.com/vieja",
+            "https://a.com/sin-fecha",
+        ]
+
+    def test_discards_old_entries_and_duplicates(self):
+        now = datetime.now(timezone.utc)
+        entries = [
+            FeedEntry("https://a.com/1", now - timedelta(hours=3)),
+            FeedEntry("https://a.com/1", now - timedelta(hours=1)),
+            FeedEntry("https://a.com/2", now - timedelta(days=10)),
+        ]
+
+        ranked = rank_entries(entries, max_age=timedelta(days=2))
+
+        assert ranked == [FeedEntry("https://a.com/1", now - timedelta(hours=1))]
+
+
+class TestFeedDiscoveryInScraper:
+    """Tests del descubrimiento por feed en BaseNewsScraper"""
+
+    @staticmethod
+    def fake_get(responses):
+        def get(url, timeout=None, **kwargs):
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.content = responses(url)
+            return response
+
+        return get
+
+    @pytest.mark.asyncio
+    async def test_rss_strategy_ranks_and_filters_urls(self):
+        scraper = ClarinScraper(discovery_strategy=DiscoveryStrategy.RSS)
+        scraper.feed_max_age = None
+
+        with patch.object(
+            scraper.session, "get", side_effect=self.fake_get(lambda url: RSS_FEED)
+        ) as mock_get:
+            urls = await scraper._discover_article_urls()
+
+        assert urls == [
+            "https://www.clarin.com/politica/nueva.html",
+            "https://www.clarin.com/politica/vieja.html",
+        ]
+        fetched = [c.args[0] for c in mock_get.call_args_list]
+        assert fetched == NewsSource.CLARIN.discovery_feeds(DiscoveryStrategy.RSS)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_sections_when_feed_is_invalid(self):
+        section_html = (
+            b'<html><body><article><a href="/politica/nota-1.html">N</a>'
+            b"</article></body></html>"
+        )
+        scraper = ClarinScraper(discovery_strategy=DiscoveryStrategy.RSS)
+
+        with patch.object(
+            scraper.session,
+            "get",
+            side_effect=self.fake_get(lambda url: section_html),
+        ) as mock_get:
+            urls = await scraper._discover_article_urls()
+
+        assert urls == ["https://www.clarin.com/politica/nota-1.html"]
+        # 1 feed + 3 secciones
+        assert mock_get.call_count == 4
+
+    def test_source_defines_strategy_and_feeds(self):
+        for source in NewsSource:
+            strategy = source.discovery_strategy
+            assert source.discovery_feeds(strategy)
+        assert NewsSource.CLARIN.discovery_feeds(DiscoveryStrategy.SECTIONS) == []
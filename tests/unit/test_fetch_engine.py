@@ -0,0 +1,152 @@
+"""
+Tests unitarios para el motor de descargas asíncrono.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+from unittest.mock import Mock
+
+from src.infrastructure.adapters.http import AsyncFetchEngine, run_sync
+
+
+def make_session(delay: float = 0.0, status_error: Exception = None):
+    """Crea una sesión simulada que registra la concurrencia por host."""
+    session = Mock()
+    lock = threading.Lock()
+    session.in_flight = {}
+    session.max_in_flight = {}
+    session.max_total = 0
+
+    def get(url, timeout=None, **kwargs):
+        host = url.split("/")[2]
+        with lock:
+            session.in_flight[host] = session.in_flight.get(host, 0) + 1
+            session.max_in_flight[host] = max(
+                session.max_in_flight.get(host, 0), session.in_flight[host]
+            )
+            session.max_total = max(session.max_total, sum(session.in_flight.values()))
+        time.sleep(delay)
+        with lock:
+            session.in_flight[host] -= 1
+
+        response = Mock()
+        response.url = url
+        response.content = f"<html>{url}</html>".encode()
+        response.raise_for_status = Mock(side_effect=status_error)
+        return response
+
+    session.get.side_effect = get
+    return session
+
+
+class TestAsyncFetchEngine:
+    """Tests para AsyncFetchEngine"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_returns_response(self):
+        engine = AsyncFetchEngine(make_session(), timeout=5)
+
+        response = await engine.fetch("https://a.com/nota")
+
+        assert response.content == b"<html>https://a.com/nota</html>"
+        engine.session.get.assert_called_once_with("https://a.com/nota", timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_fetch_raises_on_http_error(self):
+        engine = AsyncFetchEngine(
+            make_session(status_error=requests.HTTPError("500 Server Error"))
+        )
+
+        with pytest.raises(requests.HTTPError):
+            await engine.fetch("https://a.com/nota")
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_respects_per_host_limit(self):
+        session = make_session(delay=0.05)
+        engine = AsyncFetchEngine(session, max_concurrency=8, per_host_limit=2)
+        urls = [f"https://a.com/{i}" for i in range(6)] + [
+            f"https://b.com/{i}" for i in range(6)
+        ]
+
+        results = await engine.fetch_many(urls)
+
+        assert [r.url for r in results] == urls
+        assert session.max_in_flight["a.com"] == 2
+        assert session.max_in_flight["b.com"] == 2
+        assert session.max_total == 4
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_respects_global_limit(self):
+        session = make_session(delay=0.05)
+        engine = AsyncFetchEngine(session, max_concurrency=3, per_host_limit=4)
+        urls = [f"https://host{i}.com/nota" for i in range(9)]
+
+        await engine.fetch_many(urls)
+
+        assert session.max_total == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_runs_concurrently(self):
+        engine = AsyncFetchEngine(make_session(delay=0.1), max_concurrency=8)
+
+        start = time.perf_counter()
+        await engine.fetch_many([f"https://host{i}.com/" for i in range(8)])
+
+        assert time.perf_counter() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_returns_exceptions(self):
+        session = make_session()
+        session.get.side_effect = requests.ConnectionError("sin red")
+        engine = AsyncFetchEngine(session)
+
+        results = await engine.fetch_many(["https://a.com/1", "https://a.com/2"])
+
+        assert all(isinstance(r, requests.ConnectionError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_stats_count_failed_requests(self):
+        session = make_session()
+        engine = AsyncFetchEngine(session)
+        await engine.fetch("https://a.com/1")
+        session.get.side_effect = requests.ConnectionError("sin red")
+
+        await engine.fetch_many(["https://a.com/2", "https://a.com/3"])
+
+        assert engine.stats() == {"requests": 3, "errors": 2}
+
+    def test_engine_can_be_reused_across_event_loops(self):
+        engine = AsyncFetchEngine(make_session(), per_host_limit=1)
+
+        first = asyncio.run(engine.fetch_many(["https://a.com/1", "https://a.com/2"]))
+        second = asyncio.run(engine.fetch_many(["https://a.com/3", "https://a.com/4"]))
+
+        assert len(first) == len(second) == 2
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            AsyncFetchEngine(make_session(), max_concurrency=0)
+        with pytest.raises(ValueError):
+            AsyncFetchEngine(make_session(), per_host_limit=0)
+
+
+class TestRunSync:
+    """Tests para run_sync"""
+
+    def test_run_sync_without_running_loop(self):
+        async def answer():
+            return 42
+
+        assert run_sync(answer()) == 42
+
+    @pytest.mark.asyncio
+    async def test_run_sync_inside_running_loop(self):
+        async def answer():
+            await asyncio.sleep(0)
+            return 42
+
+        assert run_sync(answer()) == 42
@@ -0,0 +1,107 @@
+"""
+Tests sobre el corpus HTML offline (tests/fixtures/html_corpus).
+
+Verifican que el corpus no cambió respecto de su manifiesto y que los
+scrapers y spiders siguen extrayendo datos de sus páginas, de modo que los
+benchmarks miden la ruta completa de parseo.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+from scrapy.http import HtmlResponse
+
+from src.infrastructure.adapters.parsing import get_html_parser
+from src.infrastructure.adapters.scrapers import (
+    ClarinScraper,
+    LaNacionScraper,
+    Pagina12Scraper,
+)
+from src.infrastructure.external_services.scrapy_adapter.spiders import (
+    ClarinSpider,
+    InfobaeSpider,
+    LaNacionSpider,
+    Pagina12Spider,
+)
+
+CORPUS = Path(__file__).parent.parent / "fixtures" / "html_corpus"
+MANIFEST = json.loads((CORPUS / "manifest.json").read_text())
+
+SCRAPERS = {
+    "clarin": ClarinScraper,
+    "pagina12": Pagina12Scraper,
+    "lanacion": LaNacionScraper,
+}
+
+SPIDERS = {
+    "clarin": ClarinSpider,
+    "pagina12": Pagina12Spider,
+    "lanacion": LaNacionSpider,
+    "infobae": InfobaeSpider,
+}
+
+
+def pages(source, kind):
+    return [
+        (page, (CORPUS / page["path"]).read_bytes())
+        for page in MANIFEST["pages"]
+        if page["path"].startswith(f"{source}/") and page["kind"] == kind
+    ]
+
+
+def test_manifest_matches_files():
+    paths = {page["path"] for page in MANIFEST["pages"]}
+    files = {str(path.relative_to(CORPUS)) for path in CORPUS.rglob("*.html")}
+
+    assert paths == files
+    for page in MANIFEST["pages"]:
+        content = (CORPUS / page["path"]).read_bytes()
+        assert hashlib.sha256(content).hexdigest() == page["sha256"], page["path"]
+
+
+@pytest.mark.parametrize("source", SCRAPERS)
+class TestScrapersOnCorpus:
+    """Los scrapers extraen lo mismo con ambos backends de parseo"""
+
+    def test_section_urls(self, source):
+        for page, content in pages(source, "section"):
+            results = [
+                SCRAPERS[source](html_parser=get_html_parser(name))._parse_article_urls(
+                    content
+                )
+                for name in ("lxml", "bs4")
+            ]
+
+            assert results[0], page["path"]
+            assert results[0] == results[1]
+
+    def test_articles(self, source):
+        for page, content in pages(source, "article"):
+            results = [
+                SCRAPERS[source](html_parser=get_html_parser(name))._parse_article(
+                    page["url"], content
+                )
+                for name in ("lxml", "bs4")
+            ]
+
+            article = results[0]
+            assert article is not None, page["path"]
+            assert article.titulo and article.contenido
+            assert article.fecha_publicacion is not None
+            assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("source", SPIDERS)
+def test_spiders_parse_articles(source):
+    spider = SPIDERS[source]()
+    spider.max_articles = len(pages(source, "article"))
+
+    for page, content in pages(source, "article"):
+        response = HtmlResponse(url=page["url"], body=content, encoding="utf-8")
+        items = list(spider.parse_article(response))
+
+        assert len(items) == 1, page["path"]
+        assert items[0]["titulo"]
+        assert items[0]["contenido"]
@@ -0,0 +1,144 @@
+"""
+Tests unitarios para los backends de parseo de HTML.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.infrastructure.adapters.parsing import (
+    BeautifulSoupHtmlParser,
+    LxmlHtmlParser,
+    detect_encoding,
+    get_html_parser,
+    http_encoding,
+)
+
+DOCUMENT = """
+<html><head>
+  <meta property="og:title" content="Titulo OG">
+  <meta property="article:published_time" content="2024-05-01T10:00:00Z">
+</head><body>
+  <h1 class="nota title">Titulo <b>principal</b></h1>
+  <article>
+    <!-- comentario -->
+    <script>var x = 1;</script>
+    <p>Primer párrafo de la nota.</p>
+    <p>Segundo párrafo.</p>
+    <a href="/politica/nota-1.html">Nota 1</a>
+    <a>Sin href</a>
+  </article>
+  <h2><a href="/politica/nota-2.html">Nota 2</a></h2>
+  <div class="article-item destacado"><a href="/nota-3.html">Nota 3</a></div>
+  <time datetime="2024-05-01">1 de mayo</time>
+</body></html>
+"""
+
+BACKENDS = [LxmlHtmlParser(), BeautifulSoupHtmlParser()]
+
+
+@pytest.mark.parametrize("parser", BACKENDS, ids=lambda parser: parser.name)
+class TestHtmlParserBackends:
+    """Ambos backends deben devolver los mismos resultados"""
+
+    def test_find_by_class_and_text(self, parser):
+        doc = parser.parse(DOCUMENT.encode())
+
+        assert doc.find("h1", attrs={"class": "title"}).get_text(strip=True) == (
+            "Tituloprincipal"
+        )
+        assert doc.find("h1", attrs={"class": "otra"}) is None
+        assert doc.find("meta", attrs={"property": "og:title"})["content"] == (
+            "Titulo OG"
+        )
+
+    def test_find_attribute_presence(self, parser):
+        doc = parser.parse(DOCUMENT.encode())
+
+        assert doc.find("time", attrs={"datetime": True}).get("datetime") == (
+            "2024-05-01"
+        )
+
+    def test_find_all_links(self, parser):
+        doc = parser.parse(DOCUMENT.encode())
+        containers = doc.find_all("article") + doc.find_all(["h2", "h3"])
+        containers += doc.find_all("div", class_=["article-item", "nota"])
+
+        hrefs = [
+            link["href"]
+            for container in containers
+            for link in container.find_all("a", href=True)
+        ]
+
+        assert hrefs == [
+            "/politica/nota-1.html",
+            "/politica/nota-2.html",
+            "/nota-3.html",
+        ]
+
+    def test_get_text_skips_scripts_and_comments(self, parser):
+        doc = parser.parse(DOCUMENT.encode())
+
+        text = doc.find("article").get_text(separator=" ", strip=True)
+
+        assert text == "Primer párrafo de la nota. Segundo párrafo. Nota 1 Sin href"
+
+    def test_declared_encoding_is_used(self, parser):
+        content = "<html><body><h1>Economía</h1></body></html>".encode("latin-1")
+
+        doc = parser.parse(content, encoding="ISO-8859-1")
+
+        assert doc.find("h1").get_text() == "Economía"
+
+    def test_empty_document(self, parser):
+        assert parser.parse(b"").find("h1") is None
+
+    def test_extract_text_removes_non_content_tags(self, parser):
+        text = parser.extract_text(
+            "<div><script>alert('x')</script><p>Hola</p><nav>Menu</nav> fin</div>"
+        )
+
+        assert text == "Hola fin"
+
+
+class TestEncodingDetection:
+    """Tests para detect_encoding y http_encoding"""
+
+    def test_http_encoding_has_priority(self):
+        content = b'<meta charset="utf-8">'
+
+        assert detect_encoding(content, "latin-1") == "iso8859-1"
+
+    def test_meta_charset(self):
+        content = b'<html><head><meta charset="ISO-8859-1"></head></html>'
+
+        assert detect_encoding(content) == "iso8859-1"
+
+    def test_fallback_by_utf8_validity(self):
+        assert detect_encoding("Economía".encode("utf-8")) == "utf-8"
+        assert detect_encoding("Economía".encode("latin-1")) == "cp1252"
+
+    def test_http_encoding_only_from_explicit_charset(self):
+        response = Mock()
+        response.headers = {"Content-Type": "text/html; charset=UTF-8"}
+        assert http_encoding(response) == "utf-8"
+
+        response.headers = {"Content-Type": "text/html"}
+        assert http_encoding(response) is None
+
+
+class TestGetHtmlParser:
+    """Tests para get_html_parser"""
+
+    def test_default_backend_is_lxml(self, monkeypatch):
+        monkeypatch.delenv("SCRAPER_HTML_PARSER", raising=False)
+
+        assert get_html_parser().name == "lxml"
+
+    def test_backend_from_environment(self, monkeypatch):
+        monkeypatch.setenv("SCRAPER_HTML_PARSER", "bs4")
+
+        assert isinstance(get_html_parser(), BeautifulSoupHtmlParser)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            get_html_parser("html5lib")
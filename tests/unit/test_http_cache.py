@@ -0,0 +1,166 @@
+"""
+Tests unitarios para la caché HTTP condicional.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.infrastructure.adapters.http import AsyncFetchEngine, HttpCache
+from src.infrastructure.adapters.scrapers.clarin_scraper import ClarinScraper
+
+
+def make_response(content: bytes = b"<html></html>", status_code=200, headers=None):
+    response = Mock()
+    response.content = content
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.raise_for_status = Mock()
+    return response
+
+
+class TestHttpCache:
+    """Tests para HttpCache"""
+
+    def test_store_and_lookup_validators(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        response = make_response(
+            headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 May 2024 10:00:00 GMT"}
+        )
+
+        assert cache.store("https://a.com/", response) is True
+
+        entry = cache.lookup("https://a.com/")
+        assert entry.validators() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 May 2024 10:00:00 GMT",
+        }
+        assert cache.read(entry) == b"<html></html>"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_response_without_validators_is_not_stored(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        cache.store("https://a.com/", make_response(headers={"ETag": '"v1"'}))
+
+        assert cache.store("https://a.com/", make_response()) is False
+
+        assert cache.lookup("https://a.com/") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_index_survives_new_instance(self, tmp_path):
+        HttpCache(tmp_path).store(
+            "https://a.com/", make_response(b"body", headers={"ETag": '"v1"'})
+        )
+
+        cache = HttpCache(tmp_path)
+
+        entry = cache.lookup("https://a.com/")
+        assert entry.etag == '"v1"'
+        assert cache.read(entry) == b"body"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = HttpCache(tmp_path, max_bytes=500)
+        headers = {"ETag": '"v"'}
+        cache.store("https://a.com/1", make_response(b"x" * 100, headers=headers))
+        cache.store("https://a.com/2", make_response(b"x" * 100, headers=headers))
+        cache.read(cache.lookup("https://a.com/1"))
+
+        cache.store("https://a.com/3", make_response(b"x" * 100, headers=headers))
+
+        assert cache.lookup("https://a.com/2") is None
+        assert cache.lookup("https://a.com/1") is not None
+        assert cache.lookup("https://a.com/3") is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= 500
+
+    def test_read_missing_file_returns_none(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        cache.store("https://a.com/", make_response(headers={"ETag": '"v1"'}))
+        entry = cache.lookup("https://a.com/")
+        cache.clear()
+
+        assert cache.read(entry) is None
+        assert cache.stats()["hits"] == 0
+
+
+class TestConditionalFetch:
+    """Tests para AsyncFetchEngine.fetch_conditional"""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_serves_cached_body(self, tmp_path):
+        session = Mock()
+        session.get.side_effect = [
+            make_response(b"<html>v1</html>", headers={"ETag": '"v1"'}),
+            make_response(b"", status_code=304),
+        ]
+        engine = AsyncFetchEngine(session, timeout=5, http_cache=HttpCache(tmp_path))
+
+        first = await engine.fetch_conditional("https://a.com/")
+        second = await engine.fetch_conditional("https://a.com/")
+
+        assert first == (b"<html>v1</html>", False)
+        assert second == (b"<html>v1</html>", True)
+        session.get.assert_called_with(
+            "https://a.com/", headers={"If-None-Match": '"v1"'}, timeout=5
+        )
+
+    @pytest.mark.asyncio
+    async def test_modified_response_replaces_entry(self, tmp_path):
+        session = Mock()
+        session.get.side_effect = [
+            make_response(b"v1", headers={"ETag": '"v1"'}),
+            make_response(b"v2", headers={"ETag": '"v2"'}),
+        ]
+        cache = HttpCache(tmp_path)
+        engine = AsyncFetchEngine(session, http_cache=cache)
+
+        await engine.fetch_conditional("https://a.com/")
+        content, not_modified = await engine.fetch_conditional("https://a.com/")
+
+        assert (content, not_modified) == (b"v2", False)
+        assert cache.lookup("https://a.com/").etag == '"v2"'
+        assert cache.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_section_skips_url_extraction(self, tmp_path):
+        section = (
+            b'<html><body><article><a href="/politica/nota-1.html">Nota</a>'
+            b"</article></body></html>"
+        )
+        scraper = ClarinScraper(http_cache=HttpCache(tmp_path))
+        scraper.skip_unchanged_sections = True
+        scraper.session.get = Mock(
+            side_effect=[
+                make_response(section, headers={"ETag": '"v1"'}),
+                make_response(b"", status_code=304),
+            ]
+        )
+        scraper._parse_article_urls = Mock(return_value=["https://www.clarin.com/x"])
+
+        first = await scraper._aextract_article_urls_from_section(scraper.base_url)
+        second = await scraper._aextract_article_urls_from_section(scraper.base_url)
+
+        assert first == ["https://www.clarin.com/x"]
+        assert second == []
+        scraper._parse_article_urls.assert_called_once_with(section)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_section_reuses_cached_body_by_default(self, tmp_path):
+        section = (
+            b'<html><body><article><a href="/politica/nota-1.html">Nota</a>'
+            b"</article></body></html>"
+        )
+        scraper = ClarinScraper(http_cache=HttpCache(tmp_path))
+        scraper.session.get = Mock(
+            side_effect=[
+                make_response(section, headers={"ETag": '"v1"'}),
+                make_response(b"", status_code=304),
+            ]
+        )
+
+        first = await scraper._aextract_article_urls_from_section(scraper.base_url)
+        second = await scraper._aextract_article_urls_from_section(scraper.base_url)
+
+        assert first == ["https://www.clarin.com/politica/nota-1.html"]
+        assert second == first
+        assert scraper.session.get.call_count == 2
@@ -0,0 +1,111 @@
+"""
+Tests unitarios para el cliente HTTP compartido.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from src.infrastructure.adapters.http import (
+    AsyncFetchEngine,
+    PooledHttpClient,
+    close_shared_http_client,
+    get_shared_http_client,
+)
+from src.infrastructure.adapters.scrapers import ClarinScraper
+
+
+class SlowAdapter(BaseAdapter):
+    """Adaptador que responde después de una demora, sin red."""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def send(self, request, **kwargs):
+        time.sleep(self.delay)
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response._content = b"<html></html>"
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def shared_client():
+    close_shared_http_client()
+    yield
+    close_shared_http_client()
+
+
+class TestPooledHttpClient:
+    """Tests para PooledHttpClient"""
+
+    def test_global_ceiling_across_threads(self):
+        client = PooledHttpClient(max_connections=3)
+        client.mount("https://", SlowAdapter(delay=0.02))
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            urls = [f"https://host-{i % 5}.com/nota" for i in range(20)]
+            responses = list(executor.map(client.get, urls))
+
+        assert all(response.status_code == 200 for response in responses)
+        stats = client.stats()
+        assert stats["requests"] == 20
+        assert stats["in_flight"] == 0
+        assert stats["max_in_flight"] == 3
+
+    def test_fetch_engine_keeps_shared_pools(self):
+        client = PooledHttpClient(connections_per_host=2)
+        adapter = client.get_adapter("https://www.clarin.com/")
+
+        AsyncFetchEngine(client, max_concurrency=16)
+
+        assert client.get_adapter("https://www.clarin.com/") is adapter
+
+    def test_scrapers_share_client_and_do_not_close_it(self):
+        client = PooledHttpClient()
+        closed = threading.Event()
+        client.close = closed.set
+
+        scraper = ClarinScraper(http_client=client)
+        assert scraper.session is client
+        scraper.__del__()
+
+        assert not closed.is_set()
+
+    def test_http2_falls_back_without_h2(self):
+        pytest.importorskip("urllib3.http2")
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            assert PooledHttpClient(http2=True).http2 is False
+        else:
+            pytest.skip("h2 instalado")
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            PooledHttpClient(max_connections=0)
+        with pytest.raises(ValueError):
+            PooledHttpClient(connections_per_host=0)
+
+
+def test_shared_client_is_configured_from_environment(shared_client, monkeypatch):
+    monkeypatch.setenv("SCRAPER_HTTP_MAX_CONNECTIONS", "12")
+    monkeypatch.setenv("SCRAPER_HTTP_CONNECTIONS_PER_HOST", "3")
+
+    client = get_shared_http_client()
+
+    assert client is get_shared_http_client()
+    assert client.max_connections == 12
+    assert client.connections_per_host == 3
+
+    close_shared_http_client()
+    assert get_shared_http_client() is not client
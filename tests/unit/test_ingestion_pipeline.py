@@ -0,0 +1,266 @@
+"""
+Tests unitarios para el pipeline de ingesta productor/consumidor.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.application.pipeline import (
+    IngestionPipeline,
+    PipelineConfig,
+    create_parse_process_pool,
+)
+from src.application.pipeline import process_parsing
+from src.application.pipeline.process_parsing import (
+    from_record,
+    parse_in_worker,
+    to_record,
+)
+from src.domain.dto.article_dto import ArticleDTO
+from src.domain.dto.fetched_page import FetchedPage
+from src.infrastructure.adapters.parsing import get_html_parser
+from src.infrastructure.adapters.scrapers import ClarinScraper
+
+CORPUS = Path(__file__).parent.parent / "fixtures" / "html_corpus"
+
+
+class FakeScraper:
+    """Scraper en memoria que implementa PipelineScraperPort."""
+
+    def __init__(self, urls, fetch_delay=0.0, titles=None, fail_on=None, hang_on=()):
+        self.urls = urls
+        self.fetch_delay = fetch_delay
+        self.titles = titles or {}
+        self.fail_on = fail_on
+        self.hang_on = set(hang_on)
+        self.fetched = 0
+        self.parsed = {}
+
+    async def collect_article_urls(self):
+        return list(self.urls)
+
+    async def fetch_article(self, url):
+        await asyncio.sleep(30 if url in self.hang_on else self.fetch_delay)
+        if url == self.fail_on:
+            raise RuntimeError("fallo inesperado")
+        self.fetched += 1
+        if url.endswith("roto"):
+            return None
+        return FetchedPage(url, self.titles.get(url, url).encode())
+
+    def parse_article(self, page):
+        if not page.content:
+            return None
+        return ArticleDTO(
+            titulo=page.content.decode(),
+            contenido="Contenido",
+            fuente="Clarín",
+            fecha_publicacion=datetime.now(timezone.utc),
+            url=page.url,
+        )
+
+    async def mark_parsed(self, url, parsed):
+        self.parsed[url] = parsed
+
+
+class CorpusClarinScraper(ClarinScraper):
+    """ClarinScraper que lee las notas del corpus HTML en lugar de la red."""
+
+    async def collect_article_urls(self):
+        manifest = json.loads((CORPUS / "manifest.json").read_text())
+        self.pages = {
+            page["url"]: CORPUS / page["path"]
+            for page in manifest["pages"]
+            if page["path"].startswith("clarin/articles/")
+        }
+        return list(self.pages)
+
+    async def fetch_article(self, url):
+        return FetchedPage(url, self.pages[url].read_bytes())
+
+
+class RecordingWriter:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.batches = []
+
+    async def __call__(self, batch):
+        await asyncio.sleep(self.delay)
+        self.batches.append([article.url for article in batch])
+        return len(batch)
+
+
+@pytest.mark.asyncio
+class TestIngestionPipeline:
+    """Tests para IngestionPipeline"""
+
+    async def test_processes_all_stages_and_deduplicates(self):
+        urls = [f"https://www.clarin.com/nota-{i}.html" for i in range(12)]
+        # Una URL repetida (por ejemplo, listada en dos secciones)
+        urls += [urls[1], "https://www.clarin.com/roto"]
+        # Notas distintas con el mismo título no son duplicados
+        titles = {urls[3]: "Últimas noticias", urls[4]: "Últimas noticias"}
+        writer = RecordingWriter()
+        pipeline = IngestionPipeline(
+            FakeScraper(urls, titles=titles),
+            writer,
+            PipelineConfig(fetch_concurrency=3, parse_workers=2, batch_size=5),
+        )
+
+        result = await pipeline.run()
+
+        assert result.articles_scraped == 13
+        assert result.articles_persisted == 12
+        assert [len(batch) for batch in writer.batches] == [5, 5, 2]
+        assert {urls[3], urls[4]} <= {url for batch in writer.batches for url in batch}
+        metrics = result.metrics_dict()
+        assert metrics["fetch"]["processed"] == 14
+        assert metrics["fetch"]["emitted"] == 13
+        assert metrics["dedup"]["emitted"] == 12
+        assert metrics["writer"]["emitted"] == 3
+        assert metrics["fetch"]["workers"] == 3
+
+    async def test_reports_parse_results_to_scraper(self):
+        urls = ["https://www.clarin.com/nota-1.html", "https://www.clarin.com/vacia"]
+        scraper = FakeScraper(urls, titles={urls[1]: ""})
+
+        await IngestionPipeline(scraper, RecordingWriter()).run()
+
+        assert scraper.parsed == {urls[0]: True, urls[1]: False}
+
+    async def test_slow_writer_throttles_fetchers(self):
+        urls = [f"https://www.clarin.com/nota-{i}.html" for i in range(40)]
+        scraper = FakeScraper(urls)
+        writer = RecordingWriter(delay=0.02)
+        config = PipelineConfig(
+            fetch_concurrency=4, parse_workers=1, queue_size=2, batch_size=2
+        )
+        outstanding = []
+
+        async def tracking_writer(batch):
+            written = sum(len(b) for b in writer.batches)
+            outstanding.append(scraper.fetched - written)
+            return await writer(batch)
+
+        result = await IngestionPipeline(scraper, tracking_writer, config).run()
+
+        assert result.articles_persisted == 40
+        # Colas + workers + lote en curso: nunca toda la fuente en memoria
+        bound = 3 * config.queue_size + config.fetch_concurrency + 2 * 2 + 2
+        assert max(outstanding) <= bound
+        assert result.metrics["dedup"].blocked_seconds > 0
+
+    async def test_partial_batch_is_flushed_after_interval(self):
+        urls = [f"https://www.clarin.com/nota-{i}.html" for i in range(4)]
+        writer = RecordingWriter()
+        config = PipelineConfig(
+            fetch_concurrency=1, batch_size=100, flush_interval=0.01
+        )
+
+        await IngestionPipeline(
+            FakeScraper(urls, fetch_delay=0.03), writer, config
+        ).run()
+
+        assert len(writer.batches) > 1
+        assert sum(len(batch) for batch in writer.batches) == 4
+
+    async def test_deadline_cancels_fetches_and_keeps_extracted_articles(self):
+        urls = [f"https://www.clarin.com/nota-{i}.html" for i in range(12)]
+        scraper = FakeScraper(urls, fetch_delay=0.01, hang_on={urls[2], urls[5]})
+        writer = RecordingWriter()
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        result = await IngestionPipeline(
+            scraper, writer, PipelineConfig(fetch_concurrency=3, batch_size=4)
+        ).run(deadline=started + 0.3)
+
+        assert loop.time() - started < 1
+        assert result.timed_out
+        assert result.articles_persisted == 10
+        assert sum(len(batch) for batch in writer.batches) == 10
+
+    async def test_stage_failure_cancels_pipeline(self):
+        urls = [f"https://www.clarin.com/nota-{i}.html" for i in range(10)]
+        scraper = FakeScraper(urls, fail_on=urls[3])
+
+        with pytest.raises(RuntimeError, match="fallo inesperado"):
+            await asyncio.wait_for(
+                IngestionPipeline(scraper, RecordingWriter()).run(), timeout=2
+            )
+
+
+@pytest.mark.asyncio
+async def test_parses_in_process_pool():
+    config = PipelineConfig(parse_processes=2, batch_size=100)
+    threaded = RecordingWriter()
+    in_processes = RecordingWriter()
+    articles = []
+
+    async def collect(batch):
+        articles.extend(batch)
+        return await in_processes(batch)
+
+    html_parser = get_html_parser("bs4")
+    await IngestionPipeline(
+        CorpusClarinScraper(html_parser=html_parser), threaded
+    ).run()
+    with create_parse_process_pool(2) as pool:
+        result = await IngestionPipeline(
+            CorpusClarinScraper(html_parser=html_parser),
+            collect,
+            config,
+            parse_executor=pool,
+        ).run()
+
+    assert result.articles_scraped > 0
+    assert sorted(in_processes.batches[0]) == sorted(threaded.batches[0])
+    assert all(isinstance(article, ArticleDTO) for article in articles)
+    assert result.metrics["parse"].workers == 2
+
+
+def test_parse_in_worker_returns_compact_record():
+    path = next((CORPUS / "clarin" / "articles").glob("*.html"))
+    url = "https://www.clarin.com/politica/nota.html"
+
+    record = parse_in_worker(ClarinScraper, url, path.read_bytes())
+
+    assert isinstance(record, tuple)
+    article = from_record(record)
+    assert article.url == url
+    assert article.titulo and article.fuente == "Clarín"
+    assert to_record(article) == record
+    assert parse_in_worker(ClarinScraper, url, b"<html></html>") is None
+
+
+def test_parse_in_worker_reuses_parse_only_scraper(monkeypatch):
+    monkeypatch.setattr(process_parsing, "_parsers", {})
+    path = next((CORPUS / "clarin" / "articles").glob("*.html"))
+    url = "http://127.0.0.1:8000/politica/nota.html"
+    base_url = "http://127.0.0.1:8000/"
+
+    record = parse_in_worker(
+        ClarinScraper, url, path.read_bytes(), None, "bs4", base_url
+    )
+    parse_in_worker(ClarinScraper, url, path.read_bytes(), None, "bs4", base_url)
+
+    [parser] = process_parsing._parsers.values()
+    assert parser.html_parser.name == "bs4"
+    assert parser.base_url == "http://127.0.0.1:8000"
+    assert not hasattr(parser, "session") and not hasattr(parser, "fetch_engine")
+    in_process = ClarinScraper(html_parser=get_html_parser("bs4"), base_url=base_url)
+    page = FetchedPage(url, path.read_bytes())
+    assert record == to_record(in_process.parse_article(page))
+
+
+def test_invalid_config():
+    with pytest.raises(ValueError):
+        PipelineConfig(queue_size=0)
+    with pytest.raises(ValueError):
+        PipelineConfig(flush_interval=0)
+    with pytest.raises(ValueError):
+        PipelineConfig(parse_processes=-1)
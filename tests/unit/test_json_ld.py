@@ -0,0 +1,91 @@
+"""
+Tests unitarios para la extracción de artículos desde JSON-LD.
+"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from src.infrastructure.adapters.scrapers.clarin_scraper import ClarinScraper
+from src.infrastructure.adapters.scrapers.json_ld import extract_article_metadata
+
+
+def page(ld, body: str = "") -> bytes:
+    script = f'<script type="application/ld+json">{json.dumps(ld)}</script>'
+    return f"<html><head>{script}</head><body>{body}</body></html>".encode()
+
+
+NEWS_ARTICLE = {
+    "@context": "https://schema.org",
+    "@type": "NewsArticle",
+    "headline": "El dólar &amp; los mercados",
+    "datePublished": "2024-05-01T10:30:00-03:00",
+    "articleSection": ["Economía", "Mercados"],
+    "articleBody": "<p>Primer párrafo.</p>\n<p>Segundo   párrafo.</p>",
+}
+
+
+class TestExtractArticleMetadata:
+    """Tests para extract_article_metadata"""
+
+    def test_reads_news_article_fields(self):
+        metadata = extract_article_metadata(page(NEWS_ARTICLE))
+
+        assert metadata.titulo == "El dólar & los mercados"
+        assert metadata.contenido == "Primer párrafo. Segundo párrafo."
+        assert metadata.fecha_publicacion == datetime(
+            2024, 5, 1, 13, 30, tzinfo=timezone.utc
+        )
+        assert metadata.categoria == "Economía"
+
+    def test_finds_article_inside_graph_and_skips_invalid_blocks(self):
+        content = b'<script type="application/ld+json">{invalido</script>' + page(
+            {
+                "@graph": [
+                    {"@type": "WebSite", "name": "Diario"},
+                    {"@type": ["NewsArticle"], "headline": "Nota"},
+                ]
+            }
+        )
+
+        metadata = extract_article_metadata(content)
+
+        assert metadata.titulo == "Nota"
+        assert metadata.contenido is None
+        assert metadata.categoria is None
+
+    def test_without_json_ld_returns_empty_metadata(self):
+        metadata = extract_article_metadata(b"<html><h1>Titulo</h1></html>")
+
+        assert metadata.titulo is None
+        assert metadata.fecha_publicacion is None
+
+
+class TestParseArticleWithJsonLd:
+    """Tests de _parse_article con la ruta JSON-LD"""
+
+    def test_complete_json_ld_skips_dom(self):
+        scraper = ClarinScraper()
+
+        with patch.object(scraper.html_parser, "parse") as parse:
+            article = scraper._parse_article("https://a.com/n", page(NEWS_ARTICLE))
+
+        parse.assert_not_called()
+        assert article.titulo == "El dólar & los mercados"
+        assert article.categoria == "Economía"
+
+    def test_missing_fields_fall_back_to_dom(self):
+        scraper = ClarinScraper()
+        ld = {"@type": "NewsArticle", "headline": "Titulo JSON-LD"}
+        body = (
+            '<h1 class="title">Titulo DOM</h1>'
+            '<div class="body-nota"><p>Contenido desde el DOM.</p></div>'
+            '<time datetime="2024-05-02T08:00:00Z"></time>'
+        )
+
+        article = scraper._parse_article("https://a.com/n", page(ld, body))
+
+        assert article.titulo == "Titulo JSON-LD"
+        assert article.contenido == "Contenido desde el DOM."
+        assert article.fecha_publicacion == datetime(2024, 5, 2, 8, tzinfo=timezone.utc)
+        assert article.categoria is None
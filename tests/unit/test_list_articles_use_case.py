@@ -0,0 +1,78 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from src.application.use_cases.list_articles import ListArticlesUseCase
+from src.domain.entities.news_article import NewsArticle
+from src.infrastructure.persistence.in_memory_news_article_repository import (
+    InMemoryNewsArticleRepository,
+)
+
+BASE_DATE = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+async def make_repository(total: int) -> InMemoryNewsArticleRepository:
+    repository = InMemoryNewsArticleRepository()
+    for i in range(total):
+        await repository.create(
+            NewsArticle.create(
+                titulo=f"Titulo {i}",
+                contenido="Contenido",
+                fuente="Clarín" if i % 2 else "Infobae",
+                # Pares de artículos con la misma fecha para forzar desempates por id
+                fecha_publicacion=BASE_DATE + timedelta(hours=i // 2),
+                url=f"https://a.com/{i}",
+            )
+        )
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_execute_page_walks_all_articles_once():
+    repository = await make_repository(7)
+    use_case = ListArticlesUseCase(repository)
+
+    seen = []
+    cursor = None
+    while True:
+        page = await use_case.execute_page(limit=3, cursor=cursor)
+        seen.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == 7
+    assert len({article.url for article in seen}) == 7
+    dates = [article.fecha_publicacion for article in seen]
+    assert dates == sorted(dates, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_execute_page_filters_by_fuente():
+    use_case = ListArticlesUseCase(await make_repository(6))
+
+    page = await use_case.execute_page(limit=10, fuente="Clarín")
+
+    assert {article.fuente for article in page.items} == {"Clarín"}
+    assert len(page.items) == 3
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_execute_page_rejects_invalid_cursor():
+    use_case = ListArticlesUseCase(await make_repository(1))
+
+    with pytest.raises(ValueError):
+        await use_case.execute_page(cursor="invalido")
+
+
+@pytest.mark.asyncio
+async def test_execute_summaries_return_excerpt_instead_of_contenido():
+    use_case = ListArticlesUseCase(await make_repository(3))
+
+    summaries = await use_case.execute_summaries(limit=3)
+    page = await use_case.execute_page(limit=2, summary=True)
+
+    assert [s.extracto for s in summaries] == ["Contenido"] * 3
+    assert not hasattr(summaries[0], "contenido")
+    assert [s.url for s in page.items] == ["https://a.com/2", page.items[1].url]
+    assert page.next_cursor is not None
@@ -95,3 +95,29 @@ def test_update_category():
 
     assert article.categoria == new_categoria
     assert article.updated_at is not None
+
+
+def test_excerpt_short_content_is_returned_whole():
+    article = NewsArticle.create(
+        titulo="Test",
+        contenido="  Contenido\n breve  ",
+        fuente="Source",
+        fecha_publicacion=datetime.now(timezone.utc),
+        url="https://test.com",
+    )
+
+    assert article.excerpt() == "Contenido breve"
+
+
+def test_excerpt_cuts_long_content_at_word_boundary():
+    article = NewsArticle.create(
+        titulo="Test",
+        contenido="palabra " * 100,
+        fuente="Source",
+        fecha_publicacion=datetime.now(timezone.utc),
+        url="https://test.com",
+    )
+
+    excerpt = article.excerpt(max_length=30)
+
+    assert excerpt == "palabra palabra palabra…"
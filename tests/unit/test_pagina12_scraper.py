@@ -29,7 +29,7 @@ class TestPagina12Scraper:
         assert scraper.max_articles == 15
         assert scraper.timeout == 30
 
-    @patch("src.infrastructure.adapters.scrapers.pagina12_scraper.requests.Session")
+    @patch("src.infrastructure.adapters.scrapers.base_scraper.requests.Session")
     def test_scrape_returns_list(self, mock_session_class):
         """Test que scrape() retorna una lista"""
         # Mock de la sesión que retorna respuestas vacías
@@ -173,7 +173,7 @@ class TestPagina12Scraper:
     def test_scraper_handles_network_errors_gracefully(self):
         """Test que el scraper maneja errores de red apropiadamente"""
         with patch(
-            "src.infrastructure.adapters.scrapers.pagina12_scraper.requests.Session"
+            "src.infrastructure.adapters.scrapers.base_scraper.requests.Session"
         ) as mock_session_class:
             mock_session = Mock()
             mock_session_class.return_value = mock_session
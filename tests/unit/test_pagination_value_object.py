@@ -0,0 +1,24 @@
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.domain.value_objects.pagination import PageCursor
+
+
+def test_cursor_roundtrip():
+    cursor = PageCursor(
+        fecha=datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc), id=uuid4()
+    )
+
+    token = cursor.encode()
+
+    assert "=" not in token
+    assert PageCursor.decode(token) == cursor
+
+
+def test_invalid_cursor():
+    invalid_tokens = ["", "no-es-un-cursor", "W10", "WyJ4IiwgInkiXQ"]
+
+    for token in invalid_tokens:
+        with pytest.raises(ValueError):
+            PageCursor.decode(token)
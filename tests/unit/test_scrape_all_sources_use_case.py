@@ -1,14 +1,23 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
+from src.application.pipeline import PipelineConfig
+from src.application.resilience import CircuitBreakerConfig
 from src.application.use_cases.scrape_all_sources import ScrapeAllSourcesUseCase
 from src.domain.entities.source import Source
 from src.domain.entities.scraping_job import ScrapingJob
-from src.domain.entities.news_article import NewsArticle
 from src.domain.dto.article_dto import ArticleDTO
+from src.domain.dto.fetched_page import FetchedPage
 from src.domain.enums import NewsSource
+from src.domain.value_objects.pagination import CursorPage
+from src.infrastructure.adapters.http import HttpCache
 
 
 class TestScrapeAllSourcesUseCase:
@@ -28,8 +37,11 @@ class TestScrapeAllSourcesUseCase:
 
     @pytest.fixture
     def mock_article_repository(self):
-        """Mock del repositorio de artículos."""
+        """Mock del repositorio de artículos (todas las URLs son nuevas)."""
         mock = AsyncMock()
+        mock.bulk_create_if_absent.side_effect = lambda articles: {
+            article.url for article in articles
+        }
         return mock
 
     @pytest.fixture
@@ -113,10 +125,6 @@ class TestScrapeAllSourcesUseCase:
         mock_scraping_job_repository.create.side_effect = create_job_side_effect
         mock_scraping_job_repository.update.return_value = None
 
-        # Mock para verificación de artículos duplicados
-        mock_article_repository.get_by_url.return_value = None
-        mock_article_repository.create.return_value = None
-
         # Mock del scraper
         with patch.object(use_case, "_get_scraper_for_source") as mock_get_scraper:
             mock_scraper = Mock()
@@ -135,6 +143,8 @@ class TestScrapeAllSourcesUseCase:
 
             # Verificar que se llamaron los métodos correctos
             mock_source_repository.get_active_sources.assert_called_once()
+            # Todo el lote se persiste con una única llamada
+            mock_article_repository.bulk_create_if_absent.assert_called_once()
             assert mock_scraping_job_repository.create.call_count == 1
             assert (
                 mock_scraping_job_repository.update.call_count >= 2
@@ -195,23 +205,11 @@ class TestScrapeAllSourcesUseCase:
         mock_scraping_job_repository.create.side_effect = create_job_side_effect
         mock_scraping_job_repository.update.return_value = None
 
-        # Simular que el primer artículo ya existe
-        existing_article = NewsArticle.create(
-            titulo="Artículo existente",
-            contenido="Contenido",
-            fuente="Clarín",
-            fecha_publicacion=datetime.now(timezone.utc),
-            url=sample_article_dtos[0].url,
-            categoria=None,
-        )
-
-        def get_by_url_side_effect(url):
-            if url == sample_article_dtos[0].url:
-                return existing_article
-            return None
-
-        mock_article_repository.get_by_url.side_effect = get_by_url_side_effect
-        mock_article_repository.create.return_value = None
+        # Simular que el primer artículo ya existe: solo se inserta el segundo
+        mock_article_repository.bulk_create_if_absent.side_effect = None
+        mock_article_repository.bulk_create_if_absent.return_value = {
+            sample_article_dtos[1].url
+        }
 
         # Mock del scraper
         with patch.object(use_case, "_get_scraper_for_source") as mock_get_scraper:
@@ -226,6 +224,711 @@ class TestScrapeAllSourcesUseCase:
             assert result["total_articles_persisted"] == 1  # Solo uno nuevo
             assert result["jobs_details"][0]["duplicates"] == 1
 
+    @pytest.mark.asyncio
+    async def test_persist_falls_back_to_single_inserts_when_batch_fails(
+        self, use_case, mock_article_repository, sample_article_dtos
+    ):
+        """Un lote fallido se reintenta por artículo y un DTO inválido se omite."""
+        calls = []
+
+        def persist(articles):
+            calls.append([article.url for article in articles])
+            if len(articles) > 1 or articles[0].url == sample_article_dtos[0].url:
+                raise RuntimeError("violación de restricción")
+            return {articles[0].url}
+
+        mock_article_repository.bulk_create_if_absent.side_effect = persist
+        invalid = ArticleDTO.model_construct(url="https://ejemplo.com/roto")
+        extra = sample_article_dtos[1].model_copy(
+            update={"url": "https://ejemplo.com/articulo3"}
+        )
+
+        persisted = await use_case._persist_articles(
+            [*sample_article_dtos, invalid, extra]
+        )
+
+        assert persisted == 2
+        assert calls == [
+            [
+                "https://ejemplo.com/articulo1",
+                "https://ejemplo.com/articulo2",
+                "https://ejemplo.com/articulo3",
+            ],
+            ["https://ejemplo.com/articulo1"],
+            ["https://ejemplo.com/articulo2"],
+            ["https://ejemplo.com/articulo3"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_runs_sources_concurrently(
+        self,
+        use_case,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+        sample_sources,
+        sample_article_dtos,
+    ):
+        """Debe ejecutar las fuentes en paralelo y conservar su orden."""
+        mock_source_repository.get_active_sources.return_value = sample_sources
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+
+        def slow_scrape():
+            time.sleep(0.2)
+            return sample_article_dtos
+
+        with patch.object(use_case, "_get_scraper_for_source") as mock_get_scraper:
+            mock_scraper = Mock()
+            mock_scraper.scrape.side_effect = slow_scrape
+            mock_get_scraper.return_value = mock_scraper
+
+            start = time.perf_counter()
+            result = await use_case.execute()
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5  # Secuencial tardaría al menos 0.6s
+        assert result["total_jobs_completed"] == 3
+        assert result["total_articles_scraped"] == 6
+        assert [detail["source"] for detail in result["jobs_details"]] == [
+            source.nombre for source in sample_sources
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_respects_max_concurrent_sources(
+        self,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+        sample_sources,
+    ):
+        """No debe superar el máximo de fuentes en vuelo configurado."""
+        use_case = ScrapeAllSourcesUseCase(
+            source_repository=mock_source_repository,
+            scraping_job_repository=mock_scraping_job_repository,
+            article_repository=mock_article_repository,
+            max_concurrent_sources=2,
+        )
+        mock_source_repository.get_active_sources.return_value = sample_sources
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def tracked_scrape():
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.1)
+            with lock:
+                in_flight -= 1
+            return []
+
+        with patch.object(use_case, "_get_scraper_for_source") as mock_get_scraper:
+            mock_scraper = Mock()
+            mock_scraper.scrape.side_effect = tracked_scrape
+            mock_get_scraper.return_value = mock_scraper
+
+            result = await use_case.execute()
+
+        assert result["total_jobs_completed"] == 3
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_sequential_mode(
+        self,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+        sample_sources,
+        sample_article_dtos,
+    ):
+        """Con concurrent=False debe procesar las fuentes una a una."""
+        use_case = ScrapeAllSourcesUseCase(
+            source_repository=mock_source_repository,
+            scraping_job_repository=mock_scraping_job_repository,
+            article_repository=mock_article_repository,
+            concurrent=False,
+        )
+        mock_source_repository.get_active_sources.return_value = sample_sources
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+
+        with patch.object(use_case, "_get_scraper_for_source") as mock_get_scraper:
+            mock_scraper = Mock()
+            mock_scraper.scrape.return_value = sample_article_dtos
+            mock_get_scraper.return_value = mock_scraper
+
+            result = await use_case.execute()
+
+        assert result["total_sources"] == 3
+        assert result["total_jobs_completed"] == 3
+        assert result["total_articles_persisted"] == 6
+
+    def test_invalid_max_concurrent_sources(
+        self,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+    ):
+        """Debe rechazar un máximo de fuentes concurrentes menor a 1."""
+        with pytest.raises(ValueError):
+            ScrapeAllSourcesUseCase(
+                source_repository=mock_source_repository,
+                scraping_job_repository=mock_scraping_job_repository,
+                article_repository=mock_article_repository,
+                max_concurrent_sources=0,
+            )
+
+    @pytest.mark.asyncio
+    async def test_execute_awaits_async_scrapers(
+        self,
+        use_case,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+        sample_sources,
+        sample_article_dtos,
+    ):
+        """Debe usar ascrape() cuando el scraper ofrece punto de entrada async."""
+        mock_source_repository.get_active_sources.return_value = [sample_sources[0]]
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+
+        class AsyncScraper:
+            def scrape(self):
+                raise AssertionError("No debe usarse scrape()")
+
+            async def ascrape(self):
+                return sample_article_dtos
+
+        with patch.object(
+            use_case, "_get_scraper_for_source", return_value=AsyncScraper()
+        ):
+            result = await use_case.execute()
+
+        assert result["total_jobs_completed"] == 1
+        assert result["total_articles_scraped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_persists_streamed_articles_in_batches(
+        self,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+        sample_sources,
+    ):
+        """Debe persistir micro-lotes mientras el scraper sigue entregando."""
+        mock_source_repository.get_active_sources.return_value = [sample_sources[0]]
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+        events = []
+
+        async def persist(articles):
+            events.append(("persist", len(articles)))
+            return {article.url for article in articles}
+
+        mock_article_repository.bulk_create_if_absent.side_effect = persist
+
+        class StreamingScraper:
+            def scrape(self):
+                raise AssertionError("No debe usarse scrape()")
+
+            async def astream(self):
+                for i in range(5):
+                    events.append(("yield", i))
+                    yield ArticleDTO(
+                        titulo=f"Nota {i}",
+                        contenido="Contenido",
+                        fuente="Clarín",
+                        fecha_publicacion=datetime.now(timezone.utc),
+                        url=f"https://www.clarin.com/nota-{i}.html",
+                    )
+
+        use_case = ScrapeAllSourcesUseCase(
+            source_repository=mock_source_repository,
+            scraping_job_repository=mock_scraping_job_repository,
+            article_repository=mock_article_repository,
+            persist_batch_size=2,
+        )
+        with patch.object(
+            use_case, "_get_scraper_for_source", return_value=StreamingScraper()
+        ):
+            result = await use_case.execute()
+
+        assert result["total_articles_scraped"] == 5
+        assert result["total_articles_persisted"] == 5
+        assert events == [
+            ("yield", 0),
+            ("yield", 1),
+            ("persist", 2),
+            ("yield", 2),
+            ("yield", 3),
+            ("persist", 2),
+            ("yield", 4),
+            ("persist", 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_uses_ingestion_pipeline(
+        self,
+        use_case,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+        sample_sources,
+    ):
+        """Debe usar el pipeline de ingesta y guardar sus métricas en el job."""
+        mock_source_repository.get_active_sources.return_value = [sample_sources[0]]
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+        mock_scraping_job_repository.update.side_effect = lambda job: job
+
+        class PipelineScraper:
+            async def collect_article_urls(self):
+                return [f"https://www.clarin.com/nota-{i}.html" for i in range(3)]
+
+            async def fetch_article(self, url):
+                return FetchedPage(url, b"<html></html>")
+
+            def parse_article(self, page):
+                return ArticleDTO(
+                    titulo=page.url,
+                    contenido="Contenido",
+                    fuente="Clarín",
+                    fecha_publicacion=datetime.now(timezone.utc),
+                    url=page.url,
+                )
+
+            async def mark_parsed(self, url, parsed):
+                pass
+
+        with patch.object(
+            use_case, "_get_scraper_for_source", return_value=PipelineScraper()
+        ):
+            result = await use_case.execute()
+
+        assert result["total_articles_scraped"] == 3
+        assert result["total_articles_persisted"] == 3
+        metrics = result["jobs_details"][0]["metrics"]
+        assert set(metrics) == {"fetch", "parse", "dedup", "writer"}
+        assert metrics["fetch"]["processed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_only_given_sources(
+        self,
+        use_case,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        sample_sources,
+        sample_article_dtos,
+    ):
+        """Debe procesar solo las fuentes recibidas y registrar los artículos nuevos."""
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+        mock_scraper = Mock()
+        mock_scraper.scrape.return_value = sample_article_dtos
+
+        with patch.object(
+            use_case, "_get_scraper_for_source", return_value=mock_scraper
+        ):
+            result = await use_case.execute(sources=[sample_sources[2]])
+
+        mock_source_repository.get_active_sources.assert_not_called()
+        assert [d["source"] for d in result["jobs_details"]] == ["La Nación"]
+        saved_job = mock_scraping_job_repository.update.call_args.args[0]
+        assert saved_job.articulos_nuevos == 2
+
+    @pytest.mark.asyncio
+    async def test_source_timeout_persists_partial_results(
+        self,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+        sample_sources,
+        sample_article_dtos,
+    ):
+        """Debe cortar una fuente colgada, guardar lo extraído y marcarla timed_out."""
+        use_case = ScrapeAllSourcesUseCase(
+            source_repository=mock_source_repository,
+            scraping_job_repository=mock_scraping_job_repository,
+            article_repository=mock_article_repository,
+            source_timeout=0.2,
+        )
+        mock_source_repository.get_active_sources.return_value = [sample_sources[0]]
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+
+        class HangingScraper:
+            async def astream(self):
+                for article_dto in sample_article_dtos:
+                    yield article_dto
+                await asyncio.sleep(30)
+
+        started = time.perf_counter()
+        with patch.object(
+            use_case, "_get_scraper_for_source", return_value=HangingScraper()
+        ):
+            result = await use_case.execute()
+
+        assert time.perf_counter() - started < 1
+        assert result["total_jobs_timed_out"] == 1
+        assert result["total_jobs_failed"] == 0
+        assert result["total_articles_persisted"] == 2
+        assert result["jobs_details"][0]["status"] == "timed_out"
+        saved_job = mock_scraping_job_repository.update.call_args.args[0]
+        assert saved_job.status == "timed_out"
+        assert saved_job.articulos_nuevos == 2
+
+    @pytest.mark.asyncio
+    async def test_run_timeout_caps_whole_run(
+        self,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+        sample_sources,
+    ):
+        """Debe cortar todas las fuentes al vencer el plazo de la ejecución."""
+        use_case = ScrapeAllSourcesUseCase(
+            source_repository=mock_source_repository,
+            scraping_job_repository=mock_scraping_job_repository,
+            article_repository=mock_article_repository,
+            concurrent=False,
+            run_timeout=0.3,
+        )
+        mock_source_repository.get_active_sources.return_value = sample_sources
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+
+        class SlowScraper:
+            async def ascrape(self):
+                await asyncio.sleep(30)
+
+        started = time.perf_counter()
+        with patch.object(
+            use_case, "_get_scraper_for_source", return_value=SlowScraper()
+        ):
+            result = await use_case.execute()
+
+        assert time.perf_counter() - started < 1
+        assert result["total_jobs_timed_out"] == 3
+        assert [d["status"] for d in result["jobs_details"]] == ["timed_out"] * 3
+
+    def test_invalid_timeouts(
+        self,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+    ):
+        """Debe rechazar plazos no positivos."""
+        repositories = {
+            "source_repository": mock_source_repository,
+            "scraping_job_repository": mock_scraping_job_repository,
+            "article_repository": mock_article_repository,
+        }
+        with pytest.raises(ValueError):
+            ScrapeAllSourcesUseCase(**repositories, source_timeout=0)
+        with pytest.raises(ValueError):
+            ScrapeAllSourcesUseCase(**repositories, run_timeout=-1)
+
+    @pytest.mark.asyncio
+    async def test_enqueue_sources_skips_open_jobs(
+        self,
+        use_case,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        sample_sources,
+    ):
+        """Debe encolar un job por fuente salvo las que ya tienen uno abierto."""
+        mock_source_repository.get_active_sources.return_value = sample_sources
+        mock_scraping_job_repository.enqueue.side_effect = lambda job: (
+            None if job.fuente == "Página 12" else job
+        )
+
+        queued = await use_case.enqueue_sources()
+
+        assert [job.fuente for job in queued] == ["Clarín", "La Nación"]
+        assert all(job.status == "pending" for job in queued)
+        assert mock_scraping_job_repository.enqueue.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_run_worker_drains_queue(
+        self, use_case, mock_scraping_job_repository, sample_article_dtos
+    ):
+        """Debe procesar los jobs tomados hasta vaciar la cola y guardarlos."""
+        queue = [ScrapingJob.create(fuente="Clarín") for _ in range(2)]
+
+        async def claim_next(worker_id, lease_seconds):
+            if not queue:
+                return None
+            job = queue.pop(0)
+            job.start()
+            return job
+
+        mock_scraping_job_repository.claim_next.side_effect = claim_next
+        mock_scraping_job_repository.finish.return_value = True
+        mock_scraper = Mock()
+        mock_scraper.scrape.return_value = sample_article_dtos
+
+        with patch.object(
+            use_case, "_get_scraper_for_source", return_value=mock_scraper
+        ):
+            result = await use_case.run_worker("worker-1", lease_seconds=30)
+
+        assert result["worker_id"] == "worker-1"
+        assert result["total_jobs_completed"] == 2
+        assert result["total_articles_scraped"] == 4
+        finished = mock_scraping_job_repository.finish.call_args_list
+        assert [call.args[1] for call in finished] == ["worker-1", "worker-1"]
+        assert all(call.args[0].status == "completed" for call in finished)
+        mock_scraping_job_repository.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_worker_cancels_job_when_lease_is_lost(
+        self, use_case, mock_scraping_job_repository
+    ):
+        """Debe cancelar el scraping y no guardar nada si otro worker reclamó el job."""
+        job = ScrapingJob.create(fuente="Clarín")
+        job.start()
+        mock_scraping_job_repository.claim_next.side_effect = [job, None]
+        mock_scraping_job_repository.renew_lease.side_effect = [True, False]
+        cancelled = []
+
+        class SlowScraper:
+            async def ascrape(self):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+
+        with patch.object(
+            use_case, "_get_scraper_for_source", return_value=SlowScraper()
+        ):
+            result = await use_case.run_worker("worker-1", lease_seconds=0.06)
+
+        assert result["total_jobs_lost"] == 1
+        assert result["jobs_details"][0]["status"] == "lost"
+        assert cancelled == [True]
+        assert mock_scraping_job_repository.renew_lease.call_count == 2
+        mock_scraping_job_repository.finish.assert_not_called()
+
+    @pytest.fixture
+    def breaker_use_case(
+        self,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+    ):
+        """Caso de uso con circuit breaker (3 fallos, 60 s de enfriamiento)."""
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+        mock_scraping_job_repository.get_page.return_value = CursorPage(items=[])
+        return ScrapeAllSourcesUseCase(
+            source_repository=mock_source_repository,
+            scraping_job_repository=mock_scraping_job_repository,
+            article_repository=mock_article_repository,
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=3, cooldown=60),
+        )
+
+    @staticmethod
+    def failed_history(finished_seconds_ago: float) -> CursorPage:
+        """Tres jobs fallidos de Clarín, el último terminado hace N segundos."""
+        jobs = []
+        for _ in range(3):
+            job = ScrapingJob.create(fuente="Clarín")
+            job.fail()
+            job.fecha_fin -= timedelta(seconds=finished_seconds_ago)
+            jobs.append(job)
+        return CursorPage(items=jobs)
+
+    class ProbingScraper:
+        """Scraper que responde (o no) al sondeo y registra si se ejecutó."""
+
+        def __init__(self, site_up: bool, article_dtos):
+            self.site_up = site_up
+            self.article_dtos = article_dtos
+            self.scraped = False
+
+        async def probe(self):
+            return self.site_up
+
+        async def ascrape(self):
+            self.scraped = True
+            return self.article_dtos
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_source_without_job(
+        self, breaker_use_case, mock_scraping_job_repository, sample_sources
+    ):
+        """Debe omitir la fuente sin crear job ni scrapear con el circuito abierto."""
+        mock_scraping_job_repository.get_page.return_value = self.failed_history(0)
+        scraper = self.ProbingScraper(site_up=True, article_dtos=[])
+
+        with patch.object(
+            breaker_use_case, "_get_scraper_for_source", return_value=scraper
+        ):
+            result = await breaker_use_case.execute(sources=[sample_sources[0]])
+
+        assert result["total_jobs_skipped"] == 1
+        assert result["total_jobs_failed"] == 0
+        assert result["jobs_details"][0]["status"] == "skipped"
+        assert result["jobs_details"][0]["job_id"] is None
+        assert not scraper.scraped
+        mock_scraping_job_repository.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_half_open_circuit_probes_before_scraping(
+        self,
+        breaker_use_case,
+        mock_scraping_job_repository,
+        sample_sources,
+        sample_article_dtos,
+    ):
+        """Debe scrapear solo si responde el sondeo; si no, registrar un fallo."""
+        mock_scraping_job_repository.get_page.return_value = self.failed_history(120)
+        down = self.ProbingScraper(site_up=False, article_dtos=sample_article_dtos)
+        up = self.ProbingScraper(site_up=True, article_dtos=sample_article_dtos)
+
+        with patch.object(
+            breaker_use_case, "_get_scraper_for_source", return_value=down
+        ):
+            result = await breaker_use_case.execute(sources=[sample_sources[0]])
+
+        assert result["jobs_details"][0]["status"] == "failed"
+        assert not down.scraped
+        assert mock_scraping_job_repository.update.call_args.args[0].status == "failed"
+
+        with patch.object(breaker_use_case, "_get_scraper_for_source", return_value=up):
+            result = await breaker_use_case.execute(sources=[sample_sources[0]])
+
+        assert result["jobs_details"][0]["status"] == "completed"
+        assert result["total_articles_persisted"] == 2
+        assert up.scraped
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_scraper_is_reused_for_the_run(
+        self, breaker_use_case, mock_scraping_job_repository, sample_sources
+    ):
+        """El scraper del sondeo es el mismo que luego scrapea la fuente."""
+        mock_scraping_job_repository.get_page.return_value = self.failed_history(120)
+        scraper = self.ProbingScraper(site_up=True, article_dtos=[])
+
+        with patch.object(
+            breaker_use_case, "_get_scraper_for_source", return_value=scraper
+        ) as mock_get_scraper:
+            result = await breaker_use_case.execute(sources=[sample_sources[0]])
+
+        assert result["jobs_details"][0]["status"] == "completed"
+        assert scraper.scraped
+        mock_get_scraper.assert_called_once_with("Clarín")
+
+    @pytest.mark.asyncio
+    async def test_circuit_errors_only_affect_their_source(
+        self,
+        breaker_use_case,
+        mock_scraping_job_repository,
+        sample_sources,
+        sample_article_dtos,
+    ):
+        """Un error del breaker o del sondeo no corta la ejecución de las demás fuentes."""
+        history = self.failed_history(120)
+
+        async def get_page(fuente, **kwargs):
+            if fuente == "Página 12":
+                raise RuntimeError("base de datos caída")
+            return history if fuente == "Clarín" else CursorPage(items=[])
+
+        mock_scraping_job_repository.get_page.side_effect = get_page
+        mock_scraping_job_repository.update.side_effect = lambda job: job
+
+        def get_scraper(source_name):
+            if source_name == "Clarín":
+                raise RuntimeError("factory rota")
+            return self.ProbingScraper(site_up=True, article_dtos=sample_article_dtos)
+
+        with patch.object(
+            breaker_use_case, "_get_scraper_for_source", side_effect=get_scraper
+        ):
+            result = await breaker_use_case.execute(sources=sample_sources)
+
+        statuses = {d["source"]: d["status"] for d in result["jobs_details"]}
+        # Sondeo con error: fallo del job de Clarín; breaker caído: se scrapea
+        assert statuses == {
+            "Clarín": "failed",
+            "Página 12": "completed",
+            "La Nación": "completed",
+        }
+
+    @pytest.mark.asyncio
+    async def test_unreachable_site_fails_job(
+        self, use_case, mock_scraping_job_repository, sample_sources
+    ):
+        """Debe marcar como fallido un job sin artículos cuyo sitio no respondió."""
+        mock_scraping_job_repository.create.side_effect = lambda job: job
+
+        class DownScraper:
+            async def ascrape(self):
+                return []
+
+            def request_stats(self):
+                return {"requests": 6, "errors": 6}
+
+        with patch.object(
+            use_case, "_get_scraper_for_source", return_value=DownScraper()
+        ):
+            result = await use_case.execute(sources=[sample_sources[0]])
+
+        assert result["total_jobs_failed"] == 1
+        assert "no respondió" in result["jobs_details"][0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_workers_skip_sources_with_open_circuit(
+        self, breaker_use_case, mock_source_repository, mock_scraping_job_repository
+    ):
+        """No debe encolar ni scrapear fuentes con el circuito abierto."""
+        mock_scraping_job_repository.get_page.return_value = self.failed_history(0)
+        mock_source_repository.get_active_sources.return_value = [
+            Source.create(source_type=NewsSource.CLARIN)
+        ]
+        assert await breaker_use_case.enqueue_sources() == []
+        mock_scraping_job_repository.enqueue.assert_not_called()
+
+        # Job encolado antes de que se abriera el circuito
+        job = ScrapingJob.create(fuente="Clarín")
+        job.start()
+        mock_scraping_job_repository.claim_next.side_effect = [job, None]
+        mock_scraping_job_repository.finish.return_value = True
+        mock_get_scraper = Mock()
+
+        with patch.object(
+            breaker_use_case, "_get_scraper_for_source", mock_get_scraper
+        ):
+            result = await breaker_use_case.run_worker("worker-1", lease_seconds=30)
+
+        assert result["total_jobs_skipped"] == 1
+        assert mock_scraping_job_repository.finish.call_args.args[0].status == "skipped"
+        mock_get_scraper.assert_not_called()
+
+    def test_parse_executor_shared_by_run(
+        self,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+    ):
+        """Debe reutilizar el executor recibido o crear un pool de procesos."""
+        repositories = {
+            "source_repository": mock_source_repository,
+            "scraping_job_repository": mock_scraping_job_repository,
+            "article_repository": mock_article_repository,
+        }
+        executor = Mock()
+        use_case = ScrapeAllSourcesUseCase(**repositories, parse_executor=executor)
+        with use_case._open_parse_executor() as parse_executor:
+            assert parse_executor is executor
+
+        use_case = ScrapeAllSourcesUseCase(
+            **repositories, pipeline_config=PipelineConfig(parse_processes=2)
+        )
+        with use_case._open_parse_executor() as parse_executor:
+            assert isinstance(parse_executor, ProcessPoolExecutor)
+
+        with ScrapeAllSourcesUseCase(**repositories)._open_parse_executor() as pool:
+            assert pool is None
+
     def test_get_scraper_for_source_clarin(self, use_case):
         """Debe retornar ClarinScraper para fuente Clarín."""
         scraper = use_case._get_scraper_for_source("Clarín")
@@ -244,6 +947,62 @@ class TestScrapeAllSourcesUseCase:
         assert scraper is not None
         assert scraper.__class__.__name__ == "LaNacionScraper"
 
+    def test_scrapers_check_known_urls_against_repository(
+        self, use_case, mock_article_repository
+    ):
+        """Los scrapers deben filtrar URLs conocidas contra el repositorio."""
+        scraper = use_case._get_scraper_for_source("Clarín")
+        assert scraper.known_urls_checker == mock_article_repository.get_existing_urls
+
+    def test_scrapers_use_crawl_frontier(
+        self,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+    ):
+        """Con frontera el corte es la racha de URLs conocidas, no un cupo fijo."""
+        frontier = AsyncMock()
+        use_case = ScrapeAllSourcesUseCase(
+            source_repository=mock_source_repository,
+            scraping_job_repository=mock_scraping_job_repository,
+            article_repository=mock_article_repository,
+            frontier_repository=frontier,
+            known_streak_limit=5,
+        )
+
+        scraper = use_case._get_scraper_for_source("La Nación")
+
+        assert scraper.frontier is frontier
+        assert scraper.known_streak_limit == 5
+        assert (
+            scraper.max_articles == ScrapeAllSourcesUseCase.MAX_ARTICLES_WITH_FRONTIER
+        )
+
+    def test_http_cache_is_injected(
+        self,
+        use_case,
+        mock_source_repository,
+        mock_scraping_job_repository,
+        mock_article_repository,
+        tmp_path,
+    ):
+        """Sin caché inyectada los scrapers no escriben en disco."""
+        assert (
+            use_case._get_scraper_for_source("Clarín").fetch_engine.http_cache is None
+        )
+
+        cache = HttpCache(tmp_path)
+        use_case = ScrapeAllSourcesUseCase(
+            source_repository=mock_source_repository,
+            scraping_job_repository=mock_scraping_job_repository,
+            article_repository=mock_article_repository,
+            http_cache=cache,
+        )
+
+        scraper = use_case._get_scraper_for_source("Clarín")
+
+        assert scraper.fetch_engine.http_cache is cache
+
     def test_get_scraper_for_source_unknown(self, use_case):
         """Debe retornar None para fuente desconocida."""
         scraper = use_case._get_scraper_for_source("Fuente Desconocida")
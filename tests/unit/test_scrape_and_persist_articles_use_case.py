@@ -0,0 +1,73 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+from src.application.use_cases.scrape_and_persist_articles import (
+    ScrapeAndPersistArticlesUseCase,
+)
+from src.domain.dto.article_dto import ArticleDTO
+
+
+def make_dto(url: str) -> ArticleDTO:
+    return ArticleDTO(
+        titulo=f"Titulo {url}",
+        url=url,
+        contenido="Contenido",
+        fecha_publicacion=datetime.now(timezone.utc),
+        fuente="Clarín",
+    )
+
+
+class TestScrapeAndPersistArticlesUseCase:
+    @pytest.mark.asyncio
+    async def test_execute_persists_batch_in_single_call(self):
+        scraper = Mock()
+        scraper.scrape.return_value = [
+            make_dto("https://a.com/1"),
+            make_dto("https://a.com/2"),
+            make_dto("https://a.com/3"),
+        ]
+        repository = AsyncMock()
+        repository.bulk_create_if_absent.return_value = {
+            "https://a.com/1",
+            "https://a.com/3",
+        }
+
+        result = await ScrapeAndPersistArticlesUseCase(scraper, repository).execute()
+
+        repository.bulk_create_if_absent.assert_awaited_once()
+        repository.get_by_url.assert_not_called()
+        repository.create.assert_not_called()
+        assert result["total_scraped"] == 3
+        assert result["total_new"] == 2
+        assert result["total_duplicates"] == 1
+        assert [a.url for a in result["articles"]] == [
+            "https://a.com/1",
+            "https://a.com/3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_counts_repeated_urls_as_duplicates(self):
+        scraper = Mock()
+        scraper.scrape.return_value = [
+            make_dto("https://a.com/1"),
+            make_dto("https://a.com/1"),
+        ]
+        repository = AsyncMock()
+        repository.bulk_create_if_absent.return_value = {"https://a.com/1"}
+
+        result = await ScrapeAndPersistArticlesUseCase(scraper, repository).execute()
+
+        assert result["total_new"] == 1
+        assert result["total_duplicates"] == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_without_articles(self):
+        scraper = Mock()
+        scraper.scrape.return_value = []
+        repository = AsyncMock()
+
+        result = await ScrapeAndPersistArticlesUseCase(scraper, repository).execute()
+
+        assert result["total_scraped"] == 0
+        repository.bulk_create_if_absent.assert_not_called()
@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.domain.entities.scraping_job import ScrapingJob
 
@@ -50,6 +50,32 @@ def test_fail_job():
     assert job.updated_at is not None
 
 
+def test_complete_releases_lease():
+    job = ScrapingJob.create(fuente="test.com")
+    job.start()
+    job.lease_owner = "worker-1"
+    job.lease_expires_at = datetime.now(timezone.utc)
+
+    job.complete(total_articulos=3)
+
+    assert job.lease_expires_at is None
+    assert job.lease_owner == "worker-1"
+
+
+def test_time_out_keeps_partial_counts():
+    job = ScrapingJob.create(fuente="test.com")
+    job.start()
+    job.lease_expires_at = datetime.now(timezone.utc)
+
+    job.time_out(total_articulos=7, articulos_nuevos=4)
+
+    assert job.status == "timed_out"
+    assert job.total_articulos == 7
+    assert job.articulos_nuevos == 4
+    assert job.fecha_fin is not None
+    assert job.lease_expires_at is None
+
+
 def test_increment_articles():
     job = ScrapingJob.create(fuente="test.com")
 
@@ -0,0 +1,40 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from src.application.use_cases.search_articles import SearchArticlesUseCase
+from src.domain.entities.news_article import NewsArticle
+from src.infrastructure.persistence.in_memory_news_article_repository import (
+    InMemoryNewsArticleRepository,
+)
+
+
+def make_article(url: str, titulo: str, contenido: str, hours_ago: int = 0):
+    return NewsArticle.create(
+        titulo=titulo,
+        contenido=contenido,
+        fuente="Clarín",
+        fecha_publicacion=datetime.now(timezone.utc) - timedelta(hours=hours_ago),
+        url=url,
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_returns_matching_articles_title_first():
+    repository = InMemoryNewsArticleRepository()
+    await repository.create(
+        make_article("https://a.com/1", "Fútbol", "Habló del dólar")
+    )
+    await repository.create(
+        make_article("https://a.com/2", "El dólar sube", "Mercados", hours_ago=3)
+    )
+    await repository.create(make_article("https://a.com/3", "Clima", "Lluvias"))
+
+    results = await SearchArticlesUseCase(repository).execute("dólar")
+
+    assert [a.url for a in results] == ["https://a.com/2", "https://a.com/1"]
+
+
+@pytest.mark.asyncio
+async def test_search_with_empty_query():
+    with pytest.raises(ValueError):
+        await SearchArticlesUseCase(InMemoryNewsArticleRepository()).execute("  ")